@@ -1,5 +1,6 @@
 from langgraph.graph import Graph, StateGraph
 from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.runnables import RunnableLambda
 from typing import Dict, Any, TypedDict
 from .chatbot_node import ChatbotNode
 import uuid
@@ -25,8 +26,8 @@ def create_chatbot_graph():
     # 챗봇 노드 생성
     chatbot_node = ChatbotNode()
     
-    # 노드 추가
-    workflow.add_node("chatbot", chatbot_node)
+    # 노드 추가 (ainvoke/astream_events 실행 시 비동기 경로로 토큰 스트리밍)
+    workflow.add_node("chatbot", RunnableLambda(chatbot_node, afunc=chatbot_node.ainvoke, name="chatbot"))
     
     # 엔트리 포인트 설정
     workflow.set_entry_point("chatbot")
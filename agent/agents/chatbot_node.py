@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
@@ -38,11 +39,17 @@ REDIS_SESSION_PREFIX = 'chat_session:'
 REDIS_SESSION_TTL = 60 * 60 * 24  # 24시간
 
 def save_message_to_history(session_id, role, message):
+    save_messages_to_history(session_id, [(role, message)])
+
+def save_messages_to_history(session_id, messages):
+    """여러 메시지를 한 번에 저장 ([(role, message), ...])"""
     client = get_redis_client()
     key = REDIS_SESSION_PREFIX + session_id
-    entry = json.dumps({'role': role, 'message': message})
-    client.rpush(key, entry)
-    client.expire(key, REDIS_SESSION_TTL)
+    pipe = client.pipeline()
+    for role, message in messages:
+        pipe.rpush(key, json.dumps({'role': role, 'message': message}))
+    pipe.expire(key, REDIS_SESSION_TTL)
+    pipe.execute()
 
 def get_conversation_history(session_id, limit=10):
     client = get_redis_client()
@@ -109,71 +116,94 @@ class ChatbotNode:
         6. 현재 페이지 정보를 활용하여 페이지별 맞춤 도움을 제공하세요
         7. 입력 필드의 실제 라벨과 현재 값을 정확히 파악하여 도움을 제공하세요"""
     
+    def _prepare(self, state: Dict[str, Any]) -> Tuple[str, List[Dict]]:
+        """이전 대화 기록을 불러와 프롬프트 생성 (이전 대화 + 현재 메시지 + 페이지 컨텍스트)"""
+        user_message = state.get("user_message", "")
+        session_id = state.get("session_id", "default_session")
+        page_context = state.get("page_context", {})
+        
+        history = get_conversation_history(session_id, limit=10)
+        history_prompt = ''
+        for h in history:
+            if h['role'] == 'user':
+                history_prompt += f"User: {h['message']}\n"
+            else:
+                history_prompt += f"AI: {h['message']}\n"
+        
+        prompt = f"{history_prompt}User: {user_message}\n"
+        if page_context:
+            prompt += f"[PageContext: {json.dumps(page_context, ensure_ascii=False)}]\n"
+        prompt += "AI: "
+        return prompt, history
+    
+    def _complete(self, state: Dict[str, Any], prompt: str, history: List[Dict], ai_response: str) -> Dict[str, Any]:
+        """응답 완료 후 대화 기록 저장 및 최종 상태 생성"""
+        user_message = state.get("user_message", "")
+        session_id = state.get("session_id", "default_session")
+        page_context = state.get("page_context", {})
+        
+        # 사용자 메시지와 AI 응답을 함께 저장 (응답이 끝난 경우에만 기록)
+        save_messages_to_history(session_id, [('user', user_message), ('ai', ai_response)])
+        
+        return {
+            **state,
+            "ai_response": ai_response,
+            "context_used": prompt,
+            "conversation_history_length": len(history) + 1,
+            # 페이지별 제안사항 / DOM 액션 생성 (필요한 경우)
+            "page_suggestions": self._generate_page_suggestions(page_context, user_message),
+            "dom_actions": self._generate_dom_actions(page_context, user_message)
+        }
+    
+    def _empty_message_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **state,
+            "ai_response": "안녕하세요! 무엇을 도와드릴까요?",
+            "context_used": ""
+        }
+    
+    def _error_state(self, state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+        print(f"Error in chatbot node: {e}")
+        return {
+            **state,
+            "ai_response": "죄송합니다. 오류가 발생했습니다. 다시 시도해주세요.",
+            "context_used": "",
+            "error": str(e),
+            "page_suggestions": [],
+            "dom_actions": []
+        }
+    
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """챗봇 노드 실행"""
         try:
-            # 상태에서 필요한 정보 추출
-            user_message = state.get("user_message", "")
-            session_id = state.get("session_id", "default_session")
-            page_context = state.get("page_context", {})
-            
-            if not user_message:
-                return {
-                    **state,
-                    "ai_response": "안녕하세요! 무엇을 도와드릴까요?",
-                    "context_used": ""
-                }
+            if not state.get("user_message", ""):
+                return self._empty_message_state(state)
             
-            # 1. 이전 대화 기록 불러오기
-            history = get_conversation_history(session_id, limit=10)
-            history_prompt = ''
-            for h in history:
-                if h['role'] == 'user':
-                    history_prompt += f"User: {h['message']}\n"
-                else:
-                    history_prompt += f"AI: {h['message']}\n"
-            
-            # 2. 이번 메시지 저장
-            save_message_to_history(session_id, 'user', user_message)
-            
-            # 3. 프롬프트 생성 (이전 대화 + 현재 메시지 + 페이지 컨텍스트)
-            prompt = f"{history_prompt}User: {user_message}\n"
-            if page_context:
-                prompt += f"[PageContext: {json.dumps(page_context, ensure_ascii=False)}]\n"
-            prompt += "AI: "
-            
-            # 4. LLM 호출
+            prompt, history = self._prepare(state)
             response = self.llm.invoke(prompt)
-            ai_response = response.content
-            
-            # 5. AI 응답 저장
-            save_message_to_history(session_id, 'ai', ai_response)
-            
-            # 페이지별 제안사항 생성
-            page_suggestions = self._generate_page_suggestions(page_context, user_message)
+            return self._complete(state, prompt, history, response.content)
             
-            # DOM 액션 생성 (필요한 경우)
-            dom_actions = self._generate_dom_actions(page_context, user_message)
+        except Exception as e:
+            return self._error_state(state, e)
+    
+    async def ainvoke(self, state: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """챗봇 노드 비동기 실행
+
+        LLM을 astream으로 호출하므로 그래프의 astream_events에서 토큰 단위 이벤트를 받을 수 있습니다.
+        Redis 입출력은 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+        """
+        try:
+            if not state.get("user_message", ""):
+                return self._empty_message_state(state)
             
-            return {
-                **state,
-                "ai_response": ai_response,
-                "context_used": prompt,
-                "conversation_history_length": len(history) + 1,
-                "page_suggestions": page_suggestions,
-                "dom_actions": dom_actions
-            }
+            prompt, history = await asyncio.to_thread(self._prepare, state)
+            chunks = []
+            async for chunk in self.llm.astream(prompt, config=config):
+                chunks.append(chunk.content)
+            return await asyncio.to_thread(self._complete, state, prompt, history, "".join(chunks))
             
         except Exception as e:
-            print(f"Error in chatbot node: {e}")
-            return {
-                **state,
-                "ai_response": "죄송합니다. 오류가 발생했습니다. 다시 시도해주세요.",
-                "context_used": "",
-                "error": str(e),
-                "page_suggestions": [],
-                "dom_actions": []
-            }
+            return self._error_state(state, e)
     
     def _generate_system_prompt(self, page_context: Dict[str, Any]) -> str:
         """페이지 컨텍스트를 기반으로 시스템 프롬프트 생성"""
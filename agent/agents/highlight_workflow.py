@@ -1,13 +1,20 @@
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 from typing import Dict, Any, List, Optional
+import asyncio
 import json
+import os
 import re
 from agent.utils.llm_cache import redis_cache
+from agent.utils.sentiment_engine import get_sentiment_engine
 
 # LLM 초기화
 llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
 
+# 카테고리별 LLM 분석 동시 실행 수 / 카테고리당 제한 시간(초)
+HIGHLIGHT_MAX_CONCURRENCY = int(os.getenv("HIGHLIGHT_MAX_CONCURRENCY", "5"))
+HIGHLIGHT_CATEGORY_TIMEOUT = float(os.getenv("HIGHLIGHT_CATEGORY_TIMEOUT", "60"))
+
 # 임베딩 시스템 관련 코드 완전 제거
 
 def is_transition_word(text: str) -> bool:
@@ -598,33 +605,21 @@ async def analyze_category_with_llm(
 async def analyze_orange_with_sentiment(candidates: List[Dict[str, Any]], full_text: str) -> List[Dict[str, Any]]:
     """오렌지색 하이라이팅 - 감정 모델과 프롬프트 결합"""
     try:
-        # 감정 모델 로드 시도
-        sentiment_model = None
-        sentiment_tokenizer = None
-        
-        try:
-            from transformers import AutoTokenizer, AutoModelForSequenceClassification
-            import torch
-            
-            model_name = "nlp04/korean_sentiment_analysis_kcelectra"
-            sentiment_tokenizer = AutoTokenizer.from_pretrained(model_name)
-            sentiment_model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            print("✅ 감정 모델 로드 성공")
-        except Exception as e:
-            print(f"⚠️ 감정 모델 로드 실패: {e}")
+        # 상주 감정 분석 엔진으로 전체 후보 문장을 한 번에 배치 추론 (부정 확률)
+        sentences = [candidate['sentence'] for candidate in candidates]
+        sentiment_scores = None
+        if sentences:
+            try:
+                engine = await asyncio.to_thread(get_sentiment_engine)
+                sentiment_scores = await asyncio.to_thread(engine.negative_scores, sentences)
+            except Exception as e:
+                print(f"⚠️ 감정 모델 분석 실패: {e}")
         
-        # 감정 분석 수행
+        # 감정 분석 결과 반영
         negative_sentences = []
-        for candidate in candidates:
-            sentence = candidate['sentence']
-            
-            if sentiment_model and sentiment_tokenizer:
-                # 감정 모델로 분석
-                inputs = sentiment_tokenizer(sentence, return_tensors="pt", truncation=True, max_length=512)
-                with torch.no_grad():
-                    outputs = sentiment_model(**inputs)
-                    probabilities = torch.softmax(outputs.logits, dim=1)
-                    sentiment_score = probabilities[0][1].item()  # 부정 확률
+        for index, sentence in enumerate(sentences):
+            if sentiment_scores is not None:
+                sentiment_score = sentiment_scores[index]
                 
                 # 부정 확률이 높은 문장 선택 (임계값 더 낮춤)
                 if sentiment_score > 0.15:  # 15% 이상 부정 (더 낮은 임계값)
@@ -711,8 +706,8 @@ async def analyze_orange_with_sentiment(candidates: List[Dict[str, Any]], full_t
         print(f"오렌지색 감정 분석 오류: {str(e)}")
         return []
 
-def perform_advanced_highlighting(state: Dict[str, Any]) -> Dict[str, Any]:
-    """고급 하이라이팅 수행 노드 (LLM 기반)"""
+async def perform_advanced_highlighting(state: Dict[str, Any]) -> Dict[str, Any]:
+    """고급 하이라이팅 수행 노드 (LLM 기반, 카테고리별 동시 실행)"""
     resume_content = state.get("resume_content", "")
     highlight_criteria = state.get("highlight_criteria", {})
     jobpost_id = state.get("jobpost_id")
@@ -727,42 +722,30 @@ def perform_advanced_highlighting(state: Dict[str, Any]) -> Dict[str, Any]:
         "blue": []
     }
     
-    # 비동기 분석을 위한 준비
-    import asyncio
+    semaphore = asyncio.Semaphore(max(1, HIGHLIGHT_MAX_CONCURRENCY))
     
-    async def run_all_analyses():
-        tasks = []
-        
-        # 각 카테고리별 분석 태스크 생성
-        for color, criteria in highlight_criteria.items():
-            # 키워드 대신 빈 배열 전달 (LLM이 문맥으로 판단)
-            task = analyze_category_with_llm(resume_content, color, [])
-            tasks.append((color, task))
-        
-        # 모든 분석 실행
-        results = {}
-        for color, task in tasks:
+    async def run_category(color: str) -> List[Dict[str, Any]]:
+        async with semaphore:
             try:
-                result = await task
-                results[color] = result
+                # 키워드 대신 빈 배열 전달 (LLM이 문맥으로 판단)
+                result = await asyncio.wait_for(
+                    analyze_category_with_llm(resume_content, color, []),
+                    timeout=HIGHLIGHT_CATEGORY_TIMEOUT
+                )
                 print(f"✅ {color} 분석 완료: {len(result)}개 결과")
+                return result
+            except asyncio.TimeoutError:
+                print(f"⏱️ 분석 시간 초과 ({color}): {HIGHLIGHT_CATEGORY_TIMEOUT}초")
+                return []
             except Exception as e:
                 print(f"❌ 분석 오류 ({color}): {str(e)}")
-                results[color] = []
-        
-        return results
+                return []
     
-    # 비동기 실행
+    # 카테고리별 분석 동시 실행
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, run_all_analyses())
-                highlights = future.result()
-        else:
-            highlights = loop.run_until_complete(run_all_analyses())
+        colors = list(highlight_criteria.keys())
+        results = await asyncio.gather(*(run_category(color) for color in colors))
+        highlights.update(zip(colors, results))
     except Exception as e:
         print(f"하이라이팅 실행 오류: {str(e)}")
         # 오류 시 기본 키워드 매칭으로 fallback
@@ -964,12 +947,12 @@ def build_highlight_workflow() -> StateGraph:
 # 워크플로우 인스턴스 생성
 highlight_workflow = build_highlight_workflow()
 
-def process_highlight_workflow(
+async def aprocess_highlight_workflow(
     resume_content: str,
     jobpost_id: int = None,
     company_id: int = None
 ) -> Dict[str, Any]:
-    """형광펜 하이라이팅 워크플로우 실행"""
+    """형광펜 하이라이팅 워크플로우 실행 (비동기)"""
     
     # 초기 상태 설정
     initial_state = {
@@ -980,7 +963,7 @@ def process_highlight_workflow(
     
     try:
         # 워크플로우 실행
-        result = highlight_workflow.invoke(initial_state)
+        result = await highlight_workflow.ainvoke(initial_state)
         return result.get("final_result", {})
     except Exception as e:
         print(f"하이라이팅 워크플로우 오류: {str(e)}")
@@ -997,4 +980,21 @@ def process_highlight_workflow(
                 "color_distribution": {},
                 "issues": [f"워크플로우 오류: {str(e)}"]
             }
-        } 
\ No newline at end of file
+        }
+
+def process_highlight_workflow(
+    resume_content: str,
+    jobpost_id: int = None,
+    company_id: int = None
+) -> Dict[str, Any]:
+    """형광펜 하이라이팅 워크플로우 실행 (동기 호출용 래퍼)"""
+    coro = aprocess_highlight_workflow(resume_content, jobpost_id, company_id)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    # 이미 실행 중인 루프 안의 동기 호출이면 별도 스레드에서 실행
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
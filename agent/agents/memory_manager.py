@@ -5,34 +5,81 @@ import redis
 import os
 from datetime import datetime
 
+# 세션/사용자 대화 보존 기간
+SESSION_HISTORY_TTL = 86400  # 세션 대화는 24시간 보존
+USER_HISTORY_TTL = 86400 * 7  # 사용자 대화는 7일 보존
+# 이전 형식 확인을 마친 키를 기억할 최대 개수 (넘으면 비우고 다시 확인)
+MIGRATED_KEY_CACHE_SIZE = 100_000
+
+# 이전 형식 확인을 마친 키 (프로세스 내 모든 인스턴스가 공유, 키마다 TYPE 조회는 1회만)
+_migrated_keys = set()
+
 class ConversationMemory:
-    def __init__(self, redis_url: str = None):
-        """대화 메모리 관리자 초기화"""
+    def __init__(self, redis_url: str = None, max_messages: Optional[int] = None):
+        """대화 메모리 관리자 초기화
+
+        대화 히스토리는 Redis 리스트에 메시지 단위로 저장합니다(RPUSH + LTRIM + EXPIRE).
+        메시지 추가 비용은 세션 길이와 무관하게 일정하며, 키당 max_messages개까지만 보관합니다.
+        """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
         self.redis_client = redis.from_url(self.redis_url)
-        
+        self.max_messages = max_messages or int(os.getenv("CONVERSATION_MAX_MESSAGES", "200"))
+
+    @staticmethod
+    def _history_key(session_id: str, user_id: str = None):
+        """사용자 ID가 있으면 사용자 기반, 없으면 세션 기반 키"""
+        if user_id:
+            return f"user_conversation:{user_id}", USER_HISTORY_TTL
+        return f"conversation:{session_id}", SESSION_HISTORY_TTL
+
+    @staticmethod
+    def _serialize(message: BaseMessage) -> Optional[str]:
+        if isinstance(message, HumanMessage):
+            return json.dumps({"type": "human", "content": message.content}, ensure_ascii=False)
+        if isinstance(message, AIMessage):
+            return json.dumps({"type": "ai", "content": message.content}, ensure_ascii=False)
+        return None
+
+    @staticmethod
+    def _deserialize(items: List) -> List[BaseMessage]:
+        messages = []
+        for item in items:
+            msg = json.loads(item)
+            if msg["type"] == "human":
+                messages.append(HumanMessage(content=msg["content"]))
+            elif msg["type"] == "ai":
+                messages.append(AIMessage(content=msg["content"]))
+        return messages
+
+    def _migrate_legacy_key(self, key: str, ttl: int):
+        """이전 형식(JSON 문자열 전체 저장) 키를 리스트 형식으로 1회 변환 (이미 확인한 키는 Redis 조회 없이 통과)"""
+        if key in _migrated_keys:
+            return
+        if self.redis_client.type(key) not in (b"string", "string"):
+            self._remember_migrated(key)
+            return
+        history_data = self.redis_client.get(key)
+        items = [json.dumps(msg, ensure_ascii=False) for msg in json.loads(history_data or "[]")]
+        pipe = self.redis_client.pipeline()
+        pipe.delete(key)
+        if items:
+            pipe.rpush(key, *items[-self.max_messages:])
+            pipe.expire(key, ttl)
+        pipe.execute()
+        self._remember_migrated(key)
+
+    @staticmethod
+    def _remember_migrated(key: str):
+        if len(_migrated_keys) >= MIGRATED_KEY_CACHE_SIZE:
+            _migrated_keys.clear()
+        _migrated_keys.add(key)
+
     def get_conversation_history(self, session_id: str, user_id: str = None) -> List[BaseMessage]:
         """세션 ID 또는 사용자 ID로 대화 히스토리 조회"""
         try:
-            # 사용자 ID가 있으면 사용자 기반, 없으면 세션 기반
-            if user_id:
-                key = f"user_conversation:{user_id}"
-                ttl = 86400 * 7  # 사용자 대화는 7일 보존
-            else:
-                key = f"conversation:{session_id}"
-                ttl = 86400  # 세션 대화는 24시간 보존
-            
-            history_data = self.redis_client.get(key)
-            if history_data:
-                history = json.loads(history_data)
-                messages = []
-                for msg in history:
-                    if msg["type"] == "human":
-                        messages.append(HumanMessage(content=msg["content"]))
-                    elif msg["type"] == "ai":
-                        messages.append(AIMessage(content=msg["content"]))
-                return messages
-            return []
+            key, ttl = self._history_key(session_id, user_id)
+            self._migrate_legacy_key(key, ttl)
+            return self._deserialize(self.redis_client.lrange(key, 0, -1))
         except Exception as e:
             print(f"Error retrieving conversation history: {e}")
             return []
@@ -41,48 +88,36 @@ class ConversationMemory:
         """대화 히스토리에 메시지 추가 (세션 및 사용자 기반)"""
         try:
             # 세션 기반 저장
-            self._add_message_to_key(f"conversation:{session_id}", message, 86400)
+            self._add_message_to_key(f"conversation:{session_id}", message, SESSION_HISTORY_TTL)
             
             # 사용자 ID가 있으면 사용자 기반도 저장
             if user_id:
-                self._add_message_to_key(f"user_conversation:{user_id}", message, 86400 * 7)
+                self._add_message_to_key(f"user_conversation:{user_id}", message, USER_HISTORY_TTL)
                 
         except Exception as e:
             print(f"Error adding message to history: {e}")
     
     def _add_message_to_key(self, key: str, message: BaseMessage, ttl: int):
-        """특정 키에 메시지 추가"""
+        """특정 키에 메시지 추가 (기존 히스토리를 읽지 않고 리스트 끝에 추가)"""
         try:
-            history = self._get_messages_from_key(key)
-            history.append(message)
-            
-            # Redis에 저장할 수 있는 형태로 변환
-            history_data = []
-            for msg in history:
-                if isinstance(msg, HumanMessage):
-                    history_data.append({"type": "human", "content": msg.content})
-                elif isinstance(msg, AIMessage):
-                    history_data.append({"type": "ai", "content": msg.content})
-            
-            # Redis에 저장
-            self.redis_client.setex(key, ttl, json.dumps(history_data))
+            item = self._serialize(message)
+            if item is None:
+                return
+            self._migrate_legacy_key(key, ttl)
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.rpush(key, item)
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.expire(key, ttl)
+            pipe.execute()
         except Exception as e:
             print(f"Error adding message to key {key}: {e}")
     
-    def _get_messages_from_key(self, key: str) -> List[BaseMessage]:
-        """특정 키에서 메시지 조회"""
+    def _get_messages_from_key(self, key: str, limit: Optional[int] = None) -> List[BaseMessage]:
+        """특정 키에서 메시지 조회 (limit이 있으면 마지막 limit개만)"""
         try:
-            history_data = self.redis_client.get(key)
-            if history_data:
-                history = json.loads(history_data)
-                messages = []
-                for msg in history:
-                    if msg["type"] == "human":
-                        messages.append(HumanMessage(content=msg["content"]))
-                    elif msg["type"] == "ai":
-                        messages.append(AIMessage(content=msg["content"]))
-                return messages
-            return []
+            start = -limit if limit else 0
+            return self._deserialize(self.redis_client.lrange(key, start, -1))
         except Exception as e:
             print(f"Error retrieving messages from key {key}: {e}")
             return []
@@ -100,23 +135,30 @@ class ConversationMemory:
             print(f"Error clearing conversation history: {e}")
     
     def get_recent_messages(self, session_id: str, limit: int = 10, user_id: str = None) -> List[BaseMessage]:
-        """최근 N개의 메시지만 조회"""
-        history = self.get_conversation_history(session_id, user_id)
-        return history[-limit:] if len(history) > limit else history
+        """최근 N개의 메시지만 조회 (리스트 끝부분만 LRANGE)"""
+        if limit <= 0:
+            return []
+        key, ttl = self._history_key(session_id, user_id)
+        try:
+            self._migrate_legacy_key(key, ttl)
+        except Exception as e:
+            print(f"Error migrating conversation history: {e}")
+        return self._get_messages_from_key(key, limit)
     
     def get_user_conversation_summary(self, user_id: str) -> Dict:
         """사용자의 대화 요약 정보"""
         try:
             key = f"user_conversation:{user_id}"
-            history_data = self.redis_client.get(key)
-            if history_data:
-                history = json.loads(history_data)
+            self._migrate_legacy_key(key, USER_HISTORY_TTL)
+            total = self.redis_client.llen(key)
+            if total:
+                history = [json.loads(item) for item in self.redis_client.lrange(key, 0, -1)]
                 return {
-                    "total_messages": len(history),
-                    "last_conversation": history[-1]["content"][:100] + "..." if history else "",
+                    "total_messages": total,
+                    "last_conversation": history[-1]["content"][:100] + "...",
                     "conversation_count": len([msg for msg in history if msg["type"] == "human"])
                 }
             return {"total_messages": 0, "last_conversation": "", "conversation_count": 0}
         except Exception as e:
             print(f"Error getting user conversation summary: {e}")
-            return {"total_messages": 0, "last_conversation": "", "conversation_count": 0}
\ No newline at end of file
+            return {"total_messages": 0, "last_conversation": "", "conversation_count": 0}
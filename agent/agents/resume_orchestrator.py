@@ -1,6 +1,7 @@
-from typing import Dict, Any, Optional
-import asyncio
+from typing import Dict, Any, Optional, Tuple
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from agent.utils.llm_cache import redis_cache
 
 # 각 툴들 import
@@ -10,12 +11,35 @@ from agent.tools.detailed_analysis_tool import generate_detailed_analysis
 from agent.tools.competitiveness_comparison_tool import generate_competitiveness_comparison
 from agent.tools.impact_points_tool import ImpactPointsTool
 
+# 툴별 기본 타임아웃(초) - RESUME_TOOL_TIMEOUT_<툴 이름> 환경 변수로 조정
+DEFAULT_TOOL_TIMEOUTS = {
+    'highlight': 180,
+    'comprehensive': 120,
+    'detailed': 120,
+    'competitiveness': 120,
+    'impact_points': 120
+}
+
+# 여러 이력서 분석 요청이 공유하는 툴 실행 스레드 풀 (LLM 호출 대기 위주라 스레드로 충분)
+_tool_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RESUME_ORCHESTRATOR_MAX_WORKERS", 10)),
+    thread_name_prefix="resume-tool"
+)
+
+
+def _is_complete_analysis(results: Dict[str, Any]) -> bool:
+    """오류나 타임아웃 없이 모든 툴이 완료된 결과만 캐시"""
+    return not results.get('errors') and not results.get('metadata', {}).get('partial')
+
+
 class ResumeOrchestrator:
     """
     이력서 분석 오케스트레이터
     
     형광펜 툴과 각 분석 툴들을 독립적으로 호출하여
     통합된 이력서 분석 결과를 제공합니다.
+    툴 간 의존성이 없으므로 활성화된 툴을 동시에 실행하고,
+    툴별 타임아웃을 넘긴 결과는 제외한 부분 결과를 반환합니다.
     """
     
     def __init__(self):
@@ -26,8 +50,82 @@ class ResumeOrchestrator:
             'competitiveness': generate_competitiveness_comparison,
             'impact_points': ImpactPointsTool().analyze_impact_points
         }
+        self.tool_timeouts = {
+            name: float(os.getenv(f"RESUME_TOOL_TIMEOUT_{name.upper()}", timeout))
+            for name, timeout in DEFAULT_TOOL_TIMEOUTS.items()
+        }
+    
+    def _build_tool_kwargs(
+        self,
+        tool_name: str,
+        resume_text: str,
+        job_info: str,
+        portfolio_info: str,
+        job_matching_info: str,
+        jobpost_id: Optional[int],
+        company_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """각 툴별로 적절한 파라미터 구성"""
+        if tool_name == 'highlight':
+            return {'resume_content': resume_text, 'jobpost_id': jobpost_id, 'company_id': company_id}
+        if tool_name == 'comprehensive':
+            return {
+                'resume_text': resume_text,
+                'job_info': job_info,
+                'portfolio_info': portfolio_info,
+                'job_matching_info': job_matching_info
+            }
+        if tool_name == 'competitiveness':
+            return {'resume_text': resume_text, 'job_info': job_info, 'comparison_context': "시장 평균 대비 경쟁력 분석"}
+        return {'resume_text': resume_text, 'job_info': job_info}
     
-    @redis_cache()
+    def _run_tool(self, tool_name: str, kwargs: Dict[str, Any]) -> Tuple[Any, float, Optional[Exception]]:
+        """툴 실행 후 (결과, 실제 실행 시간, 예외) 반환"""
+        print(f"📊 {tool_name} 분석 시작...")
+        tool_start = time.time()
+        try:
+            return self.tools[tool_name](**kwargs), time.time() - tool_start, None
+        except Exception as e:
+            return None, time.time() - tool_start, e
+    
+    def _run_tools_concurrently(self, tool_kwargs: Dict[str, Dict[str, Any]], results: Dict[str, Any]):
+        """활성화된 툴을 스레드 풀에서 동시에 실행하고 결과/오류/소요시간을 results에 기록
+
+        타임아웃은 제출 시점부터 계산하며, 시간을 넘긴 툴은 결과에서 제외합니다.
+        아직 풀에서 대기 중이던 툴은 취소해 다음 요청의 워커를 차지하지 않게 하고,
+        이미 실행 중인 툴만 백그라운드에서 마저 실행되도록 둡니다(완료되면 툴 자체 캐시에 저장됨).
+        """
+        submitted_at = time.time()
+        futures = {
+            tool_name: _tool_executor.submit(self._run_tool, tool_name, kwargs)
+            for tool_name, kwargs in tool_kwargs.items()
+        }
+        timings = results['metadata']['tool_timings']
+        
+        for tool_name, future in futures.items():
+            timeout = self.tool_timeouts.get(tool_name, 120)
+            try:
+                result, tool_time, error = future.result(timeout=max(0.0, submitted_at + timeout - time.time()))
+            except FutureTimeoutError:
+                timings[tool_name] = round(time.time() - submitted_at, 3)
+                results['metadata']['timed_out_tools'].append(tool_name)
+                error_msg = f"{tool_name} 분석 시간 초과 ({timeout:g}초)"
+                if future.cancel():
+                    error_msg += " - 실행 대기 중 취소됨"
+                results['errors'][tool_name] = error_msg
+                print(f"⏱️ {error_msg}")
+                continue
+            
+            timings[tool_name] = round(tool_time, 3)
+            if error is not None:
+                error_msg = f"{tool_name} 분석 오류: {str(error)}"
+                results['errors'][tool_name] = error_msg
+                print(f"❌ {error_msg}")
+            else:
+                results['results'][tool_name] = result
+                print(f"✅ {tool_name} 분석 완료 (소요시간: {tool_time:.2f}초)")
+    
+    @redis_cache(cache_if=_is_complete_analysis)
     def analyze_resume_complete(
         self,
         resume_text: str,
@@ -53,7 +151,7 @@ class ResumeOrchestrator:
             enable_tools: 활성화할 툴 목록 (None이면 모든 툴 실행)
             
         Returns:
-            통합된 분석 결과
+            통합된 분석 결과 (시간 초과/오류 툴은 errors에 기록된 부분 결과)
         """
         
         if enable_tools is None:
@@ -68,70 +166,33 @@ class ResumeOrchestrator:
                 'enabled_tools': enable_tools,
                 'application_id': application_id,
                 'jobpost_id': jobpost_id,
-                'company_id': company_id
+                'company_id': company_id,
+                'tool_timings': {},
+                'timed_out_tools': []
             },
             'results': {},
             'errors': {},
             'summary': {}
         }
         
-        # 각 툴을 독립적으로 실행
-        for tool_name in enable_tools:
+        tool_kwargs = {}
+        for tool_name in dict.fromkeys(enable_tools):
             if tool_name not in self.tools:
                 results['errors'][tool_name] = f"알 수 없는 툴: {tool_name}"
                 continue
-                
-            try:
-                print(f"📊 {tool_name} 분석 시작...")
-                tool_start = time.time()
-                
-                # 각 툴별로 적절한 파라미터 전달
-                if tool_name == 'highlight':
-                    result = self.tools[tool_name](
-                        resume_content=resume_text,
-                        jobpost_id=jobpost_id,
-                        company_id=company_id
-                    )
-                elif tool_name == 'comprehensive':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info,
-                        portfolio_info=portfolio_info,
-                        job_matching_info=job_matching_info
-                    )
-                elif tool_name == 'detailed':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info
-                    )
-                elif tool_name == 'competitiveness':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info,
-                        comparison_context="시장 평균 대비 경쟁력 분석"
-                    )
-                elif tool_name == 'impact_points':
-                    result = self.tools[tool_name](
-                        resume_text=resume_text,
-                        job_info=job_info
-                    )
-                else:
-                    result = self.tools[tool_name](resume_text, job_info)
-                
-                results['results'][tool_name] = result
-                tool_time = time.time() - tool_start
-                print(f"✅ {tool_name} 분석 완료 (소요시간: {tool_time:.2f}초)")
-                
-            except Exception as e:
-                error_msg = f"{tool_name} 분석 오류: {str(e)}"
-                results['errors'][tool_name] = error_msg
-                print(f"❌ {error_msg}")
+            tool_kwargs[tool_name] = self._build_tool_kwargs(
+                tool_name, resume_text, job_info, portfolio_info, job_matching_info, jobpost_id, company_id
+            )
+        
+        # 각 툴을 독립적으로 동시 실행
+        self._run_tools_concurrently(tool_kwargs, results)
         
         # 분석 요약 생성
         results['summary'] = self._generate_analysis_summary(results['results'])
         
         total_time = time.time() - start_time
         results['metadata']['total_processing_time'] = total_time
+        results['metadata']['partial'] = bool(results['errors'])
         print(f"🎯 이력서 종합 분석 완료 (총 소요시간: {total_time:.2f}초)")
         
         return results
@@ -25,6 +25,9 @@ class PlagiarismRequest(BaseModel):
     content: str
     resume_id: int
 
+class PlagiarismBatchRequest(BaseModel):
+    resumes: List[PlagiarismRequest]
+
 class GrowthPredictionRequest(BaseModel):
     resume_data: Dict[str, Any]
     job_description: str
@@ -72,13 +75,19 @@ class PassReasonToolRequest(BaseModel):
 
 @router.post("/analysis/plagiarism")
 async def check_plagiarism(req: PlagiarismRequest):
-    return plagiarism_service.check_plagiarism(req.content)
+    # 이미 등록된 자기 자신의 이력서는 표절 후보에서 제외
+    return plagiarism_service.check_plagiarism(req.content, exclude_resume_id=req.resume_id)
 
 @router.post("/analysis/plagiarism/add")
 async def add_resume_to_plagiarism_db(req: PlagiarismRequest):
     success = plagiarism_service.add_resume(req.resume_id, req.content)
     return {"success": success}
 
+@router.post("/analysis/plagiarism/add-batch")
+def add_resumes_to_plagiarism_db(req: PlagiarismBatchRequest):
+    """이력서 일괄 등록 (문단 임베딩은 배치로 요청하므로 스레드풀에서 실행)"""
+    return plagiarism_service.add_resumes([resume.model_dump() for resume in req.resumes])
+
 @router.get("/analysis/plagiarism/health")
 async def plagiarism_health_check():
     """표절 검사 서비스 상태 확인"""
@@ -88,7 +97,8 @@ async def plagiarism_health_check():
         return {
             "status": "healthy",
             "openai_api_valid": True,
-            "chromadb_connected": True
+            "chromadb_connected": True,
+            "indexed_resumes": len(plagiarism_service.index)
         }
     except Exception as e:
         return {
@@ -148,9 +158,9 @@ async def generate_written_test(req: WrittenTestGenRequest):
     return generate_written_test_questions({"jobpost": req.job_post})
 
 @router.post("/tools/written-test/grade")
-async def grade_written_test(req: WrittenTestGradeRequest):
-    """필기시험 답안 채점"""
-    return grade_written_test_answer(req.question, req.answer)
+def grade_written_test(req: WrittenTestGradeRequest):
+    """필기시험 답안 채점 (동기 LLM 호출이므로 스레드풀에서 실행되도록 def로 선언)"""
+    return grade_written_test_answer.invoke({"question": req.question, "answer": req.answer})
 
 @router.post("/tools/pass-reason")
 async def generate_pass_reason(req: PassReasonToolRequest):
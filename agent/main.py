@@ -1,8 +1,10 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import sys
 import os
 from datetime import datetime
+import asyncio
 
 # Python 경로에 현재 디렉토리 추가 (가장 먼저 실행)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -34,28 +36,30 @@ from fastapi import FastAPI, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
 import tempfile
 import os
-from .tools.speech_recognition_tool import SpeechRecognitionTool
 from .tools.realtime_interview_evaluation_tool import RealtimeInterviewEvaluationTool
 from .tools.answer_grading_tool import grade_written_test_answer
-from .services.pattern_analysis_service import PatternAnalysisService # 추가
+from .services.pattern_analysis_service import get_pattern_analysis_service # 추가
 
 # 화자 분리 및 비디오 자르기 관련
 import base64
 import tempfile
 import subprocess
 import whisper
-import librosa
 import numpy as np
 from typing import List, Dict, Any, Optional
 import soundfile as sf
-from pyannote.audio import Pipeline
 from pyannote.audio.pipelines.utils.hook import ProgressHook
+from .utils.model_registry import acquire_whisper_model, acquire_diarization_pipeline, model_registry
 
 # Python 경로에 현재 디렉토리 추가 (상단으로 이동됨)
 # sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 load_dotenv()
 
+# 공유 볼륨 경로 전달 설정
+# SHARED_TEMP_DIR: video-analysis와 함께 마운트한 공유 볼륨 경로 (경로 전달 요청은 이 아래 파일만 허용)
+SHARED_TEMP_DIR = os.path.realpath(os.getenv("SHARED_TEMP_DIR", "/tmp"))
+
 app = FastAPI(
     title="AI Agent API",
     description="AI Agent for KOCruit Project",
@@ -80,10 +84,13 @@ class HighlightResumeRequest(BaseModel):
     company_id: Optional[int] = None
 
 class SpeakerAnalysisRequest(BaseModel):
-    audio_data: str  # base64 encoded audio
-    video_data: str  # base64 encoded video
+    audio_data: Optional[str] = None  # base64 encoded audio
+    video_data: Optional[str] = None  # base64 encoded video
     audio_filename: str
     video_filename: str
+    # 공유 볼륨(shared_temp) 경로 전달 방식: 파일을 base64로 주고받지 않음
+    audio_path: Optional[str] = None
+    video_path: Optional[str] = None
 
 class WhisperAnalysisRequest(BaseModel):
     audio_path: str
@@ -105,7 +112,7 @@ app.include_router(analysis_router, prefix="/api/v2/agent", tags=["Analysis"])
 @app.get("/health")
 async def health_check():
     """서버 상태 확인 엔드포인트"""
-    return {"status": "healthy", "message": "Kocruit Agent API is running"}
+    return {"status": "healthy", "message": "Kocruit Agent API is running", "models": model_registry.stats()}
 
 @app.get("/")
 async def root():
@@ -115,6 +122,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "chat": "/chat/",
+            "chat_stream": "/chat/stream",
             "highlight_resume": "/highlight-resume",
             "extract_weights": "/extract-weights/",
             "evaluate_application": "/evaluate-application/",
@@ -132,37 +140,43 @@ class SpeakerAnalysisService:
     def __init__(self):
         self.whisper_model = None
         self.speaker_pipeline = None
+        self._whisper_lease = None
+        self._pipeline_lease = None
         self._initialize_models()
     
     def _initialize_models(self):
-        """AI 모델들 초기화"""
+        """AI 모델들 초기화 (프로세스 전역 레지스트리에서 공유 모델 획득)"""
         try:
             print("화자 분리 서비스 모델 초기화 시작...")
             
             # Whisper 모델 로드 (더 빠른 모델 사용)
-            self.whisper_model = whisper.load_model("tiny")  # base → tiny로 변경
+            self._whisper_lease = acquire_whisper_model("tiny")  # base → tiny로 변경
+            self.whisper_model = self._whisper_lease.model
             print("Whisper 모델 로드 완료 (tiny 모델)")
             
             # 화자 분리 파이프라인 초기화 (HuggingFace 토큰 지원)
             try:
-                auth_token = os.environ.get("HUGGINGFACE_TOKEN") or os.environ.get("HF_TOKEN")
-                if auth_token:
-                    self.speaker_pipeline = Pipeline.from_pretrained(
-                        "pyannote/speaker-diarization-3.1",
-                        use_auth_token=auth_token
-                    )
-                else:
-                    self.speaker_pipeline = Pipeline.from_pretrained(
-                        "pyannote/speaker-diarization-3.1"
-                    )
+                self._pipeline_lease = acquire_diarization_pipeline()
+                self.speaker_pipeline = self._pipeline_lease.model
                 print("화자 분리 파이프라인 초기화 완료")
             except Exception as e:
                 print(f"화자 분리 파이프라인 초기화 실패: {str(e)}")
+                self._pipeline_lease = None
                 self.speaker_pipeline = None
             
         except Exception as e:
             print(f"모델 초기화 오류: {str(e)}")
             raise
+
+    def _diarize(self, audio_path: str):
+        """공유 파이프라인 복제본을 독점해 화자 분리 수행"""
+        with self._pipeline_lease.use() as pipeline:
+            return pipeline(audio_path)
+
+    def _transcribe(self, audio, **options):
+        """공유 Whisper 모델 복제본을 독점해 음성 인식 수행 (동시 호출 시 스레드 안전)"""
+        with self._whisper_lease.use() as model:
+            return model.transcribe(audio, **options)
     
     def extract_applicant_audio(self, audio_path: str) -> List[Dict[str, float]]:
         """화자 분리를 통해 면접자 음성 세그먼트를 추출합니다."""
@@ -174,7 +188,7 @@ class SpeakerAnalysisService:
             print("화자 분리 시작...")
             
             # 화자 분리 실행
-            diarization = self.speaker_pipeline(audio_path)
+            diarization = self._diarize(audio_path)
             
             # 화자별 세그먼트 추출
             speaker_segments = {}
@@ -275,7 +289,7 @@ class SpeakerAnalysisService:
             print("질문별 비디오 세그먼트 분리 시작...")
             
             # Whisper로 음성 인식 및 타임스탬프 추출
-            result = self.whisper_model.transcribe(audio_path, word_timestamps=True)
+            result = self._transcribe(audio_path, word_timestamps=True)
             
             # 질문 키워드 감지 (면접관 질문 패턴)
             question_keywords = [
@@ -384,13 +398,20 @@ class SpeakerAnalysisService:
             print(f"비디오 길이 확인 오류: {str(e)}")
             return None
     
-    def analyze_audio_with_whisper(self, audio_path: str) -> Dict[str, Any]:
-        """Whisper로 음성을 분석합니다."""
+    def _load_audio(self, audio_path: str) -> np.ndarray:
+        """오디오 파일을 16kHz mono float32 버퍼로 한 번만 디코딩합니다."""
+        return whisper.load_audio(audio_path)
+
+    def analyze_audio_with_whisper(self, audio_path: str, audio: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Whisper로 음성을 분석합니다.
+
+        audio가 주어지면 파일을 다시 디코딩하지 않고 해당 16kHz float32 버퍼(슬라이스 뷰 포함)를 사용합니다.
+        """
         try:
             print(f"🎤 Whisper 분석 시작: {audio_path}")
             
             # 파일 존재 확인
-            if not os.path.exists(audio_path):
+            if audio is None and not os.path.exists(audio_path):
                 print(f"❌ 오디오 파일이 존재하지 않습니다: {audio_path}")
                 return {
                     "text": "",
@@ -401,26 +422,28 @@ class SpeakerAnalysisService:
                     "language": "ko"
                 }
             
+            # 한 번 디코딩한 버퍼로 인식과 길이 계산을 함께 처리
+            if audio is None:
+                audio = self._load_audio(audio_path)
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            
             # Whisper로 음성 인식
-            result = self.whisper_model.transcribe(audio_path, word_timestamps=True)
+            result = self._transcribe(audio, word_timestamps=True)
             transcription = result.get("text", "")
             segments = result.get("segments", [])
             language = result.get("language", "ko")
             
             print(f"✅ Whisper 분석 완료: {len(transcription)} 문자")
             
-            # 오디오 로드
-            audio, sr = librosa.load(audio_path, sr=16000)
-            
             # 발화 속도 계산
-            speech_rate = self._calculate_speech_rate(transcription, len(audio) / sr)
+            speech_rate = self._calculate_speech_rate(transcription, duration)
             
             return {
                 "text": transcription,  # 'text' 키 추가
                 "transcription": transcription,
                 "speech_rate": round(speech_rate, 3),
                 "segments_count": len(segments),
-                "duration": len(audio) / sr,
+                "duration": duration,
                 "language": language,
                 "segments": segments
             }
@@ -465,23 +488,16 @@ class SpeakerAnalysisService:
         blocks.append(current)
         return blocks
 
-    def _slice_audio(self, audio_path: str, start: float, end: float) -> Optional[str]:
-        """오디오에서 특정 구간을 파일로 저장하고 경로 반환"""
-        try:
-            if end - start <= 0.5:
-                return None
-            audio, sr = librosa.load(audio_path, sr=16000)
-            s_idx = int(max(0.0, start) * sr)
-            e_idx = int(min(len(audio) / sr, end) * sr)
-            if e_idx <= s_idx:
-                return None
-            chunk = audio[s_idx:e_idx]
-            out_path = tempfile.mktemp(suffix=f"_{int(start)}-{int(end)}s.wav")
-            sf.write(out_path, chunk, sr)
-            return out_path
-        except Exception as e:
-            print(f"오디오 슬라이스 오류: {str(e)}")
+    def _slice_audio(self, audio: np.ndarray, start: float, end: float) -> Optional[np.ndarray]:
+        """디코딩된 버퍼에서 특정 구간을 복사 없이 잘라 반환 (numpy view)"""
+        if end - start <= 0.5:
+            return None
+        sr = whisper.audio.SAMPLE_RATE
+        s_idx = int(max(0.0, start) * sr)
+        e_idx = int(min(len(audio) / sr, end) * sr)
+        if e_idx <= s_idx:
             return None
+        return audio[s_idx:e_idx]
 
     def build_qa_pairs_and_analyze_answers(self, audio_path: str, persist: bool = False, output_dir: Optional[str] = None, application_id: Optional[str] = None, max_workers: int = 2) -> Dict[str, Any]:
         """화자분리로 Q→A 페어를 만들고, 지원자 답변별 Whisper 분석 수행
@@ -491,7 +507,7 @@ class SpeakerAnalysisService:
         try:
             diar_segments: List[Dict[str, Any]] = []
             if self.speaker_pipeline:
-                diarization = self.speaker_pipeline(audio_path)
+                diarization = self._diarize(audio_path)
                 for turn, _, speaker in diarization.itertracks(yield_label=True):
                     diar_segments.append({
                         'start': float(turn.start),
@@ -503,8 +519,7 @@ class SpeakerAnalysisService:
                 # Fallback: pyannote 미초기화 시 간단 화자 감지 사용
                 print("화자 분리 파이프라인 없음 → fallback 화자 감지 시도")
                 try:
-                    speech_tool = SpeechRecognitionTool()
-                    diar = speech_tool.detect_speakers(audio_path)
+                    diar = speech_recognition_tool.detect_speakers(audio_path)
                     diar_segments = [
                         {
                             'start': float(s.get('start', 0.0)),
@@ -552,14 +567,17 @@ class SpeakerAnalysisService:
                             'answer': {'start': b['start'], 'end': b['end']}
                         })
 
+            # 전체 오디오를 한 번만 디코딩하고, 답변 구간은 버퍼의 view로 전달
+            audio = self._load_audio(audio_path)
+
             # 각 답변 구간에 대해 Whisper 분석 (병렬)
             analyzed: List[Dict[str, Any]] = []
             from concurrent.futures import ThreadPoolExecutor, as_completed
 
             def process_one(idx: int, pair: Dict[str, Any]) -> Dict[str, Any]:
                 answer = pair['answer']
-                ans_path = self._slice_audio(audio_path, answer['start'], answer['end'])
-                if not ans_path:
+                ans_audio = self._slice_audio(audio, answer['start'], answer['end'])
+                if ans_audio is None:
                     return {
                         'index': idx,
                         'question': pair['question'],
@@ -567,7 +585,7 @@ class SpeakerAnalysisService:
                         'analysis': {"text": "", "transcription": "", "duration": 0, "speech_rate": 0},
                         'answer_audio_path': None
                     }
-                analysis = self.analyze_audio_with_whisper(ans_path)
+                analysis = self.analyze_audio_with_whisper(audio_path, audio=ans_audio)
                 saved_path = None
                 if persist:
                     try:
@@ -576,8 +594,7 @@ class SpeakerAnalysisService:
                             base_dir = os.path.join(base_dir, str(application_id))
                         os.makedirs(base_dir, exist_ok=True)
                         saved_path = os.path.join(base_dir, f"answer_{idx:02d}_{int(answer['start'])}-{int(answer['end'])}s.wav")
-                        import shutil
-                        shutil.move(ans_path, saved_path)
+                        sf.write(saved_path, ans_audio, whisper.audio.SAMPLE_RATE)
                     except Exception as e:
                         print(f"답변 오디오 저장 오류: {str(e)}")
                         saved_path = None
@@ -586,7 +603,7 @@ class SpeakerAnalysisService:
                     'question': pair['question'],
                     'answer': answer,
                     'analysis': analysis,
-                    'answer_audio_path': saved_path or ans_path
+                    'answer_audio_path': saved_path
                 }
 
             max_workers = max(1, int(max_workers or 1))
@@ -760,26 +777,38 @@ async def run(request: Request):
         "resume_score": result.get("resume_score"),
     }
 
+CHATBOT_UNAVAILABLE_RESPONSE = "죄송합니다. 현재 챗봇 서비스가 설정 중입니다. 잠시 후 다시 시도해주세요."
+
+def _chat_response(session_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """챗봇 그래프 최종 상태 → API 응답"""
+    return {
+        "session_id": session_id,
+        "ai_response": result.get("ai_response", ""),
+        "context_used": result.get("context_used", ""),
+        "conversation_history_length": result.get("conversation_history_length", 0),
+        "page_suggestions": result.get("page_suggestions", []),  # 페이지별 제안사항
+        "dom_actions": result.get("dom_actions", []),  # DOM 조작 액션
+        "error": result.get("error", "")
+    }
+
+async def _parse_chat_request(request: Request):
+    data = await request.json()
+    # 세션 ID가 없으면 새로 생성
+    return data.get("message", ""), data.get("session_id") or create_session_id(), data.get("page_context", {})
+
 @app.post("/chat/")
 async def chat(request: Request):
     """챗봇 대화 API"""
-    data = await request.json()
-    user_message = data.get("message", "")
-    session_id = data.get("session_id", None)
-    page_context = data.get("page_context", {})  # 페이지 컨텍스트 추가
+    user_message, session_id, page_context = await _parse_chat_request(request)
     
     if not user_message:
         return {"error": "Message is required"}
     
-    # 세션 ID가 없으면 새로 생성
-    if not session_id:
-        session_id = create_session_id()
-    
     # chatbot_graph가 초기화되지 않은 경우 기본 응답
     if chatbot_graph is None:
         return {
             "session_id": session_id,
-            "ai_response": "죄송합니다. 현재 챗봇 서비스가 설정 중입니다. 잠시 후 다시 시도해주세요.",
+            "ai_response": CHATBOT_UNAVAILABLE_RESPONSE,
             "context_used": "",
             "conversation_history_length": 0,
             "page_suggestions": [],
@@ -790,18 +819,10 @@ async def chat(request: Request):
     # 챗봇 상태 초기화 (페이지 컨텍스트 포함)
     chat_state = initialize_chat_state(user_message, session_id, page_context)
     
-    # 챗봇 그래프 실행
+    # 챗봇 그래프 실행 (비동기 경로: LLM 대기 중 이벤트 루프를 막지 않음)
     try:
-        result = chatbot_graph.invoke(chat_state)
-        return {
-            "session_id": session_id,
-            "ai_response": result.get("ai_response", ""),
-            "context_used": result.get("context_used", ""),
-            "conversation_history_length": result.get("conversation_history_length", 0),
-            "page_suggestions": result.get("page_suggestions", []),  # 페이지별 제안사항
-            "dom_actions": result.get("dom_actions", []),  # DOM 조작 액션
-            "error": result.get("error", "")
-        }
+        result = await chatbot_graph.ainvoke(chat_state)
+        return _chat_response(session_id, result)
     except Exception as e:
         return {
             "session_id": session_id,
@@ -809,6 +830,53 @@ async def chat(request: Request):
             "ai_response": "죄송합니다. 오류가 발생했습니다."
         }
 
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/chat/stream")
+async def chat_stream(request: Request):
+    """챗봇 대화 스트리밍 API (Server-Sent Events)
+
+    이벤트 순서: session → token(생성되는 토큰마다) → done(/chat/ 와 같은 최종 응답) 또는 error
+    대화 기록은 응답이 끝까지 생성된 경우에만 저장됩니다.
+    """
+    user_message, session_id, page_context = await _parse_chat_request(request)
+    
+    if not user_message:
+        raise HTTPException(status_code=400, detail="Message is required")
+    
+    async def event_stream():
+        yield _sse("session", {"session_id": session_id})
+        if chatbot_graph is None:
+            yield _sse("token", {"content": CHATBOT_UNAVAILABLE_RESPONSE})
+            yield _sse("error", {"session_id": session_id, "error": "OpenAI API key not configured"})
+            return
+        
+        chat_state = initialize_chat_state(user_message, session_id, page_context)
+        result = None
+        try:
+            async for event in chatbot_graph.astream_events(chat_state, version="v2"):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if content:
+                        yield _sse("token", {"content": content})
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    # 최상위(그래프) 실행 종료 이벤트의 출력이 최종 상태
+                    result = event["data"].get("output")
+            if not isinstance(result, dict):
+                raise RuntimeError("챗봇 그래프 결과가 없습니다")
+            yield _sse("done", _chat_response(session_id, result))
+        except Exception as e:
+            print(f"Chatbot stream error: {e}")
+            yield _sse("error", {"session_id": session_id, "error": f"Chatbot error: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/chat/add-knowledge/")
 async def add_knowledge(request: Request):
     """지식 베이스에 문서 추가"""
@@ -1410,28 +1478,57 @@ async def ai_interview_evaluation_api(request: Request):
             "error": str(e)
         }
 
+def _resolve_shared_path(path: str) -> Optional[str]:
+    """공유 볼륨 아래의 실제 경로 (상대 경로/심볼릭 링크를 해석한 결과가 공유 볼륨 밖이면 None)"""
+    resolved = os.path.realpath(path)
+    if os.path.commonpath([resolved, SHARED_TEMP_DIR]) != SHARED_TEMP_DIR:
+        return None
+    return resolved
+
 @app.post("/speaker-analysis-and-trim")
 async def speaker_analysis_and_trim(request: SpeakerAnalysisRequest):
     """화자 분리 및 비디오 자르기 엔드포인트"""
     try:
         print("화자 분리 및 비디오 자르기 요청 시작...")
         
-        # base64 디코딩
-        audio_data = base64.b64decode(request.audio_data)
-        video_data = base64.b64decode(request.video_data)
-        
-        # 임시 파일 생성
-        temp_audio_path = tempfile.mktemp(suffix=".wav")
-        temp_video_path = tempfile.mktemp(suffix=".mp4")
+        # 경로 전달 방식: 호출자가 공유 볼륨에 둔 파일을 그대로 사용 (정리도 호출자 담당)
+        use_shared_paths = bool(request.audio_path and request.video_path)
+        if use_shared_paths:
+            resolved_paths = []
+            for path in (request.audio_path, request.video_path):
+                resolved = _resolve_shared_path(path)
+                if resolved is None:
+                    # 공유 볼륨 밖의 파일은 읽거나 자르지 않음 (호출자는 base64 전송으로 전환)
+                    return {
+                        "success": False,
+                        "message": f"공유 볼륨({SHARED_TEMP_DIR}) 밖의 경로는 사용할 수 없습니다: {path}",
+                        "error_code": "shared_path_outside_volume",
+                        "analysis": {}
+                    }
+                if not os.path.isfile(resolved):
+                    return {
+                        "success": False,
+                        "message": f"공유 경로에서 파일을 찾을 수 없습니다: {path}",
+                        "error_code": "shared_path_not_found",
+                        "analysis": {}
+                    }
+                resolved_paths.append(resolved)
+            temp_audio_path, temp_video_path = resolved_paths
+        else:
+            if not request.audio_data or not request.video_data:
+                raise HTTPException(status_code=400, detail="audio_data/video_data 또는 audio_path/video_path가 필요합니다")
+            temp_audio_path = tempfile.mktemp(suffix=".wav")
+            temp_video_path = tempfile.mktemp(suffix=".mp4")
         
         try:
-            # 파일 저장
-            with open(temp_audio_path, 'wb') as f:
-                f.write(audio_data)
-            with open(temp_video_path, 'wb') as f:
-                f.write(video_data)
-            
-            print(f"임시 파일 생성: {temp_audio_path}, {temp_video_path}")
+            if not use_shared_paths:
+                # base64 디코딩 후 파일 저장
+                with open(temp_audio_path, 'wb') as f:
+                    f.write(base64.b64decode(request.audio_data))
+                with open(temp_video_path, 'wb') as f:
+                    f.write(base64.b64decode(request.video_data))
+                
+                print(f"임시 파일 생성: {temp_audio_path}, {temp_video_path}")
             
             # 1단계: 화자 분리
             applicant_segments = speaker_analysis_service.extract_applicant_audio(temp_audio_path)
@@ -1468,20 +1565,27 @@ async def speaker_analysis_and_trim(request: SpeakerAnalysisRequest):
             )
             
             # 7단계: 결과 정리
+            is_trimmed = trimmed_video_path != temp_video_path and os.path.exists(trimmed_video_path)
             trimmed_video_base64 = None
-            if trimmed_video_path != temp_video_path and os.path.exists(trimmed_video_path):
+            shared_trimmed_video_path = None
+            if is_trimmed and use_shared_paths:
+                # 자른 비디오는 공유 볼륨에 남겨두고 경로만 전달 (정리는 호출자 담당)
+                shared_trimmed_video_path = trimmed_video_path
+            elif is_trimmed:
                 # 자른 비디오를 base64로 인코딩
                 with open(trimmed_video_path, 'rb') as f:
                     trimmed_video_data = f.read()
                 trimmed_video_base64 = base64.b64encode(trimmed_video_data).decode('utf-8')
+                os.remove(trimmed_video_path)
             
             analysis_result = {
                 "applicant_segments": applicant_segments,
                 "applicant_speech_duration": applicant_speech_duration,
                 "trimmed_video_base64": trimmed_video_base64,
-                "is_trimmed": trimmed_video_path != temp_video_path,
+                "trimmed_video_path": shared_trimmed_video_path,
+                "is_trimmed": is_trimmed,
                 "whisper_analysis": whisper_analysis,
-                "trimmed_filename": f"trimmed_{request.video_filename}" if trimmed_video_base64 else None,
+                "trimmed_filename": f"trimmed_{request.video_filename}" if is_trimmed else None,
                 "log_path": log_path,
                 "video_segments": video_segments,  # 질문별 세그먼트 정보
                 "original_duration": video_duration,
@@ -1497,16 +1601,19 @@ async def speaker_analysis_and_trim(request: SpeakerAnalysisRequest):
             }
             
         finally:
-            # 임시 파일 정리
+            # 임시 파일 정리 (경로 전달 방식의 입력 파일은 호출자가 정리)
             try:
-                if os.path.exists(temp_audio_path):
-                    os.remove(temp_audio_path)
-                if os.path.exists(temp_video_path):
-                    os.remove(temp_video_path)
-                print("임시 파일 정리 완료")
+                if not use_shared_paths:
+                    if os.path.exists(temp_audio_path):
+                        os.remove(temp_audio_path)
+                    if os.path.exists(temp_video_path):
+                        os.remove(temp_video_path)
+                    print("임시 파일 정리 완료")
             except Exception as e:
                 print(f"임시 파일 정리 오류: {str(e)}")
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"화자 분리 및 비디오 자르기 오류: {str(e)}")
         return {
@@ -1720,9 +1827,8 @@ async def evaluate_audio(
         tmp_path = tmp.name
 
     try:
-        # 2. 오디오→텍스트(STT)
-        speech_tool = SpeechRecognitionTool()
-        trans_result = speech_tool.transcribe_audio(tmp_path)
+        # 2. 오디오→텍스트(STT) - 공유 모델을 쓰는 전역 인스턴스 재사용
+        trans_result = speech_recognition_tool.transcribe_audio(tmp_path)
         trans_text = trans_result.get("text", "")
 
         # 3. 감정/태도 분석
@@ -1826,8 +1932,9 @@ async def analyze_high_performers(request: Request):
         method = data.get("method", "kmeans")
         n_clusters = data.get("n_clusters", 3)
         
-        service = PatternAnalysisService()
-        result = service.analyze_patterns(high_performers_data, method, n_clusters)
+        # 공유 서비스 사용 (임베딩 모델 1회 로드, 경력 텍스트 임베딩 캐시 재사용), CPU 작업은 스레드에서 실행
+        service = get_pattern_analysis_service()
+        result = await asyncio.to_thread(service.analyze_patterns, high_performers_data, method, n_clusters)
         
         # LLM 요약이 필요하다면 여기서 추가 호출 가능
         # from .agents.pattern_summary_node import create_pattern_summary_node
@@ -1,4 +1,8 @@
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 from sklearn.cluster import KMeans
@@ -19,10 +23,19 @@ from langchain_community.embeddings import HuggingFaceEmbeddings
 
 logger = logging.getLogger(__name__)
 
+# 경력 텍스트 임베딩 캐시 크기 (행 해시 기준, LRU)
+PATTERN_EMBEDDING_CACHE_SIZE = int(os.environ.get("PATTERN_EMBEDDING_CACHE_SIZE", 20000))
+
 class PatternAnalysisService:
-    """고성과자 패턴 분석 서비스 (Agent용)"""
+    """고성과자 패턴 분석 서비스 (Agent용)
+
+    경력 텍스트 임베딩은 텍스트 해시별로 캐시되어, 데이터가 일부만 바뀌면
+    바뀐 행만 다시 임베딩합니다 (서비스 인스턴스는 get_pattern_analysis_service()로 공유).
+    """
     
     def __init__(self):
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         # LangChain의 HuggingFaceEmbeddings 사용 (CPU 최적화)
         self.embedder = HuggingFaceEmbeddings(
             model_name="sentence-transformers/xlm-r-100langs-bert-base-nli-stsb-mean-tokens",
@@ -43,6 +56,29 @@ class PatternAnalysisService:
         if data.get('certifications'): parts.append(f"자격증: {data['certifications']}")
         return " ".join(parts)
 
+    def embed_career_texts(self, career_texts: List[str]) -> np.ndarray:
+        """경력 텍스트 임베딩 (캐시에 없는 텍스트만 한 번에 임베딩)"""
+        keys = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in career_texts]
+        with self._cache_lock:
+            vectors = {key: self._embedding_cache.get(key) for key in keys}
+        missing = {}
+        for key, text in zip(keys, career_texts):
+            if vectors[key] is None:
+                missing[key] = text
+        if missing:
+            computed = self.embedder.embed_documents(list(missing.values()))
+            with self._cache_lock:
+                for key, vector in zip(missing, computed):
+                    vectors[key] = self._embedding_cache[key] = np.asarray(vector, dtype=np.float32)
+                while len(self._embedding_cache) > PATTERN_EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+            logger.info(f"경력 텍스트 임베딩: 신규 {len(missing)}건, 캐시 재사용 {len(set(keys)) - len(missing)}건")
+        with self._cache_lock:
+            for key in keys:
+                if key in self._embedding_cache:
+                    self._embedding_cache.move_to_end(key)
+        return np.vstack([vectors[key] for key in keys])
+
     def analyze_patterns(self, high_performers_data: List[Dict[str, Any]], method: str = "kmeans", n_clusters: int = 3) -> Dict[str, Any]:
         try:
             if not high_performers_data:
@@ -50,8 +86,7 @@ class PatternAnalysisService:
 
             # 1. 텍스트 임베딩
             career_texts = [self.create_career_text(d) for d in high_performers_data]
-            embeddings = self.embedder.embed_documents(career_texts)
-            embeddings_np = np.array(embeddings)
+            embeddings_np = self.embed_career_texts(career_texts)
 
             # 2. 클러스터링
             if method == "kmeans":
@@ -142,3 +177,15 @@ class PatternAnalysisService:
             
         return stats
 
+
+_pattern_analysis_service = None
+_service_lock = threading.Lock()
+
+def get_pattern_analysis_service() -> PatternAnalysisService:
+    """프로세스 전역 패턴 분석 서비스 (임베딩 모델/캐시 공유)"""
+    global _pattern_analysis_service
+    if _pattern_analysis_service is None:
+        with _service_lock:
+            if _pattern_analysis_service is None:
+                _pattern_analysis_service = PatternAnalysisService()
+    return _pattern_analysis_service
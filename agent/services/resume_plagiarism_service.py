@@ -1,66 +1,187 @@
 import logging
-from typing import Dict, Any
+import os
+from typing import Dict, Any, List, Optional
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
+from agent.utils.minhash_lsh import MinHashLSHIndex
 
 logger = logging.getLogger(__name__)
 
+# 1단계(MinHash) 후보로 인정할 최소 추정 Jaccard, 2단계 임베딩 비교를 수행할 최대 후보 이력서 수
+CANDIDATE_MIN_JACCARD = float(os.environ.get("PLAGIARISM_CANDIDATE_JACCARD", 0.3))
+MAX_CANDIDATE_RESUMES = int(os.environ.get("PLAGIARISM_MAX_CANDIDATES", 20))
+
 class ResumePlagiarismService:
-    """이력서 표절 검사 서비스 (Agent 측 구현)"""
-    
+    """이력서 표절 검사 서비스 (Agent 측 구현)
+
+    1단계: 로컬 MinHash/LSH 인덱스로 복사된 문단 후보를 찾습니다 (네트워크 호출 없음).
+    2단계: 후보가 있을 때만 해당 문단의 임베딩을 비교해 유사도를 확정합니다.
+    """
+
     def __init__(self, chroma_persist_dir: str = "./chroma_db"):
         self.chroma_persist_dir = chroma_persist_dir
         self.embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        # 문단 단위 임베딩 (id: "{resume_id}:{문단 번호}")
         self.vectorstore = Chroma(
             persist_directory=chroma_persist_dir,
             embedding_function=self.embeddings,
-            collection_name="resume_plagiarism"
+            collection_name="resume_plagiarism_passages"
         )
-        logger.info("이력서 표절 검사 서비스 초기화 완료")
-    
+        self.index = MinHashLSHIndex(os.path.join(chroma_persist_dir, "plagiarism_minhash"))
+        logger.info(f"이력서 표절 검사 서비스 초기화 완료 (인덱스 이력서 {len(self.index)}건)")
+
+    @staticmethod
+    def _passage_id(resume_id, passage_index: int) -> str:
+        return f"{resume_id}:{passage_index}"
+
     def add_resume(self, resume_id: int, content: str):
-        """이력서 벡터 DB에 추가"""
+        """이력서를 MinHash 인덱스와 문단 임베딩 저장소에 추가 (같은 id는 교체)"""
+        return not self.add_resumes([{"resume_id": resume_id, "content": content}])["failed"]
+
+    def add_resumes(self, resumes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 이력서 일괄 추가
+
+        MinHash 인덱스에 한 번에 추가(샤드 로그도 일괄 기록)한 뒤, 전체 문단을 한 번의 add_texts로
+        임베딩/저장합니다 (OpenAIEmbeddings가 내부에서 배치 단위로 요청).
+        일괄 추가가 실패하면 이력서별로 다시 추가해 실패한 이력서만 골라냅니다.
+        문단 임베딩 저장 실패는 2단계에서 Jaccard 추정치로 대체되므로 추가 자체는 성공 처리합니다.
+        """
+        indexed: Dict[Any, List[str]] = {}
+        failed = []
+        try:
+            indexed = self.index.add_many([
+                (resume["resume_id"], resume.get("content") or "") for resume in resumes
+            ])
+        except Exception as e:
+            logger.warning(f"MinHash 일괄 추가 실패, 이력서별로 재시도: {e}")
+            for resume in resumes:
+                try:
+                    indexed[resume["resume_id"]] = self.index.add(resume["resume_id"], resume.get("content") or "")
+                except Exception as e:
+                    logger.error(f"이력서 추가 실패 (resume_id={resume.get('resume_id')}): {e}")
+                    failed.append(resume.get("resume_id"))
+
+        if indexed:
+            try:
+                existing = self.vectorstore.get(where={"resume_id": {"$in": list(indexed)}})
+                if existing.get("ids"):
+                    self.vectorstore.delete(ids=existing["ids"])
+                texts, metadatas, ids = [], [], []
+                for resume_id, passages in indexed.items():
+                    for i, passage in enumerate(passages):
+                        texts.append(passage)
+                        metadatas.append({"resume_id": resume_id, "passage_index": i, "source": "applicant"})
+                        ids.append(self._passage_id(resume_id, i))
+                if texts:
+                    self.vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+            except Exception as e:
+                logger.warning(f"문단 임베딩 저장 실패 ({len(indexed)}건): {e}")
+        return {"success": len(indexed), "failed": failed}
+
+    def remove_resume(self, resume_id: int) -> bool:
+        """인덱스와 임베딩 저장소에서 이력서 제거"""
         try:
-            # 메타데이터 준비
-            metadata = {"resume_id": resume_id, "source": "applicant"}
-            
-            # 텍스트가 너무 길면 분할 (간단히)
-            texts = [content] 
-            
-            self.vectorstore.add_texts(texts=texts, metadatas=[metadata])
-            return True
+            removed = self.index.remove(resume_id)
+            existing = self.vectorstore.get(where={"resume_id": resume_id})
+            if existing.get("ids"):
+                self.vectorstore.delete(ids=existing["ids"])
+            return removed
         except Exception as e:
-            logger.error(f"이력서 추가 실패: {e}")
+            logger.error(f"이력서 제거 실패: {e}")
             return False
 
-    def check_plagiarism(self, content: str, threshold: float = 0.8) -> Dict[str, Any]:
-        """표절 검사 수행"""
+    def _passage_similarities(self, passages: List[str], candidates: Dict[Any, List[Dict]]) -> Dict[tuple, float]:
+        """후보 문단 쌍의 임베딩 코사인 유사도 (질의 문단만 한 번에 임베딩, 저장된 문단 임베딩은 조회)"""
+        query_indices = sorted({m["query_index"] for matches in candidates.values() for m in matches})
+        stored_ids = sorted({
+            self._passage_id(resume_id, m["matched_index"])
+            for resume_id, matches in candidates.items() for m in matches
+        })
+        try:
+            query_vectors = dict(zip(
+                query_indices,
+                np.asarray(self.embeddings.embed_documents([passages[i] for i in query_indices]), dtype=np.float32)
+            ))
+            stored = self.vectorstore.get(ids=stored_ids, include=["embeddings"])
+            stored_vectors = {
+                passage_id: np.asarray(vector, dtype=np.float32)
+                for passage_id, vector in zip(stored["ids"], stored["embeddings"])
+            }
+        except Exception as e:
+            logger.warning(f"문단 임베딩 비교 실패, MinHash 추정치 사용: {e}")
+            return {}
+
+        similarities = {}
+        for resume_id, matches in candidates.items():
+            for m in matches:
+                query_vector = query_vectors.get(m["query_index"])
+                stored_vector = stored_vectors.get(self._passage_id(resume_id, m["matched_index"]))
+                if query_vector is None or stored_vector is None:
+                    continue
+                norm = np.linalg.norm(query_vector) * np.linalg.norm(stored_vector)
+                if norm:
+                    similarities[(resume_id, m["query_index"], m["matched_index"])] = float(
+                        np.dot(query_vector, stored_vector) / norm
+                    )
+        return similarities
+
+    def check_plagiarism(self, content: str, threshold: float = 0.8, exclude_resume_id: Optional[int] = None) -> Dict[str, Any]:
+        """표절 검사 수행 (겹치는 문단 목록 포함)"""
         try:
-            # 유사 문서 검색
-            results = self.vectorstore.similarity_search_with_score(content, k=3)
-            
-            plagiarism_detected = False
+            # 1단계: MinHash/LSH 근접 중복 문단 후보
+            passages, candidates = self.index.query(content, CANDIDATE_MIN_JACCARD, exclude=exclude_resume_id)
+            if not candidates:
+                return {
+                    "plagiarism_detected": False,
+                    "similar_resumes": [],
+                    "passage_count": len(passages),
+                    "candidates_checked": 0
+                }
+            candidates = dict(sorted(
+                candidates.items(),
+                key=lambda item: max(m["jaccard"] for m in item[1]),
+                reverse=True
+            )[:MAX_CANDIDATE_RESUMES])
+
+            # 2단계: 후보 문단만 임베딩 비교 (실패 시 Jaccard 추정치 사용)
+            similarities = self._passage_similarities(passages, candidates)
+            total_chars = sum(len(p) for p in passages) or 1
+
             similar_resumes = []
-            
-            for doc, score in results:
-                # ChromaDB score는 거리(distance) 기반일 수 있음 (낮을수록 유사)
-                # 코사인 유사도(similarity)라면 높을수록 유사
-                # 여기서는 라이브러리 버전에 따라 다르므로 일반적인 로직 적용
-                
-                similarity = 1.0 - score # 거리 -> 유사도 변환 가정
-                if similarity >= threshold:
-                    plagiarism_detected = True
-                    similar_resumes.append({
-                        "resume_id": doc.metadata.get("resume_id"),
-                        "similarity": similarity,
-                        "content_snippet": doc.page_content[:200] + "..."
+            for resume_id, matches in candidates.items():
+                stored_passages = self.index.get_passages(resume_id)
+                overlapping = []
+                for m in matches:
+                    similarity = similarities.get((resume_id, m["query_index"], m["matched_index"]), m["jaccard"])
+                    overlapping.append({
+                        "query_passage_index": m["query_index"],
+                        "matched_passage_index": m["matched_index"],
+                        "query_passage": passages[m["query_index"]],
+                        "matched_passage": stored_passages[m["matched_index"]] if m["matched_index"] < len(stored_passages) else "",
+                        "jaccard": m["jaccard"],
+                        "similarity": round(similarity, 4)
                     })
-            
+                overlapping.sort(key=lambda p: p["similarity"], reverse=True)
+                similarity = overlapping[0]["similarity"]
+                if similarity < threshold:
+                    continue
+                copied = {p["query_passage_index"] for p in overlapping if p["similarity"] >= threshold}
+                similar_resumes.append({
+                    "resume_id": resume_id,
+                    "similarity": similarity,
+                    "overlap_ratio": round(sum(len(passages[i]) for i in copied) / total_chars, 4),
+                    "content_snippet": overlapping[0]["matched_passage"][:200] + "...",
+                    "overlapping_passages": overlapping
+                })
+            similar_resumes.sort(key=lambda r: r["similarity"], reverse=True)
+
             return {
-                "plagiarism_detected": plagiarism_detected,
-                "similar_resumes": similar_resumes
+                "plagiarism_detected": bool(similar_resumes),
+                "similar_resumes": similar_resumes,
+                "passage_count": len(passages),
+                "candidates_checked": len(candidates)
             }
         except Exception as e:
             logger.error(f"표절 검사 실패: {e}")
             return {"error": str(e)}
-
@@ -7,6 +7,7 @@ from typing import Optional, Dict, Any, List
 import json
 import re
 from agent.utils.llm_cache import redis_cache
+from agent.utils.applicant_feature_cache import ApplicantFeatureCache, education_level
 
 # 데이터베이스 모델 import - 더 안전한 방식으로 수정
 try:
@@ -30,7 +31,7 @@ try:
     print(f"Current working directory: {os.getcwd()}")
     print(f"Python path: {sys.path[:5]}...")  # 처음 5개만 표시
     
-    from backend.app.models.v2.document.resume import Resume, Spec
+    from backend.app.models.v2.document.resume import Resume, Spec, ResumeDocument
     from backend.app.models.v2.document.application import Application
     from backend.app.models.v2.auth.user import User, ApplicantUser
     from backend.app.models.v2.recruitment.job import JobPost
@@ -42,7 +43,7 @@ except ImportError as e:
     print(f"Current working directory: {os.getcwd()}")
     # 직접 app 모듈에서 import 시도
     try:
-        from app.models.v2.document.resume import Resume, Spec
+        from app.models.v2.document.resume import Resume, Spec, ResumeDocument
         from app.models.v2.document.application import Application
         from app.models.v2.auth.user import User, ApplicantUser
         from app.models.v2.recruitment.job import JobPost
@@ -58,6 +59,7 @@ except ImportError as e:
         ApplicantUser = None
         JobPost = None
         Spec = None
+        ResumeDocument = None
         Session = None
         joinedload = None
         DATABASE_AVAILABLE = False
@@ -77,8 +79,129 @@ load_dotenv()
 
 llm = ChatOpenAI(model="gpt-4o-mini")
 
+# 이력서 항목 유형 → 개수 특징
+SPEC_COUNT_TYPES = {
+    "experience_count": ("experience", "career", "경력"),
+    "project_count": ("project", "projects", "프로젝트"),
+    "certificate_count": ("certificate", "certificates", "자격증"),
+    "skill_count": ("skill", "skills", "기술"),
+}
+
+def _extract_education(specs) -> tuple:
+    """학력 항목(스펙 dict 목록)에서 (학교, 전공, 학위 수준) 추출"""
+    education = "정보 없음"
+    major = "정보 없음"
+    degree_raw = ""
+    for s in specs:
+        if s["spec_type"] != "education":
+            continue
+        if s["spec_title"] == "institution" and education == "정보 없음" and s["spec_description"]:
+            education = s["spec_description"]
+        elif s["spec_title"] == "degree" and not degree_raw and s["spec_description"]:
+            degree_raw = s["spec_description"]
+            m = re.match(r"(.+?)\((.+?)\)", degree_raw)
+            major = m.group(1).strip() if m else degree_raw.strip()
+    return education, major, education_level(f"{degree_raw} {education}")
+
+def _load_applicant_fingerprints(db: Session, job_post_id: int) -> Dict[int, tuple]:
+    """공고 지원서별 변경 감지용 지문 (상태/점수/단계/이력서 수정 시각/이력서 문서 버전)"""
+    rows = (
+        db.query(
+            Application.id,
+            Application.overall_status,
+            Application.final_score,
+            Application.current_stage,
+            Application.resume_id,
+            Resume.updated_at,
+            ResumeDocument.version
+        )
+        .outerjoin(Resume, Resume.id == Application.resume_id)
+        .outerjoin(ResumeDocument, ResumeDocument.resume_id == Application.resume_id)
+        .filter(Application.job_post_id == job_post_id)
+        .all()
+    )
+    return {row[0]: tuple(str(value) for value in row[1:]) for row in rows}
+
+def _load_applicant_feature_rows(db: Session, job_post_id: int, application_ids: List[int]) -> List[Dict]:
+    """지원서 묶음의 특징 행 조회 (지원서/이력서 1회, 이력서 문서 1회 쿼리)"""
+    feature_rows = []
+    for start in range(0, len(application_ids), 500):
+        chunk = application_ids[start:start + 500]
+        results = (
+            db.query(Application.id, Application.overall_status, Application.final_score, User.name, Resume)
+            .join(User, User.id == Application.user_id)
+            .join(ApplicantUser, ApplicantUser.id == Application.user_id)
+            .join(Resume, Resume.id == Application.resume_id)
+            .filter(Application.id.in_(chunk))
+            .all()
+        )
+        resume_ids = {resume.id for *_, resume in results}
+        documents = {
+            document.resume_id: document
+            for document in db.query(ResumeDocument).filter(ResumeDocument.resume_id.in_(resume_ids)).all()
+        } if resume_ids else {}
+        # 이력서 문서가 아직 없는 이력서만 스펙 행 조회 (문서는 백엔드가 이력서/스펙 변경 시 갱신)
+        specs_by_resume: Dict[int, List] = {}
+        missing = resume_ids - set(documents)
+        if missing:
+            for spec in db.query(Spec).filter(Spec.resume_id.in_(missing)).order_by(Spec.id).all():
+                specs_by_resume.setdefault(spec.resume_id, []).append(spec)
+
+        for app_id, overall_status, final_score, name, resume in results:
+            try:
+                document = documents.get(resume.id)
+                if document:
+                    specs, resume_text = document.specs or [], document.resume_text or ""
+                else:
+                    spec_rows = specs_by_resume.get(resume.id, [])
+                    resume_text = combine_resume_and_specs(resume, spec_rows)
+                    specs = [
+                        {"spec_type": spec.spec_type, "spec_title": spec.spec_title, "spec_description": spec.spec_description}
+                        for spec in spec_rows
+                    ]
+                education, major, level = _extract_education(specs)
+                status = getattr(overall_status, "value", overall_status) or "서류 검토 중"
+                spec_types = [str(spec["spec_type"] or "").lower() for spec in specs]
+                feature_rows.append({
+                    "application_id": app_id,
+                    "education_level": level,
+                    **{
+                        feature: sum(1 for t in spec_types if t in types)
+                        for feature, types in SPEC_COUNT_TYPES.items()
+                    },
+                    "resume_length": len(resume_text),
+                    "score": float(final_score) if final_score is not None else None,
+                    "education": education,
+                    "major": major,
+                    "status": status,
+                    "profile": {
+                        "application_id": app_id,
+                        "name": name or f"지원자 {app_id}",
+                        "education": education,
+                        "major": major,
+                        "status": status,
+                        "summary": resume_text[:300] + "..." if len(resume_text) > 300 else resume_text
+                    }
+                })
+            except Exception as e:
+                print(f"개별 지원자 처리 오류 (application_id: {app_id}): {str(e)}")
+    return feature_rows
+
+# 공고별 전체 지원자 특징 배열 캐시 (지원서 변경 시 증분 갱신)
+applicant_feature_cache = ApplicantFeatureCache(_load_applicant_fingerprints, _load_applicant_feature_rows)
+
+def get_applicant_pool_comparison(job_post_id: int, application_id: int, db: Session, top_k: int = 5) -> Optional[Dict]:
+    """공고 전체 지원자 대비 순위/백분위 (지원자가 풀에 없거나 DB를 쓸 수 없으면 None)"""
+    if not db or not DATABASE_AVAILABLE or not job_post_id or not application_id:
+        return None
+    try:
+        return applicant_feature_cache.get(job_post_id, db).compare(application_id, top_k=top_k)
+    except Exception as e:
+        print(f"지원자 풀 비교 오류: {str(e)}")
+        return None
+
 def get_job_applicants_data(job_post_id: int, db: Session, current_application_id: Optional[int] = None, limit: int = 10) -> List[Dict]:
-    """해당 공고의 지원자 데이터를 가져오는 함수"""
+    """해당 공고의 지원자 데이터를 가져오는 함수 (종합 점수 상위 지원자 순)"""
     if not db or not DATABASE_AVAILABLE:
         print("⚠️  Database not available, returning mock data")
         return [
@@ -88,81 +211,47 @@ def get_job_applicants_data(job_post_id: int, db: Session, current_application_i
                 "education": "Mock 대학교",
                 "major": "Mock 전공",
                 "status": "서류 검토 중",
-                "resume_text": "Mock resume content for comparison analysis",
                 "summary": "Mock resume summary for testing purposes"
             }
         ]
     
     try:
-        # 해당 공고의 지원자들을 가져오기 (현재 지원자 제외)
-        query = (
-            db.query(Application)
-            .options(
-                joinedload(Application.user),
-                joinedload(Application.resume).joinedload(Resume.specs)
-            )
-            .filter(Application.job_post_id == job_post_id)
-        )
-        
-        # 현재 지원자 제외
-        if current_application_id:
-            query = query.filter(Application.id != current_application_id)
-        
-        applications = query.limit(limit).all()
-        
+        matrix = applicant_feature_cache.get(job_post_id, db)
+        order = matrix.composite_scores().argsort()[::-1]
         applicants_data = []
-        for app in applications:
-            try:
-                # ApplicantUser 확인
-                is_applicant = db.query(ApplicantUser).filter(ApplicantUser.id == app.user_id).first()
-                if not is_applicant or not app.user or not app.resume:
-                    continue
-                
-                # 이력서 텍스트 생성
-                resume_text = combine_resume_and_specs(app.resume, app.resume.specs)
-                
-                # 기본 정보 추출
-                education = "정보 없음"
-                major = "정보 없음"
-                
-                if app.resume.specs:
-                    # 학력 정보 추출
-                    edu_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "institution"]
-                    if edu_specs:
-                        education = edu_specs[0].spec_description
-                    
-                    # 전공 정보 추출
-                    degree_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "degree"]
-                    if degree_specs:
-                        degree_raw = degree_specs[0].spec_description or ""
-                        if degree_raw:
-                            import re
-                            m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                            if m:
-                                major = m.group(1).strip()
-                            else:
-                                major = degree_raw.strip()
-                
-                applicant_data = {
-                    "application_id": app.id,
-                    "name": app.user.name or f"지원자 {app.id}",
-                    "education": education,
-                    "major": major,
-                    "status": app.status or "서류 검토 중",
-                    "resume_text": resume_text,
-                    "summary": resume_text[:300] + "..." if len(resume_text) > 300 else resume_text
-                }
-                applicants_data.append(applicant_data)
-            except Exception as e:
-                print(f"개별 지원자 처리 오류 (application_id: {app.id}): {str(e)}")
+        for i in order:
+            app_id = int(matrix.application_ids[i])
+            if app_id == current_application_id:
                 continue
-        
+            applicants_data.append(matrix.profiles[app_id])
+            if len(applicants_data) >= limit:
+                break
         return applicants_data
         
     except Exception as e:
         print(f"지원자 데이터 조회 오류: {str(e)}")
         return []
 
+def format_pool_statistics(pool: Optional[Dict]) -> str:
+    """정량 비교 결과를 프롬프트용 텍스트로 변환"""
+    if not pool:
+        return "정량 비교 결과 없음 (다른 지원자 정보만 참고하여 추정)"
+    lines = [
+        f"- 비교 대상: 공고 전체 지원자 {pool['pool_size']}명",
+        f"- 종합 순위: {pool['overall_rank']}위 (상위 {pool['top_percent']}%), 경쟁력 등급 {pool['competitiveness_grade']}"
+    ]
+    for feature in pool["features"].values():
+        if feature["value"] is None:
+            continue
+        lines.append(
+            f"- {feature['label']}: {feature['value']} (상위 {feature['top_percent']}%, "
+            f"평균 {feature['pool_mean']}, 중앙값 {feature['pool_median']})"
+        )
+    for name, label in (("education", "학교"), ("major", "전공")):
+        item = pool["categorical"][name]
+        lines.append(f"- {label}: {item['value']} (같은 {label} 지원자 비율 {item['same_value_ratio'] * 100:.1f}%)")
+    return "\n".join(lines)
+
 def normalize_competitiveness_grade(grade_text):
     """경쟁력 등급을 단일 값으로 정규화"""
     if not grade_text or grade_text == 'N/A':
@@ -200,6 +289,12 @@ applicant_comparison_prompt = PromptTemplate.from_template(
     {job_info}
     ---
     
+    **공고 전체 지원자 대비 정량 비교 결과:**
+    ---
+    {pool_statistics}
+    ---
+    
+    정량 비교 결과가 있으면 순위와 등급은 그 결과를 그대로 사용하고, 강점/약점과 전략 등 서술형 분석에 집중하세요.
     위 정보를 바탕으로 현재 지원자가 같은 공고의 다른 지원자들과 비교했을 때의 경쟁력을 정확하고 상세하게 분석해 주세요.
     
     **중요**: 
@@ -329,7 +424,46 @@ market_competitiveness_prompt = PromptTemplate.from_template(
 applicant_comparison_chain = LLMChain(llm=llm, prompt=applicant_comparison_prompt)
 market_competitiveness_chain = LLMChain(llm=llm, prompt=market_competitiveness_prompt)
 
-@redis_cache()
+def _format_other_applicants(other_applicants: List[Dict]) -> str:
+    return "\n\n".join([
+        f"지원자 {i+1}: {applicant['name']}\n"
+        f"학력: {applicant['education']}\n"
+        f"전공: {applicant['major']}\n"
+        f"상태: {applicant['status']}\n"
+        f"이력서 요약: {applicant['summary']}\n"
+        for i, applicant in enumerate(other_applicants)
+    ])
+
+@redis_cache(cache_if=bool)
+def _generate_comparison_narrative(
+    current_resume_text: str,
+    other_applicants_text: str,
+    job_info: str,
+    total_applicants: int,
+    pool_statistics: str
+) -> Dict:
+    """서술형 비교 분석 (LLM). JSON 파싱 실패 시 빈 dict"""
+    result = applicant_comparison_chain.invoke({
+        "current_applicant_text": current_resume_text,
+        "other_applicants_text": other_applicants_text,
+        "job_info": job_info or "직무 정보가 없습니다.",
+        "total_applicants": total_applicants,
+        "pool_statistics": pool_statistics
+    })
+    text = result.get("text", "")
+    print(f"🤖 AI 응답 길이: {len(text)} chars")
+    json_match = re.search(r'\{.*\}', text, re.DOTALL)
+    if not json_match:
+        print("❌ JSON 블록을 찾을 수 없음")
+        print(f"Raw response: {text}")
+        return {}
+    try:
+        return json.loads(json_match.group())
+    except json.JSONDecodeError as je:
+        print(f"❌ JSON 파싱 오류: {je}")
+        print(f"Raw response: {text}")
+        return {}
+
 def generate_applicant_comparison_analysis(
     current_resume_text: str, 
     job_post_id: int,
@@ -338,124 +472,122 @@ def generate_applicant_comparison_analysis(
     db: Session = None,
     comparison_count: int = 5
 ):
-    """해당 공고 내 지원자들 간 비교 분석 생성"""
+    """해당 공고 내 지원자들 간 비교 분석 생성
+
+    순위/백분위/등급은 공고 전체 지원자 특징 배열에서 계산하고,
+    LLM에는 정량 결과와 상위 경쟁자 comparison_count명의 요약만 넘겨 서술형 분석을 받습니다.
+    """
     print(f"🔍 지원자 비교 분석 시작 - job_post_id: {job_post_id}, application_id: {application_id}")
     
     try:
-        # 다른 지원자들 데이터 가져오기
-        other_applicants = get_job_applicants_data(
-            job_post_id=job_post_id,
-            db=db,
-            current_application_id=application_id,
-            limit=comparison_count
-        )
+        pool = get_applicant_pool_comparison(job_post_id, application_id, db, top_k=comparison_count)
+        if pool:
+            other_applicants = pool["top_competitors"]
+            total_applicants = pool["pool_size"]
+        else:
+            other_applicants = get_job_applicants_data(
+                job_post_id=job_post_id,
+                db=db,
+                current_application_id=application_id,
+                limit=comparison_count
+            )
+            total_applicants = len(other_applicants) + 1
         
-        print(f"📊 찾은 다른 지원자 수: {len(other_applicants)}")
+        print(f"📊 비교 대상 지원자 수: {total_applicants - 1} (프롬프트 포함 {len(other_applicants)}명)")
         
         if not other_applicants:
             print("⚠️  다른 지원자가 없어 일반 시장 분석으로 대체")
             # 다른 지원자가 없으면 일반 시장 분석으로 대체
             return generate_competitiveness_comparison(current_resume_text, job_info, "해당 공고에 다른 지원자가 없어 일반 시장 기준으로 분석합니다.")
         
-        # 다른 지원자들 정보를 텍스트로 구성
-        other_applicants_text = "\n\n".join([
-            f"지원자 {i+1}: {applicant['name']}\n"
-            f"학력: {applicant['education']}\n"
-            f"전공: {applicant['major']}\n"
-            f"상태: {applicant['status']}\n"
-            f"이력서 요약: {applicant['summary']}\n"
-            for i, applicant in enumerate(other_applicants)
-        ])
-        
         print("🤖 AI 분석 시작...")
-        result = applicant_comparison_chain.invoke({
-            "current_applicant_text": current_resume_text,
-            "other_applicants_text": other_applicants_text,
-            "job_info": job_info or "직무 정보가 없습니다.",
-            "total_applicants": len(other_applicants) + 1
-        })
-        
-        # JSON 파싱
-        text = result.get("text", "")
-        print(f"🤖 AI 응답 길이: {len(text)} chars")
-        print(f"🤖 AI 응답 미리보기: {text[:200]}...")
-        
-        # JSON 블록 찾기
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            try:
-                analysis_data = json.loads(json_match.group())
-                print("✅ JSON 파싱 성공")
-                
-                # 경쟁력 등급 정규화
-                if "competition_analysis" in analysis_data and "competitiveness_grade" in analysis_data["competition_analysis"]:
-                    original_grade = analysis_data["competition_analysis"]["competitiveness_grade"]
-                    normalized_grade = normalize_competitiveness_grade(original_grade)
-                    analysis_data["competition_analysis"]["competitiveness_grade"] = normalized_grade
-                    print(f"등급 정규화: {original_grade} → {normalized_grade}")
-                
-                # 다른 지원자들의 간단한 정보 추가
-                if "other_applicants_summary" not in analysis_data:
-                    analysis_data["other_applicants_summary"] = [
-                        {
-                            "application_id": applicant['application_id'],
-                            "name": applicant['name'],
-                            "education": applicant['education'],
-                            "major": applicant['major'],
-                            "status": applicant['status'],
-                            "strengths": ["분석 필요"],
-                            "weaknesses": ["분석 필요"],
-                            "competitive_threat": "분석 필요"
-                        }
-                        for applicant in other_applicants
-                    ]
-                
-                return analysis_data
-            except json.JSONDecodeError as je:
-                print(f"❌ JSON 파싱 오류: {je}")
-                print(f"Raw response: {text}")
+        analysis_data = _generate_comparison_narrative(
+            current_resume_text,
+            _format_other_applicants(other_applicants),
+            job_info,
+            total_applicants,
+            format_pool_statistics(pool)
+        )
         
+        if analysis_data:
+            print("✅ JSON 파싱 성공")
+            # 경쟁력 등급 정규화
+            if "competition_analysis" in analysis_data and "competitiveness_grade" in analysis_data["competition_analysis"]:
+                original_grade = analysis_data["competition_analysis"]["competitiveness_grade"]
+                normalized_grade = normalize_competitiveness_grade(original_grade)
+                analysis_data["competition_analysis"]["competitiveness_grade"] = normalized_grade
+                print(f"등급 정규화: {original_grade} → {normalized_grade}")
         else:
-            print("❌ JSON 블록을 찾을 수 없음")
-            print(f"Raw response: {text}")
+            # 기본 응답
+            print("🔄 기본 응답 반환")
+            analysis_data = {
+                "competition_analysis": {
+                    "estimated_ranking": "분석 중",
+                    "rank_explanation": "AI 분석을 진행 중입니다",
+                    "total_applicants_analyzed": total_applicants,
+                    "competitiveness_grade": "B"
+                },
+                "comparative_strengths": ["AI 분석 진행 중"],
+                "comparative_weaknesses": ["AI 분석 진행 중"],
+                "differentiation_points": ["AI 분석 진행 중"],
+                "competitive_strategy": {
+                    "appeal_points": ["AI 분석 진행 중"],
+                    "positioning": "AI 분석 진행 중",
+                    "unique_value": "AI 분석 진행 중"
+                },
+                "interview_focus": ["AI 분석 진행 중"],
+                "hiring_probability": {
+                    "success_rate": "분석 중",
+                    "key_factors": ["AI 분석 진행 중"],
+                    "risk_factors": ["AI 분석 진행 중"]
+                },
+                "other_applicants_summary": [
+                    {
+                        "application_id": applicant['application_id'],
+                        "name": applicant['name'],
+                        "education": applicant['education'],
+                        "major": applicant['major'],
+                        "status": applicant['status'],
+                        "strengths": ["분석 진행 중"],
+                        "weaknesses": ["분석 진행 중"],
+                        "competitive_threat": "보통"
+                    }
+                    for applicant in other_applicants
+                ]
+            }
         
-        # 기본 응답 반환
-        print("🔄 기본 응답 반환")
-        return {
-            "competition_analysis": {
-                "estimated_ranking": "분석 중",
-                "rank_explanation": "AI 분석을 진행 중입니다",
-                "total_applicants_analyzed": len(other_applicants) + 1,
-                "competitiveness_grade": "B"
-            },
-            "comparative_strengths": ["AI 분석 진행 중"],
-            "comparative_weaknesses": ["AI 분석 진행 중"],
-            "differentiation_points": ["AI 분석 진행 중"],
-            "competitive_strategy": {
-                "appeal_points": ["AI 분석 진행 중"],
-                "positioning": "AI 분석 진행 중",
-                "unique_value": "AI 분석 진행 중"
-            },
-            "interview_focus": ["AI 분석 진행 중"],
-            "hiring_probability": {
-                "success_rate": "분석 중",
-                "key_factors": ["AI 분석 진행 중"],
-                "risk_factors": ["AI 분석 진행 중"]
-            },
-            "other_applicants_summary": [
+        # 다른 지원자들의 간단한 정보 추가
+        if "other_applicants_summary" not in analysis_data:
+            analysis_data["other_applicants_summary"] = [
                 {
                     "application_id": applicant['application_id'],
                     "name": applicant['name'],
                     "education": applicant['education'],
                     "major": applicant['major'],
                     "status": applicant['status'],
-                    "strengths": ["분석 진행 중"],
-                    "weaknesses": ["분석 진행 중"],
-                    "competitive_threat": "보통"
+                    "strengths": ["분석 필요"],
+                    "weaknesses": ["분석 필요"],
+                    "competitive_threat": "분석 필요"
                 }
                 for applicant in other_applicants
             ]
-        }
+        
+        # 순위/등급은 전체 지원자 기준 정량 결과로 확정
+        if pool:
+            competition = analysis_data.setdefault("competition_analysis", {})
+            explanation = competition.get("rank_explanation")
+            competition.update({
+                "estimated_ranking": f"상위 {pool['top_percent']}%",
+                "rank_explanation": f"공고 전체 지원자 {pool['pool_size']}명 중 종합 {pool['overall_rank']}위"
+                                    + (f" - {explanation}" if explanation else ""),
+                "total_applicants_analyzed": pool["pool_size"],
+                "competitiveness_grade": pool["competitiveness_grade"]
+            })
+            analysis_data["quantitative_comparison"] = {
+                key: value for key, value in pool.items() if key != "top_competitors"
+            }
+        
+        return analysis_data
         
     except Exception as e:
         print(f"❌ 지원자 비교 분석 오류: {str(e)}")
@@ -517,7 +649,8 @@ def generate_applicant_comparison_analysis_with_data(
             "current_applicant_text": current_resume_text,
             "other_applicants_text": other_applicants_text,
             "job_info": job_info or "직무 정보가 없습니다.",
-            "total_applicants": len(other_applicants) + 1
+            "total_applicants": len(other_applicants) + 1,
+            "pool_statistics": format_pool_statistics(None)
         })
         
         # JSON 파싱
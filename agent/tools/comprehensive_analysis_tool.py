@@ -24,7 +24,7 @@ except ImportError:
     Session = None
 
 # 공통 유틸리티 import
-from agent.utils.resume_utils import combine_resume_and_specs
+from agent.utils.resume_utils import get_resume_text
 
 load_dotenv()
 
@@ -367,8 +367,7 @@ def generate_comprehensive_analysis_from_db(resume_id: int, application_id: Opti
         if not resume:
             raise ValueError("이력서를 찾을 수 없습니다.")
         
-        specs = db.query(Spec).filter(Spec.resume_id == resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집 (application_id가 있는 경우)
         job_info = ""
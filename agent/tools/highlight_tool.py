@@ -1,11 +1,86 @@
 from typing import Dict, Any, Optional, List
-from agent.agents.highlight_workflow import process_highlight_workflow
+from agent.agents.highlight_workflow import aprocess_highlight_workflow, process_highlight_workflow
 from agent.utils.llm_cache import redis_cache
 import time
 
 # 임베딩 시스템 import 제거 (선택적 기능으로 변경)
 # from agents.highlight_embedding_system import HighlightEmbeddingSystem
 
+def _empty_highlight_result(e: Exception) -> Dict[str, Any]:
+    return {
+        "yellow": [],
+        "red": [],
+        "orange": [],
+        "purple": [],
+        "blue": [],
+        "highlights": [],
+        "metadata": {
+            "total_highlights": 0,
+            "quality_score": 0.0,
+            "color_distribution": {},
+            "issues": [f"하이라이팅 오류: {str(e)}"]
+        }
+    }
+
+def _empty_application_result(application_id: int, e: Exception) -> Dict[str, Any]:
+    return {
+        "yellow": [],
+        "red": [],
+        "orange": [],
+        "purple": [],
+        "blue": [],
+        "highlights": [],
+        "all_highlights": [],
+        "metadata": {
+            "error": str(e),
+            "application_id": application_id
+        }
+    }
+
+def _with_application_id(result: Dict[str, Any], application_id: int) -> Dict[str, Any]:
+    """application_id를 메타데이터에 추가"""
+    if "metadata" not in result:
+        result["metadata"] = {}
+    result["metadata"]["application_id"] = application_id
+    return result
+
+@redis_cache()
+async def ahighlight_resume_content(
+    resume_content: str,
+    jobpost_id: Optional[int] = None,
+    company_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    이력서 내용을 형광펜으로 하이라이팅하는 도구 (비동기, 이벤트 루프에서 호출)
+    
+    Args:
+        resume_content: 이력서 내용
+        jobpost_id: 채용공고 ID (선택사항)
+        company_id: 회사 ID (선택사항)
+        
+    Returns:
+        하이라이팅 결과 딕셔너리
+    """
+    try:
+        print(f"🔍 형광펜 하이라이팅 시작: {len(resume_content)} 문자")
+        start_time = time.time()
+        
+        # 워크플로우 실행
+        result = await aprocess_highlight_workflow(
+            resume_content=resume_content,
+            jobpost_id=jobpost_id,
+            company_id=company_id
+        )
+        
+        processing_time = time.time() - start_time
+        print(f"✅ 형광펜 하이라이팅 완료: {result.get('metadata', {}).get('total_highlights', 0)}개 하이라이트 (소요시간: {processing_time:.2f}초)")
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ 형광펜 하이라이팅 오류: {str(e)}")
+        return _empty_highlight_result(e)
+
 @redis_cache()
 def highlight_resume_content(
     resume_content: str,
@@ -13,7 +88,7 @@ def highlight_resume_content(
     company_id: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    이력서 내용을 형광펜으로 하이라이팅하는 도구
+    이력서 내용을 형광펜으로 하이라이팅하는 도구 (동기 호출용, 스레드 풀 등 동기 코드 전용)
     
     Args:
         resume_content: 이력서 내용
@@ -41,20 +116,32 @@ def highlight_resume_content(
         
     except Exception as e:
         print(f"❌ 형광펜 하이라이팅 오류: {str(e)}")
-        return {
-            "yellow": [],
-            "red": [],
-            "orange": [],
-            "purple": [],
-            "blue": [],
-            "highlights": [],
-            "metadata": {
-                "total_highlights": 0,
-                "quality_score": 0.0,
-                "color_distribution": {},
-                "issues": [f"하이라이팅 오류: {str(e)}"]
-            }
-        }
+        return _empty_highlight_result(e)
+
+@redis_cache()
+async def ahighlight_resume_by_application_id(
+    application_id: int,
+    resume_content: str,
+    jobpost_id: int = None,
+    company_id: int = None
+) -> Dict[str, Any]:
+    """application_id 기반 이력서 하이라이트 분석 (비동기, 이벤트 루프에서 호출)"""
+    try:
+        print(f"🔄 application_id {application_id} 기반 하이라이트 분석 시작...")
+        
+        # 워크플로우 실행
+        result = await aprocess_highlight_workflow(
+            resume_content=resume_content,
+            jobpost_id=jobpost_id,
+            company_id=company_id
+        )
+        
+        print(f"✅ application_id {application_id} 하이라이트 분석 완료")
+        return _with_application_id(result, application_id)
+        
+    except Exception as e:
+        print(f"❌ application_id {application_id} 하이라이트 분석 실패: {e}")
+        return _empty_application_result(application_id, e)
 
 @redis_cache()
 def highlight_resume_by_application_id(
@@ -63,7 +150,7 @@ def highlight_resume_by_application_id(
     jobpost_id: int = None,
     company_id: int = None
 ) -> Dict[str, Any]:
-    """application_id 기반 이력서 하이라이트 분석"""
+    """application_id 기반 이력서 하이라이트 분석 (동기 호출용)"""
     try:
         print(f"🔄 application_id {application_id} 기반 하이라이트 분석 시작...")
         
@@ -74,29 +161,12 @@ def highlight_resume_by_application_id(
             company_id=company_id
         )
         
-        # application_id를 메타데이터에 추가
-        if "metadata" not in result:
-            result["metadata"] = {}
-        result["metadata"]["application_id"] = application_id
-        
         print(f"✅ application_id {application_id} 하이라이트 분석 완료")
-        return result
+        return _with_application_id(result, application_id)
         
     except Exception as e:
         print(f"❌ application_id {application_id} 하이라이트 분석 실패: {e}")
-        return {
-            "yellow": [],
-            "red": [],
-            "orange": [],
-            "purple": [],
-            "blue": [],
-            "highlights": [],
-            "all_highlights": [],
-            "metadata": {
-                "error": str(e),
-                "application_id": application_id
-            }
-        }
+        return _empty_application_result(application_id, e)
 
 def get_highlight_statistics(highlights: Dict[str, Any]) -> Dict[str, Any]:
     """
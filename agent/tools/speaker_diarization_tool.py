@@ -1,6 +1,3 @@
-import torch
-import torchaudio
-from pyannote.audio import Pipeline
 from pyannote.audio.pipelines.utils.hook import ProgressHook
 import numpy as np
 from typing import Dict, List, Any, Optional
@@ -10,31 +7,24 @@ import json
 from datetime import datetime
 import logging
 
+from ..utils.model_registry import acquire_diarization_pipeline
+
 class SpeakerDiarizationTool:
     def __init__(self):
         """화자 분리 도구 초기화"""
         self.pipeline = None
+        self._pipeline_lease = None
         self.speaker_mapping = {}
         self.max_speakers = 6  # 면접관 3명 + 지원자 3명
         
     def initialize_pipeline(self, auth_token: str = None):
-        """pyannote.audio 파이프라인 초기화"""
+        """pyannote.audio 파이프라인 초기화 (프로세스 전역 레지스트리에서 공유 파이프라인 획득)"""
+        if self._pipeline_lease is not None:
+            return True
         try:
-            # HuggingFace 토큰이 있으면 사용, 없으면 로컬 모델 사용
-            if auth_token:
-                self.pipeline = Pipeline.from_pretrained(
-                    "pyannote/speaker-diarization-3.1",
-                    use_auth_token=auth_token
-                )
-            else:
-                # 로컬 모델 사용 (기본 설정)
-                self.pipeline = Pipeline.from_pretrained(
-                    "pyannote/speaker-diarization-3.1"
-                )
-            
-            # GPU 사용 가능시 GPU 사용
-            if torch.cuda.is_available():
-                self.pipeline = self.pipeline.to(torch.device("cuda"))
+            # HuggingFace 토큰이 있으면 사용, 없으면 환경 변수/로컬 설정 사용
+            self._pipeline_lease = acquire_diarization_pipeline(auth_token=auth_token).bind(self)
+            self.pipeline = self._pipeline_lease.model
                 
             logging.info("화자 분리 파이프라인 초기화 완료")
             return True
@@ -53,12 +43,12 @@ class SpeakerDiarizationTool:
             화자별 세그먼트 정보
         """
         try:
-            if not self.pipeline:
+            if not self._pipeline_lease:
                 return {"error": "파이프라인이 초기화되지 않았습니다", "success": False}
             
             # 화자 분리 수행
-            with ProgressHook() as hook:
-                diarization = self.pipeline(audio_file_path, hook=hook)
+            with self._pipeline_lease.use() as pipeline, ProgressHook() as hook:
+                diarization = pipeline(audio_file_path, hook=hook)
             
             # 결과 파싱
             segments = []
@@ -1,4 +1,3 @@
-import whisper
 import torch
 import torchaudio
 import librosa
@@ -11,11 +10,14 @@ import tempfile
 import json
 from datetime import datetime
 from .speaker_diarization_tool import SpeakerDiarizationTool
+from ..utils.model_registry import acquire_whisper_model
 
 class SpeechRecognitionTool:
     def __init__(self):
         """도구 초기화"""
-        self.model = whisper.load_model("base")
+        # 프로세스 전역 레지스트리의 공유 모델 사용 (요청마다 다시 로드하지 않음)
+        self._model_lease = acquire_whisper_model("base").bind(self)
+        self.model = self._model_lease.model
         self.sample_rate = 16000
         self.speaker_diarization = SpeakerDiarizationTool()
         # pyannote.audio 파이프라인 초기화 (HuggingFace 토큰이 있으면 사용)
@@ -37,7 +39,8 @@ class SpeechRecognitionTool:
             audio.export(temp_wav.name, format="wav")
             
             # Whisper로 음성 인식
-            result = self.model.transcribe(temp_wav.name)
+            with self._model_lease.use() as model:
+                result = model.transcribe(temp_wav.name)
             
             # 임시 파일 삭제
             os.unlink(temp_wav.name)
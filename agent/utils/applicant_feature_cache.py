@@ -0,0 +1,261 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 지원자 특징 캐시 설정
+# APPLICANT_FEATURE_REFRESH_SECONDS: 공고별 변경 확인(지문 조회) 최소 간격(초)
+# APPLICANT_FEATURE_MAX_JOB_POSTS: 메모리에 유지할 공고 수 (LRU)
+REFRESH_SECONDS = float(os.environ.get("APPLICANT_FEATURE_REFRESH_SECONDS", 30))
+MAX_JOB_POSTS = int(os.environ.get("APPLICANT_FEATURE_MAX_JOB_POSTS", 64))
+
+# 수치 특징과 종합 점수 가중치
+NUMERIC_FEATURES = (
+    "education_level",
+    "experience_count",
+    "project_count",
+    "certificate_count",
+    "skill_count",
+    "resume_length",
+    "score",
+)
+FEATURE_WEIGHTS = np.array([1.0, 1.5, 1.2, 0.8, 0.8, 0.3, 1.5], dtype=np.float32)
+FEATURE_LABELS = {
+    "education_level": "학력 수준",
+    "experience_count": "경력 항목 수",
+    "project_count": "프로젝트 수",
+    "certificate_count": "자격증 수",
+    "skill_count": "기술 스택 수",
+    "resume_length": "이력서 분량",
+    "score": "평가 점수",
+}
+CATEGORICAL_FEATURES = ("education", "major", "status")
+
+# 학력 문자열 → 서열 (높을수록 상위 학위)
+EDUCATION_LEVELS = (("박사", 5), ("석사", 4), ("전문학사", 2), ("전문대", 2), ("학사", 3), ("대학교", 3), ("고등학교", 1))
+
+
+def education_level(text: str) -> float:
+    """학력 관련 문자열에서 학위 서열 추출 (알 수 없으면 NaN)"""
+    for keyword, level in EDUCATION_LEVELS:
+        if keyword in (text or ""):
+            return float(level)
+    return float("nan")
+
+
+def grade_from_top_percent(top_percent: float) -> str:
+    """상위 % → 경쟁력 등급 (비교 프롬프트의 등급 기준과 동일)"""
+    if top_percent <= 5:
+        return "A+"
+    if top_percent <= 10:
+        return "A"
+    if top_percent <= 20:
+        return "B+"
+    if top_percent <= 40:
+        return "B"
+    return "C"
+
+
+class ApplicantFeatureMatrix:
+    """공고 하나의 전체 지원자 특징 배열
+
+    numeric: (지원자 수, 수치 특징 수) float32, 값이 없으면 NaN
+    categorical: (지원자 수, 범주 특징 수) int32 코드 (labels[j][code]가 원래 값)
+    profiles: 서술형 비교(LLM)에 넘길 지원자 요약
+    """
+
+    def __init__(self, job_post_id: int):
+        self.job_post_id = job_post_id
+        self.application_ids = np.empty(0, dtype=np.int64)
+        self.numeric = np.empty((0, len(NUMERIC_FEATURES)), dtype=np.float32)
+        self.categorical = np.empty((0, len(CATEGORICAL_FEATURES)), dtype=np.int32)
+        self.labels: List[List[str]] = [[] for _ in CATEGORICAL_FEATURES]
+        self._codes: List[Dict[str, int]] = [{} for _ in CATEGORICAL_FEATURES]
+        self.profiles: Dict[int, Dict[str, Any]] = {}
+        self.fingerprints: Dict[int, Tuple] = {}
+        self.refreshed_at = 0.0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.application_ids)
+
+    def _code(self, column: int, value) -> int:
+        value = str(value) if value not in (None, "") else "정보 없음"
+        codes = self._codes[column]
+        if value not in codes:
+            codes[value] = len(self.labels[column])
+            self.labels[column].append(value)
+        return codes[value]
+
+    def apply(self, rows: List[Dict[str, Any]], removed_ids: Iterable[int] = ()):
+        """변경/추가된 지원자 행 반영 및 삭제된 지원자 제거"""
+        replaced = set(removed_ids) | {row["application_id"] for row in rows}
+        if replaced and len(self.application_ids):
+            keep = ~np.isin(self.application_ids, list(replaced))
+            self.application_ids = self.application_ids[keep]
+            self.numeric = self.numeric[keep]
+            self.categorical = self.categorical[keep]
+        for application_id in replaced:
+            self.profiles.pop(application_id, None)
+        if not rows:
+            return
+
+        self.application_ids = np.concatenate([
+            self.application_ids, np.array([row["application_id"] for row in rows], dtype=np.int64)
+        ])
+        self.numeric = np.vstack([self.numeric, np.array([
+            [row.get(name, np.nan) if row.get(name) is not None else np.nan for name in NUMERIC_FEATURES]
+            for row in rows
+        ], dtype=np.float32)])
+        self.categorical = np.vstack([self.categorical, np.array([
+            [self._code(j, row.get(name)) for j, name in enumerate(CATEGORICAL_FEATURES)]
+            for row in rows
+        ], dtype=np.int32)])
+        for row in rows:
+            self.profiles[row["application_id"]] = row.get("profile", {})
+
+    def composite_scores(self) -> np.ndarray:
+        """특징별 z-score의 가중 평균 (값이 없는 특징은 평균값으로 취급)"""
+        if not len(self):
+            return np.empty(0, dtype=np.float32)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nanmean(self.numeric, axis=0)
+            std = np.nanstd(self.numeric, axis=0)
+            z = (self.numeric - mean) / np.where(std > 0, std, 1.0)
+        z = np.nan_to_num(z, nan=0.0)
+        return z @ FEATURE_WEIGHTS / FEATURE_WEIGHTS.sum()
+
+    def compare(self, application_id: int, top_k: int = 5) -> Optional[Dict[str, Any]]:
+        """지원자 한 명을 공고 전체 지원자와 비교 (순위/백분위는 전체 풀에서 벡터 연산)"""
+        rows = np.flatnonzero(self.application_ids == application_id)
+        if not rows.size:
+            return None
+        index = int(rows[0])
+        pool_size = len(self)
+
+        composite = self.composite_scores()
+        overall_rank = int(np.sum(composite > composite[index])) + 1
+        top_percent = round(overall_rank / pool_size * 100, 1)
+
+        features = {}
+        for j, name in enumerate(NUMERIC_FEATURES):
+            column = self.numeric[:, j]
+            value = column[index]
+            valid = column[~np.isnan(column)]
+            if np.isnan(value) or not valid.size:
+                features[name] = {"label": FEATURE_LABELS[name], "value": None, "applicants_with_value": int(valid.size)}
+                continue
+            rank = int(np.sum(valid > value)) + 1
+            features[name] = {
+                "label": FEATURE_LABELS[name],
+                "value": round(float(value), 2),
+                "rank": rank,
+                "top_percent": round(rank / valid.size * 100, 1),
+                "percentile": round(float(np.mean(valid <= value)) * 100, 1),
+                "pool_mean": round(float(valid.mean()), 2),
+                "pool_median": round(float(np.median(valid)), 2),
+                "applicants_with_value": int(valid.size)
+            }
+
+        categorical = {}
+        for j, name in enumerate(CATEGORICAL_FEATURES):
+            code = self.categorical[index, j]
+            counts = np.bincount(self.categorical[:, j], minlength=len(self.labels[j]))
+            categorical[name] = {
+                "value": self.labels[j][code],
+                "same_value_ratio": round(float(counts[code]) / pool_size, 3),
+                "top_values": [
+                    {"value": self.labels[j][c], "count": int(counts[c])}
+                    for c in np.argsort(-counts)[:3] if counts[c]
+                ]
+            }
+
+        order = np.argsort(-composite, kind="stable")
+        competitors = []
+        for i in order:
+            if i == index:
+                continue
+            peer_id = int(self.application_ids[i])
+            competitors.append({
+                **self.profiles.get(peer_id, {}),
+                "application_id": peer_id,
+                "overall_rank": int(np.sum(composite > composite[i])) + 1
+            })
+            if len(competitors) >= top_k:
+                break
+
+        return {
+            "pool_size": pool_size,
+            "overall_rank": overall_rank,
+            "top_percent": top_percent,
+            "competitiveness_grade": grade_from_top_percent(top_percent),
+            "features": features,
+            "categorical": categorical,
+            "top_competitors": competitors
+        }
+
+
+class ApplicantFeatureCache:
+    """공고별 지원자 특징 배열 캐시 (프로세스 전역)
+
+    refresh 간격마다 지원서 지문(상태/점수/이력서 수정 시각 등)만 조회해
+    바뀐 지원서의 특징만 다시 불러오고, 사라진 지원서는 제거합니다.
+
+    Args:
+        fingerprint_loader: (db, job_post_id) -> {application_id: 지문 튜플}
+        row_loader: (db, job_post_id, application_ids) -> 특징 행 목록
+    """
+
+    def __init__(
+        self,
+        fingerprint_loader: Callable[[Any, int], Dict[int, Tuple]],
+        row_loader: Callable[[Any, int, List[int]], List[Dict[str, Any]]],
+        refresh_seconds: float = REFRESH_SECONDS,
+        max_job_posts: int = MAX_JOB_POSTS
+    ):
+        self.fingerprint_loader = fingerprint_loader
+        self.row_loader = row_loader
+        self.refresh_seconds = refresh_seconds
+        self.max_job_posts = max_job_posts
+        self._matrices: "OrderedDict[int, ApplicantFeatureMatrix]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_post_id: int, db) -> ApplicantFeatureMatrix:
+        """공고의 특징 배열 반환 (refresh 간격이 지났으면 증분 갱신)"""
+        with self._lock:
+            matrix = self._matrices.get(job_post_id)
+            if matrix is None:
+                matrix = ApplicantFeatureMatrix(job_post_id)
+                self._matrices[job_post_id] = matrix
+            self._matrices.move_to_end(job_post_id)
+            while len(self._matrices) > self.max_job_posts:
+                self._matrices.popitem(last=False)
+
+        with matrix.lock:
+            if time.monotonic() - matrix.refreshed_at >= self.refresh_seconds:
+                self._refresh(matrix, db)
+        return matrix
+
+    def invalidate(self, job_post_id: Optional[int] = None):
+        """다음 조회 시 변경 확인을 강제 (job_post_id가 없으면 전체)"""
+        with self._lock:
+            targets = [self._matrices.get(job_post_id)] if job_post_id is not None else list(self._matrices.values())
+        for matrix in targets:
+            if matrix is not None:
+                matrix.refreshed_at = 0.0
+
+    def _refresh(self, matrix: ApplicantFeatureMatrix, db):
+        fingerprints = self.fingerprint_loader(db, matrix.job_post_id)
+        changed = [app_id for app_id, fp in fingerprints.items() if matrix.fingerprints.get(app_id) != fp]
+        removed = set(matrix.fingerprints) - set(fingerprints)
+        rows = self.row_loader(db, matrix.job_post_id, changed) if changed else []
+        # 지원자 계정이 아니거나 이력서가 없어 행이 없는 지원서는 비교 대상에서 제외
+        loaded = {row["application_id"] for row in rows}
+        matrix.apply(rows, removed | (set(changed) - loaded))
+        matrix.fingerprints = fingerprints
+        matrix.refreshed_at = time.monotonic()
+        if changed or removed:
+            print(f"지원자 특징 캐시 갱신: 공고 {matrix.job_post_id} (변경 {len(changed)}, 삭제 {len(removed)}, 전체 {len(matrix)})")
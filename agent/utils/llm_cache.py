@@ -1,12 +1,16 @@
 import redis
 import json
 import hashlib
+import copy
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from functools import wraps
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 import asyncio
 import os
-from aiocache import cached
-from aiocache.backends.redis import RedisCache
 
 # Redis 연결 설정 (원래 설정으로 복원)
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
@@ -23,55 +27,190 @@ except Exception as e:
     print(f"Redis connection failed: {e}")
     redis_client = None
 
-def redis_cache(expire=60*60*24):
+class LocalTTLCache:
+    """프로세스 내 LRU + TTL 캐시 (Redis 앞단 1차 캐시)"""
+
+    def __init__(self, maxsize: int = 512, ttl: int = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return True, copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expires_at = time.monotonic() + min(ttl or self.ttl, self.ttl)
+        with self._lock:
+            self._data[key] = (expires_at, copy.deepcopy(value))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalTTLCache(
+    maxsize=int(os.environ.get("LLM_CACHE_LOCAL_MAXSIZE", 512)),
+    ttl=int(os.environ.get("LLM_CACHE_LOCAL_TTL", 300))
+)
+
+# 동일 키로 진행 중인 호출 (요청 병합용)
+_inflight_lock = threading.Lock()
+_inflight_sync: Dict[str, Future] = {}
+_inflight_async: Dict[Tuple[int, str], "asyncio.Future"] = {}
+
+
+def _make_cache_key(func, args, kwargs) -> str:
+    """입력 파라미터로 캐시 키 생성 (함수명+파라미터 해시)"""
+    try:
+        key_raw = f"{func.__name__}:{json.dumps(args, sort_keys=True, default=str)}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+    except Exception:
+        key_raw = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+    return "llm:" + hashlib.sha256(key_raw.encode()).hexdigest()
+
+
+def _redis_get(cache_key: str) -> Tuple[bool, Any]:
+    """Redis에서 값 조회 (연결 없음/오류 시 miss)"""
+    if redis_client is None:
+        return False, None
+    try:
+        cached = redis_client.get(cache_key)
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        return False, None
+    if cached is None:
+        return False, None
+    if isinstance(cached, bytes):
+        try:
+            return True, json.loads(cached.decode('utf-8'))
+        except Exception:
+            return True, cached.decode('utf-8')
+    return True, cached
+
+
+def _redis_set(cache_key: str, result: Any, expire: int):
+    """Redis에 값 저장 (실패 시 무시)"""
+    if redis_client is None:
+        return
+    try:
+        if isinstance(result, (dict, list)):
+            redis_client.set(cache_key, json.dumps(result), ex=expire)
+        else:
+            redis_client.set(cache_key, result, ex=expire)
+    except Exception as e:
+        print(f"Redis set error: {e}")
+
+
+def redis_cache(expire=60*60*24, cache_if=None):
     """
-    LLM 함수 결과를 Redis에 캐싱하는 데코레이터.
+    LLM 함수 결과를 2단계(프로세스 내 LRU → Redis)로 캐싱하는 데코레이터.
     - 입력값(파라미터) 조합으로 캐시 키 생성
-    - 캐시 hit 시 바로 반환, miss 시 함수 실행 후 set
-    - expire: 만료(초), 기본 24시간
-    - Redis 연결 실패 시 캐싱 없이 함수 실행
+    - 로컬 캐시 hit 시 네트워크 없이 반환, Redis hit 시 로컬 캐시에도 저장
+    - 동일 키의 동시 호출은 하나의 실행 결과를 공유 (요청 병합)
+    - 동기/비동기 함수 모두 지원
+    - expire: Redis 만료(초), 기본 24시간 (로컬 캐시는 LLM_CACHE_LOCAL_TTL 이하)
+    - Redis 연결 실패 시 로컬 캐시만 사용
+    - cache_if: 결과를 받아 캐시 저장 여부를 판단하는 함수 (예: 부분 결과는 저장하지 않음)
     """
+    def cacheable(result: Any) -> bool:
+        return result is not None and (cache_if is None or cache_if(result))
+
+    def lookup(cache_key: str) -> Tuple[bool, Any]:
+        hit, value = local_cache.get(cache_key)
+        if hit:
+            return True, value
+        hit, value = _redis_get(cache_key)
+        if hit:
+            local_cache.set(cache_key, value, expire)
+        return hit, value
+
+    def store(cache_key: str, result: Any):
+        if not cacheable(result):
+            return
+        local_cache.set(cache_key, result, expire)
+        _redis_set(cache_key, result, expire)
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = _make_cache_key(func, args, kwargs)
+                hit, value = local_cache.get(cache_key)
+                if hit:
+                    return value
+
+                loop = asyncio.get_running_loop()
+                inflight_key = (id(loop), cache_key)
+                pending = _inflight_async.get(inflight_key)
+                if pending is not None:
+                    return copy.deepcopy(await asyncio.shield(pending))
+
+                pending = loop.create_future()
+                _inflight_async[inflight_key] = pending
+                try:
+                    # Redis 조회는 블로킹이므로 스레드에서 실행
+                    hit, value = await asyncio.to_thread(_redis_get, cache_key)
+                    if hit:
+                        local_cache.set(cache_key, value, expire)
+                        result = value
+                    else:
+                        result = await func(*args, **kwargs)
+                        if cacheable(result):
+                            local_cache.set(cache_key, result, expire)
+                            await asyncio.to_thread(_redis_set, cache_key, result, expire)
+                    pending.set_result(result)
+                    return result
+                except BaseException as e:
+                    pending.set_exception(e)
+                    # 대기자가 없을 때 "exception never retrieved" 경고 방지
+                    pending.exception()
+                    raise
+                finally:
+                    _inflight_async.pop(inflight_key, None)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Redis가 연결되지 않은 경우 캐싱 없이 함수 실행
-            if redis_client is None:
-                return func(*args, **kwargs)
-            
-            # 입력 파라미터로 캐시 키 생성 (함수명+파라미터 해시)
-            try:
-                key_raw = f"{func.__name__}:{json.dumps(args, sort_keys=True, default=str)}:{json.dumps(kwargs, sort_keys=True, default=str)}"
-            except Exception:
-                key_raw = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            cache_key = "llm:" + hashlib.sha256(key_raw.encode()).hexdigest()
-            
-            try:
-                cached = redis_client.get(cache_key)
-                if cached is not None:
-                    if isinstance(cached, bytes):
-                        try:
-                            return json.loads(cached.decode('utf-8'))
-                        except Exception:
-                            return cached.decode('utf-8')
-                    else:
-                        return cached
-            except Exception as e:
-                print(f"Redis get error: {e}")
-                # Redis 오류 시 캐싱 없이 함수 실행
-                pass
-            
-            result = func(*args, **kwargs)
-            
+            cache_key = _make_cache_key(func, args, kwargs)
+            hit, value = local_cache.get(cache_key)
+            if hit:
+                return value
+
+            with _inflight_lock:
+                pending = _inflight_sync.get(cache_key)
+                owner = pending is None
+                if owner:
+                    pending = Future()
+                    _inflight_sync[cache_key] = pending
+            if not owner:
+                return copy.deepcopy(pending.result())
+
             try:
-                if isinstance(result, (dict, list)):
-                    redis_client.set(cache_key, json.dumps(result), ex=expire)
-                else:
-                    redis_client.set(cache_key, result, ex=expire)
-            except Exception as e:
-                print(f"Redis set error: {e}")
-                # Redis 저장 실패 시 무시하고 결과 반환
-            
-            return result
+                hit, result = lookup(cache_key)
+                if not hit:
+                    result = func(*args, **kwargs)
+                    store(cache_key, result)
+                pending.set_result(result)
+                return result
+            except BaseException as e:
+                pending.set_exception(e)
+                raise
+            finally:
+                with _inflight_lock:
+                    _inflight_sync.pop(cache_key, None)
         return wrapper
     return decorator
 
@@ -87,9 +226,12 @@ def clear_function_cache(function_name: str):
         return 0
     
     try:
+        # 키가 해시라 함수별로 구분할 수 없으므로 로컬 캐시는 전체 비움
+        local_cache.clear()
+        
         # 모든 키를 스캔하여 해당 함수명의 캐시를 찾아 제거
         pattern = f"llm:*"
-        keys = redis_client.keys(pattern)
+        keys = redis_client.scan_iter(match=pattern, count=500)
         removed_count = 0
         
         for key in keys:
@@ -142,29 +284,6 @@ def migrate_function_cache(old_function_name: str, new_function_name: str):
         print(f"Error migrating cache from {old_function_name} to {new_function_name}: {e}")
         return 0
 
-# 비동기 Redis 캐시 설정
-async def get_async_cache():
-    """비동기 Redis 캐시 인스턴스 반환"""
-    return RedisCache(
-        endpoint="redis",
-        port=6379,
-        db=0,
-        timeout=60
-    )
-
 def async_redis_cache(ttl: int = 3600):
-    """비동기 함수용 Redis 캐시 데코레이터"""
-    def decorator(func):
-        @cached(
-            ttl=ttl,
-            cache=RedisCache,
-            endpoint="redis",
-            port=6379,
-            db=0,
-            timeout=60
-        )
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        return wrapper
-    return decorator
+    """비동기 함수용 캐시 데코레이터 (redis_cache와 동일한 2단계 캐시 사용)"""
+    return redis_cache(expire=ttl)
@@ -0,0 +1,292 @@
+import os
+import pickle
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# MinHash/LSH 인덱스 설정
+# PLAGIARISM_INDEX_SHARDS: 인덱스 샤드 수 (샤드별 잠금/로그 파일)
+# PLAGIARISM_MINHASH_PERM: MinHash 순열 수, PLAGIARISM_LSH_BANDS: LSH 밴드 수 (순열 수의 약수)
+# PLAGIARISM_SHINGLE_SIZE: 문자 shingle 길이 (공백/문장부호 제거 후)
+INDEX_SHARDS = int(os.environ.get("PLAGIARISM_INDEX_SHARDS", 16))
+MINHASH_PERM = int(os.environ.get("PLAGIARISM_MINHASH_PERM", 128))
+LSH_BANDS = int(os.environ.get("PLAGIARISM_LSH_BANDS", 32))
+SHINGLE_SIZE = int(os.environ.get("PLAGIARISM_SHINGLE_SIZE", 5))
+
+_PRIME = (1 << 31) - 1
+_NON_TEXT = re.compile(r"[^0-9a-zA-Z가-힣]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def normalize_text(text: str) -> str:
+    """공백/문장부호를 제거하고 소문자로 변환 (띄어쓰기만 바꾼 복사도 같은 shingle이 되도록)"""
+    return _NON_TEXT.sub("", text or "").lower()
+
+
+def split_passages(text: str, min_chars: int = 40, max_chars: int = 400) -> List[str]:
+    """문단 단위로 나누고, 긴 문단은 문장 경계에서 max_chars 이하로 자름 (짧은 조각은 이어 붙임)"""
+    passages: List[str] = []
+    buffer = ""
+
+    def flush():
+        nonlocal buffer
+        if buffer:
+            passages.append(buffer)
+            buffer = ""
+
+    for block in re.split(r"\n+", text or ""):
+        block = block.strip()
+        if not block:
+            continue
+        for sentence in _SENTENCE_END.split(block):
+            while len(sentence) > max_chars:
+                flush()
+                passages.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if buffer and len(buffer) + len(sentence) + 1 > max_chars:
+                flush()
+            buffer = f"{buffer} {sentence}" if buffer else sentence
+        if len(buffer) >= min_chars:
+            flush()
+    if buffer:
+        if passages and len(buffer) < min_chars:
+            passages[-1] = f"{passages[-1]} {buffer}"
+        else:
+            passages.append(buffer)
+    return passages
+
+
+class MinHasher:
+    """문자 shingle 집합의 MinHash 서명 계산 (프로세스 간 동일한 값을 위해 crc32 + 고정 시드)"""
+
+    def __init__(self, num_perm: int = MINHASH_PERM, shingle_size: int = SHINGLE_SIZE, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.a = rng.randint(1, _PRIME, size=num_perm, dtype=np.int64)
+        self.b = rng.randint(0, _PRIME, size=num_perm, dtype=np.int64)
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        normalized = normalize_text(text)
+        k = self.shingle_size
+        if len(normalized) <= k:
+            shingles = {normalized} if normalized else set()
+        else:
+            shingles = {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+        return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.int64, count=len(shingles))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        hashes = self.shingle_hashes(text)
+        if not hashes.size:
+            return None
+        hashes %= _PRIME
+        return ((np.outer(hashes, self.a) + self.b) % _PRIME).min(axis=0).astype(np.uint32)
+
+    @staticmethod
+    def jaccard(sig1: np.ndarray, sig2: np.ndarray) -> float:
+        """두 서명의 추정 Jaccard 유사도"""
+        return float(np.mean(sig1 == sig2))
+
+
+class _Shard:
+    """LSH 버킷과 문서(문단, 서명)를 보관하는 샤드
+
+    변경 내용은 샤드별 로그 파일에 추가 기록하고, 시작 시 재생해 버킷을 다시 만듭니다.
+    """
+
+    def __init__(self, path: Optional[str], bands: int, rows: int):
+        self.path = path
+        self.bands = bands
+        self.rows = rows
+        self.tables: List[Dict[bytes, set]] = [defaultdict(set) for _ in range(bands)]
+        self.docs: Dict[object, Tuple[List[str], List[Optional[np.ndarray]]]] = {}
+        self.records = 0
+        self.lock = threading.RLock()
+        self._load()
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _insert(self, doc_id, passages: List[str], signatures: List[Optional[np.ndarray]]):
+        self._remove(doc_id)
+        self.docs[doc_id] = (passages, signatures)
+        for index, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            for band, key in self._band_keys(signature):
+                self.tables[band][key].add((doc_id, index))
+
+    def _remove(self, doc_id):
+        existing = self.docs.pop(doc_id, None)
+        if not existing:
+            return
+        for index, signature in enumerate(existing[1]):
+            if signature is None:
+                continue
+            for band, key in self._band_keys(signature):
+                bucket = self.tables[band].get(key)
+                if bucket:
+                    bucket.discard((doc_id, index))
+                    if not bucket:
+                        del self.tables[band][key]
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            while True:
+                try:
+                    doc_id, passages, signatures = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception as e:
+                    # 마지막 기록이 쓰다 만 상태면 그 앞까지만 사용
+                    print(f"MinHash 샤드 로그 읽기 중단 ({self.path}): {e}")
+                    break
+                self.records += 1
+                if passages is None:
+                    self._remove(doc_id)
+                else:
+                    self._insert(doc_id, passages, signatures)
+
+    def _append(self, *records):
+        """변경 기록을 로그 파일에 추가 (일괄 추가 시 파일을 한 번만 열어 기록)"""
+        if not self.path or not records:
+            return
+        with open(self.path, "ab") as f:
+            for record in records:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.records += len(records)
+        # 교체/삭제로 쌓인 기록이 현재 문서 수의 두 배를 넘으면 로그 압축
+        if self.records > 2 * len(self.docs) + 100:
+            self._compact()
+
+    def _compact(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for doc_id, (passages, signatures) in self.docs.items():
+                pickle.dump((doc_id, passages, signatures), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.records = len(self.docs)
+
+    def add(self, doc_id, passages: List[str], signatures: List[Optional[np.ndarray]]):
+        self.add_many([(doc_id, passages, signatures)])
+
+    def add_many(self, records: List[Tuple[object, List[str], List[Optional[np.ndarray]]]]):
+        with self.lock:
+            for doc_id, passages, signatures in records:
+                self._insert(doc_id, passages, signatures)
+            self._append(*records)
+
+    def remove(self, doc_id) -> bool:
+        with self.lock:
+            if doc_id not in self.docs:
+                return False
+            self._remove(doc_id)
+            self._append((doc_id, None, None))
+            return True
+
+    def candidates(self, signature: np.ndarray) -> set:
+        found = set()
+        with self.lock:
+            for band, key in self._band_keys(signature):
+                bucket = self.tables[band].get(key)
+                if bucket:
+                    found |= bucket
+        return found
+
+
+class MinHashLSHIndex:
+    """문단 단위 MinHash/LSH 근접 중복 인덱스
+
+    문서(이력서)를 문단으로 나눠 MinHash 서명을 저장하고, LSH 밴드 버킷으로
+    복사된 문단 후보를 네트워크 호출 없이 찾습니다. 문서는 id 기준으로 샤드에 나뉘어 저장됩니다.
+    """
+
+    def __init__(
+        self,
+        persist_dir: Optional[str] = None,
+        num_shards: int = INDEX_SHARDS,
+        num_perm: int = MINHASH_PERM,
+        bands: int = LSH_BANDS,
+        shingle_size: int = SHINGLE_SIZE
+    ):
+        if num_perm % bands:
+            raise ValueError(f"MinHash 순열 수({num_perm})는 밴드 수({bands})의 배수여야 합니다")
+        self.hasher = MinHasher(num_perm, shingle_size)
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+        self.shards = [
+            _Shard(os.path.join(persist_dir, f"shard_{i}.log") if persist_dir else None, bands, num_perm // bands)
+            for i in range(num_shards)
+        ]
+
+    def _shard_index(self, doc_id) -> int:
+        key = doc_id if isinstance(doc_id, int) else zlib.crc32(str(doc_id).encode("utf-8"))
+        return key % len(self.shards)
+
+    def _shard(self, doc_id) -> _Shard:
+        return self.shards[self._shard_index(doc_id)]
+
+    def __len__(self) -> int:
+        return sum(len(shard.docs) for shard in self.shards)
+
+    def add(self, doc_id, text: str) -> List[str]:
+        """문서 추가(같은 id는 교체) 후 나뉜 문단 목록 반환"""
+        passages = split_passages(text)
+        signatures = [self.hasher.signature(passage) for passage in passages]
+        self._shard(doc_id).add(doc_id, passages, signatures)
+        return passages
+
+    def add_many(self, docs: List[Tuple[object, str]]) -> Dict[object, List[str]]:
+        """여러 문서 추가 (샤드별로 모아 로그 파일을 한 번씩만 기록) 후 {id: 문단 목록} 반환"""
+        by_shard: Dict[int, List[Tuple]] = defaultdict(list)
+        result: Dict[object, List[str]] = {}
+        for doc_id, text in docs:
+            passages = split_passages(text)
+            signatures = [self.hasher.signature(passage) for passage in passages]
+            by_shard[self._shard_index(doc_id)].append((doc_id, passages, signatures))
+            result[doc_id] = passages
+        for shard_index, records in by_shard.items():
+            self.shards[shard_index].add_many(records)
+        return result
+
+    def remove(self, doc_id) -> bool:
+        return self._shard(doc_id).remove(doc_id)
+
+    def get_passages(self, doc_id) -> List[str]:
+        doc = self._shard(doc_id).docs.get(doc_id)
+        return list(doc[0]) if doc else []
+
+    def query(self, text: str, min_jaccard: float = 0.3, exclude=None) -> Tuple[List[str], Dict[object, List[Dict]]]:
+        """문단별 근접 중복 후보 검색
+
+        Returns:
+            (질의 문단 목록, {doc_id: [{"query_index", "matched_index", "jaccard"}]})
+        """
+        passages = split_passages(text)
+        matches: Dict[object, List[Dict]] = defaultdict(list)
+        for query_index, passage in enumerate(passages):
+            signature = self.hasher.signature(passage)
+            if signature is None:
+                continue
+            for shard in self.shards:
+                for doc_id, matched_index in shard.candidates(signature):
+                    if doc_id == exclude:
+                        continue
+                    doc = shard.docs.get(doc_id)
+                    if not doc or doc[1][matched_index] is None:
+                        continue
+                    jaccard = MinHasher.jaccard(signature, doc[1][matched_index])
+                    if jaccard >= min_jaccard:
+                        matches[doc_id].append({
+                            "query_index": query_index,
+                            "matched_index": matched_index,
+                            "jaccard": round(jaccard, 4)
+                        })
+        return passages, dict(matches)
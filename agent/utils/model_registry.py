@@ -0,0 +1,220 @@
+import os
+import queue
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 모델 레지스트리 설정
+# MODEL_IDLE_TTL: 참조가 없는 모델을 메모리에서 내리기까지의 유휴 시간(초, 0이면 내리지 않음)
+# MODEL_LOAD_RETRY_INTERVAL: 로드 실패 후 재시도까지 대기 시간(초)
+# WHISPER_MODEL_REPLICAS / DIARIZATION_PIPELINE_REPLICAS: 동시 추론용 모델 복제본 최대 수
+MODEL_IDLE_TTL = int(os.environ.get("MODEL_IDLE_TTL", 0))
+MODEL_LOAD_RETRY_INTERVAL = int(os.environ.get("MODEL_LOAD_RETRY_INTERVAL", 300))
+WHISPER_MODEL_REPLICAS = int(os.environ.get("WHISPER_MODEL_REPLICAS", 1))
+DIARIZATION_PIPELINE_REPLICAS = int(os.environ.get("DIARIZATION_PIPELINE_REPLICAS", 1))
+
+DIARIZATION_PIPELINE_NAME = "pyannote/speaker-diarization-3.1"
+
+
+def default_device() -> str:
+    """GPU 사용 가능 시 cuda, 아니면 cpu"""
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except Exception:
+        return "cpu"
+
+
+class _ModelEntry:
+    """키 하나에 대한 모델 복제본 풀과 참조 카운트"""
+
+    def __init__(self, key: Tuple, loader: Callable[[], Any], max_replicas: int):
+        self.key = key
+        self.loader = loader
+        self.max_replicas = max(1, max_replicas)
+        self.replicas: List[Any] = []
+        self.available: "queue.Queue[Any]" = queue.Queue()
+        self.refcount = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def primary(self):
+        return self.replicas[0] if self.replicas else None
+
+    def ensure_loaded(self):
+        with self.lock:
+            if not self.replicas:
+                model = self.loader()
+                self.replicas.append(model)
+                self.available.put(model)
+
+    @contextmanager
+    def use(self):
+        """복제본 하나를 독점 사용 (모두 사용 중이면 여유가 있을 때 새로 로드하거나 대기)"""
+        try:
+            model = self.available.get_nowait()
+        except queue.Empty:
+            model = None
+            with self.lock:
+                if len(self.replicas) < self.max_replicas:
+                    model = self.loader()
+                    self.replicas.append(model)
+            if model is None:
+                model = self.available.get()
+        try:
+            yield model
+        finally:
+            self.last_used = time.monotonic()
+            self.available.put(model)
+
+
+class ModelLease:
+    """레지스트리에서 빌린 모델 핸들
+
+    model 속성은 첫 번째 복제본이며, 여러 스레드에서 추론할 때는
+    `with lease.use() as model:` 형태로 복제본을 독점해서 사용합니다.
+    release()를 호출하거나 소유 객체가 수거되면 참조가 반환됩니다.
+    """
+
+    def __init__(self, registry: "ModelRegistry", entry: _ModelEntry):
+        self._registry = registry
+        self._entry = entry
+        self._released = False
+
+    @property
+    def model(self):
+        return self._entry.primary
+
+    def use(self):
+        return self._entry.use()
+
+    def bind(self, owner: Any) -> "ModelLease":
+        """owner 객체가 수거될 때 자동으로 참조 반환"""
+        weakref.finalize(owner, self.release)
+        return self
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._registry._release(self._entry)
+
+
+class ModelRegistry:
+    """프로세스 전역 모델 레지스트리
+
+    (종류, 이름/크기, 디바이스) 키로 모델을 한 번만 로드해 공유합니다.
+    참조가 없는 모델은 idle_ttl이 지나면 다음 조회 시 메모리에서 내립니다.
+    """
+
+    def __init__(self, idle_ttl: int = MODEL_IDLE_TTL, retry_interval: int = MODEL_LOAD_RETRY_INTERVAL):
+        self.idle_ttl = idle_ttl
+        self.retry_interval = retry_interval
+        self._entries: Dict[Tuple, _ModelEntry] = {}
+        self._failures: Dict[Tuple, Tuple[float, Exception]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Tuple, loader: Callable[[], Any], max_replicas: int = 1) -> ModelLease:
+        """모델 참조 획득 (없으면 로드). 최근 로드 실패한 키는 재시도 간격 동안 즉시 실패"""
+        self.evict_idle()
+        with self._lock:
+            failure = self._failures.get(key)
+            if failure and time.monotonic() - failure[0] < self.retry_interval:
+                raise RuntimeError(f"모델 로드 실패 (재시도 대기 중): {failure[1]}")
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _ModelEntry(key, loader, max_replicas)
+                self._entries[key] = entry
+            entry.refcount += 1
+
+        try:
+            entry.ensure_loaded()
+        except Exception as e:
+            with self._lock:
+                self._failures[key] = (time.monotonic(), e)
+                entry.refcount -= 1
+                if not entry.replicas and self._entries.get(key) is entry:
+                    del self._entries[key]
+            raise
+
+        with self._lock:
+            self._failures.pop(key, None)
+        entry.last_used = time.monotonic()
+        return ModelLease(self, entry)
+
+    def _release(self, entry: _ModelEntry):
+        with self._lock:
+            entry.refcount = max(0, entry.refcount - 1)
+            entry.last_used = time.monotonic()
+
+    def evict_idle(self):
+        """참조가 없고 idle_ttl 이상 사용되지 않은 모델 제거"""
+        if not self.idle_ttl:
+            return
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key for key, entry in self._entries.items()
+                if entry.refcount == 0 and now - entry.last_used > self.idle_ttl
+            ]
+            for key in expired:
+                del self._entries[key]
+        if expired:
+            print(f"유휴 모델 해제: {expired}")
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except Exception:
+                pass
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "key": list(key),
+                    "refcount": entry.refcount,
+                    "replicas": len(entry.replicas),
+                    "idle_seconds": round(time.monotonic() - entry.last_used, 1)
+                }
+                for key, entry in self._entries.items()
+            ]
+
+
+model_registry = ModelRegistry()
+
+
+def acquire_whisper_model(size: str = "base", device: Optional[str] = None) -> ModelLease:
+    """공유 Whisper 모델 획득"""
+    device = device or default_device()
+
+    def load():
+        import whisper
+        print(f"Whisper 모델 로드: {size} ({device})")
+        return whisper.load_model(size, device=device)
+
+    return model_registry.acquire(("whisper", size, device), load, WHISPER_MODEL_REPLICAS)
+
+
+def acquire_diarization_pipeline(name: str = DIARIZATION_PIPELINE_NAME, device: Optional[str] = None, auth_token: Optional[str] = None) -> ModelLease:
+    """공유 pyannote 화자 분리 파이프라인 획득 (토큰 미지정 시 HUGGINGFACE_TOKEN/HF_TOKEN 사용)"""
+    device = device or default_device()
+    auth_token = auth_token or os.environ.get("HUGGINGFACE_TOKEN") or os.environ.get("HF_TOKEN")
+
+    def load():
+        import torch
+        from pyannote.audio import Pipeline
+        print(f"화자 분리 파이프라인 로드: {name} ({device})")
+        if auth_token:
+            pipeline = Pipeline.from_pretrained(name, use_auth_token=auth_token)
+        else:
+            pipeline = Pipeline.from_pretrained(name)
+        if pipeline is None:
+            raise RuntimeError(f"파이프라인을 불러올 수 없습니다: {name}")
+        if device != "cpu":
+            pipeline = pipeline.to(torch.device(device))
+        return pipeline
+
+    return model_registry.acquire(("pyannote", name, device), load, DIARIZATION_PIPELINE_REPLICAS)
@@ -1,75 +1,10 @@
 from typing import List
 from app.models.v2.document.resume import Resume, Spec
+from app.services.v2.document.resume_document_service import build_resume_text, get_resume_text
 
 def combine_resume_and_specs(resume: Resume, specs: List[Spec]) -> str:
-    """Resume와 Spec을 조합하여 포괄적인 resume_text 생성"""
-    
-    # 기본 이력서 정보
-    resume_text = f"""
-이력서 제목: {resume.title}
-
-기본 내용:
-{resume.content or "내용 없음"}
-"""
-    
-    # Spec 타입별로 분류
-    spec_categories = {}
-    for spec in specs:
-        spec_type = spec.spec_type
-        if spec_type not in spec_categories:
-            spec_categories[spec_type] = []
-        spec_categories[spec_type].append(spec)
-    
-    # 프로젝트 정보 (우선순위 높음)
-    if "project" in spec_categories or "프로젝트" in spec_categories:
-        projects = spec_categories.get("project", []) + spec_categories.get("프로젝트", [])
-        resume_text += "\n\n주요 프로젝트 경험:\n"
-        for i, project in enumerate(projects, 1):
-            resume_text += f"{i}. {project.spec_title}\n"
-            if project.spec_description:
-                resume_text += f"   {project.spec_description}\n"
-    
-    # 교육사항
-    if "education" in spec_categories or "교육" in spec_categories:
-        educations = spec_categories.get("education", []) + spec_categories.get("교육", [])
-        resume_text += "\n\n교육사항:\n"
-        for education in educations:
-            resume_text += f"- {education.spec_title}\n"
-            if education.spec_description:
-                resume_text += f"  {education.spec_description}\n"
-    
-    # 자격증
-    if "certificate" in spec_categories or "자격증" in spec_categories:
-        certificates = spec_categories.get("certificate", []) + spec_categories.get("자격증", [])
-        resume_text += "\n\n자격증:\n"
-        for cert in certificates:
-            resume_text += f"- {cert.spec_title}\n"
-            if cert.spec_description:
-                resume_text += f"  {cert.spec_description}\n"
-    
-    # 기술스택
-    if "skill" in spec_categories or "기술" in spec_categories:
-        skills = spec_categories.get("skill", []) + spec_categories.get("기술", [])
-        resume_text += "\n\n기술 스택:\n"
-        for skill in skills:
-            resume_text += f"- {skill.spec_title}\n"
-            if skill.spec_description:
-                resume_text += f"  {skill.spec_description}\n"
-    
-    # 기타 스펙들
-    other_specs = []
-    for spec_type, specs_list in spec_categories.items():
-        if spec_type not in ["project", "프로젝트", "education", "교육", "certificate", "자격증", "skill", "기술"]:
-            other_specs.extend(specs_list)
-    
-    if other_specs:
-        resume_text += "\n\n기타 경험:\n"
-        for spec in other_specs:
-            resume_text += f"- {spec.spec_title} ({spec.spec_type})\n"
-            if spec.spec_description:
-                resume_text += f"  {spec.spec_description}\n"
-    
-    return resume_text.strip()
+    """Resume와 Spec을 조합하여 포괄적인 resume_text 생성 (이력서 문서와 같은 형식)"""
+    return build_resume_text(resume.title, resume.content, specs)
 
 def get_complete_resume_data_by_id(resume_id: int, db) -> str:
     """resume_id로 완전한 이력서 데이터 가져오기"""
@@ -78,8 +13,7 @@ def get_complete_resume_data_by_id(resume_id: int, db) -> str:
         if not resume:
             raise ValueError(f"Resume not found: {resume_id}")
         
-        specs = db.query(Spec).filter(Spec.resume_id == resume_id).all()
-        return combine_resume_and_specs(resume, specs)
+        return get_resume_text(db, resume)
         
     except Exception as e:
         print(f"이력서 데이터 조회 오류: {str(e)}")
@@ -94,8 +28,7 @@ def get_complete_resume_data_by_application_id(application_id: int, db) -> str:
         if not application or not application.resume:
             raise ValueError(f"Application or Resume not found: {application_id}")
         
-        specs = db.query(Spec).filter(Spec.resume_id == application.resume.id).all()
-        return combine_resume_and_specs(application.resume, specs)
+        return get_resume_text(db, application.resume)
         
     except Exception as e:
         print(f"Application 기반 이력서 데이터 조회 오류: {str(e)}")
@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from agent.utils.model_registry import model_registry
+
+# 한국어 감정 분석 엔진 설정
+# SENTIMENT_MODEL_NAME: 감정 분류 모델 (출력 1번 클래스를 부정 확률로 사용)
+# SENTIMENT_BACKEND: torch | int8 (torch 동적 양자화, CPU) | onnx (optimum[onnxruntime] 필요, 없으면 torch)
+# SENTIMENT_NUM_THREADS: 추론 스레드 수 (0이면 torch 기본값)
+# SENTIMENT_BATCH_SIZE / SENTIMENT_MAX_LENGTH: 배치 크기 / 최대 토큰 길이
+# SENTIMENT_CACHE_SIZE: 문장별 점수 캐시 크기 (LRU)
+# SENTIMENT_MODEL_REPLICAS: 동시 추론용 모델 복제본 최대 수
+SENTIMENT_MODEL_NAME = os.environ.get("SENTIMENT_MODEL_NAME", "nlp04/korean_sentiment_analysis_kcelectra")
+SENTIMENT_BACKEND = os.environ.get("SENTIMENT_BACKEND", "torch").lower()
+SENTIMENT_NUM_THREADS = int(os.environ.get("SENTIMENT_NUM_THREADS", 0))
+SENTIMENT_BATCH_SIZE = int(os.environ.get("SENTIMENT_BATCH_SIZE", 32))
+SENTIMENT_MAX_LENGTH = int(os.environ.get("SENTIMENT_MAX_LENGTH", 512))
+SENTIMENT_CACHE_SIZE = int(os.environ.get("SENTIMENT_CACHE_SIZE", 4096))
+SENTIMENT_MODEL_REPLICAS = int(os.environ.get("SENTIMENT_MODEL_REPLICAS", 1))
+
+
+def _load_sentiment_model(name: str, backend: str):
+    """(tokenizer, model) 로드 (프로세스당 한 번, model_registry에서 호출)"""
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    if SENTIMENT_NUM_THREADS > 0:
+        torch.set_num_threads(SENTIMENT_NUM_THREADS)
+    tokenizer = AutoTokenizer.from_pretrained(name)
+
+    if backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            model = ORTModelForSequenceClassification.from_pretrained(name, export=True)
+            print(f"감정 모델 로드: {name} (onnx)")
+            return tokenizer, model
+        except ImportError:
+            print("optimum[onnxruntime]이 설치되지 않아 torch 백엔드로 감정 모델을 로드합니다")
+            backend = "torch"
+
+    model = AutoModelForSequenceClassification.from_pretrained(name)
+    model.eval()
+    if backend == "int8":
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    print(f"감정 모델 로드: {name} ({backend})")
+    return tokenizer, model
+
+
+class SentimentEngine:
+    """상주 한국어 감정 분석 엔진
+
+    모델은 레지스트리에서 프로세스당 한 번만 로드하고, 여러 문장을 길이순으로 묶어
+    배치마다 가장 긴 문장 길이까지만 패딩해 한 번에 추론합니다.
+    문장별 부정 확률은 해시 기준으로 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str = SENTIMENT_MODEL_NAME,
+        backend: str = SENTIMENT_BACKEND,
+        batch_size: int = SENTIMENT_BATCH_SIZE,
+        max_length: int = SENTIMENT_MAX_LENGTH,
+        cache_size: int = SENTIMENT_CACHE_SIZE
+    ):
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._lease = model_registry.acquire(
+            ("sentiment", model_name, backend),
+            lambda: _load_sentiment_model(model_name, backend),
+            SENTIMENT_MODEL_REPLICAS
+        ).bind(self)
+
+    @staticmethod
+    def _key(sentence: str) -> str:
+        return hashlib.sha1(sentence.encode("utf-8")).hexdigest()
+
+    def _cached(self, key: str) -> Optional[float]:
+        with self._cache_lock:
+            score = self._cache.get(key)
+            if score is not None:
+                self._cache.move_to_end(key)
+            return score
+
+    def _store(self, scores: Dict[str, float]):
+        with self._cache_lock:
+            self._cache.update(scores)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _infer(self, sentences: List[str]) -> List[float]:
+        import torch
+
+        with self._lease.use() as (tokenizer, model), torch.inference_mode():
+            scores = []
+            for start in range(0, len(sentences), self.batch_size):
+                batch = sentences[start:start + self.batch_size]
+                inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=self.max_length)
+                logits = model(**inputs).logits
+                scores.extend(torch.softmax(logits, dim=-1)[:, 1].tolist())
+            return scores
+
+    def negative_scores(self, sentences: List[str]) -> List[float]:
+        """문장별 부정 확률 (입력 순서대로)"""
+        keys = [self._key(sentence) for sentence in sentences]
+        scores = {key: self._cached(key) for key in set(keys)}
+        missing = {}
+        for key, sentence in zip(keys, sentences):
+            if scores[key] is None:
+                missing[key] = sentence
+        if missing:
+            # 비슷한 길이끼리 묶이도록 길이순 정렬 후 배치 추론 (패딩 낭비 최소화)
+            ordered = sorted(missing.items(), key=lambda item: len(item[1]))
+            computed = dict(zip((key for key, _ in ordered), self._infer([sentence for _, sentence in ordered])))
+            self._store(computed)
+            scores.update(computed)
+        return [scores[key] for key in keys]
+
+
+_engine: Optional[SentimentEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_sentiment_engine() -> SentimentEngine:
+    """프로세스 전역 감정 분석 엔진 (로드 실패 시 예외, 재시도는 레지스트리의 재시도 간격을 따름)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SentimentEngine()
+    return _engine
@@ -89,7 +89,10 @@ async def batch_qa_local(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """로컬/캐시 파일 기반으로 QA+감정/문맥 일괄 분석
+    """로컬/캐시 파일 기반으로 QA+감정/문맥 분석 작업을 일괄 등록
+
+    분석은 qa_analysis 작업 큐에서 실행되며, 응답의 job_id별 상태는
+    GET /api/v2/whisper-analysis/qa-jobs/{job_id}로 조회합니다.
 
     payload 옵션:
       - application_ids: [int] 지정 시 해당 id만 처리
@@ -134,7 +137,8 @@ async def _run_batch_qa_local_core(db: Session, payload: dict):
     else:
         apps = db.query(Application).filter(Application.ai_interview_video_url.isnot(None)).all()
 
-    results = {"processed": 0, "success": [], "failed": []}
+    # 분석은 작업 큐에서 실행되므로 여기서는 등록된 작업만 집계
+    results = {"queued": 0, "jobs": [], "failed": []}
 
     for app in apps:
         app_id = app.id
@@ -176,13 +180,18 @@ async def _run_batch_qa_local_core(db: Session, payload: dict):
             continue
 
         try:
-            # 내부 함수 직접 호출로 오버헤드 최소화
-            res = await process_qa_local(payload_one, db)
-            if res.get("success"):
-                results["success"].append({"application_id": app_id, "total_pairs": res.get("total_pairs")})
-                results["processed"] += 1
-            else:
-                results["failed"].append({"application_id": app_id, "error": res.get("detail") or res})
+            # 작업 큐(qa_analysis_queue)에 등록하고 job_id만 받음 (분석 완료를 기다리지 않음)
+            job = await process_qa_local(payload_one, db)
+            results["jobs"].append({
+                "application_id": app_id,
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "deduplicated": job["deduplicated"],
+                "status_url": job["status_url"]
+            })
+            results["queued"] += 1
+        except HTTPException as e:
+            results["failed"].append({"application_id": app_id, "error": e.detail})
         except Exception as e:
             results["failed"].append({"application_id": app_id, "error": str(e)})
 
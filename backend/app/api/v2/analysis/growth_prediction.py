@@ -1,13 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
 from app.models.v2.document.application import Application
-from app.models.v2.document.resume import Resume, Spec
 from app.models.v2.analysis.growth_prediction_result import GrowthPredictionResult
-from app.services.v2.analysis.high_performer_pattern_service import HighPerformerPatternService
-from app.services.v2.analysis.applicant_growth_scoring_service import ApplicantGrowthScoringService
-from app.schemas.growth_prediction import GrowthPredictionRequest, GrowthPredictionResponse
+from app.services.v2.analysis.high_performer_pattern_service import (
+    HighPerformerPatternService, build_boxplot_reference, applicant_boxplot_data
+)
+from app.services.v2.document.applicant_growth_scoring_service import ApplicantGrowthScoringService
+from app.services.v2.document.resume_document_service import get_resume_document
+from app.services.v2.analysis.growth_prediction_batch_service import growth_prediction_batch_service
+from app.services.v2.interview.analysis_job_queue import growth_prediction_queue, CallbackURLNotAllowed
+from app.schemas.growth_prediction import GrowthPredictionRequest, GrowthPredictionResponse, GrowthPredictionBatchRequest
+import asyncio
+import json
 import time
 
 router = APIRouter()
@@ -62,149 +69,36 @@ def create_growth_prediction_table(db: Session = Depends(get_db)):
         db.rollback()
         raise HTTPException(status_code=500, detail=f"테이블 생성 실패: {str(e)}")
 
-@router.post("/predict", response_model=GrowthPredictionResponse)
-def predict_growth(
-    req: GrowthPredictionRequest,
-    db: Session = Depends(get_db)
-):
-    start_time = time.time()
-    
+def _load_prediction_inputs(db: Session, application_id: int):
+    """지원서, 이력서 스펙, 고성과자 기준 데이터 조회 (DB/Agent 동기 호출이므로 스레드에서 실행)"""
     # 1. 지원서/이력서/스펙 조회
-    application = db.query(Application).filter(Application.id == req.application_id).first()
+    application = db.query(Application).filter(Application.id == application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
-    resume = db.query(Resume).filter(Resume.id == application.resume_id).first()
-    if not resume:
+    # 이력서 문서(구체화된 스펙 목록) 한 번 조회
+    resume_document = get_resume_document(db, application.resume_id) if application.resume_id else None
+    if not resume_document:
         raise HTTPException(status_code=404, detail="Resume not found")
-    specs = db.query(Spec).filter(Spec.resume_id == resume.id).all()
-    specs_dict = [
-        {
-            "spec_type": s.spec_type,
-            "spec_title": s.spec_title,
-            "spec_description": s.spec_description
-        } for s in specs
-    ]
     # 2. 고성과자 패턴 통계(평균 등) 조회
+    # 고성과자 데이터 버전별 스냅샷 재사용 (kmeans 클러스터 1개 = 전체 평균, 데이터가 바뀔 때만 재분석)
     pattern_service = HighPerformerPatternService()
-    # kmeans로 1회 분석(클러스터 1개만 사용, 전체 평균)
-    pattern_result = pattern_service.analyze_high_performer_patterns(db, clustering_method="kmeans", n_clusters=1, include_llm_summary=False)
-    if not pattern_result or not pattern_result.get("cluster_patterns"):
+    try:
+        reference = pattern_service.get_growth_reference(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"High performer pattern analysis failed: {str(e)}")
+    if not reference:
         raise HTTPException(status_code=500, detail="High performer pattern not found")
-    stats = pattern_result["cluster_patterns"][0]["statistics"]
-    # 평균값 추출(항목별)
-    high_performer_stats = {
-        "kpi_score_mean": stats.get("kpi_score_mean", 0),
-        "promotion_speed_years_mean": stats.get("promotion_speed_years_mean", 0),
-        "degree_mean": stats.get("degree_mean", 0),
-        "certifications_count_mean": stats.get("certifications_count_mean", 0),
-        "total_experience_years_mean": stats.get("total_experience_years_mean", 0)
-    }
-    # 3. 지원자-고성과자 비교/스코어링
-    high_performer_members = pattern_result["cluster_patterns"][0]["members"]
-    scoring_service = ApplicantGrowthScoringService(high_performer_stats, high_performer_members)
-    result = scoring_service.score_applicant(specs_dict)
-
-    # 3.5. boxplot_data 생성
-    
-    # 고성과자 집단 데이터 추출
-    cluster_members = pattern_result["cluster_patterns"][0]["members"]
-    
-    # 각 항목별 값 리스트
-    def get_values(field, default=0.0):
-        vals = [m.get(field) for m in cluster_members if m.get(field) is not None]
-        try:
-            return [float(v) for v in vals if v is not None]
-        except:
-            return []
-
-    # 학력(숫자화)
-    EDU_MAP = {'BACHELOR': 2, 'MASTER': 3, 'PHD': 4}
-    degree_vals = [EDU_MAP.get(m.get('education_level'), 0) for m in cluster_members if m.get('education_level')]
-    
-    # 자격증 개수
-    import json
-    cert_vals = []
-    for m in cluster_members:
-        certs = m.get('certifications')
-        if certs:
-            try:
-                cert_list = json.loads(certs) if isinstance(certs, str) else certs
-                cert_vals.append(len(cert_list))
-            except Exception:
-                pass
-    
-    # 경력(년)
-    exp_vals = get_values('total_experience_years')
-    print('고성과자 경력(년) 값:', exp_vals)
-    # 지원자 값 추출
-    norm = scoring_service.normalize_applicant_specs(specs_dict)
-    
-    # 지원자 경력(년) 추출
-    applicant_exp = None
-    for spec in specs_dict:
-        if spec.get('spec_type') == 'experience' and spec.get('spec_title') == 'years':
-            try:
-                applicant_exp = float(spec.get('spec_description'))
-            except:
-                applicant_exp = None
-    
-    boxplot_data = {}
-    
-    # 통계 계산 헬퍼 함수 (numpy 대체)
-    def calculate_stats(values, applicant_value):
-        if not values:
-            return None
-        
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
-        
-        def percentile(p):
-            k = (n - 1) * (p / 100)
-            f = int(k)
-            c = k - f
-            if f + 1 < n:
-                return sorted_vals[f] * (1 - c) + sorted_vals[f + 1] * c
-            else:
-                return sorted_vals[f]
-        
-        return {
-            'min': float(min(sorted_vals)),
-            'q1': float(percentile(25)),
-            'median': float(percentile(50)),
-            'q3': float(percentile(75)),
-            'max': float(max(sorted_vals)),
-            'applicant': float(applicant_value) if applicant_value is not None else 0.0
-        }
-
-    # 경력(년)
-    if exp_vals:
-        stats = calculate_stats(exp_vals, applicant_exp)
-        if stats:
-            boxplot_data['경력(년)'] = stats
-            
-    # 학력
-    if degree_vals:
-        app_degree = norm.get('degree', 0.0)
-        stats = calculate_stats(degree_vals, app_degree)
-        if stats:
-            boxplot_data['학력'] = stats
-            
-    # 자격증
-    if cert_vals:
-        app_cert = norm.get('certifications_count', 0.0)
-        stats = calculate_stats(cert_vals, app_cert)
-        if stats:
-            boxplot_data['자격증'] = stats
+    return application, resume_document.specs, reference
 
-    analysis_duration = time.time() - start_time
-
-    # 4. DB에 결과 저장
+def _save_prediction_result(db: Session, application: Application, result: dict, boxplot_data: dict, analysis_duration: float):
+    """예측 결과 저장 (기존 결과가 있으면 업데이트, 동기 DB 작업이므로 스레드에서 실행)"""
+    application_id = application.id
     try:
-        print(f"💾 DB 저장 시작: application_id={req.application_id}")
+        print(f"💾 DB 저장 시작: application_id={application_id}")
         
         # 기존 결과가 있으면 업데이트, 없으면 새로 생성
         existing_result = db.query(GrowthPredictionResult).filter(
-            GrowthPredictionResult.application_id == req.application_id
+            GrowthPredictionResult.application_id == application_id
         ).first()
         
         print(f"🔍 기존 결과 조회: {'있음' if existing_result else '없음'}")
@@ -228,7 +122,7 @@ def predict_growth(
             # 새로운 결과 생성
             print(f"🆕 새로운 결과 생성 시작")
             growth_result = GrowthPredictionResult(
-                application_id=req.application_id,
+                application_id=application_id,
                 jobpost_id=application.job_post_id,
                 company_id=application.job_post.company_id if application.job_post else None,
                 total_score=result["total_score"],
@@ -257,6 +151,30 @@ def predict_growth(
         db.rollback()
         # DB 저장 실패해도 분석 결과는 반환
 
+@router.post("/predict", response_model=GrowthPredictionResponse)
+async def predict_growth(
+    req: GrowthPredictionRequest,
+    db: Session = Depends(get_db)
+):
+    start_time = time.time()
+    
+    # 1~2. 조회/스냅샷 준비는 블로킹 작업(DB, 스냅샷이 없을 때 Agent 클러스터링 호출)이므로 이벤트 루프 밖에서 실행
+    application, specs_dict, reference = await asyncio.to_thread(_load_prediction_inputs, db, req.application_id)
+    high_performer_stats = reference["high_performer_stats"]
+    # 3. 지원자-고성과자 비교/스코어링
+    high_performer_members = reference["members"]
+    scoring_service = ApplicantGrowthScoringService(high_performer_stats, high_performer_members)
+    result = await scoring_service.score_applicant(specs_dict)
+
+    # 3.5. boxplot_data 생성 (고성과자 집단의 항목별 통계 + 지원자 값)
+    norm = scoring_service.normalize_applicant_specs(specs_dict)
+    boxplot_data = applicant_boxplot_data(build_boxplot_reference(reference), norm)
+
+    analysis_duration = time.time() - start_time
+
+    # 4. DB에 결과 저장 (실패해도 분석 결과는 반환)
+    await asyncio.to_thread(_save_prediction_result, db, application, result, boxplot_data, analysis_duration)
+
     # 5. 응답
     return GrowthPredictionResponse(
         total_score=result["total_score"],
@@ -270,6 +188,64 @@ def predict_growth(
         narrative=result.get("narrative")
     )
 
+@router.post("/predict-batch")
+async def predict_growth_batch(req: GrowthPredictionBatchRequest):
+    """
+    공고 전체 지원자 성장가능성 일괄 예측 작업 등록 (백그라운드 실행)
+
+    - **job_post_id**: 공고 ID
+    - **reset**: 체크포인트를 지우고 처음부터 다시 예측
+
+    같은 공고의 작업이 진행 중이면 기존 작업을 반환하며, 실패/중단된 작업은 마지막 배치 이후부터 이어서 실행됩니다.
+    진행 상황은 GET /predict-batch/{job_id} 또는 GET /predict-batch/{job_id}/stream(SSE)으로 확인합니다.
+    """
+    try:
+        return await growth_prediction_batch_service.start_batch_prediction(
+            job_post_id=req.job_post_id,
+            reset=req.reset,
+            callback_url=req.callback_url
+        )
+    except CallbackURLNotAllowed as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"성장가능성 일괄 예측 등록 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/predict-batch/{job_id}")
+async def get_predict_batch_status(job_id: str):
+    """성장가능성 일괄 예측 작업 상태/진행률 조회"""
+    job = await growth_prediction_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"일괄 예측 작업(ID: {job_id})을 찾을 수 없습니다.")
+    return job
+
+@router.get("/predict-batch/{job_id}/stream")
+async def stream_predict_batch_status(job_id: str):
+    """성장가능성 일괄 예측 진행률 스트리밍 (SSE: 진행률이 바뀔 때마다 progress, 종료 시 completed/failed)"""
+    if not await growth_prediction_queue.get(job_id):
+        raise HTTPException(status_code=404, detail=f"일괄 예측 작업(ID: {job_id})을 찾을 수 없습니다.")
+
+    async def event_stream():
+        last_sent = None
+        while True:
+            job = await growth_prediction_queue.get(job_id)
+            if not job:
+                yield f"event: failed\ndata: {json.dumps({'job_id': job_id, 'error': '작업 정보가 만료되었습니다'}, ensure_ascii=False)}\n\n"
+                return
+            if job["status"] in ("completed", "failed"):
+                yield f"event: {job['status']}\ndata: {json.dumps(job, ensure_ascii=False, default=str)}\n\n"
+                return
+            snapshot = (job["status"], job.get("progress"), job.get("queue_position"))
+            if snapshot != last_sent:
+                last_sent = snapshot
+                yield f"event: progress\ndata: {json.dumps(job, ensure_ascii=False, default=str)}\n\n"
+            await asyncio.sleep(1)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/results/{application_id}")
 def get_growth_prediction_results(
     application_id: int,
@@ -10,10 +10,10 @@ from app.models.v2.document.application import Application
 from app.models.v2.recruitment.job import JobPost
 from app.models.v2.auth.company import Company
 from app.models.v2.analysis.highlight_result import HighlightResult
-from app.models.v2.document.resume import Resume, Spec
+from app.models.v2.document.resume import Resume
 
 # 공통 유틸리티 import 추가
-from agent.utils.resume_utils import combine_resume_and_specs
+from app.services.v2.document.resume_document_service import get_resume_text
 
 # 임베딩 시스템 관련 코드 완전 제거
 
@@ -50,11 +50,8 @@ async def highlight_resume_by_application(
             print(f"❌ Resume not found for application: {request.application_id}")
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Resume와 Spec 데이터 조회
-        specs = db.query(Spec).filter(Spec.resume_id == application.resume.id).all()
-        
-        # 완전한 이력서 데이터 생성 (프로젝트, 교육, 자격증, 기술스택 등 포함)
-        resume_content = combine_resume_and_specs(application.resume, specs)
+        # 완전한 이력서 데이터 (프로젝트, 교육, 자격증, 기술스택 등 포함, 구체화된 이력서 문서에서 조회)
+        resume_content = get_resume_text(db, application.resume)
         
         if not resume_content or len(resume_content.strip()) == 0:
             print(f"❌ Resume content is empty for application: {request.application_id}")
@@ -63,12 +60,12 @@ async def highlight_resume_by_application(
         print(f"✅ Complete resume data found: {len(resume_content)} characters (Resume + Specs included)")
         
         # 새로운 형광펜 도구 사용
-        from agent.tools.highlight_tool import highlight_resume_by_application_id
+        from agent.tools.highlight_tool import ahighlight_resume_by_application_id
         
         print(f"🚀 형광펜 하이라이팅 도구 호출")
         
         # 형광펜 도구로 하이라이팅 수행
-        result = highlight_resume_by_application_id(
+        result = await ahighlight_resume_by_application_id(
             application_id=request.application_id,
             resume_content=resume_content,  # ← 완전한 이력서 데이터 사용
             jobpost_id=request.jobpost_id,
@@ -4,7 +4,8 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
-from app.services.v2.analysis.resume_plagiarism_service import ResumePlagiarismService
+from app.services.v2.analysis.resume_plagiarism_service import resume_plagiarism_service
+from app.services.v2.interview.analysis_job_queue import resume_embedding_queue, CallbackURLNotAllowed
 
 router = APIRouter()
 
@@ -32,13 +33,18 @@ class BatchEmbedResponse(BaseModel):
     total: int
     error: Optional[str] = None
 
+class EmbeddingBackfillRequest(BaseModel):
+    job_post_id: Optional[int] = Field(None, description="공고 ID (해당 공고 지원자 이력서만 등록, None이면 전체)")
+    reset: bool = Field(False, description="체크포인트를 지우고 처음부터 다시 등록")
+    callback_url: Optional[str] = Field(None, description="완료 시 작업 상태를 POST할 URL (ANALYSIS_CALLBACK_ALLOWED_HOSTS의 내부 호스트만 허용)")
+
 class CollectionStatsResponse(BaseModel):
     collection_name: str
     total_resumes: int
     persist_directory: str
 
-# 서비스 인스턴스
-plagiarism_service = ResumePlagiarismService()
+# 서비스 인스턴스 (백필 작업 핸들러와 로컬 인덱스를 공유하기 위해 싱글톤 사용)
+plagiarism_service = resume_plagiarism_service
 
 @router.post("/check-plagiarism", response_model=PlagiarismCheckResponse)
 async def check_plagiarism(
@@ -109,7 +115,7 @@ async def embed_resume(
     - **resume_id**: 임베딩할 이력서 ID
     """
     try:
-        success = plagiarism_service.embed_and_store_resume(db=db, resume_id=resume_id)
+        success = await plagiarism_service.embed_and_store_resume(db=db, resume_id=resume_id)
         
         if success:
             return {"message": f"이력서 {resume_id} 임베딩 완료", "success": True}
@@ -130,7 +136,7 @@ async def batch_embed_resumes(
     - **resume_ids**: 임베딩할 이력서 ID 리스트 (None이면 모든 이력서)
     """
     try:
-        result = plagiarism_service.batch_embed_resumes(
+        result = await plagiarism_service.batch_embed_resumes(
             db=db,
             resume_ids=request.resume_ids
         )
@@ -140,6 +146,38 @@ async def batch_embed_resumes(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"일괄 임베딩 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/embedding-backfill")
+async def start_embedding_backfill(request: EmbeddingBackfillRequest):
+    """
+    이력서 임베딩 백필 작업 등록 (백그라운드 실행)
+    
+    - **job_post_id**: 공고 ID (해당 공고 지원자만 등록, 없으면 전체 이력서)
+    - **reset**: 체크포인트를 지우고 처음부터 다시 등록
+    
+    같은 범위의 작업이 진행 중이면 기존 작업을 반환하며, 중단된 작업은 마지막 배치 이후부터 이어서 실행됩니다.
+    진행 상황은 GET /embedding-backfill/{job_id}의 progress 필드로 확인합니다.
+    """
+    try:
+        return await plagiarism_service.start_embedding_backfill(
+            job_post_id=request.job_post_id,
+            reset=request.reset,
+            callback_url=request.callback_url
+        )
+    except CallbackURLNotAllowed as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"임베딩 백필 등록 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/embedding-backfill/{job_id}")
+async def get_embedding_backfill_status(job_id: str):
+    """
+    이력서 임베딩 백필 작업 상태/진행률 조회
+    """
+    job = await resume_embedding_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"백필 작업(ID: {job_id})을 찾을 수 없습니다.")
+    return job
+
 @router.get("/collection-stats", response_model=CollectionStatsResponse)
 async def get_collection_stats():
     """
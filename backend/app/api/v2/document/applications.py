@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload, aliased
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, aliased
 from sqlalchemy import Table, MetaData, select, func
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 import re
 from app.core.database import get_db
@@ -19,7 +19,7 @@ from app.schemas.written_test_answer import WrittenTestAnswerResponse
 from app.services.v2.document.application_evaluation_service import auto_evaluate_all_applications
 from app.utils.enum_converter import get_safe_interview_statuses
 from app.models.v2.interview.media_analysis import MediaAnalysis
-from app.utils.resume_parser import parse_resume_specs
+from app.services.v2.document.resume_document_service import get_structured_specs
 from app.services.v2.document.application_service import update_stage_status
 import logging
 import requests 
@@ -28,6 +28,42 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 지원자 목록 페이지 크기 (keyset 페이지네이션)
+APPLICANT_PAGE_DEFAULT_LIMIT = 50
+APPLICANT_PAGE_MAX_LIMIT = 500
+
+# 면접 통계 대상 단계 (통계 키 → 단계, AI 면접은 WRITTEN_TEST에 매핑)
+INTERVIEW_STATISTICS_STAGES = {
+    "ai_interview": StageName.WRITTEN_TEST,
+    "practical_interview": StageName.PRACTICAL_INTERVIEW,
+    "executive_interview": StageName.EXECUTIVE_INTERVIEW,
+}
+INTERVIEW_STATISTICS_BUCKETS = {
+    StageStatus.PASSED.value: "passed",
+    StageStatus.FAILED.value: "failed",
+    StageStatus.IN_PROGRESS.value: "in_progress",
+    StageStatus.COMPLETED.value: "completed",
+}
+
+
+def _applicant_list_options():
+    """지원자 목록(ApplicationList) 직렬화에 필요한 컬럼만 로드
+
+    컬렉션(stages, resume.specs)은 selectinload로 별도 IN 쿼리 조회해 조인 행 폭증을 막습니다.
+    """
+    return (
+        load_only(
+            Application.id, Application.user_id, Application.resume_id, Application.job_post_id,
+            Application.current_stage, Application.overall_status, Application.final_score,
+            Application.applied_at, Application.application_source, Application.ai_interview_video_url
+        ),
+        selectinload(Application.stages),
+        selectinload(Application.user).load_only(User.id, User.name, User.email, User.user_type),
+        selectinload(Application.resume).load_only(Resume.id).selectinload(Resume.specs).load_only(
+            Spec.id, Spec.resume_id, Spec.spec_type, Spec.spec_title, Spec.spec_description
+        ),
+    )
+
 
 @router.get("/", response_model=List[ApplicationList])
 def get_applications(
@@ -36,9 +72,9 @@ def get_applications(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    # joinedload를 사용하여 stages 정보를 함께 로드 (N+1 문제 방지)
+    # stages는 selectinload로 별도 IN 쿼리 조회 (N+1 및 조인 행 증가 방지)
     applications = db.query(Application).options(
-        joinedload(Application.stages)
+        selectinload(Application.stages)
     ).offset(skip).limit(limit).all()
     return applications
 
@@ -56,7 +92,7 @@ def get_application(
         .options(
             joinedload(Application.stages),
             joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs)
+            joinedload(Application.resume)
         )
         .filter(Application.id == application_id)
         .first()
@@ -65,9 +101,8 @@ def get_application(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    # 스펙 데이터 파싱
-    specs = application.resume.specs if application.resume else []
-    parsed_specs = parse_resume_specs(specs)
+    # 스펙 데이터 (구체화된 이력서 문서의 파싱 결과, 스펙 행을 다시 읽지 않음)
+    parsed_specs = get_structured_specs(db, application.resume_id if application.resume else None)
     
     response_data = {
         # 기본 필드
@@ -220,9 +255,8 @@ def ai_evaluate_application(
         "title": application.resume.title
     }
     
-    # Spec 데이터 분류 (유틸리티 함수 활용)
-    specs = application.resume.specs if application.resume else []
-    structured_spec_data = parse_resume_specs(specs)
+    # Spec 데이터 분류 (구체화된 이력서 문서의 파싱 결과)
+    structured_spec_data = get_structured_specs(db, application.resume_id if application.resume else None)
     
     # 가중치 데이터 로드
     weights = db.query(Weight).filter(Weight.jobpost_id == application.job_post.id).all()
@@ -282,19 +316,48 @@ def get_applicants_by_job(
     job_post_id: int,
     db: Session = Depends(get_db)
 ):
-    """채용공고별 지원자 목록 조회"""
+    """채용공고별 지원자 목록 조회 (전체, 대량 조회는 /applicants/page 사용)"""
     applications = (
         db.query(Application)
-        .options(
-            joinedload(Application.user),
-            joinedload(Application.resume).joinedload(Resume.specs),
-            joinedload(Application.stages)
-        )
+        .options(*_applicant_list_options())
         .filter(Application.job_post_id == job_post_id)
+        .order_by(Application.id)
         .all()
     )
     return applications
 
+@router.get("/job/{job_post_id}/applicants/page")
+def get_applicants_page_by_job(
+    job_post_id: int,
+    after_id: Optional[int] = Query(None, description="이전 페이지의 next_cursor (첫 페이지는 생략)"),
+    limit: int = Query(APPLICANT_PAGE_DEFAULT_LIMIT, ge=1, le=APPLICANT_PAGE_MAX_LIMIT),
+    current_stage: Optional[StageName] = None,
+    db: Session = Depends(get_db)
+):
+    """채용공고별 지원자 목록 조회 (keyset 페이지네이션)
+
+    지원서 id 순으로 limit개씩 반환하며, 응답의 next_cursor를 after_id로 넘겨 다음 페이지를 조회합니다.
+    OFFSET 없이 인덱스 범위 조회만 하므로 지원자 수와 무관하게 페이지 조회 비용이 일정합니다.
+    """
+    query = (
+        db.query(Application)
+        .options(*_applicant_list_options())
+        .filter(Application.job_post_id == job_post_id)
+    )
+    if current_stage is not None:
+        query = query.filter(Application.current_stage == current_stage)
+    if after_id is not None:
+        query = query.filter(Application.id > after_id)
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    applications = query.order_by(Application.id).limit(limit + 1).all()
+    has_more = len(applications) > limit
+    applications = applications[:limit]
+    return {
+        "items": [ApplicationList.model_validate(app).model_dump(by_alias=True) for app in applications],
+        "next_cursor": applications[-1].id if has_more else None,
+        "has_more": has_more
+    }
+
 @router.get("/job/{job_post_id}/applicants-ai-interview")
 # @redis_cache(expire=300) 
 def get_applicants_with_ai_interview(job_post_id: int, db: Session = Depends(get_db)):
@@ -303,7 +366,7 @@ def get_applicants_with_ai_interview(job_post_id: int, db: Session = Depends(get
         query = db.query(Application).options(
             joinedload(Application.user),
             joinedload(Application.resume),
-            joinedload(Application.stages)
+            selectinload(Application.stages)
         ).filter(
             Application.job_post_id == job_post_id,
             Application.current_stage == StageName.AI_INTERVIEW 
@@ -325,7 +388,7 @@ def get_applicants_with_practical_interview(job_post_id: int, db: Session = Depe
         query = db.query(Application).options(
             joinedload(Application.user),
             joinedload(Application.resume),
-            joinedload(Application.stages)
+            selectinload(Application.stages)
         ).filter(
             Application.job_post_id == job_post_id,
             Application.current_stage == StageName.PRACTICAL_INTERVIEW
@@ -347,7 +410,7 @@ def get_applicants_with_executive_interview(job_post_id: int, db: Session = Depe
         query = db.query(Application).options(
             joinedload(Application.user),
             joinedload(Application.resume),
-            joinedload(Application.stages)
+            selectinload(Application.stages)
         ).filter(
             Application.job_post_id == job_post_id,
             Application.current_stage == StageName.EXECUTIVE_INTERVIEW
@@ -363,45 +426,35 @@ def get_applicants_with_executive_interview(job_post_id: int, db: Session = Depe
 def get_interview_statistics(job_post_id: int, db: Session = Depends(get_db)):
     """면접 통계 및 예정된 면접 조회 API"""
     try:
-        # 1. 해당 공고의 모든 지원자 조회 (Stages 포함)
-        applications = (
-            db.query(Application)
-            .options(joinedload(Application.stages))
-            .filter(Application.job_post_id == job_post_id)
+        # 1. 단계/상태별 지원자 수 집계 (ApplicationStage GROUP BY 한 번)
+        stage_counts = (
+            db.query(
+                ApplicationStage.stage_name,
+                ApplicationStage.status,
+                func.count(func.distinct(ApplicationStage.application_id))
+            )
+            .join(Application, Application.id == ApplicationStage.application_id)
+            .filter(
+                Application.job_post_id == job_post_id,
+                ApplicationStage.stage_name.in_(list(INTERVIEW_STATISTICS_STAGES.values()))
+            )
+            .group_by(ApplicationStage.stage_name, ApplicationStage.status)
             .all()
         )
+        total_applications = db.query(func.count(Application.id)).filter(Application.job_post_id == job_post_id).scalar() or 0
         
-        # 2. 통계 집계 초기화
+        # 2. 통계 집계 (해당 단계 기록이 없거나 그 외 상태는 pending)
         stats = {
-            "ai_interview": {"passed": 0, "failed": 0, "in_progress": 0, "pending": 0, "completed": 0},
-            "practical_interview": {"passed": 0, "failed": 0, "in_progress": 0, "pending": 0, "completed": 0},
-            "executive_interview": {"passed": 0, "failed": 0, "in_progress": 0, "pending": 0, "completed": 0},
+            key: {"passed": 0, "failed": 0, "in_progress": 0, "pending": 0, "completed": 0}
+            for key in INTERVIEW_STATISTICS_STAGES
         }
-        
-        for app in applications:
-            # AI 면접
-            ai_status = app.ai_interview_status
-            if ai_status == StageStatus.PASSED: stats["ai_interview"]["passed"] += 1
-            elif ai_status == StageStatus.FAILED: stats["ai_interview"]["failed"] += 1
-            elif ai_status == StageStatus.IN_PROGRESS: stats["ai_interview"]["in_progress"] += 1
-            elif ai_status == StageStatus.COMPLETED: stats["ai_interview"]["completed"] += 1
-            else: stats["ai_interview"]["pending"] += 1
-            
-            # 실무 면접
-            prac_status = app.practical_interview_status
-            if prac_status == StageStatus.PASSED: stats["practical_interview"]["passed"] += 1
-            elif prac_status == StageStatus.FAILED: stats["practical_interview"]["failed"] += 1
-            elif prac_status == StageStatus.IN_PROGRESS: stats["practical_interview"]["in_progress"] += 1
-            elif prac_status == StageStatus.COMPLETED: stats["practical_interview"]["completed"] += 1
-            else: stats["practical_interview"]["pending"] += 1
-            
-            # 임원 면접
-            exec_status = app.executive_interview_status
-            if exec_status == StageStatus.PASSED: stats["executive_interview"]["passed"] += 1
-            elif exec_status == StageStatus.FAILED: stats["executive_interview"]["failed"] += 1
-            elif exec_status == StageStatus.IN_PROGRESS: stats["executive_interview"]["in_progress"] += 1
-            elif exec_status == StageStatus.COMPLETED: stats["executive_interview"]["completed"] += 1
-            else: stats["executive_interview"]["pending"] += 1
+        stage_keys = {stage: key for key, stage in INTERVIEW_STATISTICS_STAGES.items()}
+        for stage_name, stage_status, count in stage_counts:
+            bucket = INTERVIEW_STATISTICS_BUCKETS.get(getattr(stage_status, "value", stage_status))
+            if bucket:
+                stats[stage_keys[stage_name]][bucket] += count
+        for counts in stats.values():
+            counts["pending"] = max(total_applications - sum(counts.values()), 0)
 
         # 3. 예정된 면접 (Mock Data) - 실제 스케줄 테이블 연동 필요
         # 임시로 랜덤 생성 또는 고정값 반환
@@ -13,12 +13,11 @@ from app.api.v2.auth.auth import get_current_user
 from app.utils.llm_cache import redis_cache
 from pydantic import BaseModel
 from app.models.v2.recruitment.job import JobPost
-from app.models.v2.document.resume import Spec
 from app.models.v2.analysis.analysis_result import AnalysisResult
 from datetime import datetime
 
 # 공통 유틸리티 import
-from agent.utils.resume_utils import combine_resume_and_specs
+from app.services.v2.document.resume_document_service import get_resume_text
 import time
 
 router = APIRouter()
@@ -174,7 +173,7 @@ def update_resume_memo(
     db.refresh(db_memo)
     return db_memo 
 
-# combine_resume_and_specs 함수는 comprehensive_analysis_tool에서 import하여 사용
+# 이력서+스펙 통합 텍스트는 구체화된 이력서 문서(resume_document_service)에서 조회
 
 @router.post("/applicant-comparison", response_model=ResumeAnalysisResponse)
 async def generate_applicant_comparison_analysis(request: ResumeAnalysisRequest, db: Session = Depends(get_db)):
@@ -203,8 +202,7 @@ async def generate_applicant_comparison_analysis(request: ResumeAnalysisRequest,
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 및 공고 ID 수집
         job_info = ""
@@ -223,92 +221,17 @@ async def generate_applicant_comparison_analysis(request: ResumeAnalysisRequest,
         if not job_post_id:
             raise HTTPException(status_code=400, detail="Job post information is required for applicant comparison")
         
-        # 같은 공고의 다른 지원자들 데이터 수집
-        from sqlalchemy.orm import joinedload
-        from app.models.v2.auth.user import ApplicantUser
-        
-        other_applications = (
-            db.query(Application)
-            .options(
-                joinedload(Application.user),
-                joinedload(Application.resume).joinedload(Resume.specs)
-            )
-            .filter(Application.job_post_id == job_post_id)
-            .filter(Application.id != request.application_id)
-            .limit(5)
-            .all()
+        # 공고 전체 지원자 특징 배열 기준 정량 비교 + 상위 경쟁자 서술형 분석
+        from agent.tools.competitiveness_comparison_tool import generate_applicant_comparison_analysis
+        result = generate_applicant_comparison_analysis(
+            current_resume_text=resume_text,
+            job_post_id=job_post_id,
+            application_id=request.application_id,
+            job_info=job_info,
+            db=db,
+            comparison_count=5
         )
         
-        other_applicants = []
-        for app in other_applications:
-            try:
-                # ApplicantUser 확인
-                is_applicant = db.query(ApplicantUser).filter(ApplicantUser.id == app.user_id).first()
-                if not is_applicant or not app.user or not app.resume:
-                    continue
-                
-                # 이력서 텍스트 생성
-                app_resume_text = combine_resume_and_specs(app.resume, app.resume.specs)
-                
-                # 기본 정보 추출
-                education = "정보 없음"
-                major = "정보 없음"
-                
-                if app.resume.specs:
-                    # 학력 정보 추출
-                    edu_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "institution"]
-                    if edu_specs:
-                        education = edu_specs[0].spec_description or "정보 없음"
-                    
-                    # 전공 정보 추출
-                    degree_specs = [s for s in app.resume.specs if s.spec_type == "education" and s.spec_title == "degree"]
-                    if degree_specs:
-                        degree_raw = degree_specs[0].spec_description or ""
-                        if degree_raw:
-                            import re
-                            m = re.match(r"(.+?)\((.+?)\)", degree_raw)
-                            if m:
-                                major = m.group(1).strip()
-                            else:
-                                major = degree_raw.strip()
-                
-                applicant_data = {
-                    "application_id": app.id,
-                    "name": app.user.name or f"지원자 {app.id}",
-                    "education": education,
-                    "major": major,
-                    "status": app.status or "서류 검토 중",
-                    "resume_text": app_resume_text,
-                    "summary": app_resume_text[:300] + "..." if len(app_resume_text) > 300 else app_resume_text
-                }
-                other_applicants.append(applicant_data)
-            except Exception as e:
-                print(f"개별 지원자 처리 오류 (application_id: {app.id}): {str(e)}")
-                continue
-        
-        # 새로운 지원자 비교 분석 도구 사용 (other_applicants 데이터를 직접 전달)
-        from agent.tools.competitiveness_comparison_tool import generate_applicant_comparison_analysis_with_data
-        
-        # 새로운 함수가 없으면 기존 함수 사용
-        try:
-            result = generate_applicant_comparison_analysis_with_data(
-                current_resume_text=resume_text,
-                other_applicants=other_applicants,
-                job_info=job_info,
-                job_post_id=job_post_id
-            )
-        except AttributeError:
-            # 기존 함수 사용
-            from agent.tools.competitiveness_comparison_tool import generate_applicant_comparison_analysis
-            result = generate_applicant_comparison_analysis(
-                current_resume_text=resume_text,
-                job_post_id=job_post_id,
-                application_id=request.application_id,
-                job_info=job_info,
-                db=db,
-                comparison_count=5
-            )
-        
         # 분석 결과를 DB에 저장
         if request.application_id:
             try:
@@ -380,8 +303,7 @@ async def generate_detailed_analysis(request: ResumeAnalysisRequest, db: Session
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집 (application_id가 있는 경우)
         job_info = ""
@@ -460,8 +382,7 @@ async def generate_competitiveness_comparison(request: ResumeAnalysisRequest, db
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집 (application_id가 있는 경우)
         job_info = ""
@@ -523,8 +444,7 @@ async def generate_comprehensive_analysis(request: ResumeAnalysisRequest, db: Se
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집 (application_id가 있는 경우)
         job_info = ""
@@ -625,8 +545,7 @@ async def generate_impact_points_analysis(request: ResumeAnalysisRequest, db: Se
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집 (application_id가 있는 경우)
         job_info = ""
@@ -11,7 +11,8 @@ from app.api.v2.auth.auth import get_current_user
 from app.models.v2.auth.user import User
 from app.models.v2.document.application import Application, ApplicationStage, OverallStatus, StageStatus, StageName
 from app.models.v2.recruitment.job import JobPost
-from app.models.v2.document.resume import Resume, Spec
+from app.models.v2.document.resume import Resume
+from app.services.v2.document.resume_document_service import get_resume_text, get_resume_documents
 from app.models.v2.interview.personal_question_result import PersonalQuestionResult
 from app.services.v2.interview.interview_question_service import InterviewQuestionService
 from app.schemas.interview_question import InterviewQuestionCreate, InterviewQuestionBulkCreate,InterviewQuestionResponse, InterviewQuestionBulkCreate
@@ -238,76 +239,6 @@ class JobBasedStrengthsResponse(BaseModel):
     development_areas: List[str]
     competitive_advantages: List[str]
 
-def combine_resume_and_specs(resume: Resume, specs: List[Spec]) -> str:
-    """Resume와 Spec을 조합하여 포괄적인 resume_text 생성"""
-    
-    # 기본 이력서 정보
-    resume_text = f"""
-이력서 제목: {resume.title}
-
-기본 내용:
-{resume.content or "내용 없음"}
-"""
-    
-    # Spec 타입별로 분류
-    spec_categories = {}
-    for spec in specs:
-        spec_type = spec.spec_type
-        if spec_type not in spec_categories:
-            spec_categories[spec_type] = []
-        spec_categories[spec_type].append(spec)
-    
-    # 프로젝트 정보 (우선순위 높음)
-    if "project" in spec_categories or "프로젝트" in spec_categories:
-        projects = spec_categories.get("project", []) + spec_categories.get("프로젝트", [])
-        resume_text += "\n\n주요 프로젝트 경험:\n"
-        for i, project in enumerate(projects, 1):
-            resume_text += f"{i}. {project.spec_title}\n"
-            if project.spec_description:
-                resume_text += f"   {project.spec_description}\n"
-    
-    # 교육사항
-    if "education" in spec_categories or "교육" in spec_categories:
-        educations = spec_categories.get("education", []) + spec_categories.get("교육", [])
-        resume_text += "\n\n교육사항:\n"
-        for education in educations:
-            resume_text += f"- {education.spec_title}\n"
-            if education.spec_description:
-                resume_text += f"  {education.spec_description}\n"
-    
-    # 자격증
-    if "certificate" in spec_categories or "자격증" in spec_categories:
-        certificates = spec_categories.get("certificate", []) + spec_categories.get("자격증", [])
-        resume_text += "\n\n자격증:\n"
-        for cert in certificates:
-            resume_text += f"- {cert.spec_title}\n"
-            if cert.spec_description:
-                resume_text += f"  {cert.spec_description}\n"
-    
-    # 기술스택
-    if "skill" in spec_categories or "기술" in spec_categories:
-        skills = spec_categories.get("skill", []) + spec_categories.get("기술", [])
-        resume_text += "\n\n기술 스택:\n"
-        for skill in skills:
-            resume_text += f"- {skill.spec_title}\n"
-            if skill.spec_description:
-                resume_text += f"  {skill.spec_description}\n"
-    
-    # 기타 스펙들
-    other_specs = []
-    for spec_type, specs_list in spec_categories.items():
-        if spec_type not in ["project", "프로젝트", "education", "교육", "certificate", "자격증", "skill", "기술"]:
-            other_specs.extend(specs_list)
-    
-    if other_specs:
-        resume_text += "\n\n기타 경험:\n"
-        for spec in other_specs:
-            resume_text += f"- {spec.spec_title} ({spec.spec_type})\n"
-            if spec.spec_description:
-                resume_text += f"  {spec.spec_description}\n"
-    
-    return resume_text.strip()
-
 def parse_job_post_data(job_post: JobPost) -> str:
     """JobPost 데이터를 파싱하여 직무 정보 텍스트 생성"""
     
@@ -389,8 +320,7 @@ async def generate_integrated_questions(request: IntegratedQuestionRequest, db:
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -453,8 +383,7 @@ async def generate_resume_analysis(request: ResumeAnalysisRequest, db: Session =
         resume = db.query(Resume).filter(Resume.id == request.resume_id).first()
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -500,8 +429,7 @@ async def generate_interview_checklist(request: InterviewChecklistRequest, db: S
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -534,8 +462,7 @@ async def analyze_strengths_weaknesses(request: StrengthsWeaknessesRequest, db:
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -568,8 +495,7 @@ async def generate_interview_guideline(request: InterviewGuidelineRequest, db: S
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -602,8 +528,7 @@ async def suggest_evaluation_criteria(request: EvaluationCriteriaRequest, db: Se
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -756,10 +681,8 @@ async def generate_project_questions(request: ProjectQuestionRequest, db: Sessio
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        
         # Resume + Spec 통합 텍스트 생성
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # LangGraph 워크플로우를 사용한 종합 질문 생성
         import sys
@@ -861,11 +784,8 @@ async def generate_job_questions(request: JobQuestionRequest, db: Session = Depe
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Spec 데이터 조회
-        specs = db.query(Spec).filter(Spec.resume_id == application.resume_id).all()
-        
         # Resume + Spec 통합 텍스트 생성
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # JobPost 정보 파싱
         job_info = parse_job_post_data(job_post)
@@ -1060,17 +980,16 @@ async def generate_passed_applicants_questions(
         # 각 합격자에 대한 개인별 질문 생성
         applicants_data = []
         
+        # 합격자 전체의 이력서 문서(통합 텍스트 + 스펙)를 한 번에 조회
+        resume_documents = get_resume_documents(db, [applicant["resume_id"] for applicant in passed_applicants])
+        
         for applicant in passed_applicants:
-            # Resume 데이터 조회
-            resume = db.query(Resume).filter(Resume.id == applicant["resume_id"]).first()
-            if not resume:
+            document = resume_documents.get(applicant["resume_id"])
+            if not document:
                 continue
             
-            # Spec 데이터 조회
-            specs = db.query(Spec).filter(Spec.resume_id == applicant["resume_id"]).all()
-            
-            # Resume + Spec 통합 텍스트 생성
-            resume_text = combine_resume_and_specs(resume, specs)
+            # Resume + Spec 통합 텍스트 (구체화된 문서)
+            resume_text = document.resume_text
             
             # 이력서 데이터 구성
             resume_data = {
@@ -1103,30 +1022,30 @@ async def generate_passed_applicants_questions(
             }
             
             # Spec 데이터에서 추가 정보 추출
-            for spec in specs:
-                if str(spec.spec_type) == "experience" and str(spec.spec_title) == "company":
-                    resume_data["experience"]["companies"].append(spec.spec_description or "")
-                elif str(spec.spec_type) == "experience" and str(spec.spec_title) == "position":
-                    resume_data["experience"]["position"] = spec.spec_description or ""
-                elif str(spec.spec_type) == "experience" and str(spec.spec_title) == "duration":
-                    resume_data["experience"]["duration"] = spec.spec_description or ""
-                elif str(spec.spec_type) == "skills" and str(spec.spec_title) == "name":
-                    if "Java" in (spec.spec_description or ""):
+            for spec in document.specs:
+                if str(spec["spec_type"]) == "experience" and str(spec["spec_title"]) == "company":
+                    resume_data["experience"]["companies"].append(spec["spec_description"] or "")
+                elif str(spec["spec_type"]) == "experience" and str(spec["spec_title"]) == "position":
+                    resume_data["experience"]["position"] = spec["spec_description"] or ""
+                elif str(spec["spec_type"]) == "experience" and str(spec["spec_title"]) == "duration":
+                    resume_data["experience"]["duration"] = spec["spec_description"] or ""
+                elif str(spec["spec_type"]) == "skills" and str(spec["spec_title"]) == "name":
+                    if "Java" in (spec["spec_description"] or ""):
                         resume_data["skills"]["programming_languages"].append("Java")
-                    if "Python" in (spec.spec_description or ""):
+                    if "Python" in (spec["spec_description"] or ""):
                         resume_data["skills"]["programming_languages"].append("Python")
-                    if "Spring" in (spec.spec_description or ""):
+                    if "Spring" in (spec["spec_description"] or ""):
                         resume_data["skills"]["frameworks"].append("Spring")
-                    if "React" in (spec.spec_description or ""):
+                    if "React" in (spec["spec_description"] or ""):
                         resume_data["skills"]["frameworks"].append("React")
-                elif str(spec.spec_type) == "projects" and str(spec.spec_title) == "name":
+                elif str(spec["spec_type"]) == "projects" and str(spec["spec_title"]) == "name":
                     resume_data["projects"].append({
-                        "name": spec.spec_description or "",
+                        "name": spec["spec_description"] or "",
                         "description": ""
                     })
-                elif str(spec.spec_type) == "activities" and str(spec.spec_title) == "name":
+                elif str(spec["spec_type"]) == "activities" and str(spec["spec_title"]) == "name":
                     resume_data["activities"].append({
-                        "name": spec.spec_description or "",
+                        "name": spec["spec_description"] or "",
                         "description": ""
                     })
             
@@ -1171,8 +1090,7 @@ async def generate_analysis_questions(request: IntegratedQuestionRequest, db: Se
         resume = db.query(Resume).filter(Resume.id == request.resume_id).first()
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
 
         job_info = ""
         if request.application_id:
@@ -1523,8 +1441,7 @@ async def generate_ai_interview_questions(request: AiInterviewRequest, db: Sessi
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -1575,8 +1492,7 @@ async def generate_and_save_ai_interview_questions(request: AiInterviewSaveReque
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -1730,11 +1646,8 @@ async def generate_ai_tools(request: AiToolsRequest, db: Session = Depends(get_d
     if not resume:
         raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
     
-    # Spec 정보 조회
-    specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-    
     # 통합 이력서 텍스트 생성
-    resume_text = combine_resume_and_specs(resume, specs)
+    resume_text = get_resume_text(db, resume)
     
     # Agent 호출 준비
     import httpx
@@ -1990,8 +1903,7 @@ async def create_resume_based_evaluation_criteria(request: EvaluationCriteriaReq
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -2332,8 +2244,7 @@ async def generate_interview_questions_with_langgraph(request: IntegratedQuestio
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -2385,8 +2296,7 @@ async def generate_resume_analysis_with_langgraph(request: ResumeAnalysisRequest
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -2441,8 +2351,7 @@ async def generate_ai_interview_with_langgraph(request: AiInterviewRequest, db:
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
@@ -2491,8 +2400,7 @@ async def generate_evaluation_tools_with_langgraph(request: AiToolsRequest, db:
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        specs = db.query(Spec).filter(Spec.resume_id == request.resume_id).all()
-        resume_text = combine_resume_and_specs(resume, specs)
+        resume_text = get_resume_text(db, resume)
         
         # 직무 정보 수집
         job_info = ""
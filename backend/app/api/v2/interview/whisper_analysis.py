@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, File, Form, UploadFile
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
+import asyncio
 import json
 import requests
 import os
@@ -9,11 +10,13 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.models.v2.interview.question_media_analysis import QuestionMediaAnalysis
 from app.models.v2.interview.media_analysis import MediaAnalysis
 from app.models.v2.document.application import Application
 from app.services.v2.interview.whisper_analysis_service import WhisperAnalysisService
+from app.services.v2.interview.analysis_job_queue import qa_analysis_queue, CallbackURLNotAllowed
+from app.utils.agent_client import agent_http_pool
 
 router = APIRouter()
 
@@ -103,21 +106,18 @@ print(json.dumps(result, ensure_ascii=False))
             "context_analysis": {"qa_pairs": [], "evaluation": {}}
         }
 
-import httpx
-
 async def run_openai_answer_analysis(question: str, answer: str) -> Dict[str, Any]:
     """OpenAI 답변 분석 (API 호출 방식)"""
     try:
         # agent 컨테이너의 API 호출
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{AGENT_URL}/openai-answer-analysis",
-                json={
-                    "question": question,
-                    "answer": answer
-                },
-                timeout=300.0
-            )
+        response = await agent_http_pool.post(
+            f"{AGENT_URL}/openai-answer-analysis",
+            json={
+                "question": question,
+                "answer": answer
+            },
+            timeout=300.0
+        )
         
         if response.status_code != 200:
             print(f"❌ OpenAI 답변 분석 실패: {response.text}")
@@ -139,15 +139,14 @@ async def run_openai_context_analysis(transcription: str, speakers: List[Dict])
     """OpenAI 문맥 분석 (API 호출 방식)"""
     try:
         # agent 컨테이너의 API 호출
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{AGENT_URL}/openai-context-analysis",
-                json={
-                    "transcription": transcription,
-                    "speakers": speakers
-                },
-                timeout=300.0
-            )
+        response = await agent_http_pool.post(
+            f"{AGENT_URL}/openai-context-analysis",
+            json={
+                "transcription": transcription,
+                "speakers": speakers
+            },
+            timeout=300.0
+        )
         
         if response.status_code != 200:
             print(f"❌ OpenAI 문맥 분석 실패: {response.text}")
@@ -169,14 +168,13 @@ async def run_emotion_analysis(transcription: str) -> Dict[str, Any]:
     """감정 분석 (API 호출 방식)"""
     try:
         # agent 컨테이너의 API 호출
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{AGENT_URL}/emotion-analysis",
-                json={
-                    "transcription": transcription
-                },
-                timeout=300.0
-            )
+        response = await agent_http_pool.post(
+            f"{AGENT_URL}/emotion-analysis",
+            json={
+                "transcription": transcription
+            },
+            timeout=300.0
+        )
         
         if response.status_code != 200:
             print(f"❌ 감정 분석 실패: {response.text}")
@@ -344,9 +342,251 @@ def extract_audio_from_video(video_path: str, max_duration_seconds: int = 120) -
         return None
 
 
+QA_RECORD_QUESTION_LOG_ID = 999  # 전체 영상 QA 분석 레코드용 임시 ID
+
+# 서비스 호출 타임아웃(초)
+EXTRACT_AUDIO_TIMEOUT = 600
+DOWNLOAD_VIDEO_TIMEOUT = 300
+QA_ANALYSIS_TIMEOUT = 1800
+QA_UPLOAD_TIMEOUT = 1200  # 실시간 녹음 업로드 QA 분석 (20분)
+DELETE_FILE_TIMEOUT = 30
+
+
+async def _post_service(url: str, payload: Dict[str, Any], timeout: float, label: str) -> Dict[str, Any]:
+    """내부 서비스 비동기 POST 호출 (공유 커넥션 풀 사용, 실패 시 RuntimeError)"""
+    try:
+        response = await agent_http_pool.post(url, json=payload, timeout=timeout)
+    except Exception as e:
+        raise RuntimeError(f"{label} 호출 실패: {str(e)}")
+    if response.status_code != 200:
+        raise RuntimeError(f"{label} 오류: {response.text}")
+    result = response.json()
+    if not result.get("success"):
+        raise RuntimeError(f"{label} 실패: {result.get('error', 'unknown')}")
+    return result
+
+
+def _save_qa_record(application_id: int, status: str, question_text: str, job: Dict[str, Any], detailed_analysis: Dict[str, Any] = None):
+    """QA 분석 레코드(question_log_id=999)의 상태/결과 저장
+
+    결과가 없는 상태 변경(queued/processing/failed)에서는 이전 분석 결과를 유지하고 작업 정보만 갱신합니다.
+    """
+    db = SessionLocal()
+    try:
+        record = db.query(QuestionMediaAnalysis).filter(
+            QuestionMediaAnalysis.application_id == application_id,
+            QuestionMediaAnalysis.question_log_id == QA_RECORD_QUESTION_LOG_ID
+        ).first()
+        if record is None:
+            record = QuestionMediaAnalysis(
+                application_id=application_id,
+                question_log_id=QA_RECORD_QUESTION_LOG_ID,
+                question_text=question_text
+            )
+            db.add(record)
+
+        record.status = status
+        if detailed_analysis is not None:
+            record.analysis_timestamp = datetime.now()
+            record.transcription = None
+            record.question_score = None
+            record.question_feedback = None
+            record.detailed_analysis = {**detailed_analysis, "job": job}
+        else:
+            record.detailed_analysis = {**(record.detailed_analysis or {}), "job": job}
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"❌ QA 분석 상태 저장 오류 ({application_id}, {status}): {str(e)}")
+    finally:
+        db.close()
+
+
+async def _update_qa_record(application_id: int, status: str, question_text: str, job: Dict[str, Any], detailed_analysis: Dict[str, Any] = None):
+    await asyncio.to_thread(_save_qa_record, application_id, status, question_text, job, detailed_analysis)
+
+
+async def _run_extra_emotion_context(result: Dict[str, Any]) -> Dict[str, Any]:
+    """QA 답변 전사를 합쳐 감정/문맥 분석 (옵션)"""
+    try:
+        parts = []
+        for item in result.get("qa", []):
+            a = item.get("analysis", {})
+            t = a.get("transcription") or a.get("text") or ""
+            if t:
+                parts.append(str(t).strip())
+        combined_transcription = " \n".join(parts)
+        if not combined_transcription:
+            return {}
+
+        # 감정 분석과 문맥 분석(OpenAI)을 동시에 실행
+        emo, ctx = await asyncio.gather(
+            run_emotion_analysis(combined_transcription),
+            run_openai_context_analysis(combined_transcription, [])
+        )
+        return {
+            "combined_transcription_length": len(combined_transcription),
+            "emotion_analysis": emo or {},
+            "context_analysis": ctx or {}
+        }
+    except Exception as e:
+        print(f"❌ 추가 감정/문맥 분석 오류: {str(e)}")
+        return {"error": str(e)}
+
+
+def _qa_job_info(params: Dict[str, Any], status: str, error: str = None) -> Dict[str, Any]:
+    info = {"job_id": params["job_id"], "status": status, "updated_at": datetime.now().isoformat()}
+    if error:
+        info["error"] = error
+    return info
+
+
+async def _run_qa_local_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """[작업] 공유 볼륨 경로의 오디오/비디오로 QA 분석 후 DB 저장"""
+    application_id = params["application_id"]
+    question_text = "Diarized QA Analysis (local)"
+    audio_path = params.get("audio_path")
+    video_path = params.get("video_path")
+    await _update_qa_record(application_id, "processing", question_text, _qa_job_info(params, "processing"))
+
+    try:
+        # 오디오 경로가 없고 비디오 경로만 있으면 video-analysis로 오디오 추출
+        if not audio_path and video_path:
+            extracted = await _post_service(f"{VIDEO_ANALYSIS_URL}/extract-audio", {
+                "video_path": video_path,
+                "max_duration_seconds": params.get("max_duration_seconds")
+            }, EXTRACT_AUDIO_TIMEOUT, "오디오 추출")
+            audio_path = extracted.get("audio_path")
+
+        # 에이전트 QA 분석 호출 (로컬 경로 직접 사용)
+        result = await _post_service(f"{AGENT_URL}/diarized-qa-analysis", {
+            "audio_path": audio_path,
+            "application_id": application_id,
+            "persist": params.get("persist", True),
+            "output_dir": params.get("output_dir"),
+            "max_workers": params.get("max_workers", 2),
+            "delete_after_input": params.get("delete_after_input", False)
+        }, QA_ANALYSIS_TIMEOUT, "Agent QA 분석")
+    except Exception as e:
+        await _update_qa_record(application_id, "failed", question_text, _qa_job_info(params, "failed", str(e)))
+        raise
+
+    emotion_ctx_result = await _run_extra_emotion_context(result) if params.get("run_emotion_context") else {}
+
+    await _update_qa_record(application_id, "completed", question_text, _qa_job_info(params, "completed"), {
+        "qa_analysis": result,
+        "source": "process-qa-local",
+        "audio_path": audio_path,
+        "extra_emotion_context": emotion_ctx_result
+    })
+
+    # 입력 파일 삭제 처리
+    try:
+        if params.get("delete_video_after") and video_path and os.path.exists(video_path):
+            os.remove(video_path)
+    except Exception as e:
+        print(f"입력 비디오 삭제 오류: {str(e)}")
+
+    return {
+        "success": True,
+        "application_id": application_id,
+        "total_pairs": result.get("total_pairs", 0),
+        "applicant_speaker_id": result.get("applicant_speaker_id"),
+        "qa": result.get("qa", []),
+        "audio_path": audio_path,
+        "extra_emotion_context": emotion_ctx_result
+    }
+
+
+async def _run_qa_video_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """[작업] 지원자 면접 영상 다운로드 → 오디오 추출 → QA 분석 → DB 저장 → 임시 파일 정리"""
+    application_id = params["application_id"]
+    question_text = "Diarized QA Analysis"
+    delete_video_after = params.get("delete_video_after", True)
+    await _update_qa_record(application_id, "processing", question_text, _qa_job_info(params, "processing"))
+
+    video_path = audio_path = None
+    try:
+        # 1) 비디오 다운로드
+        downloaded = await _post_service(f"{VIDEO_ANALYSIS_URL}/download-video", {
+            "video_url": params["video_url"],
+            "application_id": application_id
+        }, DOWNLOAD_VIDEO_TIMEOUT, "비디오 다운로드")
+        video_path = downloaded.get("video_path")
+
+        # 2) 오디오 추출 (QA 분석은 전체 구간 필요성이 높아 여유롭게 상한 설정)
+        extracted = await _post_service(f"{VIDEO_ANALYSIS_URL}/extract-audio", {
+            "video_path": video_path,
+            "max_duration_seconds": 3600
+        }, EXTRACT_AUDIO_TIMEOUT, "오디오 추출")
+        audio_path = extracted.get("audio_path")
+
+        # 3) Agent에 QA 분석 요청
+        result = await _post_service(f"{AGENT_URL}/diarized-qa-analysis", {
+            "audio_path": audio_path,
+            "application_id": application_id,
+            "persist": params.get("persist", False),
+            "output_dir": params.get("output_dir"),
+            "run_emotion_context": params.get("run_emotion_context", False)
+        }, QA_ANALYSIS_TIMEOUT, "Agent QA 분석")
+
+        # 4) 결과를 DB에 저장/업데이트
+        await _update_qa_record(application_id, "completed", question_text, _qa_job_info(params, "completed"), {
+            "qa_analysis": result
+        })
+    except Exception as e:
+        await _update_qa_record(application_id, "failed", question_text, _qa_job_info(params, "failed", str(e)))
+        raise
+    finally:
+        # 5) 임시 파일 정리 (video-analysis 컨테이너에 삭제 요청)
+        if delete_video_after:
+            for file_path in (video_path, audio_path):
+                if not file_path:
+                    continue
+                try:
+                    cleanup_response = await agent_http_pool.post(
+                        f"{VIDEO_ANALYSIS_URL}/delete-file",
+                        json={"file_path": file_path},
+                        timeout=DELETE_FILE_TIMEOUT,
+                        retries=0
+                    )
+                    if cleanup_response.status_code == 200:
+                        print(f"✅ 임시 파일 삭제 완료: {file_path}")
+                    else:
+                        print(f"⚠️ 임시 파일 삭제 실패: {cleanup_response.text}")
+                except Exception as e:
+                    print(f"⚠️ 임시 파일 정리 중 오류 (무시): {str(e)}")
+
+    return {
+        "success": True,
+        "application_id": application_id,
+        "total_pairs": result.get("total_pairs", 0),
+        "applicant_speaker_id": result.get("applicant_speaker_id"),
+        "qa": result.get("qa", []),
+        "files_cleaned": delete_video_after
+    }
+
+
+qa_analysis_queue.register("qa_local", _run_qa_local_job)
+qa_analysis_queue.register("qa_video", _run_qa_video_job)
+
+
+def _job_response(application_id: int, job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "application_id": application_id,
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "deduplicated": job.get("deduplicated", False),
+        "status_url": f"/api/v2/whisper-analysis/qa-jobs/{job['job_id']}"
+    }
+
+
 @router.post("/process-qa-local")
 async def process_qa_local(payload: Dict[str, Any], db: Session = Depends(get_db)):
-    """로컬(공유 볼륨) 경로의 오디오/비디오를 직접 받아 QA 분석 실행 후 DB 저장
+    """로컬(공유 볼륨) 경로의 오디오/비디오로 QA 분석 작업을 등록하고 job_id를 즉시 반환
+
+    분석 결과는 GET /qa-jobs/{job_id} 또는 GET /qa-analysis/{application_id}로 조회합니다.
 
     payload:
       - application_id: int
@@ -357,150 +597,38 @@ async def process_qa_local(payload: Dict[str, Any], db: Session = Depends(get_db
       - max_workers: int = 2
       - max_duration_seconds: int | None (video_path 사용 시 오디오 추출 상한)
       - delete_video_after: bool = False (video_path 사용 시, 분석 완료 후 비디오 삭제)
+      - callback_url: str | None (완료 시 작업 상태를 POST할 웹훅, ANALYSIS_CALLBACK_ALLOWED_HOSTS의 내부 호스트만 허용)
     """
     try:
         application_id = int(payload.get("application_id")) if payload.get("application_id") is not None else None
-        audio_path = payload.get("audio_path")
-        video_path = payload.get("video_path")
-        persist = bool(payload.get("persist", True))
-        output_dir = payload.get("output_dir", "/data/qa_slices")
-        max_workers = int(payload.get("max_workers", 2))
-        delete_after_input = bool(payload.get("delete_after_input", False))
-        run_emotion_context = bool(payload.get("run_emotion_context", False))
-        max_duration_seconds = payload.get("max_duration_seconds")
-        delete_video_after = bool(payload.get("delete_video_after", False))
-
         if not application_id:
             raise HTTPException(status_code=400, detail="application_id is required")
-
-        # 오디오 경로가 없고 비디오 경로만 있으면 video-analysis로 오디오 추출
-        if not audio_path and video_path:
-            try:
-                resp = requests.post(
-                    f"{VIDEO_ANALYSIS_URL}/extract-audio",
-                    json={
-                        "video_path": video_path,
-                        "max_duration_seconds": max_duration_seconds
-                    },
-                    timeout=600
-                )
-                if resp.status_code != 200 or not resp.json().get("success"):
-                    raise HTTPException(status_code=502, detail=f"오디오 추출 실패: {resp.text}")
-                audio_path = resp.json().get("audio_path")
-            except Exception as e:
-                raise HTTPException(status_code=502, detail=f"오디오 추출 오류: {str(e)}")
-
-        if not audio_path:
+        if not payload.get("audio_path") and not payload.get("video_path"):
             raise HTTPException(status_code=400, detail="audio_path or video_path is required")
 
-        # 에이전트 QA 분석 호출 (로컬 경로 직접 사용)
-        try:
-            response = requests.post(
-                f"{AGENT_URL}/diarized-qa-analysis",
-                json={
-                    "audio_path": audio_path,
-                    "application_id": application_id,
-                    "persist": persist,
-                    "output_dir": output_dir,
-                    "max_workers": max_workers,
-                    "delete_after_input": delete_after_input
-                },
-                timeout=1800
-            )
-        except Exception as e:
-            raise HTTPException(status_code=502, detail=f"Agent 호출 실패: {str(e)}")
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=502, detail=f"Agent 오류: {response.text}")
-
-        result = response.json()
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=f"QA 분석 실패: {result.get('error', 'unknown')}")
-
-        # 추가: 감정/문맥 분석 실행 (옵션)
-        emotion_ctx_result: Dict[str, Any] = {}
-        if run_emotion_context:
-            try:
-                qa_items = result.get("qa", [])
-                parts = []
-                for item in qa_items:
-                    a = item.get("analysis", {})
-                    t = a.get("transcription") or a.get("text") or ""
-                    if t:
-                        parts.append(str(t).strip())
-                combined_transcription = " \n".join(parts)
-
-                if combined_transcription:
-                    # 감정 분석
-                    emo = await run_emotion_analysis(combined_transcription)
-                    # 문맥 분석(OpenAI)
-                    ctx = await run_openai_context_analysis(combined_transcription, [])
-                    emotion_ctx_result = {
-                        "combined_transcription_length": len(combined_transcription),
-                        "emotion_analysis": emo or {},
-                        "context_analysis": ctx or {}
-                    }
-            except Exception as e:
-                print(f"❌ 추가 감정/문맥 분석 오류: {str(e)}")
-                emotion_ctx_result = {"error": str(e)}
-
-        # DB 저장/업데이트(question_log_id=999)
-        try:
-            existing = db.query(QuestionMediaAnalysis).filter(
-                QuestionMediaAnalysis.application_id == application_id,
-                QuestionMediaAnalysis.question_log_id == 999
-            ).first()
-            if existing:
-                existing.analysis_timestamp = datetime.now()
-                existing.status = "completed"
-                existing.transcription = None
-                existing.question_score = None
-                existing.question_feedback = None
-                existing.detailed_analysis = {
-                    "qa_analysis": result,
-                    "source": "process-qa-local",
-                    "audio_path": audio_path,
-                    "extra_emotion_context": emotion_ctx_result
-                }
-            else:
-                new_row = QuestionMediaAnalysis(
-                    application_id=application_id,
-                    question_log_id=999,
-                    question_text="Diarized QA Analysis (local)",
-                    analysis_timestamp=datetime.now(),
-                    status="completed",
-                    detailed_analysis={
-                        "qa_analysis": result,
-                        "source": "process-qa-local",
-                        "audio_path": audio_path,
-                        "extra_emotion_context": emotion_ctx_result
-                    }
-                )
-                db.add(new_row)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            print(f"❌ QA 분석 DB 저장 오류(process-qa-local): {str(e)}")
-
-        # 입력 파일 삭제 처리
-        try:
-            if delete_video_after and video_path and os.path.exists(video_path):
-                os.remove(video_path)
-        except Exception as e:
-            print(f"입력 비디오 삭제 오류: {str(e)}")
-
-        return {
-            "success": True,
+        job = await qa_analysis_queue.enqueue("qa_local", {
             "application_id": application_id,
-            "total_pairs": result.get("total_pairs", 0),
-            "applicant_speaker_id": result.get("applicant_speaker_id"),
-            "qa": result.get("qa", []),
-            "audio_path": audio_path,
-            "extra_emotion_context": emotion_ctx_result
-        }
+            "audio_path": payload.get("audio_path"),
+            "video_path": payload.get("video_path"),
+            "persist": bool(payload.get("persist", True)),
+            "output_dir": payload.get("output_dir", "/data/qa_slices"),
+            "max_workers": int(payload.get("max_workers", 2)),
+            "delete_after_input": bool(payload.get("delete_after_input", False)),
+            "run_emotion_context": bool(payload.get("run_emotion_context", False)),
+            "max_duration_seconds": payload.get("max_duration_seconds"),
+            "delete_video_after": bool(payload.get("delete_video_after", False))
+        }, dedupe_key=f"application:{application_id}", callback_url=payload.get("callback_url"))
+
+        if not job.get("deduplicated"):
+            await _update_qa_record(application_id, "queued", "Diarized QA Analysis (local)", {
+                "job_id": job["job_id"], "status": "queued", "updated_at": datetime.now().isoformat()
+            })
+        return _job_response(application_id, job)
 
     except HTTPException:
         raise
+    except CallbackURLNotAllowed as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"❌ process-qa-local 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -513,126 +641,54 @@ async def process_qa_based_analysis(
     output_dir: str = None,
     run_emotion_context: bool = False,
     delete_video_after: bool = True,
+    callback_url: str = None,
     db: Session = Depends(get_db)
 ):
-    """화자분리 기반으로 면접관→지원자 페어를 만들고, 지원자 답변만 Whisper 분석하여 리스트로 반환"""
+    """화자분리 기반 QA 분석 작업을 등록하고 job_id를 즉시 반환
+
+    면접관→지원자 페어를 만들고 지원자 답변만 Whisper 분석하는 작업은 백그라운드 워커에서 실행되며,
+    결과는 GET /qa-jobs/{job_id} 또는 GET /qa-analysis/{application_id}로 조회합니다.
+    """
     try:
-        # 1) 지원자/영상 확인
+        # 지원자/영상 확인
         application = db.query(Application).filter(Application.id == application_id).first()
         if not application:
             raise HTTPException(status_code=404, detail="지원자를 찾을 수 없습니다")
         if not application.ai_interview_video_url:
             raise HTTPException(status_code=404, detail="AI 면접 비디오가 없습니다")
 
-        # 2) 비디오 다운로드
-        video_path = download_video_from_drive(application.ai_interview_video_url, application_id)
-        if not video_path:
-            raise HTTPException(status_code=500, detail="비디오 다운로드 실패")
-
-        # 3) 오디오 추출 (QA 분석은 전체 구간 필요성이 높아 여유롭게 상한 설정)
-        audio_path = extract_audio_from_video(video_path, max_duration_seconds=3600)
-        if not audio_path:
-            raise HTTPException(status_code=500, detail="오디오 추출 실패")
-
-        # 4) Agent에 QA 분석 요청
-        try:
-            response = requests.post(
-                f"{AGENT_URL}/diarized-qa-analysis",
-                json={
-                    "audio_path": audio_path,
-                    "application_id": application_id,
-                    "persist": persist,
-                    "output_dir": output_dir,
-                    "run_emotion_context": run_emotion_context
-                },
-                timeout=1200
-            )
-        except Exception as e:
-            raise HTTPException(status_code=502, detail=f"Agent 호출 실패: {str(e)}")
-
-        if response.status_code != 200:
-            raise HTTPException(status_code=502, detail=f"Agent 오류: {response.text}")
-
-        result = response.json()
-        if not result.get("success"):
-            raise HTTPException(status_code=500, detail=f"QA 분석 실패: {result.get('error', 'unknown')}")
-
-        # 5) 결과를 DB에 저장/업데이트 (전체 분석 레코드: question_log_id=999)
-        try:
-            existing = db.query(QuestionMediaAnalysis).filter(
-                QuestionMediaAnalysis.application_id == application_id,
-                QuestionMediaAnalysis.question_log_id == 999
-            ).first()
-            if existing:
-                existing.analysis_timestamp = datetime.now()
-                existing.status = "completed"
-                existing.transcription = None
-                existing.question_score = None
-                existing.question_feedback = None
-                existing.detailed_analysis = {
-                    "qa_analysis": result
-                }
-            else:
-                new_row = QuestionMediaAnalysis(
-                    application_id=application_id,
-                    question_log_id=999,
-                    question_text="Diarized QA Analysis",
-                    analysis_timestamp=datetime.now(),
-                    status="completed",
-                    detailed_analysis={
-                        "qa_analysis": result
-                    }
-                )
-                db.add(new_row)
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            print(f"❌ QA 분석 DB 저장 오류: {str(e)}")
-
-        # 6) 임시 파일 정리 (분석 완료 후)
-        try:
-            if delete_video_after and video_path:
-                # video-analysis 컨테이너에 비디오 삭제 요청
-                cleanup_response = requests.post(
-                    f"{VIDEO_ANALYSIS_URL}/delete-file",
-                    json={"file_path": video_path},
-                    timeout=30
-                )
-                if cleanup_response.status_code == 200:
-                    print(f"✅ 임시 비디오 파일 삭제 완료: {video_path}")
-                else:
-                    print(f"⚠️ 임시 비디오 파일 삭제 실패: {cleanup_response.text}")
-            
-            if delete_video_after and audio_path:
-                # video-analysis 컨테이너에 오디오 삭제 요청
-                cleanup_response = requests.post(
-                    f"{VIDEO_ANALYSIS_URL}/delete-file",
-                    json={"file_path": audio_path},
-                    timeout=30
-                )
-                if cleanup_response.status_code == 200:
-                    print(f"✅ 임시 오디오 파일 삭제 완료: {audio_path}")
-                else:
-                    print(f"⚠️ 임시 오디오 파일 삭제 실패: {cleanup_response.text}")
-        except Exception as e:
-            print(f"⚠️ 임시 파일 정리 중 오류 (무시): {str(e)}")
-
-        # 7) 결과 반환 (프론트는 dropdown으로 qa 배열을 표시)
-        return {
-            "success": True,
+        job = await qa_analysis_queue.enqueue("qa_video", {
             "application_id": application_id,
-            "total_pairs": result.get("total_pairs", 0),
-            "applicant_speaker_id": result.get("applicant_speaker_id"),
-            "qa": result.get("qa", []),
-            "files_cleaned": delete_video_after
-        }
+            "video_url": application.ai_interview_video_url,
+            "persist": persist,
+            "output_dir": output_dir,
+            "run_emotion_context": run_emotion_context,
+            "delete_video_after": delete_video_after
+        }, dedupe_key=f"application:{application_id}", callback_url=callback_url)
+
+        if not job.get("deduplicated"):
+            await _update_qa_record(application_id, "queued", "Diarized QA Analysis", {
+                "job_id": job["job_id"], "status": "queued", "updated_at": datetime.now().isoformat()
+            })
+        return _job_response(application_id, job)
 
     except HTTPException:
         raise
+    except CallbackURLNotAllowed as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"❌ QA 기반 분석 오류: {str(e)}")
+        print(f"❌ QA 기반 분석 작업 등록 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/qa-jobs/{job_id}")
+async def get_qa_job_status(job_id: str):
+    """QA 분석 작업 상태 조회 (완료 시 result에 분석 결과 포함)"""
+    job = await qa_analysis_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없거나 만료되었습니다")
+    return job
+
 def run_whisper_analysis(audio_path: str, application_id: int) -> Dict[str, Any]:
     """Whisper 분석 실행 (API 호출 방식)"""
     try:
@@ -791,6 +847,8 @@ async def get_qa_analysis_result(
             
             return {
                 "success": True,
+                "status": analysis.status,
+                "job": analysis.detailed_analysis.get("job"),
                 "qa_analysis": {
                     "total_pairs": qa_data.get("total_pairs", 0),
                     "applicant_speaker_id": qa_data.get("applicant_speaker_id"),
@@ -852,9 +910,9 @@ async def process_qa_audio_upload(
         
         print(f"✅ 오디오 파일 임시 저장 완료: {temp_file_path}")
         
-        # 4. Agent에 QA 분석 요청
+        # 4. Agent에 QA 분석 요청 (이벤트 루프를 막지 않도록 공유 비동기 커넥션 풀 사용)
         try:
-            response = requests.post(
+            response = await agent_http_pool.post(
                 f"{AGENT_URL}/diarized-qa-analysis",
                 json={
                     "audio_path": temp_file_path,
@@ -863,7 +921,7 @@ async def process_qa_audio_upload(
                     "output_dir": None,
                     "run_emotion_context": True
                 },
-                timeout=1200  # 20분 타임아웃
+                timeout=QA_UPLOAD_TIMEOUT
             )
         except Exception as e:
             raise HTTPException(status_code=502, detail=f"Agent 호출 실패: {str(e)}")
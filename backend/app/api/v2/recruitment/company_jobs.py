@@ -7,7 +7,7 @@ import logging
 import time
 from datetime import datetime
 from app.core.database import get_db
-from app.core.cache import cache_result, invalidate_cache, CACHE_KEYS
+from app.core.cache import cache_result, invalidate_tags, CACHE_KEYS
 from app.schemas.job import JobPostCreate, JobPostUpdate, JobPostDetail, JobPostList, InterviewScheduleCreate, InterviewScheduleDetail
 from app.models.v2.recruitment.job import JobPost, JobPostRole
 from app.models.v2.common.schedule import Schedule
@@ -38,7 +38,13 @@ def check_company_role(current_user: User):
         raise HTTPException(status_code=403, detail="기업 회원만 접근 가능합니다")
 
 @router.get("/", response_model=List[JobPostList])
-@cache_result(expire_time=1800, key_prefix="company_job_posts")  # 30분 캐싱
+@cache_result(
+    expire_time=1800,  # 30분 캐싱
+    key_prefix="company_job_posts",
+    key_args=["skip", "limit", "status", "current_user.company_id"],
+    tags=["company:{current_user.company_id}:jobposts"],
+    response_model=List[JobPostList]
+)
 def get_company_job_posts(
     skip: int = 0,
     limit: int = 100,
@@ -81,7 +87,13 @@ def get_company_job_posts(
 
 
 @router.get("/{job_post_id}", response_model=JobPostDetail)
-@cache_result(expire_time=300, key_prefix="company_job_post_detail")  # 5분 캐싱 (매우 빠른 반응)
+@cache_result(
+    expire_time=300,  # 5분 캐싱 (매우 빠른 반응)
+    key_prefix="company_job_post_detail",
+    key_args=["job_post_id", "current_user.company_id"],
+    tags=["jobpost:{job_post_id}", "company:{current_user.company_id}:jobposts"],
+    response_model=JobPostDetail
+)
 def get_company_job_post(
     job_post_id: int, 
     db: Session = Depends(get_db),
@@ -276,10 +288,7 @@ def create_company_job_post(
     
     # 캐시 무효화: 새로운 채용공고가 추가되었으므로 목록 캐시 무효화
     try:
-        company_cache_pattern = f"cache:company_job_posts:*company_id_{current_user.company_id}*"
-        public_cache_pattern = "cache:job_posts:*"
-        invalidate_cache(company_cache_pattern)
-        invalidate_cache(public_cache_pattern)
+        invalidate_tags(f"company:{current_user.company_id}:jobposts", "jobposts:public")
         logger.info(f"Cache invalidated after creating job post {db_job_post.id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate cache: {e}")
@@ -521,15 +530,11 @@ def update_company_job_post(
     
     # 캐시 무효화: 채용공고가 수정되었으므로 관련 캐시 무효화
     try:
-        company_cache_pattern = f"cache:company_job_posts:*company_id_{current_user.company_id}*"
-        detail_cache_pattern = f"cache:company_job_post_detail:*job_post_id_{job_post_id}*"
-        public_cache_pattern = "cache:job_posts:*"
-        public_detail_cache_pattern = f"cache:job_post_detail:*job_post_id_{job_post_id}*"
-        
-        invalidate_cache(company_cache_pattern)
-        invalidate_cache(detail_cache_pattern)
-        invalidate_cache(public_cache_pattern)
-        invalidate_cache(public_detail_cache_pattern)
+        invalidate_tags(
+            f"jobpost:{job_post_id}",
+            f"company:{current_user.company_id}:jobposts",
+            "jobposts:public"
+        )
         logger.info(f"Cache invalidated after updating job post {job_post_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate cache: {e}")
@@ -1088,15 +1093,11 @@ def delete_company_job_post(
         
         # 캐시 무효화: 채용공고가 삭제되었으므로 관련 캐시 무효화
         try:
-            company_cache_pattern = f"cache:company_job_posts:*company_id_{current_user.company_id}*"
-            detail_cache_pattern = f"cache:company_job_post_detail:*job_post_id_{job_post_id}*"
-            public_cache_pattern = "cache:job_posts:*"
-            public_detail_cache_pattern = f"cache:job_post_detail:*job_post_id_{job_post_id}*"
-            
-            invalidate_cache(company_cache_pattern)
-            invalidate_cache(detail_cache_pattern)
-            invalidate_cache(public_cache_pattern)
-            invalidate_cache(public_detail_cache_pattern)
+            invalidate_tags(
+                f"jobpost:{job_post_id}",
+                f"company:{current_user.company_id}:jobposts",
+                "jobposts:public"
+            )
             logger.info(f"Cache invalidated after deleting job post {job_post_id}")
         except Exception as e:
             logger.warning(f"Failed to invalidate cache: {e}")
@@ -1136,12 +1137,8 @@ def clear_company_job_posts_cache(
         # 기업 회원 권한 체크
         check_company_role(current_user)
         
-        # 해당 기업의 캐시만 무효화
-        company_cache_pattern = f"cache:company_job_posts:*company_id_{current_user.company_id}*"
-        detail_cache_pattern = f"cache:company_job_post_detail:*company_id_{current_user.company_id}*"
-        
-        invalidate_cache(company_cache_pattern)
-        invalidate_cache(detail_cache_pattern)
+        # 해당 기업의 캐시만 무효화 (목록/상세 모두 기업 태그에 연결됨)
+        invalidate_tags(f"company:{current_user.company_id}:jobposts")
         
         logger.info(f"Cleared cache for company {current_user.company_id}")
         return {"message": "Company job posts cache cleared successfully"}
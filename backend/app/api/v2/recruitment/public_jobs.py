@@ -5,7 +5,7 @@ from typing import List
 import logging
 import time
 from app.core.database import get_db
-from app.core.cache import cache_result, invalidate_cache, CACHE_KEYS
+from app.core.cache import cache_result, invalidate_tags, CACHE_KEYS
 from app.schemas.job import JobPostDetail, JobPostList
 from app.models.v2.recruitment.job import JobPost
 
@@ -52,7 +52,13 @@ def execute_with_retry(db: Session, query_func, max_retries=3, delay=1):
 
 
 @router.get("/", response_model=List[JobPostList])
-@cache_result(expire_time=3600, key_prefix="job_posts")  # 1시간 캐싱 (t3.small 최적화)
+@cache_result(
+    expire_time=3600,  # 1시간 캐싱 (t3.small 최적화)
+    key_prefix="job_posts",
+    key_args=["skip", "limit"],
+    tags=["jobposts:public"],
+    response_model=List[JobPostList]
+)
 def get_public_job_posts(
     skip: int = 0,
     limit: int = 100,
@@ -88,7 +94,13 @@ def get_public_job_posts(
 
 
 @router.get("/{job_post_id}", response_model=JobPostDetail)
-@cache_result(expire_time=7200, key_prefix="job_post_detail")  # 2시간 캐싱 (t3.small 최적화)
+@cache_result(
+    expire_time=7200,  # 2시간 캐싱 (t3.small 최적화)
+    key_prefix="job_post_detail",
+    key_args=["job_post_id"],
+    tags=["jobpost:{job_post_id}", "jobposts:public"],
+    response_model=JobPostDetail
+)
 def get_public_job_post(
     job_post_id: int, 
     db: Session = Depends(get_db)
@@ -139,8 +151,7 @@ def get_public_job_post(
 def clear_job_posts_cache():
     """채용공고 관련 캐시 무효화 (관리자용)"""
     try:
-        invalidate_cache("cache:job_posts:*")
-        invalidate_cache("cache:job_post_detail:*")
+        invalidate_tags("jobposts:public")
         return {"message": "Job posts cache cleared successfully"}
     except Exception as e:
         logger.error(f"Failed to clear cache: {e}")
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
-import httpx
 from app.core.config import settings
+from app.utils.agent_client import agent_http_pool
 from app.core.database import get_db
 from app.models.v2.document.application import Application, StageStatus, StageName
 
@@ -23,13 +23,12 @@ async def extract_top3_rejection_reasons_llm(fail_reasons: list[str]) -> list[st
     url = f"{agent_url}/api/v2/agent/tools/report/rejection-reasons"
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json={"reasons": fail_reasons}, timeout=30.0)
-            if response.status_code == 200:
-                return response.json().get("top_reasons", [])
-            else:
-                print(f"[LLM-탈락사유] API 호출 실패: {response.status_code}")
-                return []
+        response = await agent_http_pool.post(url, json={"reasons": fail_reasons}, timeout=30.0)
+        if response.status_code == 200:
+            return response.json().get("top_reasons", [])
+        else:
+            print(f"[LLM-탈락사유] API 호출 실패: {response.status_code}")
+            return []
     except Exception as e:
         print(f"[LLM-탈락사유] API 호출 오류: {e}")
         return []
@@ -43,13 +42,12 @@ async def extract_passed_summary_llm(pass_reasons: list[str]) -> str:
     url = f"{agent_url}/api/v2/agent/tools/report/passed-summary"
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json={"reasons": pass_reasons}, timeout=30.0)
-            if response.status_code == 200:
-                return response.json().get("summary", "")
-            else:
-                print(f"[LLM-합격자요약] API 호출 실패: {response.status_code}")
-                return ""
+        response = await agent_http_pool.post(url, json={"reasons": pass_reasons}, timeout=30.0)
+        if response.status_code == 200:
+            return response.json().get("summary", "")
+        else:
+            print(f"[LLM-합격자요약] API 호출 실패: {response.status_code}")
+            return ""
     except Exception as e:
         print(f"[LLM-합격자요약] API 호출 오류: {e}")
         return ""
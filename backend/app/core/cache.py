@@ -1,9 +1,12 @@
 import redis
 import json
-import pickle
-from typing import Any, Optional, Union
+import hashlib
+import inspect
+from typing import Any, Optional, Sequence, Union
 from functools import wraps
 import logging
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -19,64 +22,155 @@ redis_client = redis.Redis(
     retry_on_timeout=True
 )
 
-def cache_result(expire_time: int = 3600, key_prefix: str = "cache"):
+# key_args 미지정 시 캐시 키에서 제외할 요청 단위 객체 인자
+NON_KEY_ARGS = {"db", "current_user", "request", "background_tasks"}
+
+# 태그 집합 키 접두사 (태그 → 캐시 키 집합)
+TAG_KEY_PREFIX = "cache:tag:"
+
+
+def _resolve_arg(arguments: dict, path: str) -> Any:
+    """바인딩된 인자에서 'current_user.company_id' 같은 점 경로 값을 꺼냅니다."""
+    name, *attrs = path.split(".")
+    value = arguments.get(name)
+    for attr in attrs:
+        value = getattr(value, attr, None)
+    return value
+
+
+def build_cache_key(key_prefix: str, func_name: str, key_values: dict) -> str:
+    """선언된 인자 값만으로 프로세스/워커와 무관하게 동일한 캐시 키 생성"""
+    payload = json.dumps(key_values, sort_keys=True, default=str, ensure_ascii=False)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"cache:{key_prefix}:{func_name}:{digest}"
+
+
+def cache_result(
+    expire_time: int = 3600,
+    key_prefix: str = "cache",
+    key_args: Optional[Sequence[str]] = None,
+    tags: Optional[Sequence[str]] = None,
+    response_model: Any = None
+):
     """
-    함수 결과를 Redis에 캐싱하는 데코레이터
+    함수 결과를 Redis에 JSON으로 캐싱하는 데코레이터
     
     Args:
         expire_time: 캐시 만료 시간 (초)
         key_prefix: 캐시 키 접두사
+        key_args: 캐시 키에 포함할 인자 이름 (점 경로 지원, 예: "current_user.company_id").
+            지정하지 않으면 db/current_user 등 요청 객체를 제외한 모든 인자를 사용
+        tags: 무효화용 태그 템플릿 (예: "jobpost:{job_post_id}")
+        response_model: 결과 직렬화에 사용할 Pydantic 모델/타입 (ORM 객체 결과용)
     """
     def decorator(func):
+        signature = inspect.signature(func)
+        adapter = TypeAdapter(response_model) if response_model is not None else None
+
+        def serialize(result: Any) -> bytes:
+            if adapter is not None:
+                data = adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json")
+            else:
+                data = jsonable_encoder(result)
+            return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # 캐시 키 생성
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(kwargs))}"
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                if key_args is not None:
+                    key_values = {path: _resolve_arg(arguments, path) for path in key_args}
+                else:
+                    key_values = {
+                        name: value for name, value in arguments.items()
+                        if name not in NON_KEY_ARGS
+                    }
+                cache_key = build_cache_key(key_prefix, func.__name__, key_values)
+                resolved_tags = [tag.format(**arguments) for tag in (tags or [])]
+            except Exception as e:
+                logger.error(f"Cache key error: {e}")
+                return func(*args, **kwargs)
             
             try:
                 # 캐시에서 데이터 확인
                 cached_data = redis_client.get(cache_key)
                 if cached_data:
                     logger.info(f"Cache hit for {cache_key}")
-                    return pickle.loads(cached_data)
-                
-                # 캐시 미스 - 함수 실행
-                logger.info(f"Cache miss for {cache_key}")
-                result = func(*args, **kwargs)
-                
-                # 결과를 캐시에 저장
-                if result is not None:
-                    redis_client.setex(
-                        cache_key,
-                        expire_time,
-                        pickle.dumps(result)
-                    )
-                    logger.info(f"Cached result for {cache_key}")
-                
-                return result
-                
+                    return json.loads(cached_data)
             except redis.RedisError as e:
                 logger.warning(f"Redis error: {e}, falling back to direct execution")
                 return func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Cache error: {e}")
-                return func(*args, **kwargs)
+            
+            # 캐시 미스 - 함수 실행 (함수 예외는 그대로 전파)
+            logger.info(f"Cache miss for {cache_key}")
+            result = func(*args, **kwargs)
+            
+            # 결과를 캐시에 저장
+            if result is not None:
+                try:
+                    pipe = redis_client.pipeline()
+                    pipe.setex(cache_key, expire_time, serialize(result))
+                    for tag in resolved_tags:
+                        tag_key = f"{TAG_KEY_PREFIX}{tag}"
+                        pipe.sadd(tag_key, cache_key)
+                        # 태그 집합은 가장 오래 남는 캐시 키만큼 유지
+                        pipe.expire(tag_key, expire_time, nx=True)
+                        pipe.expire(tag_key, expire_time, gt=True)
+                    pipe.execute()
+                    logger.info(f"Cached result for {cache_key}")
+                except Exception as e:
+                    logger.warning(f"Failed to cache result for {cache_key}: {e}")
+            
+            return result
         
         return wrapper
     return decorator
 
+def invalidate_tags(*tags: str):
+    """
+    태그에 연결된 캐시 키들을 무효화
+    
+    Args:
+        tags: 무효화할 태그 (예: "jobpost:12", "company:3:jobposts")
+    """
+    try:
+        tag_keys = [f"{TAG_KEY_PREFIX}{tag}" for tag in tags]
+        pipe = redis_client.pipeline()
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members = pipe.execute()
+        
+        cache_keys = set()
+        for tag_members in members:
+            cache_keys.update(tag_members)
+        
+        pipe = redis_client.pipeline()
+        if cache_keys:
+            pipe.delete(*cache_keys)
+        pipe.delete(*tag_keys)
+        pipe.execute()
+        logger.info(f"Invalidated {len(cache_keys)} cache keys for tags: {', '.join(tags)}")
+    except redis.RedisError as e:
+        logger.warning(f"Failed to invalidate cache tags: {e}")
+
 def invalidate_cache(pattern: str):
     """
-    특정 패턴의 캐시를 무효화
+    특정 패턴의 캐시를 무효화 (SCAN 기반, 가능하면 invalidate_tags 사용)
     
     Args:
-        pattern: 무효화할 캐시 패턴 (예: "cache:get_public_job_posts:*")
+        pattern: 무효화할 캐시 패턴 (예: "cache:job_posts:*")
     """
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            redis_client.delete(*keys)
-            logger.info(f"Invalidated {len(keys)} cache keys matching pattern: {pattern}")
+        deleted = 0
+        pipe = redis_client.pipeline()
+        for key in redis_client.scan_iter(match=pattern, count=500):
+            pipe.delete(key)
+            deleted += 1
+        if deleted:
+            pipe.execute()
+            logger.info(f"Invalidated {deleted} cache keys matching pattern: {pattern}")
     except redis.RedisError as e:
         logger.warning(f"Failed to invalidate cache: {e}")
 
@@ -39,6 +39,11 @@ class Settings(BaseSettings):
     # AI Agent URL
     AGENT_URL: str = "http://agent:8001"
     
+    # 분석 작업 완료 웹훅(callback_url)을 보낼 수 있는 내부 호스트 (쉼표 구분)
+    ANALYSIS_CALLBACK_ALLOWED_HOSTS: str = os.getenv(
+        "ANALYSIS_CALLBACK_ALLOWED_HOSTS", "backend,agent,kocruit_agent,video-analysis,localhost"
+    )
+    
     # OAuth
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
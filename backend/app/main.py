@@ -10,6 +10,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import settings
 from app.api.v2.api import api_router
 from app.core.database import engine, Base
+from app.services.v2.interview.analysis_job_queue import qa_analysis_queue, resume_embedding_queue, growth_prediction_queue
+from app.utils.agent_client import agent_http_pool
+from app.services.v2.document import resume_document_service
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
 except ImportError:
@@ -182,11 +185,47 @@ async def lifespan(app: FastAPI):
         import traceback
         print(f"상세 오류: {traceback.format_exc()}")
 
+    # agent/video-analysis 호출용 공유 HTTP 커넥션 풀
+    await agent_http_pool.start()
+
+    # 면접 QA 분석 작업 큐 소비자 시작
+    try:
+        await qa_analysis_queue.start()
+    except Exception as e:
+        print(f"QA 분석 작업 큐 시작 실패: {e}")
+
+    # 이력서 임베딩 백필 작업 큐 소비자 시작 (중단된 백필은 체크포인트부터 이어서 실행)
+    try:
+        await resume_embedding_queue.start()
+    except Exception as e:
+        print(f"이력서 임베딩 작업 큐 시작 실패: {e}")
+
+    # 성장가능성 일괄 예측 작업 큐 소비자 시작
+    try:
+        await growth_prediction_queue.start()
+    except Exception as e:
+        print(f"성장가능성 예측 작업 큐 시작 실패: {e}")
+
+    # 이력서 문서 동기화: 시드/일괄 적재 등 ORM 밖에서 바뀐 이력서/스펙 반영 (백그라운드 스레드)
+    resume_document_sync_task = None
+    if resume_document_service.SYNC_ON_STARTUP:
+        resume_document_sync_task = asyncio.create_task(asyncio.to_thread(resume_document_service.run_startup_sync))
+
     print("=== FastAPI 서버 시작 완료 ===")
     
     yield
     
     # Shutdown
+    if resume_document_sync_task is not None and not resume_document_sync_task.done():
+        # 스레드는 강제로 멈출 수 없으므로 다음 배치 전에 멈추도록 알리고 태스크를 취소
+        resume_document_service.stop_startup_sync()
+        resume_document_sync_task.cancel()
+        await asyncio.gather(resume_document_sync_task, return_exceptions=True)
+    await qa_analysis_queue.stop()
+    await resume_embedding_queue.stop()
+    await growth_prediction_queue.stop()
+    await agent_http_pool.close()
+    
     # print("🔄 Stopping JobPost status scheduler...")
     # await job_status_scheduler.stop()
     # print("JobPost 상태 스케줄러 중지 완료")
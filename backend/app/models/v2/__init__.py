@@ -8,7 +8,7 @@ from .recruitment.weight import Weight
 
 # Application
 from .document.application import Application
-from .document.resume import Resume, ResumeMemo, Spec
+from .document.resume import Resume, ResumeMemo, Spec, ResumeDocument
 from .common.schedule import Schedule
 
 # Interview
@@ -50,6 +50,7 @@ __all__ = [
     "Resume",
     "ResumeMemo",
     "Spec",
+    "ResumeDocument",
     "Schedule",
     "InterviewQuestion",
     "InterviewQuestionLog", 
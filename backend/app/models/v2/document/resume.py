@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -41,6 +41,23 @@ class Spec(Base):
     resume = relationship("Resume", back_populates="specs")
 
 
+class ResumeDocument(Base):
+    """이력서 문서 (Resume + Spec EAV 행을 한 행으로 구체화한 읽기용 사본)
+
+    이력서/스펙이 ORM으로 변경되면 같은 트랜잭션에서 다시 만들어지고 version이 올라갑니다
+    (resume_document_service 참고). 읽기 경로는 resume_id 하나로 조회합니다.
+    """
+    __tablename__ = "resume_document"
+
+    resume_id = Column(Integer, ForeignKey('resume.id', ondelete='CASCADE'), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    source_fingerprint = Column(String(64), nullable=False, comment="원본 지문 (스펙 수:최대 스펙 id:이력서 수정 시각)")
+    specs = Column(JSON, comment="원본 스펙 행 목록 (id 순)")
+    structured_specs = Column(JSON, comment="parse_resume_specs 결과")
+    resume_text = Column(Text, comment="LLM 프롬프트용 이력서+스펙 통합 텍스트")
+    built_at = Column(DateTime, default=datetime.utcnow)
+
+
 class ResumeMemo(Base):
     __tablename__ = "resume_memo"
     
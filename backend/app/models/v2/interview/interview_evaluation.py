@@ -138,9 +138,9 @@ def auto_evaluate_all_applications(db: Session):
                 continue
             
             # Spec 데이터 구성 (resume_parser 유틸리티 사용 권장하나, 여기서는 기존 코드 유지/수정)
-            from app.utils.resume_parser import parse_resume_specs
-            specs = resume.specs if resume else []
-            structured_specs = parse_resume_specs(specs)
+            # 구체화된 이력서 문서의 파싱 결과 사용 (스펙 행 재조회/재파싱 없음)
+            from app.services.v2.document.resume_document_service import get_structured_specs
+            structured_specs = get_structured_specs(db, resume.id)
             
             # 변환: resume_parser 결과 -> 기존 로직의 spec_data 구조 (약간 다를 수 있음)
             # 여기서는 resume_parser가 반환하는 구조를 그대로 사용하는 것이 안전함.
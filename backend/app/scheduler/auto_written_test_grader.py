@@ -5,8 +5,22 @@ from app.models.v2.test.written_test_answer import WrittenTestAnswer
 from app.models.v2.test.written_test_question import WrittenTestQuestion
 from app.models.v2.document.application import Application, StageStatus, StageName
 from app.models.v2.recruitment.job import JobPost
+from app.services.v2.document.application_service import update_stage_status
+from app.utils.agent_client import grade_written_test_answer
 from sqlalchemy import func
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
 import datetime
+import os
+import time
+
+# 한 번에 조회할 미채점 답안 수 / 동시 채점 요청 수 / 초당 채점 요청 수
+GRADING_BATCH_SIZE = int(os.getenv("WRITTEN_TEST_GRADING_BATCH_SIZE", "200"))
+GRADING_CONCURRENCY = int(os.getenv("WRITTEN_TEST_GRADING_CONCURRENCY", "8"))
+GRADING_RATE_PER_SECOND = float(os.getenv("WRITTEN_TEST_GRADING_RATE", "5"))
+
+EMPTY_ANSWER_FEEDBACK = '답변이 없어 피드백을 생성할 수 없습니다.'
 
 def update_written_test_pass_status(db, jobpost_id):
     jobpost = db.query(JobPost).filter(JobPost.id == jobpost_id).first()
@@ -33,84 +47,185 @@ def update_written_test_pass_status(db, jobpost_id):
     db.commit()
 
 
+class _RateLimiter:
+    """초당 요청 수 제한 (요청 시작 시각을 일정 간격으로 분산)"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _grade_unique_pairs(pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[dict]]:
+    """(문제, 답변) 고유 쌍을 동시성/속도 제한 하에 채점. 실패한 쌍은 None"""
+    semaphore = asyncio.Semaphore(GRADING_CONCURRENCY)
+    limiter = _RateLimiter(GRADING_RATE_PER_SECOND)
+
+    async def grade(pair: Tuple[str, str]):
+        async with semaphore:
+            await limiter.wait()
+            try:
+                result = await grade_written_test_answer(pair[0], pair[1])
+            except Exception as e:
+                print(f"[Auto Grader] 채점 호출 오류: {e}")
+                return pair, None
+        if not isinstance(result, dict) or result.get("error") or result.get("score") is None:
+            print(f"[Auto Grader] 채점 실패: {result.get('error') if isinstance(result, dict) else result}")
+            return pair, None
+        return pair, result
+
+    results = await asyncio.gather(*(grade(pair) for pair in pairs))
+    return dict(results)
+
+
+def _grade_batch(db: Session, answers) -> Tuple[List[dict], int]:
+    """답안 묶음 채점 후 (점수 업데이트 목록, 실패 수) 반환
+
+    문제는 한 번에 미리 조회하고, 같은 문제에 같은 답변(앞뒤 공백 무시)은 한 번만 채점합니다.
+    """
+    question_ids = {answer.question_id for answer in answers}
+    questions = dict(
+        db.query(WrittenTestQuestion.id, WrittenTestQuestion.question_text)
+        .filter(WrittenTestQuestion.id.in_(question_ids))
+        .all()
+    )
+
+    updates: List[dict] = []
+    pending: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for answer in answers:
+        answer_text = (answer.answer_text or "").strip()
+        if not answer_text:
+            updates.append({"id": answer.id, "score": 0, "feedback": EMPTY_ANSWER_FEEDBACK})
+            continue
+        question_text = questions.get(answer.question_id)
+        if question_text:
+            pending[(question_text, answer_text)].append(answer.id)
+
+    failed = 0
+    if pending:
+        graded = asyncio.run(_grade_unique_pairs(list(pending)))
+        for pair, answer_ids in pending.items():
+            result = graded.get(pair)
+            if result is None:
+                failed += len(answer_ids)
+                continue
+            updates.extend(
+                {"id": answer_id, "score": result["score"], "feedback": result.get("feedback")}
+                for answer_id in answer_ids
+            )
+        print(f"[Auto Grader] 답안 {sum(len(ids) for ids in pending.values())}개 → 고유 채점 {len(pending)}건")
+    return updates, failed
+
+
+def _update_written_test_scores(db: Session, pairs: Set[Tuple[int, int]]) -> Set[int]:
+    """채점이 모두 끝난 (user_id, jobpost_id)의 평균 점수를 application.written_test_score에 일괄 반영"""
+    if not pairs:
+        return set()
+    user_ids = {user_id for user_id, _ in pairs}
+    jobpost_ids = {jobpost_id for _, jobpost_id in pairs}
+
+    stats = db.query(
+        WrittenTestAnswer.user_id,
+        WrittenTestAnswer.jobpost_id,
+        func.count(WrittenTestAnswer.id),
+        func.count(WrittenTestAnswer.score),
+        func.avg(WrittenTestAnswer.score)
+    ).filter(
+        WrittenTestAnswer.user_id.in_(user_ids),
+        WrittenTestAnswer.jobpost_id.in_(jobpost_ids)
+    ).group_by(WrittenTestAnswer.user_id, WrittenTestAnswer.jobpost_id).all()
+
+    # 해당 지원자의 모든 답안이 채점 완료된 경우만 평균 점수 반영 (소수점 둘째자리)
+    avg_scores = {
+        (user_id, jobpost_id): round(float(avg_score), 2) if avg_score is not None else None
+        for user_id, jobpost_id, total_answers, graded_answers, avg_score in stats
+        if (user_id, jobpost_id) in pairs and total_answers > 0 and total_answers == graded_answers
+    }
+    if not avg_scores:
+        return set()
+
+    applications = db.query(Application.id, Application.user_id, Application.job_post_id).filter(
+        Application.user_id.in_({user_id for user_id, _ in avg_scores}),
+        Application.job_post_id.in_({jobpost_id for _, jobpost_id in avg_scores})
+    ).all()
+    mappings = [
+        {"id": app_id, "written_test_score": avg_scores[(user_id, jobpost_id)]}
+        for app_id, user_id, jobpost_id in applications
+        if (user_id, jobpost_id) in avg_scores
+    ]
+    if mappings:
+        db.bulk_update_mappings(Application, mappings)
+        db.commit()
+        print(f"[Auto Grader] 평균점수 반영: 지원서 {len(mappings)}건")
+    return {jobpost_id for _, jobpost_id in avg_scores}
+
+
 def auto_grade_unscored_answers():
     start_time = datetime.datetime.now()
     print(f"[Auto Grader] 채점 시작: {start_time}")
     total_graded = 0
+    total_failed = 0
+    last_id = 0
+    updated_jobpost_ids: Set[int] = set()
     while True:
         db: Session = SessionLocal()
         try:
-            answers = db.query(WrittenTestAnswer).filter(
+            # id 기준 키셋 페이지네이션 (채점 실패로 남은 답안은 이번 실행에서 다시 조회하지 않음)
+            answers = db.query(
+                WrittenTestAnswer.id,
+                WrittenTestAnswer.user_id,
+                WrittenTestAnswer.jobpost_id,
+                WrittenTestAnswer.question_id,
+                WrittenTestAnswer.answer_text
+            ).filter(
                 WrittenTestAnswer.score == None,
-                WrittenTestAnswer.feedback == None
-            ).limit(10).all()
+                WrittenTestAnswer.feedback == None,
+                WrittenTestAnswer.id > last_id
+            ).order_by(WrittenTestAnswer.id).limit(GRADING_BATCH_SIZE).all()
             if not answers:
-                db.close()
                 break
-            # --- 기존 채점 로직 ---
-            for answer in answers:
-                question = db.query(WrittenTestQuestion).filter(WrittenTestQuestion.id == answer.question_id).first()
-                if not answer.answer_text:
-                    answer.score = 0
-                    answer.feedback = '답변이 없어 피드백을 생성할 수 없습니다.'
-                    continue
-                if question:
-                    result = grade_written_test_answer.invoke({
-                        "question": question.question_text,
-                        "answer": answer.answer_text
-                    })
-                    answer.score = result["score"]
-                    answer.feedback = result["feedback"]
-            db.commit()
-            total_graded += len(answers)
-
-            # --- 추가: 채점 후 application.written_test_score 즉시 업데이트 ---
-            # (user_id, jobpost_id) 쌍 추출
-            updated_pairs = set((a.user_id, a.jobpost_id) for a in answers)
-            updated_jobpost_ids = set()
-            for user_id, jobpost_id in updated_pairs:
-                # 해당 지원자의 모든 답안이 채점 완료됐는지 확인
-                total_answers = db.query(WrittenTestAnswer).filter(
-                    WrittenTestAnswer.user_id == user_id,
-                    WrittenTestAnswer.jobpost_id == jobpost_id
-                ).count()
-                graded_answers = db.query(WrittenTestAnswer).filter(
-                    WrittenTestAnswer.user_id == user_id,
-                    WrittenTestAnswer.jobpost_id == jobpost_id,
-                    WrittenTestAnswer.score != None
-                ).count()
-                if total_answers > 0 and total_answers == graded_answers:
-                    # 평균 점수 계산
-                    avg_score = db.query(func.avg(WrittenTestAnswer.score)).filter(
-                        WrittenTestAnswer.user_id == user_id,
-                        WrittenTestAnswer.jobpost_id == jobpost_id
-                    ).scalar()
-                    # application 테이블에 반영
-                    application = db.query(Application).filter(
-                        Application.user_id == user_id,
-                        Application.job_post_id == jobpost_id
-                    ).first()
-                    if application:
-                        # 평균점수 소수점 둘째자리까지 반영
-                        if avg_score is not None:
-                            avg_score = round(float(avg_score), 2)
-                        application.written_test_score = avg_score
-                        db.commit()
-                        print(f"[Auto Grader] 평균점수 반영: user_id={user_id}, jobpost_id={jobpost_id}, avg_score={avg_score}")
-                        updated_jobpost_ids.add(jobpost_id)
-
-            # --- 추가: 각 jobpost_id별로 상위 5배수만 PASSED 처리 ---
-            for jobpost_id in updated_jobpost_ids:
-                update_written_test_pass_status(db, jobpost_id)
+            last_id = answers[-1].id
 
-            db.close()
+            updates, failed = _grade_batch(db, answers)
+            if updates:
+                db.bulk_update_mappings(WrittenTestAnswer, updates)
+                db.commit()
+            total_graded += len(updates)
+            total_failed += failed
+
+            # 채점 후 application.written_test_score 즉시 업데이트
+            graded_ids = {update["id"] for update in updates}
+            updated_pairs = {(a.user_id, a.jobpost_id) for a in answers if a.id in graded_ids}
+            updated_jobpost_ids |= _update_written_test_scores(db, updated_pairs)
         except Exception as e:
             db.rollback()
-            db.close()
             print(f"[Auto Grader] 오류: {e}")
             break
+        finally:
+            db.close()
+
+    # 각 jobpost_id별로 상위 5배수만 PASSED 처리 (실행당 공고별 1회)
+    if updated_jobpost_ids:
+        db = SessionLocal()
+        try:
+            for jobpost_id in updated_jobpost_ids:
+                update_written_test_pass_status(db, jobpost_id)
+        except Exception as e:
+            db.rollback()
+            print(f"[Auto Grader] 합격 상태 갱신 오류: {e}")
+        finally:
+            db.close()
+
     end_time = datetime.datetime.now()
-    print(f"[Auto Grader] 채점 끝: {end_time} (소요: {end_time - start_time}, 총 {total_graded}개 채점)")
+    print(f"[Auto Grader] 채점 끝: {end_time} (소요: {end_time - start_time}, 총 {total_graded}개 채점, 실패 {total_failed}개)")
 
 def start_written_test_auto_grader():
     scheduler = BackgroundScheduler()
@@ -4,6 +4,11 @@ from typing import Optional, Dict, Any, List
 class GrowthPredictionRequest(BaseModel):
     application_id: int
 
+class GrowthPredictionBatchRequest(BaseModel):
+    job_post_id: int
+    reset: bool = False  # 체크포인트를 지우고 처음부터 다시 예측
+    callback_url: Optional[str] = None  # 완료 시 작업 상태를 POST할 URL (ANALYSIS_CALLBACK_ALLOWED_HOSTS의 내부 호스트만 허용)
+
 class GrowthPredictionDetail(BaseModel):
     score: float
     value: Optional[Any]
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from sqlalchemy import func
+from app.core.database import SessionLocal
+from app.models.v2.document.application import Application
+from app.models.v2.recruitment.job import JobPost
+from app.models.v2.analysis.growth_prediction_result import GrowthPredictionResult
+from app.services.v2.analysis.high_performer_pattern_service import (
+    HighPerformerPatternService, build_boxplot_reference, applicant_boxplot_data
+)
+from app.services.v2.document.applicant_growth_scoring_service import ApplicantGrowthScoringService
+from app.services.v2.document.resume_document_service import get_resume_documents
+from app.services.v2.interview.analysis_job_queue import growth_prediction_queue
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 조회/스코어링/저장할 지원서 수
+GROWTH_PREDICTION_BATCH_SIZE = int(os.getenv("GROWTH_PREDICTION_BATCH_SIZE", "200"))
+
+RESULT_FIELDS = ("total_score", "detail", "comparison_chart_data", "reasons", "detail_explanation", "item_table", "narrative")
+
+
+class GrowthPredictionBatchService:
+    """공고 단위 성장가능성 일괄 예측
+
+    - 지원서와 이력서 문서(구체화된 스펙)를 배치마다 집합 쿼리 두 번으로 조회합니다.
+    - 모든 지원자를 같은 고성과자 패턴 스냅샷과 배열 연산으로 비교합니다 (근거/요약은 규칙 기반).
+    - 결과는 bulk update/insert로 저장하고, 배치마다 체크포인트(마지막 지원서 id)를 기록해
+      실패/중단 후 재실행하면 남은 지원서부터 이어서 처리합니다.
+    """
+
+    @staticmethod
+    def _checkpoint_key(job_post_id: int) -> str:
+        return f"growth_prediction:checkpoint:job_post:{job_post_id}"
+
+    @staticmethod
+    def _count_applications(job_post_id: int, after_id: int) -> int:
+        db = SessionLocal()
+        try:
+            return db.query(func.count(Application.id)).filter(
+                Application.job_post_id == job_post_id, Application.id > after_id
+            ).scalar() or 0
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load_snapshot() -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            snapshot = HighPerformerPatternService().get_pattern_snapshot(db, clustering_method="kmeans", n_clusters=1)
+            if not snapshot:
+                raise RuntimeError("High performer pattern not found")
+            return snapshot
+        finally:
+            db.close()
+
+    @staticmethod
+    def _upsert_results(db, rows: List[Dict[str, Any]]):
+        """지원서별 결과 bulk upsert (기존 결과가 있으면 갱신)"""
+        existing = dict(db.query(GrowthPredictionResult.application_id, GrowthPredictionResult.id).filter(
+            GrowthPredictionResult.application_id.in_([row["application_id"] for row in rows])
+        ).all())
+        now = datetime.utcnow()
+        updates, inserts = [], []
+        for row in rows:
+            if row["application_id"] in existing:
+                updates.append({**row, "id": existing[row["application_id"]], "updated_at": now})
+            else:
+                inserts.append(row)
+        if updates:
+            db.bulk_update_mappings(GrowthPredictionResult, updates)
+        if inserts:
+            db.bulk_insert_mappings(GrowthPredictionResult, inserts)
+
+    def _process_batch(self, job_post_id: int, company_id: Optional[int], after_id: int, reference: Dict[str, Any], boxplot_reference: Dict[str, Any]) -> Dict[str, Any]:
+        """지원서 한 배치 조회 → 스코어링 → 저장 (스레드에서 실행)"""
+        db = SessionLocal()
+        try:
+            started_at = time.time()
+            applications = db.query(Application.id, Application.resume_id).filter(
+                Application.job_post_id == job_post_id, Application.id > after_id
+            ).order_by(Application.id).limit(GROWTH_PREDICTION_BATCH_SIZE).all()
+            if not applications:
+                return {"size": 0}
+
+            # 이력서 문서(구체화된 스펙 목록)를 한 번에 조회, 없는 문서는 이 배치 트랜잭션에서 생성
+            resume_documents = get_resume_documents(db, [resume_id for _, resume_id in applications])
+            existing_resumes = set(resume_documents)
+            specs_by_resume = {resume_id: document.specs for resume_id, document in resume_documents.items()}
+
+            # 이력서가 없는 지원서는 건너뜀 (단건 예측의 "Resume not found"와 동일)
+            specs_by_application = {
+                app_id: specs_by_resume.get(resume_id, [])
+                for app_id, resume_id in applications if resume_id in existing_resumes
+            }
+            scoring_service = ApplicantGrowthScoringService(reference["high_performer_stats"], reference["members"])
+            results = scoring_service.score_applicants(specs_by_application)
+
+            duration = (time.time() - started_at) / max(len(results), 1)
+            rows = [
+                {
+                    "application_id": app_id,
+                    "jobpost_id": job_post_id,
+                    "company_id": company_id,
+                    **{field: result.get(field) for field in RESULT_FIELDS},
+                    "boxplot_data": applicant_boxplot_data(boxplot_reference, result["normalized"]),
+                    "analysis_duration": duration
+                }
+                for app_id, result in results.items()
+            ]
+            if rows:
+                self._upsert_results(db, rows)
+            db.commit()
+            return {
+                "size": len(applications),
+                "last_id": applications[-1][0],
+                "scored": len(rows),
+                "skipped": len(applications) - len(rows)
+            }
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def start_batch_prediction(self, job_post_id: int, reset: bool = False, callback_url: Optional[str] = None) -> Dict[str, Any]:
+        """공고 전체 지원자 성장가능성 예측 작업 등록
+
+        체크포인트(마지막 지원서 id)부터 이어서 실행하므로 중단된 작업이나 이후 추가된 지원서만 처리합니다.
+        reset=True거나 고성과자 데이터가 바뀐 경우에는 처음부터 다시 예측합니다.
+        """
+        if reset:
+            await growth_prediction_queue.redis.delete(self._checkpoint_key(job_post_id))
+        return await growth_prediction_queue.enqueue(
+            "growth_prediction_batch",
+            {"job_post_id": job_post_id},
+            dedupe_key=f"job_post:{job_post_id}",
+            callback_url=callback_url
+        )
+
+    async def run_batch_prediction(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """일괄 예측 작업 핸들러 (배치마다 체크포인트/진행률 기록)"""
+        job_id = params["job_id"]
+        job_post_id = params["job_post_id"]
+        checkpoint_key = self._checkpoint_key(job_post_id)
+        redis = growth_prediction_queue.redis
+
+        snapshot = await asyncio.to_thread(self._load_snapshot)
+        reference = snapshot["growth_reference"]
+        boxplot_reference = build_boxplot_reference(reference)
+
+        checkpoint = await redis.hgetall(checkpoint_key)
+        if checkpoint and checkpoint.get("snapshot_version") != snapshot["version"]:
+            # 고성과자 데이터가 바뀌었으면 모든 지원자를 같은 스냅샷으로 다시 예측
+            await redis.delete(checkpoint_key)
+            checkpoint = {}
+        last_id = int(checkpoint.get("last_id", 0))
+        scored = int(checkpoint.get("scored", 0))
+        skipped = int(checkpoint.get("skipped", 0))
+        total = scored + skipped + await asyncio.to_thread(self._count_applications, job_post_id, last_id)
+
+        def load_company_id():
+            db = SessionLocal()
+            try:
+                return db.query(JobPost.company_id).filter(JobPost.id == job_post_id).scalar()
+            finally:
+                db.close()
+        company_id = await asyncio.to_thread(load_company_id)
+        started_at = time.time()
+
+        while True:
+            try:
+                batch = await asyncio.to_thread(
+                    self._process_batch, job_post_id, company_id, last_id, reference, boxplot_reference
+                )
+            except Exception as e:
+                # 체크포인트는 마지막 성공 배치에 남아 있으므로 재실행 시 이 배치부터 다시 처리
+                raise RuntimeError(f"성장가능성 일괄 예측 실패 (application_id>{last_id}): {e}")
+            if not batch["size"]:
+                break
+
+            last_id = batch["last_id"]
+            scored += batch["scored"]
+            skipped += batch["skipped"]
+            await redis.hset(checkpoint_key, mapping={
+                "last_id": last_id, "scored": scored, "skipped": skipped, "snapshot_version": snapshot["version"]
+            })
+            await growth_prediction_queue.update_progress(job_id, {
+                "scored": scored,
+                "skipped": skipped,
+                "total": total,
+                "last_application_id": last_id,
+                "percent": round((scored + skipped) / total * 100, 1) if total else 100.0,
+                "elapsed_seconds": round(time.time() - started_at, 1)
+            })
+
+        await redis.hset(checkpoint_key, "completed_at", time.time())
+        logger.info(f"성장가능성 일괄 예측 완료: 공고 {job_post_id}, {scored}건 예측, {skipped}건 건너뜀")
+        return {
+            "job_post_id": job_post_id,
+            "scored": scored,
+            "skipped": skipped,
+            "total": total,
+            "snapshot_version": snapshot["version"]
+        }
+
+
+growth_prediction_batch_service = GrowthPredictionBatchService()
+growth_prediction_queue.register("growth_prediction_batch", growth_prediction_batch_service.run_batch_prediction)
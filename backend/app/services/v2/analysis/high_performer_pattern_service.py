@@ -1,43 +1,175 @@
 import logging
 import requests
 import json
-from typing import List, Dict, Any
+import hashlib
+import os
+import threading
+import time
+from typing import List, Dict, Any, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.models.v2.analysis.high_performers import HighPerformer
+from app.core.cache import redis_client
 
 logger = logging.getLogger(__name__)
 
+# 고성과자 패턴 스냅샷 설정
+# HIGH_PERFORMER_SNAPSHOT_TTL: Redis에 보관할 스냅샷 유효 시간(초)
+# HIGH_PERFORMER_SNAPSHOT_CHECK_SECONDS: 프로세스 내 스냅샷 재사용 시 데이터 변경 확인 최소 간격(초)
+SNAPSHOT_TTL = int(os.getenv("HIGH_PERFORMER_SNAPSHOT_TTL", str(7 * 86400)))
+SNAPSHOT_CHECK_SECONDS = float(os.getenv("HIGH_PERFORMER_SNAPSHOT_CHECK_SECONDS", "60"))
+SNAPSHOT_KEY_PREFIX = "high_performer_pattern:snapshot"
+
+HIGH_PERFORMER_FIELDS = (
+    'id', 'name', 'education_level', 'major', 'certifications', 'total_experience_years',
+    'career_path', 'current_position', 'promotion_speed_years', 'kpi_score', 'notable_projects'
+)
+
+# 학력(숫자화)
+EDU_MAP = {'BACHELOR': 2, 'MASTER': 3, 'PHD': 4}
+
+# 프로세스 내 스냅샷 (키: (method, n_clusters) → {"version", "checked_at", "snapshot"})
+_local_snapshots: Dict[tuple, Dict[str, Any]] = {}
+_snapshot_lock = threading.Lock()
+
+
+def _data_version(db: Session) -> Optional[str]:
+    """고성과자 데이터 버전 (집계 쿼리 1회로 만든 지문, 데이터가 없으면 None)
+
+    행 수/최대 id/최대 created_at으로 추가·삭제를, 수치 컬럼 합계로 값 수정을 감지합니다.
+    텍스트 컬럼만 바꾼 경우는 감지하지 못하므로 force_refresh 또는 invalidate_local_snapshots()를 사용합니다.
+    """
+    stats = db.query(
+        func.count(HighPerformer.id),
+        func.max(HighPerformer.id),
+        func.max(HighPerformer.created_at),
+        func.sum(HighPerformer.total_experience_years),
+        func.sum(HighPerformer.promotion_speed_years),
+        func.sum(HighPerformer.kpi_score)
+    ).one()
+    if not stats[0]:
+        return None
+    return hashlib.sha1(":".join(str(value) for value in stats).encode("utf-8")).hexdigest()
+
+
+def build_growth_reference(pattern_result: Dict[str, Any]) -> Dict[str, Any]:
+    """첫 번째 클러스터에서 성장가능성 예측용 비교 데이터(평균/항목별 값 목록) 생성"""
+    cluster = pattern_result["cluster_patterns"][0]
+    stats = cluster["statistics"]
+    members = cluster["members"]
+
+    cert_vals = []
+    for m in members:
+        certs = m.get('certifications')
+        if certs:
+            try:
+                cert_list = json.loads(certs) if isinstance(certs, str) else certs
+                cert_vals.append(len(cert_list))
+            except Exception:
+                pass
+
+    exp_vals = []
+    for m in members:
+        try:
+            if m.get('total_experience_years') is not None:
+                exp_vals.append(float(m['total_experience_years']))
+        except (TypeError, ValueError):
+            pass
+
+    return {
+        "high_performer_stats": {
+            "kpi_score_mean": stats.get("kpi_score_mean", 0),
+            "promotion_speed_years_mean": stats.get("promotion_speed_years_mean", 0),
+            "degree_mean": stats.get("degree_mean", 0),
+            "certifications_count_mean": stats.get("certifications_count_mean", 0),
+            "total_experience_years_mean": stats.get("total_experience_years_mean", 0)
+        },
+        "members": members,
+        "exp_vals": exp_vals,
+        "degree_vals": [EDU_MAP.get(m.get('education_level'), 0) for m in members if m.get('education_level')],
+        "cert_vals": cert_vals
+    }
+
+
+def _percentile(sorted_vals: List[float], p: float) -> float:
+    n = len(sorted_vals)
+    k = (n - 1) * (p / 100)
+    f = int(k)
+    c = k - f
+    if f + 1 < n:
+        return sorted_vals[f] * (1 - c) + sorted_vals[f + 1] * c
+    return sorted_vals[f]
+
+
+def build_boxplot_reference(reference: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """고성과자 집단의 항목별 박스플롯 통계 (스냅샷당 한 번 계산해 지원자마다 재사용)"""
+    boxplot = {}
+    for label, field in (('경력(년)', 'exp_vals'), ('학력', 'degree_vals'), ('자격증', 'cert_vals')):
+        sorted_vals = sorted(reference.get(field) or [])
+        if not sorted_vals:
+            continue
+        boxplot[label] = {
+            'min': float(sorted_vals[0]),
+            'q1': float(_percentile(sorted_vals, 25)),
+            'median': float(_percentile(sorted_vals, 50)),
+            'q3': float(_percentile(sorted_vals, 75)),
+            'max': float(sorted_vals[-1])
+        }
+    return boxplot
+
+
+def applicant_boxplot_data(boxplot_reference: Dict[str, Dict[str, float]], norm: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """고성과자 박스플롯 통계에 지원자 값(정규화된 스펙) 추가"""
+    applicant_values = {
+        '경력(년)': norm.get('experience_years'),
+        '학력': norm.get('degree', 0.0),
+        '자격증': norm.get('certifications_count', 0.0)
+    }
+    return {
+        label: {**stats, 'applicant': float(applicant_values[label]) if applicant_values[label] is not None else 0.0}
+        for label, stats in boxplot_reference.items()
+    }
+
+
 class HighPerformerPatternService:
-    """고성과자 패턴 분석 서비스 (API 호출 방식)"""
-    
+    """고성과자 패턴 분석 서비스 (API 호출 방식)
+
+    분석 결과는 고성과자 데이터 버전별 스냅샷으로 Redis에 저장되어,
+    데이터가 바뀌기 전까지 모든 예측 요청이 같은 결과를 재사용합니다.
+    """
+
     def __init__(self):
         # Agent 서비스 URL (docker-compose service name)
         self.agent_url = "http://agent:8001"
-    
+
     def get_high_performers_data(self, db: Session) -> List[Dict[str, Any]]:
         """DB에서 고성과자 데이터 조회"""
         try:
-            high_performers = db.query(HighPerformer).all()
-            data = []
-            for hp in high_performers:
-                data.append({
-                    'id': hp.id,
-                    'name': hp.name,
-                    'education_level': hp.education_level,
-                    'major': hp.major,
-                    'certifications': hp.certifications,
-                    'total_experience_years': hp.total_experience_years,
-                    'career_path': hp.career_path,
-                    'current_position': hp.current_position,
-                    'promotion_speed_years': hp.promotion_speed_years,
-                    'kpi_score': hp.kpi_score,
-                    'notable_projects': hp.notable_projects
-                })
-            return data
+            high_performers = db.query(HighPerformer).order_by(HighPerformer.id).all()
+            return [{field: getattr(hp, field) for field in HIGH_PERFORMER_FIELDS} for hp in high_performers]
         except Exception as e:
             logger.error(f"고성과자 데이터 조회 실패: {e}")
             raise
 
+    def _request_pattern_analysis(self, high_performers_data: List[Dict[str, Any]], clustering_method: str, n_clusters: int) -> Dict[str, Any]:
+        payload = {
+            "data": high_performers_data,
+            "method": clustering_method,
+            "n_clusters": n_clusters
+        }
+
+        logger.info(f"Agent에 패턴 분석 요청 전송: {len(high_performers_data)}건")
+        response = requests.post(f"{self.agent_url}/analysis/high-performer-patterns", json=payload, timeout=60)
+
+        if response.status_code != 200:
+            logger.error(f"Agent API 오류: {response.text}")
+            raise Exception(f"Agent API Error: {response.status_code}")
+
+        result = response.json()
+        if result.get("error"):
+            raise Exception(f"Agent 패턴 분석 실패: {result['error']}")
+        return result
+
     def analyze_high_performer_patterns(self, db: Session, clustering_method: str = "kmeans", n_clusters: int = 3, include_llm_summary: bool = True) -> Dict[str, Any]:
         """
         고성과자 패턴 분석 (Agent API 호출)
@@ -49,25 +181,76 @@ class HighPerformerPatternService:
                 return {"error": "분석할 고성과자 데이터가 없습니다."}
 
             # 2. Agent API 호출
-            payload = {
-                "data": high_performers_data,
-                "method": clustering_method,
-                "n_clusters": n_clusters
-            }
-            
-            logger.info(f"Agent에 패턴 분석 요청 전송: {len(high_performers_data)}건")
-            response = requests.post(f"{self.agent_url}/analysis/high-performer-patterns", json=payload, timeout=60)
-            
-            if response.status_code != 200:
-                logger.error(f"Agent API 오류: {response.text}")
-                raise Exception(f"Agent API Error: {response.status_code}")
-                
-            result = response.json()
-            
             # 3. LLM 요약 (선택) - Agent가 이미 수행했을 수 있음.
             # 여기서는 Agent 결과 그대로 반환
-            return result
+            return self._request_pattern_analysis(high_performers_data, clustering_method, n_clusters)
 
         except Exception as e:
             logger.error(f"고성과자 패턴 분석 요청 실패: {e}")
             raise
+
+    def get_pattern_snapshot(self, db: Session, clustering_method: str = "kmeans", n_clusters: int = 1, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """현재 고성과자 데이터 버전의 패턴 스냅샷 조회 (없으면 분석 후 저장)
+
+        스냅샷: {"version", "created_at", "total_analyzed", "pattern_result", "growth_reference"}
+        같은 프로세스에서는 SNAPSHOT_CHECK_SECONDS 동안 데이터 변경 확인 없이 재사용합니다.
+        """
+        local_key = (clustering_method, n_clusters)
+        local = _local_snapshots.get(local_key)
+        if local and not force_refresh and time.monotonic() - local["checked_at"] < SNAPSHOT_CHECK_SECONDS:
+            return local["snapshot"]
+
+        # 전체 데이터는 스냅샷을 새로 만들 때만 조회
+        version = _data_version(db)
+        if version is None:
+            return None
+
+        with _snapshot_lock:
+            local = _local_snapshots.get(local_key)
+            if local and not force_refresh and local["version"] == version:
+                local["checked_at"] = time.monotonic()
+                return local["snapshot"]
+
+            redis_key = f"{SNAPSHOT_KEY_PREFIX}:{clustering_method}:{n_clusters}:{version}"
+            snapshot = None
+            if not force_refresh:
+                try:
+                    cached = redis_client.get(redis_key)
+                    if cached:
+                        snapshot = json.loads(cached)
+                except Exception as e:
+                    logger.warning(f"고성과자 패턴 스냅샷 조회 실패: {e}")
+
+            if snapshot is None:
+                high_performers_data = self.get_high_performers_data(db)
+                if not high_performers_data:
+                    return None
+                pattern_result = self._request_pattern_analysis(high_performers_data, clustering_method, n_clusters)
+                if not pattern_result.get("cluster_patterns"):
+                    raise Exception("High performer pattern not found")
+                snapshot = {
+                    "version": version,
+                    "created_at": time.time(),
+                    "total_analyzed": len(high_performers_data),
+                    "pattern_result": pattern_result,
+                    "growth_reference": build_growth_reference(pattern_result)
+                }
+                try:
+                    redis_client.setex(redis_key, SNAPSHOT_TTL, json.dumps(snapshot, ensure_ascii=False, default=str))
+                except Exception as e:
+                    logger.warning(f"고성과자 패턴 스냅샷 저장 실패: {e}")
+                logger.info(f"고성과자 패턴 스냅샷 생성: {clustering_method}/{n_clusters} (버전 {version[:12]}, {len(high_performers_data)}건)")
+
+            _local_snapshots[local_key] = {"version": version, "checked_at": time.monotonic(), "snapshot": snapshot}
+            return snapshot
+
+    def get_growth_reference(self, db: Session) -> Optional[Dict[str, Any]]:
+        """성장가능성 예측용 고성과자 비교 데이터 (전체를 하나의 클러스터로 본 스냅샷)"""
+        snapshot = self.get_pattern_snapshot(db, clustering_method="kmeans", n_clusters=1)
+        return snapshot["growth_reference"] if snapshot else None
+
+    @staticmethod
+    def invalidate_local_snapshots():
+        """프로세스 내 스냅샷 재사용 중단 (다음 조회 시 데이터 버전 확인)"""
+        with _snapshot_lock:
+            _local_snapshots.clear()
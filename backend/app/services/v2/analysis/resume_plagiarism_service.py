@@ -1,36 +1,142 @@
+import asyncio
 import logging
-from typing import Dict, Any, Optional
-import httpx
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.models.v2.document.application import Application
 from app.models.v2.document.resume import Resume
 from app.core.config import settings
+from app.services.v2.interview.analysis_job_queue import resume_embedding_queue
+from app.utils.agent_client import agent_http_pool
 import json
 
 logger = logging.getLogger(__name__)
 
+# 한 번의 Agent 호출/임베딩 배치에 담을 이력서 수
+RESUME_EMBEDDING_BATCH_SIZE = int(os.getenv("RESUME_EMBEDDING_BATCH_SIZE", "100"))
+
 class ResumePlagiarismService:
     """이력서 표절 검사 서비스 (Backend - Agent API 호출용)"""
     
     def __init__(self):
         # Agent 서버 주소
         self.agent_url = settings.AGENT_URL or "http://agent:8001"
+        # 로컬 ChromaDB 인덱스 (chromadb/sentence-transformers 설치 시에만 사용, 최초 사용 시 로드)
+        self._chroma_manager = None
+        self._embedder = None
+        self._local_index_lock = threading.Lock()
             
-    async def _call_agent_api(self, endpoint: str, data: Dict[str, Any] = None, method="POST") -> Dict[str, Any]:
+    async def _call_agent_api(self, endpoint: str, data: Dict[str, Any] = None, method="POST", timeout: Optional[float] = None) -> Dict[str, Any]:
         """Agent API 호출 헬퍼"""
         url = f"{self.agent_url}/api/v2/agent{endpoint}"
         try:
-            async with httpx.AsyncClient() as client:
-                if method == "POST":
-                    response = await client.post(url, json=data, timeout=30.0)
-                else:
-                    response = await client.get(url, timeout=10.0)
-                
-                response.raise_for_status()
-                return response.json()
+            if method == "POST":
+                response = await agent_http_pool.post(url, json=data, timeout=timeout or 30.0)
+            else:
+                response = await agent_http_pool.get(url, timeout=timeout or 10.0)
+            
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Agent API 호출 실패 ({url}): {e}")
             return {"error": str(e)}
 
+    @staticmethod
+    def _extract_content(content) -> str:
+        """JSON 배열 형태의 이력서 내용을 텍스트로 변환"""
+        if isinstance(content, list) or (isinstance(content, str) and content.startswith("[") and content.endswith("]")):
+             try:
+                loaded = json.loads(content) if isinstance(content, str) else content
+                content = "\n".join([item.get('content', '') for item in loaded if isinstance(item, dict)])
+             except:
+                pass
+        return str(content)
+
+    def _get_chroma_manager(self):
+        with self._local_index_lock:
+            if self._chroma_manager is None:
+                try:
+                    from app.utils.chromadb_utils import ChromaDBManager
+                    self._chroma_manager = ChromaDBManager()
+                except Exception as e:
+                    logger.warning(f"로컬 ChromaDB 인덱스 비활성화: {e}")
+                    self._chroma_manager = False
+            return self._chroma_manager or None
+
+    def _get_embedder(self):
+        with self._local_index_lock:
+            if self._embedder is None:
+                try:
+                    from app.utils.embedding_utils import TextEmbedder
+                    self._embedder = TextEmbedder()
+                except Exception as e:
+                    logger.warning(f"로컬 임베딩 모델 비활성화: {e}")
+                    self._embedder = False
+            return self._embedder or None
+
+    def _index_locally(self, resumes: List[Any], contents: List[str]):
+        """로컬 ChromaDB에 배치 임베딩(모델 호출 1회) 후 upsert 1회로 저장 (저장 실패 시 RuntimeError)"""
+        manager = self._get_chroma_manager()
+        embedder = self._get_embedder() if manager else None
+        if not manager or not embedder:
+            return
+        embeddings = embedder.embed_texts(contents)
+        stored = manager.upsert_resume_embeddings(
+            resume_ids=[resume.id for resume in resumes],
+            contents=contents,
+            embeddings=embeddings.tolist(),
+            metadatas=[
+                {"resume_id": resume.id, "user_id": resume.user_id, "title": resume.title or ""}
+                for resume in resumes
+            ]
+        )
+        if not stored:
+            raise RuntimeError(f"로컬 ChromaDB upsert 실패 ({len(resumes)}건)")
+
+    async def ingest_resumes(self, resumes: List[Any]) -> Dict[str, Any]:
+        """이력서 묶음을 Agent 표절 인덱스와 로컬 ChromaDB에 일괄 등록
+
+        Args:
+            resumes: id, user_id, title, content 속성을 가진 행 목록
+
+        Returns:
+            {"success", "failed", "skipped"} (Agent 호출이나 로컬 ChromaDB 저장이 실패하면 "error" 포함)
+        """
+        skipped_count = sum(1 for resume in resumes if not resume.content)
+        resumes = [resume for resume in resumes if resume.content]
+        contents = [self._extract_content(resume.content) for resume in resumes]
+        if not resumes:
+            return {"success": 0, "failed": 0, "skipped": skipped_count}
+
+        payload = {"resumes": [
+            {"resume_id": resume.id, "content": content} for resume, content in zip(resumes, contents)
+        ]}
+        result = await self._call_agent_api("/analysis/plagiarism/add-batch", payload, timeout=300.0)
+        if "error" in result:
+            return {"success": 0, "failed": len(resumes), "skipped": skipped_count, "error": result["error"]}
+
+        try:
+            await asyncio.to_thread(self._index_locally, resumes, contents)
+        except Exception as e:
+            # 백필 체크포인트가 이 배치를 넘어가지 않도록 오류로 반환 (재실행 시 Agent 등록은 교체되므로 안전)
+            logger.error(f"로컬 ChromaDB 일괄 등록 실패 ({len(resumes)}건): {e}")
+            return {
+                "success": 0,
+                "failed": len(resumes),
+                "skipped": skipped_count,
+                "error": f"로컬 ChromaDB 등록 실패: {e}"
+            }
+
+        return {
+            "success": result.get("success", 0),
+            "failed": len(result.get("failed", [])),
+            "skipped": skipped_count
+        }
+
     async def embed_and_store_resume(self, db: Session, resume_id: int) -> bool:
         """이력서를 Agent DB에 등록 요청"""
         try:
@@ -38,40 +144,148 @@ class ResumePlagiarismService:
             if not resume:
                 logger.error(f"이력서를 찾을 수 없음: {resume_id}")
                 return False
-                
-            # content 추출
-            content = resume.content
-            if isinstance(content, list) or (isinstance(content, str) and content.startswith("[") and content.endswith("]")):
-                 try:
-                    loaded = json.loads(content) if isinstance(content, str) else content
-                    content = "\n".join([item.get('content', '') for item in loaded if isinstance(item, dict)])
-                 except:
-                    pass
-            
-            payload = {
-                "resume_id": resume_id,
-                "content": str(content)
-            }
-            
-            result = await self._call_agent_api("/analysis/plagiarism/add", payload)
-            return result.get("success", False)
+            result = await self.ingest_resumes([resume])
+            return result["success"] == 1
             
         except Exception as e:
             logger.error(f"이력서 임베딩 요청 실패: {e}")
             return False
 
+    async def batch_embed_resumes(self, db: Session, resume_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """지정한 이력서(없으면 전체)를 배치 단위로 등록 (대량 등록은 start_embedding_backfill 사용)"""
+        success = failed = total = 0
+        last_id = 0
+        while True:
+            query = db.query(Resume.id, Resume.user_id, Resume.title, Resume.content).filter(Resume.id > last_id)
+            if resume_ids is not None:
+                query = query.filter(Resume.id.in_(resume_ids))
+            batch = query.order_by(Resume.id).limit(RESUME_EMBEDDING_BATCH_SIZE).all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+            result = await self.ingest_resumes(batch)
+            total += len(batch)
+            success += result["success"]
+            failed += result["failed"]
+            if "error" in result:
+                return {"success": success, "failed": failed, "total": total, "error": result["error"]}
+        return {"success": success, "failed": failed, "total": total}
+
+    # === 백필 작업 (resume_embedding_queue) ===
+
+    @staticmethod
+    def _backfill_scope(job_post_id: Optional[int]) -> str:
+        return f"job_post:{job_post_id}" if job_post_id else "all"
+
+    @staticmethod
+    def _checkpoint_key(scope: str) -> str:
+        return f"resume_embedding:checkpoint:{scope}"
+
+    @staticmethod
+    def _resume_query(db: Session, after_id: int, job_post_id: Optional[int], *columns):
+        query = db.query(*columns).filter(Resume.id > after_id)
+        if job_post_id:
+            query = query.filter(Resume.id.in_(
+                db.query(Application.resume_id).filter(Application.job_post_id == job_post_id)
+            ))
+        return query
+
+    def _load_resume_batch(self, after_id: int, job_post_id: Optional[int]) -> List[Any]:
+        db = SessionLocal()
+        try:
+            return self._resume_query(
+                db, after_id, job_post_id, Resume.id, Resume.user_id, Resume.title, Resume.content
+            ).order_by(Resume.id).limit(RESUME_EMBEDDING_BATCH_SIZE).all()
+        finally:
+            db.close()
+
+    def _count_resumes(self, after_id: int, job_post_id: Optional[int]) -> int:
+        db = SessionLocal()
+        try:
+            return self._resume_query(db, after_id, job_post_id, func.count(Resume.id)).scalar() or 0
+        finally:
+            db.close()
+
+    async def start_embedding_backfill(
+        self,
+        job_post_id: Optional[int] = None,
+        reset: bool = False,
+        callback_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """이력서 임베딩 백필 작업 등록
+
+        범위(전체 또는 공고 지원자)별 체크포인트(마지막 이력서 id)부터 이어서 실행하므로,
+        중단된 작업이나 이후 추가된 이력서만 처리합니다. reset=True면 처음부터 다시 등록합니다.
+        """
+        scope = self._backfill_scope(job_post_id)
+        if reset:
+            await resume_embedding_queue.redis.delete(self._checkpoint_key(scope))
+        return await resume_embedding_queue.enqueue(
+            "resume_embedding_backfill",
+            {"job_post_id": job_post_id},
+            dedupe_key=scope,
+            callback_url=callback_url
+        )
+
+    async def run_embedding_backfill(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """백필 작업 핸들러 (배치마다 체크포인트/진행률 기록)"""
+        job_id = params["job_id"]
+        job_post_id = params.get("job_post_id")
+        checkpoint_key = self._checkpoint_key(self._backfill_scope(job_post_id))
+        redis = resume_embedding_queue.redis
+
+        checkpoint = await redis.hgetall(checkpoint_key)
+        last_id = int(checkpoint.get("last_id", 0))
+        processed = int(checkpoint.get("processed", 0))
+        failed = int(checkpoint.get("failed", 0))
+        total = processed + failed + await asyncio.to_thread(self._count_resumes, last_id, job_post_id)
+        started_at = time.time()
+
+        while True:
+            batch = await asyncio.to_thread(self._load_resume_batch, last_id, job_post_id)
+            if not batch:
+                break
+            result = await self.ingest_resumes(batch)
+            if "error" in result:
+                # 체크포인트는 마지막 성공 배치에 남아 있으므로 재실행 시 이 배치부터 다시 처리
+                raise RuntimeError(f"이력서 일괄 등록 실패 (resume_id>{last_id}): {result['error']}")
+
+            last_id = batch[-1].id
+            processed += len(batch) - result["failed"]
+            failed += result["failed"]
+            await redis.hset(checkpoint_key, mapping={"last_id": last_id, "processed": processed, "failed": failed})
+            await resume_embedding_queue.update_progress(job_id, {
+                "processed": processed,
+                "failed": failed,
+                "total": total,
+                "last_resume_id": last_id,
+                "percent": round((processed + failed) / total * 100, 1) if total else 100.0,
+                "elapsed_seconds": round(time.time() - started_at, 1)
+            })
+
+        await redis.hset(checkpoint_key, "completed_at", time.time())
+        logger.info(f"이력서 임베딩 백필 완료: {processed}건 등록, {failed}건 실패 (job_post_id={job_post_id})")
+        return {"processed": processed, "failed": failed, "total": total, "last_resume_id": last_id}
+
+    def get_collection_stats(self) -> Dict[str, Any]:
+        """로컬 ChromaDB 컬렉션 통계"""
+        manager = self._get_chroma_manager()
+        if not manager:
+            return {"error": "로컬 ChromaDB 인덱스를 사용할 수 없습니다."}
+        return manager.get_collection_stats()
+
+    def delete_resume_embedding(self, resume_id: int) -> bool:
+        manager = self._get_chroma_manager()
+        return bool(manager) and manager.delete_resume(resume_id)
+
+    def clear_all_embeddings(self) -> bool:
+        manager = self._get_chroma_manager()
+        return bool(manager) and manager.clear_collection()
+
     async def check_plagiarism(self, resume_content: str) -> Dict[str, Any]:
         """표절 검사 요청"""
-        content = resume_content
-        if isinstance(content, list) or (isinstance(content, str) and content.startswith("[") and content.endswith("]")):
-             try:
-                loaded = json.loads(content) if isinstance(content, str) else content
-                content = "\n".join([item.get('content', '') for item in loaded if isinstance(item, dict)])
-             except:
-                pass
-
         payload = {
-            "content": str(content),
+            "content": self._extract_content(resume_content),
             "resume_id": 0
         }
         return await self._call_agent_api("/analysis/plagiarism", payload)
@@ -82,3 +296,5 @@ class ResumePlagiarismService:
 
 # 싱글톤 인스턴스
 resume_plagiarism_service = ResumePlagiarismService()
+
+resume_embedding_queue.register("resume_embedding_backfill", resume_plagiarism_service.run_embedding_backfill)
@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, Any, List, Optional
 import re
+import numpy as np
 from app.utils.agent_client import generate_growth_reasons, generate_score_narrative
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,11 @@ DEGREE_MAP = {
     "박사": 4
 }
 
+# 점수 만점 (학력/자격증/경력 환산 점수)
+DEGREE_MAX = 10
+CERT_MAX = 10
+EXP_MAX = 40
+
 def normalize_degree(degree: str) -> float:
     if not degree:
         return 0.0
@@ -41,6 +47,7 @@ class ApplicantGrowthScoringService:
             "degree": 0.2,
             "certifications": 0.1
         }
+        self._member_exp_mean = None
     
     def normalize_applicant_specs(self, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -83,118 +90,252 @@ class ApplicantGrowthScoringService:
             "experience_years": experience_years,
         }
     
-    async def score_applicant(self, applicant_specs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        지원자 스펙과 고성과자 통계 비교, 성장 가능성 점수 산출
-        Returns: {total_score, detail: {항목별 점수, raw 값, 평균 대비 % 등}, comparison_chart_data, detail_explanation}
-        """
-        norm = self.normalize_applicant_specs(applicant_specs)
+    def _normalize_many(self, norms: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """정규화된 스펙 목록 → 항목별 배열 (값이 없으면 0)"""
+        def column(field):
+            return np.array([float(n.get(field) or 0) for n in norms], dtype=np.float64)
+        return {
+            "kpi": column("kpi"),
+            "promotion_speed": column("promotion_speed"),
+            "degree": column("degree"),
+            "certifications_count": column("certifications_count"),
+            "experience_years": column("experience_years"),
+        }
+
+    def _component_scores(self, norms: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """항목별 점수를 지원자 전체에 대해 배열 연산으로 계산"""
+        values = self._normalize_many(norms)
+        zeros = np.zeros(len(norms))
+        kpi_mean = self.stats.get("kpi_score_mean")
+        promotion_mean = self.stats.get("promotion_speed_years_mean")
+        cert_mean = self.stats.get("certifications_count_mean")
+        high_exp = self.stats.get("total_experience_years_mean", None)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # KPI: 고성과자 평균 대비 비율 (최대 100)
+            kpi = values["kpi"]
+            kpi_score = np.where(kpi != 0, np.minimum(kpi / kpi_mean, 1.0) * 100, 0.0) if kpi_mean else zeros
+            # 승진속도: 고성과자 평균 / 지원자 (빠를수록 높음)
+            promotion = values["promotion_speed"]
+            ratio = np.where(promotion > 0, promotion_mean / promotion, 0.0) if promotion_mean else zeros
+            promotion_score = np.where(promotion != 0, np.minimum(ratio, 1.0) * 100, 0.0) if promotion_mean else zeros
+            # 자격증: 고성과자 평균 대비 비율
+            cert_score = np.minimum(values["certifications_count"] / cert_mean, 1.0) * 100 if cert_mean else zeros
+            # 경력: 고성과자 평균 대비 비율 (40점 만점 환산)
+            exp_score_40 = (
+                np.round(np.minimum(values["experience_years"] / high_exp, 1.0) * EXP_MAX)
+                if high_exp is not None and high_exp > 0 else zeros
+            )
+
+        degree = values["degree"]
+        degree_score = np.select([degree >= 4, degree >= 3, degree >= 2, degree != 0], [100, 90, 80, 60], 0.0)
+        degree_score_10 = np.round(degree_score / 100 * DEGREE_MAX)
+        cert_score_10 = np.round(cert_score / 100 * CERT_MAX)
+
+        return {
+            "kpi": kpi_score,
+            "promotion_speed": promotion_score,
+            "degree": degree_score,
+            "certifications": cert_score,
+            "degree_10": degree_score_10,
+            "certifications_10": cert_score_10,
+            "experience_40": exp_score_40,
+            "total": degree_score_10 + cert_score_10 + exp_score_40,
+        }
+
+    def _high_performer_experience_mean(self) -> Optional[float]:
+        if self._member_exp_mean is None:
+            exp_vals = [
+                float(m.get('total_experience_years', 0)) for m in (self.high_performer_members or [])
+                if m.get('total_experience_years') is not None
+            ]
+            self._member_exp_mean = sum(exp_vals) / len(exp_vals) if exp_vals else self.stats.get('total_experience_years_mean', 0.0)
+        return self._member_exp_mean
+
+    def _build_result(self, norm: Dict[str, Any], scores: Dict[str, float]) -> Dict[str, Any]:
+        """항목 점수로 상세/설명/차트/표/규칙 기반 근거·요약 생성"""
+        weight = lambda key: f"가중치 {self.weights[key]*100:.0f}%"
         detail = {}
         detail_explanation = {}
-        total_score = 0.0
         # KPI
-        kpi_score = 0.0
-        kpi_explanation = ""
         if self.stats.get("kpi_score_mean") and norm.get("kpi"):
-            kpi_score = min(norm["kpi"] / self.stats["kpi_score_mean"], 1.0) * 100
             kpi_explanation = (
                 f"지원자 KPI: {norm.get('kpi', 0)} / 고성과자 평균: {self.stats.get('kpi_score_mean', 0)}\n"
-                f"→ KPI는 {'우수' if norm['kpi'] >= self.stats['kpi_score_mean'] else '평균 이하'} (가중치 {self.weights['kpi']*100:.0f}%)"
+                f"→ KPI는 {'우수' if norm['kpi'] >= self.stats['kpi_score_mean'] else '평균 이하'} ({weight('kpi')})"
             )
         else:
             kpi_explanation = "KPI 정보 부족"
-        detail["kpi"] = {"score": kpi_score, "value": norm.get("kpi"), "mean": self.stats.get("kpi_score_mean")}
+        detail["kpi"] = {"score": scores["kpi"], "value": norm.get("kpi"), "mean": self.stats.get("kpi_score_mean")}
         detail_explanation["kpi"] = kpi_explanation
         # 승진속도
-        promotion_score = 0.0
-        promotion_explanation = ""
         if self.stats.get("promotion_speed_years_mean") and norm.get("promotion_speed"):
-            ratio = self.stats["promotion_speed_years_mean"] / norm["promotion_speed"] if norm["promotion_speed"] > 0 else 0
-            promotion_score = min(ratio, 1.0) * 100
             promotion_explanation = (
                 f"지원자 승진속도: {norm.get('promotion_speed', 0)}년 / 고성과자 평균: {self.stats.get('promotion_speed_years_mean', 0)}년\n"
-                f"→ {'빠름' if norm['promotion_speed'] <= self.stats['promotion_speed_years_mean'] else '느림'} (가중치 {self.weights['promotion_speed']*100:.0f}%)"
+                f"→ {'빠름' if norm['promotion_speed'] <= self.stats['promotion_speed_years_mean'] else '느림'} ({weight('promotion_speed')})"
             )
         else:
             promotion_explanation = "승진속도 정보 부족"
-        detail["promotion_speed"] = {"score": promotion_score, "value": norm.get("promotion_speed"), "mean": self.stats.get("promotion_speed_years_mean")}
+        detail["promotion_speed"] = {"score": scores["promotion_speed"], "value": norm.get("promotion_speed"), "mean": self.stats.get("promotion_speed_years_mean")}
         detail_explanation["promotion_speed"] = promotion_explanation
         # 학력
-        degree_score = 0.0
-        degree_explanation = ""
         if norm.get("degree"):
             if norm["degree"] >= 4:
-                degree_score = 100
-                degree_explanation = "박사 학위 보유 (최고점, 가중치 {:.0f}%)".format(self.weights['degree']*100)
+                degree_explanation = "박사 학위 보유 (최고점, {})".format(weight('degree'))
             elif norm["degree"] >= 3:
-                degree_score = 90
-                degree_explanation = "석사 학위 보유 (우수, 가중치 {:.0f}%)".format(self.weights['degree']*100)
+                degree_explanation = "석사 학위 보유 (우수, {})".format(weight('degree'))
             elif norm["degree"] >= 2:
-                degree_score = 80
-                degree_explanation = "학사 학위 보유 (충분, 가중치 {:.0f}%)".format(self.weights['degree']*100)
+                degree_explanation = "학사 학위 보유 (충분, {})".format(weight('degree'))
             else:
-                degree_score = 60
-                degree_explanation = "학력은 고졸 이하 (가중치 {:.0f}%)".format(self.weights['degree']*100)
+                degree_explanation = "학력은 고졸 이하 ({})".format(weight('degree'))
         else:
             degree_explanation = "학력 정보 부족"
-        detail["degree"] = {"score": degree_score, "value": norm.get("degree"), "mean": self.stats.get("degree_mean")}
+        detail["degree"] = {"score": scores["degree"], "value": norm.get("degree"), "mean": self.stats.get("degree_mean")}
         detail_explanation["degree"] = degree_explanation
         # 자격증
-        cert_score = 0.0
-        cert_explanation = ""
         if self.stats.get("certifications_count_mean") and norm.get("certifications_count") is not None:
-            cert_score = min(norm["certifications_count"] / self.stats["certifications_count_mean"], 1.0) * 100
             cert_explanation = (
                 f"지원자 자격증 개수: {norm.get('certifications_count', 0)} / 고성과자 평균: {self.stats.get('certifications_count_mean', 0)}\n"
-                f"→ {'많음' if norm['certifications_count'] >= self.stats['certifications_count_mean'] else '평균 이하'} (가중치 {self.weights['certifications']*100:.0f}%)"
+                f"→ {'많음' if norm['certifications_count'] >= self.stats['certifications_count_mean'] else '평균 이하'} ({weight('certifications')})"
             )
         else:
             cert_explanation = "자격증 정보 부족"
-        detail["certifications"] = {"score": cert_score, "value": norm.get("certifications_count"), "mean": self.stats.get("certifications_count_mean")}
+        detail["certifications"] = {"score": scores["certifications"], "value": norm.get("certifications_count"), "mean": self.stats.get("certifications_count_mean")}
         detail_explanation["certifications"] = cert_explanation
-        # 가중합
-        total_score = (
-            kpi_score * self.weights["kpi"] +
-            promotion_score * self.weights["promotion_speed"] +
-            degree_score * self.weights["degree"] +
-            cert_score * self.weights["certifications"]
-        )
+
         # 비교 그래프용 데이터 생성
-        chart_labels = ["경력(년)", "학력", "자격증"]
         def safe_float(val):
             try:
                 return float(val)
             except (TypeError, ValueError):
                 return 0.0
-        # 경력(년) 추출
-        applicant_exp = safe_float(norm.get("experience_years"))
-        applicant_values = [
-            applicant_exp,
-            safe_float(norm.get("degree")),
-            safe_float(norm.get("certifications_count")),
-        ]
-        # 고성과자 평균값 추출
-        high_exp = None
-        if hasattr(self, 'high_performer_members'):
-            members = self.high_performer_members
-            exp_vals = [float(m.get('total_experience_years', 0)) for m in members if m.get('total_experience_years') is not None]
-            if exp_vals:
-                high_exp = sum(exp_vals) / len(exp_vals)
-        if high_exp is None:
-            high_exp = self.stats.get('total_experience_years_mean', 0.0)
-        high_performer_values = [
-            safe_float(high_exp),
-            safe_float(self.stats.get("degree_mean")),
-            safe_float(self.stats.get("certifications_count_mean")),
-        ]
         comparison_chart_data = {
-            "labels": chart_labels,
-            "applicant": applicant_values,
-            "high_performer": high_performer_values
+            "labels": ["경력(년)", "학력", "자격증"],
+            "applicant": [
+                safe_float(norm.get("experience_years")),
+                safe_float(norm.get("degree")),
+                safe_float(norm.get("certifications_count")),
+            ],
+            "high_performer": [
+                safe_float(self._high_performer_experience_mean()),
+                safe_float(self.stats.get("degree_mean")),
+                safe_float(self.stats.get("certifications_count_mean")),
+            ]
         }
+
+        # 점수 만점 환산 및 표 데이터 생성
+        degree_score_10 = int(scores["degree_10"])
+        cert_score_10 = int(scores["certifications_10"])
+        exp_score_40 = int(scores["experience_40"])
+        total = int(scores["total"])
+        exp = norm.get("experience_years", 0)
+        high_exp = self.stats.get("total_experience_years_mean", None)
+        high_exp_label = f"{int(high_exp)}년" if high_exp is not None and high_exp > 0 else "데이터 없음"
+
+        degree_label = {4: "박사", 3: "석사", 2: "학사", 1: "전문학사"}.get(norm.get("degree"), "고졸 이하")
+        if self.stats.get("degree_mean"):
+            if self.stats["degree_mean"] >= 4: high_degree_label = "박사"
+            elif self.stats["degree_mean"] >= 3: high_degree_label = "석사"
+            elif self.stats["degree_mean"] >= 2: high_degree_label = "학사"
+            elif self.stats["degree_mean"] >= 1: high_degree_label = "전문학사"
+            else: high_degree_label = "고졸 이하"
+        else: high_degree_label = "-"
+
+        cert_count = norm.get("certifications_count", 0)
+        high_cert_count = self.stats.get("certifications_count_mean", 0)
+        item_table = [
+            {
+                "항목": "학력",
+                "지원자": degree_label,
+                "고성과자평균": high_degree_label,
+                "항목점수": f"{degree_score_10}/{DEGREE_MAX}",
+                "비중": f"{int(DEGREE_MAX)}점"
+            },
+            {
+                "항목": "자격증",
+                "지원자": f"{cert_count}개",
+                "고성과자평균": f"{int(high_cert_count)}개",
+                "항목점수": f"{cert_score_10}/{CERT_MAX}",
+                "비중": f"{int(CERT_MAX)}점"
+            },
+            {
+                "항목": "경력",
+                "지원자": f"{int(exp)}년",
+                "고성과자평균": high_exp_label,
+                "항목점수": f"{exp_score_40}/{EXP_MAX}",
+                "비중": f"{int(EXP_MAX)}점"
+            }
+        ]
+
+        # 규칙 기반 근거
+        reasons = []
+        if norm.get("kpi") is not None and self.stats.get("kpi_score_mean"):
+            if norm["kpi"] >= self.stats["kpi_score_mean"]:
+                reasons.append("✅ KPI 성장 잠재력 높음")
+            else:
+                reasons.append("⚠️ KPI가 고성과자 평균보다 낮음")
+        if norm.get("certifications_count", 0) > 0:
+            reasons.append("✅ 자격증 보유")
+        else:
+            reasons.append("⚠️ 자격증 미보유")
+        if norm.get("promotion_speed") and self.stats.get("promotion_speed_years_mean"):
+            if norm["promotion_speed"] <= self.stats["promotion_speed_years_mean"]:
+                reasons.append("✅ 승진 속도 우수")
+            else:
+                reasons.append("⚠️ 승진 속도는 다소 느린 편")
+        if norm.get("degree") and self.stats.get("degree_mean"):
+            if norm["degree"] >= self.stats["degree_mean"]:
+                reasons.append("✅ 학력 우수")
+            else:
+                reasons.append("⚠️ 학력은 고성과자 평균보다 낮음")
+
+        # 규칙 기반 요약
+        narrative = ""
+        if degree_score_10 == DEGREE_MAX and cert_score_10 == CERT_MAX:
+            narrative += f"지원자의 학력({degree_label})과 자격증({cert_count}개)은 고성과자 평균과 동일하여 만점(각 {DEGREE_MAX}점, {CERT_MAX}점)입니다.\n"
+        if high_exp is None or high_exp == 0:
+            narrative += "고성과자 경력 데이터가 부족하여 경력 항목 점수 산정이 어렵습니다.\n"
+        elif exp_score_40 == 0:
+            narrative += f"그러나 경력({int(exp)}년)이 고성과자 평균({high_exp_label})에 한참 못 미쳐 해당 항목({EXP_MAX}점)에서 0점을 받았습니다.\n"
+        narrative += f"따라서, 총점은 {total}점({DEGREE_MAX+CERT_MAX+EXP_MAX}점 만점)으로 평가됩니다.\n"
+        if EXP_MAX >= 30:
+            narrative += "경력 항목의 비중이 높으므로, 경력 보완이 성장 가능성 점수 개선의 핵심 포인트입니다."
+
+        return {
+            "total_score": total,
+            "detail": detail,
+            "comparison_chart_data": comparison_chart_data,
+            "reasons": reasons,
+            "detail_explanation": detail_explanation,
+            "item_table": item_table,
+            "narrative": narrative
+        }
+
+    def score_applicants(self, specs_by_application: Dict[int, List[Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 지원자 일괄 스코어링 (항목 점수는 배열 연산, 근거/요약은 규칙 기반으로 LLM 호출 없음)
+        Returns: {application_id: score_applicant와 같은 형식의 결과}
+        """
+        application_ids = list(specs_by_application)
+        norms = [self.normalize_applicant_specs(specs_by_application[app_id]) for app_id in application_ids]
+        scores = self._component_scores(norms)
+        results = {}
+        for index, (app_id, norm) in enumerate(zip(application_ids, norms)):
+            result = self._build_result(norm, {key: float(values[index]) for key, values in scores.items()})
+            result["normalized"] = norm
+            results[app_id] = result
+        return results
+
+    async def score_applicant(self, applicant_specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        지원자 스펙과 고성과자 통계 비교, 성장 가능성 점수 산출
+        Returns: {total_score, detail: {항목별 점수, raw 값, 평균 대비 % 등}, comparison_chart_data, detail_explanation}
+        """
+        norm = self.normalize_applicant_specs(applicant_specs)
+        scores = self._component_scores([norm])
+        result = self._build_result(norm, {key: float(values[0]) for key, values in scores.items()})
+        detail = result["detail"]
         
-        # 주요 근거 생성 (Agent API 호출)
-        llm_reasons = []
+        # 주요 근거 생성 (Agent API 호출, 실패 시 규칙 기반 근거 유지)
         try:
             comparison_data = f"""
             [학력 점수 산정 기준]
@@ -217,126 +358,28 @@ class ApplicantGrowthScoringService:
             
             if not llm_reasons:
                 raise ValueError('LLM 응답이 비어 있음')
+            result["reasons"] = llm_reasons
         except Exception as e:
             logger.warning(f"[LLM fallback] Agent API 호출 실패: {e}, rule-based로 대체")
-            reasons = []
-            if norm.get("kpi") is not None and self.stats.get("kpi_score_mean"):
-                if norm["kpi"] >= self.stats["kpi_score_mean"]:
-                    reasons.append("✅ KPI 성장 잠재력 높음")
-                else:
-                    reasons.append("⚠️ KPI가 고성과자 평균보다 낮음")
-            if norm.get("certifications_count", 0) > 0:
-                reasons.append("✅ 자격증 보유")
-            else:
-                reasons.append("⚠️ 자격증 미보유")
-            if norm.get("promotion_speed") and self.stats.get("promotion_speed_years_mean"):
-                if norm["promotion_speed"] <= self.stats["promotion_speed_years_mean"]:
-                    reasons.append("✅ 승진 속도 우수")
-                else:
-                    reasons.append("⚠️ 승진 속도는 다소 느린 편")
-            if norm.get("degree") and self.stats.get("degree_mean"):
-                if norm["degree"] >= self.stats["degree_mean"]:
-                    reasons.append("✅ 학력 우수")
-                else:
-                    reasons.append("⚠️ 학력은 고성과자 평균보다 낮음")
-            llm_reasons = reasons
-            
-        # 점수 만점 정의 및 환산 (기존 로직 유지)
-        DEGREE_MAX = 10
-        CERT_MAX = 10
-        EXP_MAX = 40
-        degree_score_10 = round((degree_score / 100) * DEGREE_MAX)
-        cert_score_10 = round((cert_score / 100) * CERT_MAX)
-        exp = norm.get("experience_years", 0)
-        high_exp = self.stats.get("total_experience_years_mean", None)
-        if high_exp is not None and high_exp > 0:
-            exp_score_40 = round(min(exp / high_exp, 1.0) * EXP_MAX)
-            high_exp_label = f"{int(high_exp)}년"
-        else:
-            exp_score_40 = 0
-            high_exp_label = "데이터 없음"
-        total = degree_score_10 + cert_score_10 + exp_score_40
-        
-        # 표 데이터 생성
-        item_table = []
-        degree_label = None
-        if norm.get("degree") == 4: degree_label = "박사"
-        elif norm.get("degree") == 3: degree_label = "석사"
-        elif norm.get("degree") == 2: degree_label = "학사"
-        elif norm.get("degree") == 1: degree_label = "전문학사"
-        else: degree_label = "고졸 이하"
-        
-        high_degree_label = None
-        if self.stats.get("degree_mean"):
-            if self.stats["degree_mean"] >= 4: high_degree_label = "박사"
-            elif self.stats["degree_mean"] >= 3: high_degree_label = "석사"
-            elif self.stats["degree_mean"] >= 2: high_degree_label = "학사"
-            elif self.stats["degree_mean"] >= 1: high_degree_label = "전문학사"
-            else: high_degree_label = "고졸 이하"
-        else: high_degree_label = "-"
         
-        item_table.append({
-            "항목": "학력",
-            "지원자": degree_label,
-            "고성과자평균": high_degree_label,
-            "항목점수": f"{degree_score_10}/{DEGREE_MAX}",
-            "비중": f"{int(DEGREE_MAX)}점"
-        })
-        cert_count = norm.get("certifications_count", 0)
-        high_cert_count = self.stats.get("certifications_count_mean", 0)
-        item_table.append({
-            "항목": "자격증",
-            "지원자": f"{cert_count}개",
-            "고성과자평균": f"{int(high_cert_count)}개",
-            "항목점수": f"{cert_score_10}/{CERT_MAX}",
-            "비중": f"{int(CERT_MAX)}점"
-        })
-        item_table.append({
-            "항목": "경력",
-            "지원자": f"{int(exp)}년",
-            "고성과자평균": high_exp_label,
-            "항목점수": f"{exp_score_40}/{EXP_MAX}",
-            "비중": f"{int(EXP_MAX)}점"
-        })
-        
-        # 점수 설명 생성 (Agent API 호출)
-        llm_narrative = None
+        # 점수 설명 생성 (Agent API 호출, 실패 시 규칙 기반 요약 유지)
         try:
             table_str = "| 항목 | 지원자 | 고성과자평균 | 항목점수 | 비중 |\n|---|---|---|---|---|\n"
-            for row in item_table:
+            for row in result["item_table"]:
                 table_str += f"| {row['항목']} | {row['지원자']} | {row['고성과자평균']} | {row['항목점수']} | {row['비중']} |\n"
             
             prompt_context = f"""
             점수 구조 표:
             {table_str}
-            총점: {total}점 (만점: {DEGREE_MAX+CERT_MAX+EXP_MAX}점)
+            총점: {result['total_score']}점 (만점: {DEGREE_MAX+CERT_MAX+EXP_MAX}점)
             """
             
             llm_narrative = await generate_score_narrative(prompt_context)
             
             if not llm_narrative:
                 raise ValueError('LLM narrative empty')
+            result["narrative"] = llm_narrative
         except Exception as e:
             logger.warning(f"[LLM narrative fallback] Agent API 호출 실패: {e}, rule-based로 대체")
-            # 기존 rule-based narrative
-            narrative = ""
-            if degree_score_10 == DEGREE_MAX and cert_score_10 == CERT_MAX:
-                narrative += f"지원자의 학력({degree_label})과 자격증({cert_count}개)은 고성과자 평균과 동일하여 만점(각 {DEGREE_MAX}점, {CERT_MAX}점)입니다.\n"
-            if high_exp is None or high_exp == 0:
-                narrative += "고성과자 경력 데이터가 부족하여 경력 항목 점수 산정이 어렵습니다.\n"
-            elif exp_score_40 == 0:
-                narrative += f"그러나 경력({int(exp)}년)이 고성과자 평균({high_exp_label})에 한참 못 미쳐 해당 항목({EXP_MAX}점)에서 0점을 받았습니다.\n"
-            narrative += f"따라서, 총점은 {total}점({DEGREE_MAX+CERT_MAX+EXP_MAX}점 만점)으로 평가됩니다.\n"
-            if EXP_MAX >= 30:
-                narrative += "경력 항목의 비중이 높으므로, 경력 보완이 성장 가능성 점수 개선의 핵심 포인트입니다."
-            llm_narrative = narrative
             
-        return {
-            "total_score": total,
-            "detail": detail,
-            "comparison_chart_data": comparison_chart_data,
-            "reasons": llm_reasons,
-            "detail_explanation": detail_explanation,
-            "item_table": item_table,
-            "narrative": llm_narrative
-        }
+        return result
@@ -0,0 +1,301 @@
+import logging
+import os
+import threading
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, func, select, delete, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.models.v2.document.resume import Resume, Spec, ResumeDocument
+from app.utils.resume_parser import parse_resume_specs
+
+logger = logging.getLogger(__name__)
+
+# 이력서 문서 구체화 설정
+# RESUME_DOCUMENT_SYNC_BATCH_SIZE: 지문 검사 후 한 번에 다시 만들고 커밋할 이력서 수
+# RESUME_DOCUMENT_SYNC_ON_STARTUP: 서버 시작 시(시드/일괄 적재 후) 없거나 어긋난 문서 재생성 여부
+SYNC_BATCH_SIZE = int(os.getenv("RESUME_DOCUMENT_SYNC_BATCH_SIZE", "500"))
+SYNC_ON_STARTUP = os.getenv("RESUME_DOCUMENT_SYNC_ON_STARTUP", "true").lower() == "true"
+# RESUME_DOCUMENT_SYNC_LOCK_TTL: 여러 워커 중 하나만 시작 동기화를 하도록 잡는 Redis 락 만료(초)
+SYNC_LOCK_TTL = int(os.getenv("RESUME_DOCUMENT_SYNC_LOCK_TTL", "1800"))
+SYNC_LOCK_KEY = "resume_document:startup_sync"
+
+# 종료 시 진행 중인 시작 동기화를 배치 사이에서 멈추기 위한 이벤트
+_startup_sync_stop = threading.Event()
+# 락을 가진 경우에만 삭제 (만료 후 다른 워커가 잡은 락은 건드리지 않음)
+_RELEASE_LOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+# 플러시 중 변경된 이력서 id를 모아 두는 session.info 키
+_PENDING_KEY = "resume_document_pending"
+
+# resume_text 섹션 순서: (스펙 타입들, 제목, 번호 매김 여부)
+TEXT_SECTIONS = (
+    (("project", "프로젝트"), "주요 프로젝트 경험", True),
+    (("education", "교육"), "교육사항", False),
+    (("certificate", "자격증"), "자격증", False),
+    (("skill", "기술"), "기술 스택", False),
+)
+SECTION_SPEC_TYPES = {spec_type for types, _, _ in TEXT_SECTIONS for spec_type in types}
+
+
+def build_resume_text(title: Optional[str], content: Optional[str], specs: Iterable[Any]) -> str:
+    """이력서와 스펙을 조합한 LLM 프롬프트용 resume_text 생성
+
+    specs는 spec_type/spec_title/spec_description 속성을 가진 객체(Spec, 조회 행) 목록입니다.
+    """
+    resume_text = f"""
+이력서 제목: {title}
+
+기본 내용:
+{content or "내용 없음"}
+"""
+
+    # Spec 타입별로 분류 (처음 나온 순서 유지)
+    spec_categories: Dict[Any, List[Any]] = {}
+    for spec in specs:
+        spec_categories.setdefault(spec.spec_type, []).append(spec)
+
+    for spec_types, heading, numbered in TEXT_SECTIONS:
+        section_specs = [spec for spec_type in spec_types for spec in spec_categories.get(spec_type, [])]
+        if not any(spec_type in spec_categories for spec_type in spec_types):
+            continue
+        resume_text += f"\n\n{heading}:\n"
+        for i, spec in enumerate(section_specs, 1):
+            if numbered:
+                resume_text += f"{i}. {spec.spec_title}\n"
+                if spec.spec_description:
+                    resume_text += f"   {spec.spec_description}\n"
+            else:
+                resume_text += f"- {spec.spec_title}\n"
+                if spec.spec_description:
+                    resume_text += f"  {spec.spec_description}\n"
+
+    # 기타 스펙들
+    other_specs = [
+        spec for spec_type, specs_list in spec_categories.items()
+        if spec_type not in SECTION_SPEC_TYPES for spec in specs_list
+    ]
+    if other_specs:
+        resume_text += "\n\n기타 경험:\n"
+        for spec in other_specs:
+            resume_text += f"- {spec.spec_title} ({spec.spec_type})\n"
+            if spec.spec_description:
+                resume_text += f"  {spec.spec_description}\n"
+
+    return resume_text.strip()
+
+
+def _fingerprint(spec_count: int, max_spec_id: Optional[int], updated_at: Optional[datetime]) -> str:
+    """원본 지문 (스펙 추가/삭제, 이력서 수정을 감지, 일괄 적재 후 동기화에 사용)"""
+    return f"{spec_count}:{max_spec_id or 0}:{updated_at.isoformat() if updated_at else ''}"
+
+
+def _build_document_rows(executor, resume_ids: List[int]) -> List[Dict[str, Any]]:
+    """이력서 문서 행 생성 (이력서/스펙 각 1회 조회, version 제외)
+
+    executor는 Session 또는 Connection이며, 이력서가 없는 id는 결과에서 빠집니다.
+    """
+    resumes = executor.execute(
+        select(Resume.id, Resume.title, Resume.content, Resume.updated_at).where(Resume.id.in_(resume_ids))
+    ).all()
+    specs_by_resume = defaultdict(list)
+    for spec in executor.execute(
+        select(Spec.id, Spec.resume_id, Spec.spec_type, Spec.spec_title, Spec.spec_description)
+        .where(Spec.resume_id.in_(resume_ids))
+        .order_by(Spec.id)
+    ):
+        specs_by_resume[spec.resume_id].append(spec)
+
+    now = datetime.utcnow()
+    rows = []
+    for resume in resumes:
+        specs = specs_by_resume.get(resume.id, [])
+        rows.append({
+            "resume_id": resume.id,
+            "source_fingerprint": _fingerprint(len(specs), specs[-1].id if specs else None, resume.updated_at),
+            "specs": [
+                {
+                    "id": spec.id,
+                    "spec_type": spec.spec_type,
+                    "spec_title": spec.spec_title,
+                    "spec_description": spec.spec_description
+                }
+                for spec in specs
+            ],
+            "structured_specs": parse_resume_specs(specs),
+            "resume_text": build_resume_text(resume.title, resume.content, specs),
+            "built_at": now
+        })
+    return rows
+
+
+def refresh_resume_documents(connection, resume_ids: Iterable[int]) -> int:
+    """이력서 문서 재생성 (주어진 연결의 트랜잭션 안에서 실행, 이력서/스펙/기존 버전 각 1회 조회)
+
+    이력서가 없어진 id의 문서는 삭제합니다. 반환값은 생성된 문서 수입니다.
+    """
+    resume_ids = sorted({resume_id for resume_id in resume_ids if resume_id})
+    if not resume_ids:
+        return 0
+
+    rows = _build_document_rows(connection, resume_ids)
+    versions = dict(connection.execute(
+        select(ResumeDocument.resume_id, ResumeDocument.version).where(ResumeDocument.resume_id.in_(resume_ids))
+    ).all())
+    for row in rows:
+        row["version"] = versions.get(row["resume_id"], 0) + 1
+
+    connection.execute(delete(ResumeDocument.__table__).where(ResumeDocument.resume_id.in_(resume_ids)))
+    if rows:
+        connection.execute(insert(ResumeDocument.__table__), rows)
+    return len(rows)
+
+
+def get_resume_documents(db: Session, resume_ids: Iterable[int]) -> Dict[int, ResumeDocument]:
+    """이력서 문서 일괄 조회
+
+    저장된 문서가 없는 이력서는 원본에서 메모리로만 만들어 반환합니다(세션에 추가하지 않음).
+    읽기 경로에서는 쓰지 않으며, 저장은 ORM 변경 훅과 sync_resume_documents가 담당합니다.
+    """
+    resume_ids = {resume_id for resume_id in resume_ids if resume_id}
+    if not resume_ids:
+        return {}
+    # 같은 세션에서 먼저 읽은 문서가 이후 재생성됐을 수 있으므로 조회 결과로 덮어씀
+    documents = {
+        document.resume_id: document
+        for document in db.query(ResumeDocument).populate_existing()
+        .filter(ResumeDocument.resume_id.in_(resume_ids)).all()
+    }
+    missing = resume_ids - set(documents)
+    if missing:
+        documents.update({
+            row["resume_id"]: ResumeDocument(version=0, **row)
+            for row in _build_document_rows(db, sorted(missing))
+        })
+    return documents
+
+
+def get_resume_document(db: Session, resume_id: int) -> Optional[ResumeDocument]:
+    """이력서 문서 조회 (resume_id 한 번 조회, 이력서가 없으면 None)"""
+    return get_resume_documents(db, [resume_id]).get(resume_id)
+
+
+def get_resume_text(db: Session, resume: Resume) -> str:
+    """LLM 프롬프트용 이력서+스펙 통합 텍스트 (구체화된 문서에서 조회)"""
+    document = get_resume_document(db, resume.id)
+    if document is None:
+        return build_resume_text(resume.title, resume.content, resume.specs)
+    return document.resume_text
+
+
+def get_structured_specs(db: Session, resume_id: Optional[int]) -> Dict[str, List[Any]]:
+    """parse_resume_specs 형식의 구조화 스펙 (이력서가 없으면 빈 구조)"""
+    document = get_resume_document(db, resume_id) if resume_id else None
+    if document is None:
+        return parse_resume_specs([])
+    return document.structured_specs
+
+
+def sync_resume_documents(
+    db: Session,
+    batch_size: int = SYNC_BATCH_SIZE,
+    stop_event: Optional[threading.Event] = None
+) -> Dict[str, int]:
+    """문서가 없거나 원본 지문과 어긋난 이력서의 문서 재생성
+
+    ORM 밖에서(시드 SQL, 일괄 적재 등) 이력서/스펙이 바뀐 경우를 위한 동기화입니다.
+    지문 비교는 스펙 GROUP BY 한 번으로 하고, 재생성은 batch_size 단위로 커밋합니다.
+    stop_event가 설정되면 다음 배치 전에 멈춥니다.
+    """
+    spec_stats = (
+        select(Spec.resume_id, func.count(Spec.id).label("spec_count"), func.max(Spec.id).label("max_spec_id"))
+        .group_by(Spec.resume_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            Resume.id, Resume.updated_at, spec_stats.c.spec_count, spec_stats.c.max_spec_id,
+            ResumeDocument.source_fingerprint
+        )
+        .outerjoin(spec_stats, spec_stats.c.resume_id == Resume.id)
+        .outerjoin(ResumeDocument, ResumeDocument.resume_id == Resume.id)
+    ).all()
+    stale = [
+        row.id for row in rows
+        if row.source_fingerprint != _fingerprint(row.spec_count or 0, row.max_spec_id, row.updated_at)
+    ]
+
+    rebuilt = 0
+    for start in range(0, len(stale), batch_size):
+        if stop_event is not None and stop_event.is_set():
+            logger.info("이력서 문서 동기화 중단 (서버 종료)")
+            break
+        rebuilt += refresh_resume_documents(db.connection(), stale[start:start + batch_size])
+        db.commit()
+    if stale:
+        logger.info(f"이력서 문서 동기화: {len(rows)}건 중 {rebuilt}건 재생성")
+    return {"checked": len(rows), "rebuilt": rebuilt}
+
+
+def run_startup_sync():
+    """서버 시작 시 이력서 문서 동기화 (스레드에서 실행)
+
+    여러 워커가 같은 배치를 동시에 다시 만들지 않도록 Redis 락(SET NX EX)을 잡은 워커만 실행합니다.
+    """
+    from app.core.cache import redis_client
+    from app.core.database import SessionLocal
+
+    token = uuid.uuid4().hex
+    try:
+        if not redis_client.set(SYNC_LOCK_KEY, token, nx=True, ex=SYNC_LOCK_TTL):
+            logger.info("이력서 문서 동기화: 다른 워커가 실행 중이므로 건너뜀")
+            return None
+    except Exception as e:
+        logger.warning(f"이력서 문서 동기화 락 획득 실패, 동기화를 건너뜀: {e}")
+        return None
+
+    db = SessionLocal()
+    try:
+        return sync_resume_documents(db, stop_event=_startup_sync_stop)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"이력서 문서 동기화 실패: {e}")
+    finally:
+        db.close()
+        try:
+            redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, SYNC_LOCK_KEY, token)
+        except Exception as e:
+            logger.warning(f"이력서 문서 동기화 락 해제 실패 (만료 시 자동 해제): {e}")
+
+
+def stop_startup_sync():
+    """진행 중인 시작 동기화를 다음 배치 전에 멈추도록 요청 (서버 종료 시)"""
+    _startup_sync_stop.set()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_resumes(session, flush_context):
+    """플러시된 Resume/Spec 변경에서 문서를 다시 만들 이력서 id 수집"""
+    changed = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Spec):
+            # 다른 이력서로 옮겨진 스펙은 이전/현재 이력서 모두 갱신
+            history = inspect(obj).attrs.resume_id.history
+            changed.update(chain(history.added, history.unchanged, history.deleted))
+        elif isinstance(obj, Resume) and obj not in session.deleted and session.is_modified(obj):
+            changed.add(obj.id)
+    changed.discard(None)
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _rebuild_changed_resumes(session, flush_context):
+    """같은 트랜잭션에서 변경된 이력서의 문서 재생성 (스펙 변경과 함께 커밋/롤백)"""
+    resume_ids = session.info.pop(_PENDING_KEY, None)
+    if resume_ids:
+        refresh_resume_documents(session.connection(), resume_ids)
@@ -0,0 +1,302 @@
+# === Analysis Job Queue (Redis) ===
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class CallbackURLNotAllowed(ValueError):
+    """callback_url이 허용된 내부 호스트가 아닐 때 발생"""
+
+
+def validate_callback_url(callback_url: str) -> str:
+    """완료 웹훅 URL 검증 (http/https이고 ANALYSIS_CALLBACK_ALLOWED_HOSTS에 있는 호스트만 허용)
+
+    임의 호스트로 요청을 보내는 SSRF를 막기 위해 등록 시점과 전송 직전에 모두 확인합니다.
+    """
+    allowed_hosts = {
+        host.strip().lower() for host in settings.ANALYSIS_CALLBACK_ALLOWED_HOSTS.split(",") if host.strip()
+    }
+    try:
+        parsed = urlparse(callback_url)
+        hostname = (parsed.hostname or "").lower()
+    except ValueError:
+        raise CallbackURLNotAllowed(f"잘못된 callback_url입니다: {callback_url}")
+    if parsed.scheme not in ("http", "https") or hostname not in allowed_hosts:
+        raise CallbackURLNotAllowed(f"허용되지 않은 callback_url 호스트입니다: {hostname or callback_url}")
+    return callback_url
+
+
+class AnalysisJobQueue:
+    """Redis 리스트 기반 분석 작업 큐
+
+    - 요청 핸들러는 enqueue()로 작업을 등록하고 job_id를 즉시 반환합니다.
+    - 각 백엔드 워커 프로세스의 소비자 태스크가 BLMOVE로 작업을 꺼내 처리 목록으로 옮긴 뒤
+      등록된 핸들러를 실행하고, 완료 시 처리 목록에서 제거합니다.
+    - 실행 중인 작업은 주기적으로 heartbeat를 갱신하며, heartbeat가 끊긴 작업(프로세스 재시작 등)은
+      다른 소비자가 큐로 되돌려 다시 실행합니다.
+    - 작업 상태/결과는 Redis 해시(job_ttl 동안 보관)에 저장되며, callback_url이 있으면 완료 시 POST합니다.
+      callback_url은 허용된 내부 호스트만 받습니다(validate_callback_url).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        job_ttl: Optional[int] = None,
+        stale_after: Optional[int] = None,
+        max_attempts: int = 2
+    ):
+        self.name = name
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.concurrency = concurrency or int(os.getenv("ANALYSIS_JOB_CONCURRENCY", "2"))
+        self.job_ttl = job_ttl or int(os.getenv("ANALYSIS_JOB_TTL", str(86400)))
+        self.stale_after = stale_after or int(os.getenv("ANALYSIS_JOB_STALE_SECONDS", "120"))
+        self.heartbeat_interval = max(5, self.stale_after // 4)
+        self.max_attempts = max_attempts
+        self.queue_key = f"{name}:queue"
+        self.processing_key = f"{name}:processing"
+        self.handlers: Dict[str, JobHandler] = {}
+        self._redis: Optional[aioredis.Redis] = None
+        self._tasks = []
+        self._stale_candidates = set()
+
+    def job_key(self, job_id: str) -> str:
+        return f"{self.name}:job:{job_id}"
+
+    def active_key(self, dedupe_key: str) -> str:
+        return f"{self.name}:active:{dedupe_key}"
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def register(self, job_type: str, handler: JobHandler):
+        """작업 유형별 비동기 핸들러 등록"""
+        self.handlers[job_type] = handler
+
+    async def enqueue(
+        self,
+        job_type: str,
+        params: Dict[str, Any],
+        dedupe_key: Optional[str] = None,
+        callback_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """작업 등록 후 상태 반환 (같은 dedupe_key의 작업이 진행 중이면 기존 작업 반환)
+
+        callback_url이 허용된 내부 호스트가 아니면 CallbackURLNotAllowed를 발생시킵니다.
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"등록되지 않은 작업 유형: {job_type}")
+        if callback_url:
+            validate_callback_url(callback_url)
+
+        job_id = uuid.uuid4().hex
+        if dedupe_key:
+            acquired = await self.redis.set(self.active_key(dedupe_key), job_id, nx=True, ex=self.job_ttl)
+            if not acquired:
+                existing_id = await self.redis.get(self.active_key(dedupe_key))
+                existing = await self.get(existing_id) if existing_id else None
+                if existing and existing["status"] in ("queued", "processing"):
+                    return {**existing, "deduplicated": True}
+                await self.redis.set(self.active_key(dedupe_key), job_id, ex=self.job_ttl)
+
+        job = {
+            "job_id": job_id,
+            "job_type": job_type,
+            "status": "queued",
+            "params": json.dumps(params, ensure_ascii=False, default=str),
+            "dedupe_key": dedupe_key or "",
+            "callback_url": callback_url or "",
+            "attempts": 0,
+            "created_at": time.time()
+        }
+        pipe = self.redis.pipeline()
+        pipe.hset(self.job_key(job_id), mapping=job)
+        pipe.expire(self.job_key(job_id), self.job_ttl)
+        pipe.lpush(self.queue_key, job_id)
+        await pipe.execute()
+        logger.info(f"분석 작업 등록: {self.name}/{job_type} ({job_id})")
+        return await self.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회"""
+        data = await self.redis.hgetall(self.job_key(job_id))
+        if not data:
+            return None
+        job = {key: value for key, value in data.items() if key not in ("params", "callback_url")}
+        for field in ("result", "progress"):
+            if field in job:
+                job[field] = json.loads(job[field])
+        for field in ("created_at", "started_at", "finished_at", "heartbeat_at"):
+            if field in job:
+                job[field] = float(job[field])
+        job["attempts"] = int(job.get("attempts", 0))
+        job["queue_position"] = None
+        if job["status"] == "queued":
+            position = await self.redis.lpos(self.queue_key, job_id)
+            if position is not None:
+                job["queue_position"] = await self.redis.llen(self.queue_key) - position
+        return job
+
+    async def update_progress(self, job_id: str, progress: Dict[str, Any]):
+        """실행 중인 작업의 진행 상황 기록 (get()의 progress 필드로 조회)"""
+        await self.redis.hset(self.job_key(job_id), "progress", json.dumps(progress, ensure_ascii=False, default=str))
+
+    async def start(self):
+        """소비자 태스크 시작"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._consume(worker_index), name=f"{self.name}-worker-{worker_index}")
+            for worker_index in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._recover_stale_loop(), name=f"{self.name}-recovery"))
+        logger.info(f"분석 작업 큐 시작: {self.name} (동시 실행 {self.concurrency}개)")
+
+    async def stop(self):
+        """소비자 태스크 종료 (실행 중이던 작업은 heartbeat 만료 후 다른 워커가 재실행)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def _consume(self, worker_index: int):
+        while True:
+            try:
+                job_id = await self.redis.blmove(self.queue_key, self.processing_key, 5, "RIGHT", "LEFT")
+                if job_id:
+                    await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"분석 작업 소비자 오류 ({self.name}#{worker_index}): {e}")
+                await asyncio.sleep(1)
+
+    async def _process(self, job_id: str):
+        key = self.job_key(job_id)
+        # 먼저 읽어야 함: 만료된 해시에 heartbeat를 먼저 쓰면 job_type 없는 해시가 다시 생겨 무한 재시도됨
+        raw = await self.redis.hgetall(key)
+        if not raw or not raw.get("job_type"):
+            await self.redis.lrem(self.processing_key, 1, job_id)
+            logger.warning(f"만료되었거나 손상된 분석 작업 제거: {self.name} ({job_id})")
+            return
+
+        handler = self.handlers.get(raw["job_type"])
+        attempts = int(raw.get("attempts", 0)) + 1
+        now = time.time()
+        await self.redis.hset(key, mapping={
+            "status": "processing", "attempts": attempts, "started_at": now, "heartbeat_at": now
+        })
+        heartbeat = asyncio.create_task(self._heartbeat(key))
+        try:
+            if handler is None:
+                raise RuntimeError(f"등록되지 않은 작업 유형: {raw['job_type']}")
+            result = await handler({"job_id": job_id, **json.loads(raw.get("params") or "{}")})
+            final = {"status": "completed", "result": json.dumps(result, ensure_ascii=False, default=str)}
+            logger.info(f"분석 작업 완료: {self.name} ({job_id})")
+        except Exception as e:
+            final = {"status": "failed", "error": str(e)}
+            logger.error(f"분석 작업 실패: {self.name} ({job_id}): {e}")
+        finally:
+            heartbeat.cancel()
+
+        final["finished_at"] = time.time()
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping=final)
+        pipe.expire(key, self.job_ttl)
+        pipe.lrem(self.processing_key, 1, job_id)
+        if raw.get("dedupe_key"):
+            pipe.delete(self.active_key(raw["dedupe_key"]))
+        await pipe.execute()
+
+        if raw.get("callback_url"):
+            await self._notify(raw["callback_url"], job_id)
+
+    async def _heartbeat(self, key: str):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self.redis.hset(key, "heartbeat_at", time.time())
+
+    async def _recover_stale_loop(self):
+        while True:
+            try:
+                await self._recover_stale()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"중단된 분석 작업 복구 오류 ({self.name}): {e}")
+            await asyncio.sleep(self.stale_after)
+
+    async def _recover_stale(self):
+        """heartbeat가 끊긴 처리 중 작업을 큐로 되돌리거나 실패 처리
+
+        방금 꺼내져 아직 heartbeat를 쓰지 않은 작업을 오인하지 않도록,
+        연속 두 번의 점검에서 모두 만료된 작업만 복구합니다.
+        """
+        now = time.time()
+        candidates = set()
+        for job_id in await self.redis.lrange(self.processing_key, 0, -1):
+            key = self.job_key(job_id)
+            raw = await self.redis.hgetall(key)
+            heartbeat_at = float(raw.get("heartbeat_at") or 0)
+            if raw and now - heartbeat_at < self.stale_after:
+                continue
+            candidates.add(job_id)
+            if job_id not in self._stale_candidates:
+                continue
+            # 다른 소비자가 먼저 복구했으면 건너뜀
+            if not await self.redis.lrem(self.processing_key, 1, job_id):
+                continue
+            if not raw:
+                continue
+            if int(raw.get("attempts", 0)) >= self.max_attempts:
+                await self.redis.hset(key, mapping={
+                    "status": "failed", "error": "작업 실행이 중단되었습니다 (재시도 한도 초과)", "finished_at": now
+                })
+                if raw.get("dedupe_key"):
+                    await self.redis.delete(self.active_key(raw["dedupe_key"]))
+                continue
+            await self.redis.hset(key, "status", "queued")
+            await self.redis.rpush(self.queue_key, job_id)
+            logger.warning(f"중단된 분석 작업 재등록: {self.name} ({job_id})")
+        self._stale_candidates = candidates
+
+    async def _notify(self, callback_url: str, job_id: str):
+        """완료 웹훅 전송 (실패해도 작업 상태에는 영향 없음)"""
+        try:
+            validate_callback_url(callback_url)
+            job = await self.get(job_id)
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                await client.post(callback_url, json=job)
+        except Exception as e:
+            logger.warning(f"분석 작업 웹훅 전송 실패 ({job_id}): {e}")
+
+
+# 면접 QA 분석 작업 큐 (whisper_analysis 라우터에서 핸들러 등록)
+qa_analysis_queue = AnalysisJobQueue("qa_analysis")
+
+# 이력서 임베딩 백필 작업 큐 (resume_plagiarism_service에서 핸들러 등록, 한 번에 하나씩 실행)
+resume_embedding_queue = AnalysisJobQueue("resume_embedding", concurrency=1, max_attempts=5)
+
+# 공고 단위 성장가능성 일괄 예측 작업 큐 (growth_prediction_batch_service에서 핸들러 등록)
+growth_prediction_queue = AnalysisJobQueue("growth_prediction", concurrency=1, max_attempts=3)
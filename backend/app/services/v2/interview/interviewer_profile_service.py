@@ -9,14 +9,28 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import statistics
 from decimal import Decimal
+from itertools import combinations, islice
+from math import comb
 import json
 
+import numpy as np
+
 from app.models.v2.interview.interview_evaluation import InterviewEvaluation, InterviewEvaluationItem
 from app.models.v2.interview.interviewer_profile import InterviewerProfile, InterviewerProfileHistory
 from app.models.v2.auth.user import CompanyUser
 from app.models.v2.common.schedule import ScheduleInterview
 
 
+# 패널 점수 계산에 사용하는 프로필 특성 (열 순서)
+PANEL_FEATURES = ('strictness_score', 'tech_focus_score', 'personality_focus_score', 'experience_score', 'consistency_score')
+
+# 조합 수가 이 값 이하이면 벡터화 전수 탐색 (약 50만 조합에 1초 내외),
+# 초과하면 탐욕 + 지역 탐색 해를 초기 하한으로 한 분기 한정(branch-and-bound) 탐색 (둘 다 정확한 최적해)
+PANEL_EXHAUSTIVE_LIMIT = 500_000
+PANEL_COMBO_CHUNK_SIZE = 20_000
+PANEL_LOCAL_SEARCH_MAX_ROUNDS = 50
+
+
 class InterviewerProfileService:
     
     @staticmethod
@@ -282,24 +296,196 @@ class InterviewerProfileService:
                 profile = InterviewerProfileService._update_interviewer_profile(db, interviewer_id)
                 profiles.append(profile)
         
-        # 가능한 모든 조합에서 최적 조합 찾기
-        from itertools import combinations
+        profiles = [p for p in profiles if p is not None]
+        if required_count < 2 or len(profiles) < required_count:
+            # 1명 이하 패널은 밸런스 점수가 없으므로 기존처럼 앞에서부터 선택
+            return available_interviewers[:required_count], 0.0
         
-        best_combination = None
-        best_score = 0.0
+        best_profiles, best_score = InterviewerProfileService.select_balanced_panel(profiles, required_count)
+        if best_profiles and best_score > 0:
+            return [p.evaluator_id for p in best_profiles], best_score
+        else:
+            return available_interviewers[:required_count], 0.0
+    
+    @staticmethod
+    def select_balanced_panel(profiles: List[InterviewerProfile], required_count: int) -> Tuple[List[InterviewerProfile], float]:
+        """프로필 목록에서 밸런스 점수가 가장 높은 패널 선택 (DB 접근 없음)
         
-        for combo in combinations(profiles, required_count):
-            # 밸런스 점수 계산
-            balance_score = InterviewerProfileService._calculate_team_balance_score(combo)
-            
-            if balance_score > best_score:
-                best_score = balance_score
-                best_combination = combo
+        조합 수가 PANEL_EXHAUSTIVE_LIMIT 이하이면 벡터화된 전수 탐색으로,
+        그보다 크면 분기 한정 탐색으로 정확한 최적해를 구합니다.
+        동점이면 evaluator_id 순으로 사전순이 앞선 패널을 선택합니다.
+        """
+        if required_count < 2 or len(profiles) < required_count:
+            return [], 0.0
         
-        if best_combination:
-            return [p.evaluator_id for p in best_combination], best_score
+        ordered = sorted(profiles, key=lambda p: p.evaluator_id)
+        features = InterviewerProfileService._build_feature_matrix(ordered)
+        
+        if comb(len(ordered), required_count) <= PANEL_EXHAUSTIVE_LIMIT:
+            best_idx, best_score = InterviewerProfileService._search_exhaustive(features, required_count)
         else:
-            return available_interviewers[:required_count], 0.0
+            best_idx, best_score = InterviewerProfileService._search_branch_and_bound(features, required_count)
+        
+        return [ordered[i] for i in best_idx], best_score
+    
+    @staticmethod
+    def _build_feature_matrix(profiles: List[InterviewerProfile]) -> np.ndarray:
+        """프로필 특성 행렬 (n x len(PANEL_FEATURES)), 값이 없으면 50"""
+        return np.array([
+            [float(getattr(p, name) or 50) for name in PANEL_FEATURES]
+            for p in profiles
+        ], dtype=np.float64)
+    
+    @staticmethod
+    def _score_panels(features: np.ndarray, panels: np.ndarray) -> np.ndarray:
+        """패널 인덱스 행렬 (m x k)의 밸런스 점수를 한 번에 계산 (_calculate_team_balance_score와 동일한 식)"""
+        selected = features[panels]  # m x k x f
+        strictness_variance = selected[:, :, 0].var(axis=1, ddof=1)
+        strictness_balance = np.maximum(0, 100 - strictness_variance)
+        coverage_score = (selected[:, :, 1].max(axis=1) + selected[:, :, 2].max(axis=1)) / 2
+        experience_avg = selected[:, :, 3].mean(axis=1)
+        consistency_avg = selected[:, :, 4].mean(axis=1)
+        scores = (
+            strictness_balance * 0.3 +
+            coverage_score * 0.3 +
+            experience_avg * 0.2 +
+            consistency_avg * 0.2
+        )
+        return np.round(scores, 2)
+    
+    @staticmethod
+    def _search_exhaustive(features: np.ndarray, required_count: int) -> Tuple[List[int], float]:
+        """모든 조합을 청크 단위로 벡터화하여 평가"""
+        combo_iter = combinations(range(len(features)), required_count)
+        best_idx: List[int] = []
+        best_score = 0.0
+        while True:
+            chunk = np.array(list(islice(combo_iter, PANEL_COMBO_CHUNK_SIZE)), dtype=np.intp)
+            if chunk.size == 0:
+                break
+            scores = InterviewerProfileService._score_panels(features, chunk)
+            pos = int(np.argmax(scores))  # 동점이면 사전순으로 앞선 조합
+            if scores[pos] > best_score:
+                best_score = float(scores[pos])
+                best_idx = chunk[pos].tolist()
+        return best_idx, best_score
+    
+    @staticmethod
+    def _search_greedy_local(features: np.ndarray, required_count: int) -> Tuple[List[int], float]:
+        """최적 2인 조합에서 시작해 탐욕적으로 확장한 뒤 1:1 교체로 개선"""
+        n = len(features)
+        
+        # 1. 모든 2인 조합 중 최고 점수 쌍으로 시작
+        pairs = np.array(list(combinations(range(n), 2)), dtype=np.intp)
+        pair_scores = InterviewerProfileService._score_panels(features, pairs)
+        panel = pairs[int(np.argmax(pair_scores))].tolist()
+        
+        # 2. 점수를 가장 많이 올리는 후보를 하나씩 추가
+        while len(panel) < required_count:
+            outside = np.array([i for i in range(n) if i not in panel], dtype=np.intp)
+            candidates = np.column_stack([np.tile(panel, (len(outside), 1)), outside])
+            scores = InterviewerProfileService._score_panels(features, candidates)
+            panel.append(int(outside[int(np.argmax(scores))]))
+        
+        panel.sort()
+        best_score = float(InterviewerProfileService._score_panels(features, np.array([panel]))[0])
+        
+        # 3. 패널 한 명을 외부 후보로 바꿔 점수가 오르면 교체 (개선이 없을 때까지)
+        for _ in range(PANEL_LOCAL_SEARCH_MAX_ROUNDS):
+            outside = np.array([i for i in range(n) if i not in panel], dtype=np.intp)
+            if outside.size == 0:
+                break
+            swaps = []
+            for pos in range(required_count):
+                swapped = np.tile(panel, (len(outside), 1))
+                swapped[:, pos] = outside
+                swaps.append(swapped)
+            candidates = np.sort(np.vstack(swaps), axis=1)
+            scores = InterviewerProfileService._score_panels(features, candidates)
+            
+            top = scores.max()
+            if top <= best_score:
+                break
+            # 동점 후보 중 사전순으로 앞선 패널 선택
+            tied = candidates[scores == top]
+            panel = list(min(map(tuple, tied.tolist())))
+            best_score = float(top)
+        
+        return panel, best_score
+    
+    @staticmethod
+    def _search_branch_and_bound(features: np.ndarray, required_count: int) -> Tuple[List[int], float]:
+        """탐욕 + 지역 탐색 해를 초기 하한으로 사전순 깊이 우선 분기 한정 탐색
+        
+        부분 패널의 상한:
+        - 엄격도: 부분 패널의 편차 제곱합 / (k-1)은 완성 패널 분산의 하한
+        - 커버리지: 부분 패널과 남은 후보 전체의 기술/인성 최댓값
+        - 경험/일관성: 부분 패널 합 + 남은 후보 중 상위 합
+        상한을 반올림해도 현재 최고 점수에 못 미치는 가지는 버리며, 마지막 한 명은 벡터화로 평가합니다.
+        """
+        n = len(features)
+        k = required_count
+        strictness = features[:, 0]
+        tech = features[:, 1]
+        personality = features[:, 2]
+        # 경험/일관성 평균 항을 구성원별 기여도로 분해
+        contribution = (features[:, 3] * 0.2 + features[:, 4] * 0.2) / k
+        
+        # 인덱스 j 이후 후보의 기술/인성 최댓값과 상위 m명 기여도 합 (m = 0..k)
+        suffix_tech = np.maximum.accumulate(tech[::-1])[::-1].tolist() + [-np.inf]
+        suffix_personality = np.maximum.accumulate(personality[::-1])[::-1].tolist() + [-np.inf]
+        top_contribution = [[0.0] * (n + 1) for _ in range(k + 1)]
+        top_values: List[float] = []
+        for j in range(n - 1, -1, -1):
+            top_values = sorted(top_values + [float(contribution[j])], reverse=True)[:k]
+            for m in range(1, k + 1):
+                top_contribution[m][j] = sum(top_values[:m])
+        strictness = strictness.tolist()
+        tech_list = tech.tolist()
+        personality_list = personality.tolist()
+        contribution_list = contribution.tolist()
+        
+        best_idx, best_score = InterviewerProfileService._search_greedy_local(features, k)
+        best = {"idx": best_idx, "score": best_score}
+        # 반올림(소수 둘째 자리)과 부동소수 오차를 고려한 가지치기 여유
+        margin = 0.005 + 1e-9
+        
+        def upper_bound(panel: List[int], next_start: int) -> float:
+            remaining = k - len(panel)
+            values = [strictness[i] for i in panel]
+            if len(values) >= 2:
+                mean = sum(values) / len(values)
+                variance_floor = sum((v - mean) ** 2 for v in values) / (k - 1)
+                strictness_bound = max(0.0, 100 - variance_floor)
+            else:
+                strictness_bound = 100.0
+            coverage_bound = (
+                max(max(tech_list[i] for i in panel), suffix_tech[next_start]) +
+                max(max(personality_list[i] for i in panel), suffix_personality[next_start])
+            ) / 2
+            contribution_bound = sum(contribution_list[i] for i in panel) + top_contribution[remaining][next_start]
+            return strictness_bound * 0.3 + coverage_bound * 0.3 + contribution_bound
+        
+        def search(panel: List[int], start: int):
+            if len(panel) == k - 1:
+                # 마지막 한 명은 남은 후보 전체를 한 번에 평가
+                last = np.arange(start, n, dtype=np.intp)
+                candidates = np.column_stack([np.tile(panel, (len(last), 1)), last]) if panel else last[:, None]
+                scores = InterviewerProfileService._score_panels(features, candidates)
+                pos = int(np.argmax(scores))
+                score = float(scores[pos])
+                candidate = candidates[pos].tolist()
+                if score > best["score"] or (score == best["score"] and candidate < best["idx"]):
+                    best["idx"], best["score"] = candidate, score
+                return
+            for j in range(start, n - (k - len(panel)) + 1):
+                extended = panel + [j]
+                if upper_bound(extended, j + 1) + margin < best["score"]:
+                    continue
+                search(extended, j + 1)
+        
+        search([], 0)
+        return best["idx"], best["score"]
     
     @staticmethod
     def _calculate_team_balance_score(profiles: List[InterviewerProfile]) -> float:
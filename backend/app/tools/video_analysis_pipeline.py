@@ -21,6 +21,83 @@ mp_face_mesh = mp.solutions.face_mesh
 mp_hands = mp.solutions.hands
 mp_pose = mp.solutions.pose
 
+# 오디오 특징 추출 설정 (Whisper 입력 형식과 같은 16kHz 모노)
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_N_FFT = 512  # 32ms 윈도우
+AUDIO_HOP_LENGTH = 160  # 10ms 간격
+SILENCE_TOP_DB = 20
+
+
+def decode_audio(video_path: str, sample_rate: int = AUDIO_SAMPLE_RATE) -> np.ndarray:
+    """영상의 오디오 트랙을 16kHz 모노 float32 배열로 한 번 디코딩"""
+    try:
+        y, _ = librosa.load(video_path, sr=sample_rate, mono=True)
+    except Exception:
+        # librosa가 컨테이너를 읽지 못하면 moviepy(ffmpeg)로 디코딩
+        video = VideoFileClip(video_path)
+        try:
+            if video.audio is None:
+                raise ValueError(f"오디오 트랙이 없습니다: {video_path}")
+            y = video.audio.to_soundarray(fps=sample_rate)
+        finally:
+            video.close()
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+    if not len(y):
+        raise ValueError(f"오디오 데이터가 비어 있습니다: {video_path}")
+    return np.ascontiguousarray(y, dtype=np.float32)
+
+
+class AudioFeatures:
+    """한 번 디코딩한 오디오와 공유 특징 배열
+
+    STFT 크기 스펙트럼, 프레임별 RMS, 피치 트랙을 한 번씩만 계산하고
+    각 오디오 지표는 이 배열들에서 파생합니다.
+    samples는 16kHz 모노 float32이므로 Whisper transcribe()에 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, samples: np.ndarray, sample_rate: int = AUDIO_SAMPLE_RATE,
+                 n_fft: int = AUDIO_N_FFT, hop_length: int = AUDIO_HOP_LENGTH):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.spectrum = np.abs(librosa.stft(samples, n_fft=n_fft, hop_length=hop_length))
+        self.rms = librosa.feature.rms(S=self.spectrum, frame_length=n_fft, hop_length=hop_length)[0]
+        self.pitches, self.magnitudes = librosa.piptrack(
+            S=self.spectrum, sr=sample_rate, n_fft=n_fft, hop_length=hop_length
+        )
+        self._mfcc = None
+
+    @classmethod
+    def from_video(cls, video_path: str) -> "AudioFeatures":
+        return cls(decode_audio(video_path))
+
+    @property
+    def duration(self) -> float:
+        """오디오 길이(초)"""
+        return len(self.samples) / self.sample_rate
+
+    @property
+    def mfcc(self) -> np.ndarray:
+        """MFCC (공유 스펙트럼에서 필요할 때 한 번 계산)"""
+        if self._mfcc is None:
+            mel = librosa.feature.melspectrogram(S=self.spectrum ** 2, sr=self.sample_rate, n_mels=40)
+            self._mfcc = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=13)
+        return self._mfcc
+
+    def voiced_mask(self, top_db: float = SILENCE_TOP_DB) -> np.ndarray:
+        """최대 RMS 대비 top_db 이내인 프레임 (librosa.effects.split과 같은 기준)"""
+        if not self.rms.size or self.rms.max() <= 0:
+            return np.zeros(self.rms.shape, dtype=bool)
+        return librosa.amplitude_to_db(self.rms, ref=np.max) > -top_db
+
+    def to_audio_data(self) -> sr.AudioData:
+        """SpeechRecognition용 16비트 PCM AudioData"""
+        pcm = (np.clip(self.samples, -1.0, 1.0) * 32767).astype(np.int16)
+        return sr.AudioData(pcm.tobytes(), self.sample_rate, 2)
+
+
 class VideoAnalysisPipeline:
     def __init__(self):
         self.face_mesh = mp_face_mesh.FaceMesh(
@@ -40,13 +117,23 @@ class VideoAnalysisPipeline:
         )
         self.recognizer = sr.Recognizer()
         
-    def analyze_video(self, video_path: str) -> Dict[str, Any]:
-        """영상 전체 분석"""
+    def extract_audio_features(self, video_path: str) -> Optional[AudioFeatures]:
+        """오디오 디코딩 및 공유 특징 계산 (실패 시 None)"""
+        try:
+            return AudioFeatures.from_video(video_path)
+        except Exception as e:
+            logging.error(f"오디오 추출 실패: {e}")
+            return None
+    
+    def analyze_video(self, video_path: str, audio_features: Optional[AudioFeatures] = None) -> Dict[str, Any]:
+        """영상 전체 분석 (audio_features를 넘기면 오디오를 다시 디코딩하지 않음)"""
         try:
             print(f"🎬 영상 분석 시작: {video_path}")
             
-            # 1. 오디오 추출 및 분석
-            audio_analysis = self._analyze_audio(video_path)
+            # 1. 오디오 추출(1회) 및 분석
+            if audio_features is None:
+                audio_features = self.extract_audio_features(video_path)
+            audio_analysis = self._analyze_audio(audio_features)
             print("✅ 오디오 분석 완료")
             
             # 2. 비디오 프레임 분석
@@ -54,7 +141,7 @@ class VideoAnalysisPipeline:
             print("✅ 비디오 프레임 분석 완료")
             
             # 3. 음성 인식 및 텍스트 분석
-            text_analysis = self._analyze_speech_text(video_path)
+            text_analysis = self._analyze_speech_text(audio_features)
             print("✅ 음성 인식 및 텍스트 분석 완료")
             
             # 4. 결과 통합
@@ -73,33 +160,28 @@ class VideoAnalysisPipeline:
             logging.error(f"영상 분석 실패: {e}")
             raise
     
-    def _analyze_audio(self, video_path: str) -> Dict[str, Any]:
-        """오디오 분석"""
+    def _analyze_audio(self, features: Optional[AudioFeatures]) -> Dict[str, Any]:
+        """오디오 분석 (공유 특징 배열에서 모든 지표 계산)"""
+        if features is None:
+            return self._get_default_audio_analysis()
         try:
-            # 오디오 추출
-            video = VideoFileClip(video_path)
-            audio = video.audio
-            
-            # 오디오 데이터 로드
-            y, sr = librosa.load(audio.filename, sr=None)
-            
             # 1. 말 속도 분석
-            speech_rate = self._calculate_speech_rate(y, sr)
+            speech_rate = self._calculate_speech_rate(features)
             
             # 2. 음성 볼륨 분석
-            volume_level = self._calculate_volume_level(y)
+            volume_level = self._calculate_volume_level(features)
             
             # 3. 발음 정확도 (기본값)
             pronunciation_score = 0.85
             
             # 4. 억양/강세 분석
-            intonation_score = self._calculate_intonation(y, sr)
+            intonation_score = self._calculate_intonation(features)
             
             # 5. 감정 변화 분석
-            emotion_variation = self._calculate_emotion_variation(y, sr)
+            emotion_variation = self._calculate_emotion_variation(features)
             
             # 6. 배경 소음 분석
-            background_noise_level = self._calculate_background_noise(y, sr)
+            background_noise_level = self._calculate_background_noise(features)
             
             return {
                 "speech_rate": speech_rate,
@@ -193,17 +275,13 @@ class VideoAnalysisPipeline:
             logging.error(f"비디오 프레임 분석 실패: {e}")
             return self._get_default_video_analysis()
     
-    def _analyze_speech_text(self, video_path: str) -> Dict[str, Any]:
+    def _analyze_speech_text(self, features: Optional[AudioFeatures]) -> Dict[str, Any]:
         """음성 인식 및 텍스트 분석"""
+        if features is None:
+            return self._get_default_text_analysis()
         try:
-            # 오디오 추출
-            video = VideoFileClip(video_path)
-            audio = video.audio
-            
-            # 음성 인식
-            with sr.AudioFile(audio.filename) as source:
-                audio_data = self.recognizer.record(source)
-                text = self.recognizer.recognize_google(audio_data, language='ko-KR')
+            # 음성 인식 (디코딩된 샘플 재사용)
+            text = self.recognizer.recognize_google(features.to_audio_data(), language='ko-KR')
             
             # 텍스트 분석
             return self._analyze_text_content(text)
@@ -212,17 +290,14 @@ class VideoAnalysisPipeline:
             logging.error(f"음성 인식 실패: {e}")
             return self._get_default_text_analysis()
     
-    def _calculate_speech_rate(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_speech_rate(self, features: AudioFeatures) -> float:
         """말 속도 계산 (단어/분)"""
         try:
-            # 음성 구간 검출
-            intervals = librosa.effects.split(y, top_db=20)
-            
-            # 음성 구간 길이 계산
-            speech_duration = sum([(end - start) / sr for start, end in intervals])
+            # 음성 구간 길이 계산 (RMS 기준 유성 프레임)
+            speech_duration = features.voiced_mask().sum() * features.hop_length / features.sample_rate
             
             # 단어 수 추정 (한국어 기준)
-            word_count = len(y) / (sr * 0.3)  # 대략적인 추정
+            word_count = features.duration / 0.3  # 대략적인 추정
             
             # 말 속도 계산
             speech_rate = (word_count / speech_duration) * 60
@@ -232,50 +307,41 @@ class VideoAnalysisPipeline:
         except:
             return 150.0  # 기본값
     
-    def _calculate_volume_level(self, y: np.ndarray) -> float:
+    def _calculate_volume_level(self, features: AudioFeatures) -> float:
         """음성 볼륨 레벨 계산"""
         try:
-            rms = np.sqrt(np.mean(y**2))
+            rms = np.sqrt(np.mean(features.rms ** 2))
             return min(max(rms, 0.1), 1.0)
         except:
             return 0.75
     
-    def _calculate_intonation(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_intonation(self, features: AudioFeatures) -> float:
         """억양/강세 분석"""
         try:
-            # 피치 추출
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            
             # 피치 변화량 계산
-            pitch_changes = np.diff(pitches, axis=1)
+            pitch_changes = np.diff(features.pitches, axis=1)
             intonation_score = np.mean(np.abs(pitch_changes))
             
             return min(max(intonation_score, 0.1), 1.0)
         except:
             return 0.6
     
-    def _calculate_emotion_variation(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_emotion_variation(self, features: AudioFeatures) -> float:
         """감정 변화 분석"""
         try:
-            # MFCC 특징 추출
-            mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-            
             # MFCC 변화량 계산
-            mfcc_changes = np.diff(mfccs, axis=1)
+            mfcc_changes = np.diff(features.mfcc, axis=1)
             emotion_variation = np.mean(np.abs(mfcc_changes))
             
             return min(max(emotion_variation, 0.1), 1.0)
         except:
             return 0.6
     
-    def _calculate_background_noise(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_background_noise(self, features: AudioFeatures) -> float:
         """배경 소음 레벨 계산"""
         try:
-            # 스펙트럼 분석
-            spec = np.abs(librosa.stft(y))
-            
             # 배경 소음 추정
-            noise_level = np.mean(spec[:, :10])  # 처음 10프레임 평균
+            noise_level = np.mean(features.spectrum[:, :10])  # 처음 10프레임 평균
             
             return min(max(noise_level, 0.0), 1.0)
         except:
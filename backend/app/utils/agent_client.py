@@ -1,5 +1,10 @@
+import asyncio
+import os
+import random
+import time
 import httpx
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
 from app.core.config import settings
 import logging
 
@@ -7,20 +12,178 @@ logger = logging.getLogger(__name__)
 
 AGENT_URL = settings.AGENT_URL or "http://agent:8001"
 
+# 재시도해도 안전한 응답 코드 (요청이 처리되지 않았거나 과부하)
+RETRYABLE_STATUS_CODES = {429, 503}
+# 게이트웨이 오류는 서버가 이미 처리했을 수 있어 멱등 요청만 재시도
+IDEMPOTENT_RETRYABLE_STATUS_CODES = {502, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class CircuitOpenError(Exception):
+    """대상 서비스가 포화/장애 상태라 호출을 차단했을 때 발생"""
+    pass
+
+
+class _CircuitBreaker:
+    """연속 실패가 threshold에 도달하면 cooldown 동안 호출을 차단 (이후 1건만 시험 호출 허용)"""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.cooldown or self.trial_in_flight:
+            return False
+        self.trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class AgentHttpPool:
+    """backend → agent/video-analysis 호출용 공유 HTTP 클라이언트 풀
+
+    - 앱 lifespan에서 start()/close()로 keep-alive 커넥션 풀을 하나만 유지합니다.
+    - 대상 호스트별 동시 요청 수 제한(semaphore)과 서킷 브레이커를 둡니다.
+    - 연결 실패/429/503만 지터를 둔 지수 백오프로 재시도하고, 502/504는 멱등 요청(GET 등)만 재시도합니다
+      (읽기 타임아웃과 POST의 게이트웨이 오류는 서버에서 처리 중일 수 있어 재시도하지 않음).
+    - lifespan 루프가 아닌 다른 이벤트 루프(스케줄러 스레드 등)에서 호출되면 1회용 클라이언트를 사용합니다.
+    """
+
+    def __init__(self):
+        self.max_connections = int(os.getenv("AGENT_HTTP_MAX_CONNECTIONS", "100"))
+        self.max_keepalive = int(os.getenv("AGENT_HTTP_MAX_KEEPALIVE", "20"))
+        self.max_concurrency = int(os.getenv("AGENT_HTTP_MAX_CONCURRENCY", "32"))
+        self.max_retries = int(os.getenv("AGENT_HTTP_MAX_RETRIES", "2"))
+        self.connect_timeout = float(os.getenv("AGENT_HTTP_CONNECT_TIMEOUT", "5"))
+        self.breaker_threshold = int(os.getenv("AGENT_HTTP_BREAKER_THRESHOLD", "5"))
+        self.breaker_cooldown = float(os.getenv("AGENT_HTTP_BREAKER_COOLDOWN", "30"))
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+
+    async def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive
+                ),
+                timeout=httpx.Timeout(30.0, connect=self.connect_timeout)
+            )
+            self._loop = asyncio.get_running_loop()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+            self._semaphores.clear()
+
+    def _timeout(self, timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout))
+
+    def _breaker(self, host: str) -> _CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = _CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+        return self._breakers[host]
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        timeout: float = 30.0,
+        retries: Optional[int] = None
+    ) -> httpx.Response:
+        """HTTP 요청 (재시도/서킷 브레이커 적용). 재시도 후에도 실패하면 마지막 응답 또는 예외 반환"""
+        host = urlsplit(url).netloc
+        breaker = self._breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{host} 호출 차단 중 (연속 실패 {breaker.failures}회)")
+        # 서킷이 닫혀 있으면 allow()는 시험 호출 슬롯을 잡지 않으므로, 잡혀 있다면 이 호출이 시험 호출
+        claimed_trial = breaker.trial_in_flight
+
+        retries = self.max_retries if retries is None else retries
+        retryable_status_codes = RETRYABLE_STATUS_CODES
+        if method.upper() in IDEMPOTENT_METHODS:
+            retryable_status_codes = RETRYABLE_STATUS_CODES | IDEMPOTENT_RETRYABLE_STATUS_CODES
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    response = await self._send(method, url, json, timeout, host)
+                except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                    if attempt >= retries:
+                        breaker.record_failure()
+                        raise
+                    logger.warning(f"{host} 연결 실패, 재시도 {attempt + 1}/{retries}: {e}")
+                except httpx.HTTPError:
+                    breaker.record_failure()
+                    raise
+                else:
+                    if response.status_code not in retryable_status_codes:
+                        breaker.record_success()
+                        return response
+                    if attempt >= retries:
+                        breaker.record_failure()
+                        return response
+                    logger.warning(f"{host} 응답 {response.status_code}, 재시도 {attempt + 1}/{retries}")
+                # 지수 백오프 + full jitter
+                await asyncio.sleep(random.uniform(0, min(8.0, 0.5 * (2 ** attempt))))
+        finally:
+            # 취소 등으로 결과가 기록되지 않아도 이 호출이 잡은 시험 호출 슬롯은 반환
+            if claimed_trial:
+                breaker.trial_in_flight = False
+
+    async def _send(self, method: str, url: str, json: Any, timeout: float, host: str) -> httpx.Response:
+        if self._client is None or self._loop is not asyncio.get_running_loop():
+            async with httpx.AsyncClient() as client:
+                return await client.request(method, url, json=json, timeout=self._timeout(timeout))
+
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphores[host]:
+            return await self._client.request(method, url, json=json, timeout=self._timeout(timeout))
+
+    async def post(self, url: str, json: Any = None, timeout: float = 30.0, retries: Optional[int] = None) -> httpx.Response:
+        return await self.request("POST", url, json=json, timeout=timeout, retries=retries)
+
+    async def get(self, url: str, timeout: float = 30.0, retries: Optional[int] = None) -> httpx.Response:
+        return await self.request("GET", url, timeout=timeout, retries=retries)
+
+
+# 앱 전역 공유 인스턴스 (main.py lifespan에서 start/close)
+agent_http_pool = AgentHttpPool()
+
+
 async def call_agent_api(endpoint: str, data: Dict[str, Any], method: str = "POST", timeout: float = 30.0) -> Dict[str, Any]:
     url = f"{AGENT_URL}/api/v2/agent{endpoint}"
     try:
-        async with httpx.AsyncClient() as client:
-            if method == "POST":
-                response = await client.post(url, json=data, timeout=timeout)
-            else:
-                response = await client.get(url, timeout=timeout)
+        if method == "POST":
+            response = await agent_http_pool.post(url, json=data, timeout=timeout)
+        else:
+            response = await agent_http_pool.get(url, timeout=timeout)
+        
+        if response.status_code != 200:
+            logger.error(f"Agent API Error: {response.text}")
+            return {"error": f"API Error: {response.status_code}"}
             
-            if response.status_code != 200:
-                logger.error(f"Agent API Error: {response.text}")
-                return {"error": f"API Error: {response.status_code}"}
-                
-            return response.json()
+        return response.json()
     except Exception as e:
         logger.error(f"Agent API 호출 실패 ({url}): {e}")
         return {"error": str(e)}
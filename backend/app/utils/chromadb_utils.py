@@ -60,7 +60,7 @@ class ChromaDBManager:
         metadata: Dict
     ) -> bool:
         """
-        이력서 임베딩을 ChromaDB에 추가
+        이력서 임베딩을 ChromaDB에 추가 (기존 문서는 교체)
         
         Args:
             resume_id: 이력서 ID
@@ -71,35 +71,43 @@ class ChromaDBManager:
         Returns:
             성공 여부
         """
-        try:
-            # 기존 문서가 있으면 삭제 (업데이트)
-            self._delete_resume_if_exists(resume_id)
+        return self.upsert_resume_embeddings([resume_id], [content], [embedding], [metadata])
+    
+    def upsert_resume_embeddings(
+        self,
+        resume_ids: List[int],
+        contents: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict]
+    ) -> bool:
+        """
+        여러 이력서 임베딩을 한 번의 upsert로 저장 (기존 문서는 교체)
+        
+        Args:
+            resume_ids: 이력서 ID 리스트
+            contents: 이력서 내용 리스트
+            embeddings: 임베딩 벡터 리스트
+            metadatas: 메타데이터 리스트
             
-            # 새 문서 추가
-            self.collection.add(
-                documents=[content],
-                embeddings=[embedding],
-                metadatas=[metadata],
-                ids=[f"resume_{resume_id}"]
+        Returns:
+            성공 여부
+        """
+        if not resume_ids:
+            return True
+        try:
+            self.collection.upsert(
+                documents=contents,
+                embeddings=[list(map(float, embedding)) for embedding in embeddings],
+                metadatas=metadatas,
+                ids=[f"resume_{resume_id}" for resume_id in resume_ids]
             )
-            
-            logger.info(f"이력서 임베딩 추가 완료: resume_{resume_id}")
+            logger.info(f"이력서 임베딩 upsert 완료: {len(resume_ids)}건")
             return True
             
         except Exception as e:
-            logger.error(f"이력서 임베딩 추가 실패 (resume_{resume_id}): {e}")
+            logger.error(f"이력서 임베딩 upsert 실패 ({len(resume_ids)}건): {e}")
             return False
     
-    def _delete_resume_if_exists(self, resume_id: int):
-        """기존 이력서 문서가 있으면 삭제"""
-        try:
-            existing = self.collection.get(ids=[f"resume_{resume_id}"])
-            if existing['ids']:
-                self.collection.delete(ids=[f"resume_{resume_id}"])
-                logger.info(f"기존 이력서 삭제: resume_{resume_id}")
-        except Exception as e:
-            logger.warning(f"기존 이력서 삭제 중 오류 (resume_{resume_id}): {e}")
-    
     def search_similar_resumes(
         self, 
         query_embedding: List[float], 
@@ -21,18 +21,19 @@ class TextEmbedder:
             logger.error(f"임베딩 모델 로드 실패: {e}")
             raise
     
-    def embed_texts(self, texts: List[str]) -> np.ndarray:
+    def embed_texts(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
         """
         텍스트 리스트를 임베딩 벡터로 변환
         
         Args:
             texts: 임베딩할 텍스트 리스트
+            batch_size: 모델 한 번에 처리할 텍스트 수
             
         Returns:
             임베딩 벡터 배열 (n_texts, embedding_dim)
         """
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            embeddings = self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
             logger.info(f"{len(texts)}개 텍스트 임베딩 완료")
             return embeddings
         except Exception as e:
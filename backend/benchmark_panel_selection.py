@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+면접 패널 선택 벤치마크 스크립트
+후보 면접관 수를 늘려가며 select_balanced_panel의 소요 시간을 재고,
+선택 결과와 탐욕 + 지역 탐색(분기 한정의 초기 해) 점수를 정확한 최적 점수와 비교합니다.
+정확한 최적 점수는 기존 방식(조합마다 _calculate_team_balance_score)으로, 그보다 큰 크기에서는
+벡터화 전수 탐색으로 구합니다. 선택 결과가 최적과 다르면 종료 코드 1을 반환합니다.
+"""
+
+import sys
+import os
+import random
+import time
+from itertools import combinations
+from math import comb
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.v2.interview.interviewer_profile_service import InterviewerProfileService
+
+POOL_SIZES = [5, 10, 20, 40, 60, 100, 200, 500]
+PANEL_SIZES = [2, 3, 4]
+SEEDS = range(5)
+BRUTE_FORCE_LIMIT = 200_000
+EXACT_LIMIT = 5_000_000
+
+
+def make_profiles(count: int, seed: int = 42):
+    """임의 특성의 면접관 프로필 생성"""
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            evaluator_id=i + 1,
+            strictness_score=rng.uniform(20, 80),
+            tech_focus_score=rng.uniform(20, 90),
+            personality_focus_score=rng.uniform(20, 90),
+            experience_score=rng.uniform(10, 100),
+            consistency_score=rng.uniform(30, 95)
+        )
+        for i in range(count)
+    ]
+
+
+def brute_force(profiles, required_count):
+    """기존 방식: 모든 조합에 대해 _calculate_team_balance_score 호출"""
+    best_score = 0.0
+    for combo in combinations(profiles, required_count):
+        score = InterviewerProfileService._calculate_team_balance_score(combo)
+        if score > best_score:
+            best_score = score
+    return best_score
+
+
+def exact_score(profiles, required_count):
+    """정확한 최적 점수 (작은 크기는 기존 방식, 큰 크기는 벡터화 전수 탐색, 둘 다 불가하면 None)"""
+    combo_count = comb(len(profiles), required_count)
+    if combo_count <= BRUTE_FORCE_LIMIT:
+        return brute_force(profiles, required_count)
+    if combo_count <= EXACT_LIMIT:
+        features = InterviewerProfileService._build_feature_matrix(sorted(profiles, key=lambda p: p.evaluator_id))
+        return InterviewerProfileService._search_exhaustive(features, required_count)[1]
+    return None
+
+
+def heuristic_score(profiles, required_count):
+    """탐욕 + 지역 탐색만으로 얻는 점수"""
+    features = InterviewerProfileService._build_feature_matrix(sorted(profiles, key=lambda p: p.evaluator_id))
+    return InterviewerProfileService._search_greedy_local(features, required_count)[1]
+
+
+def run_benchmark():
+    print(f"{'pool':>6} {'panel':>6} {'seed':>5} {'combos':>12} {'optimized(ms)':>14} {'score':>8} {'exact':>8} {'heuristic':>10}")
+    print("-" * 76)
+    checked = mismatches = heuristic_misses = 0
+    for pool_size in POOL_SIZES:
+        for panel_size in PANEL_SIZES:
+            if panel_size > pool_size:
+                continue
+            combo_count = comb(pool_size, panel_size)
+            for seed in SEEDS:
+                profiles = make_profiles(pool_size, seed)
+
+                start = time.perf_counter()
+                _, score = InterviewerProfileService.select_balanced_panel(profiles, panel_size)
+                optimized_ms = (time.perf_counter() - start) * 1000
+
+                exact = exact_score(profiles, panel_size)
+                heuristic = heuristic_score(profiles, panel_size)
+                if exact is not None:
+                    checked += 1
+                    mismatches += score != exact
+                    heuristic_misses += heuristic < exact
+                exact_text = f"{exact:.2f}" if exact is not None else "-"
+
+                print(f"{pool_size:>6} {panel_size:>6} {seed:>5} {combo_count:>12} {optimized_ms:>14.1f} {score:>8.2f} {exact_text:>8} {heuristic:>10.2f}")
+
+    print("-" * 76)
+    print(f"최적 점수 비교 {checked}건: 선택 결과 불일치 {mismatches}건, 탐욕 + 지역 탐색 단독 미달 {heuristic_misses}건")
+    return mismatches == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)
@@ -389,6 +389,37 @@ class AiInterviewApi {
     }
   }
 
+  /**
+   * QA 분석 작업 상태 조회
+   * @param {string} jobId 
+   */
+  static async getQaJobStatus(jobId) {
+    try {
+      const response = await api.get(`/whisper-analysis/qa-jobs/${jobId}`);
+      return response.data;
+    } catch (error) {
+      console.error('QA 분석 작업 상태 조회 실패:', error);
+      throw error;
+    }
+  }
+
+  /**
+   * QA 분석 작업 완료까지 폴링 후 결과 반환
+   * @param {string} jobId 
+   * @param {Object} options { intervalMs, timeoutMs, onProgress }
+   */
+  static async waitForQaJob(jobId, { intervalMs = 5000, timeoutMs = 40 * 60 * 1000, onProgress } = {}) {
+    const startedAt = Date.now();
+    while (Date.now() - startedAt < timeoutMs) {
+      const job = await AiInterviewApi.getQaJobStatus(jobId);
+      if (onProgress) onProgress(job);
+      if (job.status === 'completed') return job.result;
+      if (job.status === 'failed') throw new Error(job.error || 'QA 분석 실패');
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+    throw new Error('QA 분석 대기 시간이 초과되었습니다');
+  }
+
   /**
    * 분석 결과 조회 API
    * @param {number} applicationId 
@@ -118,6 +118,44 @@ chatbotApi.interceptors.response.use(
   }
 );
 
+// 챗봇 스트리밍 응답 (SSE: session → token... → done | error)
+// onToken(content)은 토큰이 도착할 때마다 호출되며, done 이벤트의 최종 응답을 반환
+const streamChat = async (payload, onToken) => {
+  const token = localStorage.getItem('token');
+  const response = await fetch(`${chatbotApi.defaults.baseURL}/chat/stream`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+    body: JSON.stringify(payload),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`챗봇 스트리밍 요청 실패 (${response.status})`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const events = buffer.split('\n\n');
+    buffer = events.pop();
+    for (const raw of events) {
+      const event = raw.match(/^event: (.*)$/m)?.[1];
+      const data = raw.match(/^data: (.*)$/m)?.[1];
+      if (!event || !data) continue;
+      const parsed = JSON.parse(data);
+      if (event === 'token') onToken(parsed.content);
+      if (event === 'done') return parsed;
+      if (event === 'error') throw new Error(parsed.error);
+    }
+  }
+  throw new Error('챗봇 스트리밍 응답이 완료되지 않았습니다.');
+};
+
 const Chatbot = () => {
   console.log('Chatbot component rendering');
   // 모든 훅을 최상단에 배치 (순서 중요!)
@@ -1185,22 +1223,44 @@ const Chatbot = () => {
       const pageContext = getPageContext();
       console.log('챗봇 요청:', { message: messageToSend, session_id: sessionId });
       
-      const response = await chatbotApi.post('/chat/', {
+      const payload = {
         message: messageToSend,
         session_id: sessionId,
         page_context: pageContext
-      });
+      };
+      const botMessageId = messages.length + 2;
+      let streamedText = '';
+      let data;
+      try {
+        // 토큰이 도착하는 대로 봇 메시지에 이어 붙임
+        data = await streamChat(payload, (content) => {
+          if (!streamedText) {
+            setIsTyping(false);
+            setMessages(prev => [...prev, { id: botMessageId, text: '', sender: 'bot', timestamp: new Date() }]);
+          }
+          streamedText += content;
+          const text = streamedText;
+          setMessages(prev => prev.map(m => (m.id === botMessageId ? { ...m, text } : m)));
+        });
+      } catch (streamError) {
+        // 토큰을 받기 전에 실패한 경우에만 일반 요청으로 재시도
+        if (streamedText) throw streamError;
+        console.warn('챗봇 스트리밍 실패, 일반 요청으로 재시도:', streamError);
+        data = (await chatbotApi.post('/chat/', payload)).data;
+      }
 
-      console.log('챗봇 응답:', response.data);
+      console.log('챗봇 응답:', data);
 
       const botMessage = {
-        id: messages.length + 2,
-        text: response.data.ai_response || response.data.response || '응답을 받지 못했습니다.',
+        id: botMessageId,
+        text: data.ai_response || data.response || '응답을 받지 못했습니다.',
         sender: 'bot',
         timestamp: new Date(),
       };
 
-      setMessages(prev => [...prev, botMessage]);
+      setMessages(prev => (streamedText
+        ? prev.map(m => (m.id === botMessageId ? { ...m, text: botMessage.text } : m))
+        : [...prev, botMessage]));
     } catch (error) {
       console.error('챗봇 응답 오류:', error);
       
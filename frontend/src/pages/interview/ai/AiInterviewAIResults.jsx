@@ -30,6 +30,7 @@ import {
   VideoLibrary as VideoLibraryIcon
 } from '@mui/icons-material';
 import api from '../../../api/api';
+import AiInterviewApi from '../../../api/aiInterviewApi';
 
 const AiInterviewAIResults = () => {
   const { applicationId } = useParams();
@@ -76,10 +77,12 @@ const AiInterviewAIResults = () => {
       setLoading(true);
       setError(null);
       const res = await api.post(`/whisper-analysis/process-qa/${applicationId}?persist=true&output_dir=/data/qa_slices`);
-      setQaResult(res.data || null);
-      if (!(res.data && res.data.success)) {
+      if (!(res.data && res.data.success && res.data.job_id)) {
         throw new Error(res.data?.detail || res.data?.message || 'QA 분석 실패');
       }
+      // 분석은 백그라운드 작업으로 실행되므로 완료될 때까지 상태 폴링
+      const result = await AiInterviewApi.waitForQaJob(res.data.job_id);
+      setQaResult(result || null);
       // 성공 시 자동으로 overview 보이도록 설정
     } catch (e) {
       console.error('QA 분석 실행 실패:', e);
@@ -0,0 +1,115 @@
+# === Frame Sampling Scheduler ===
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 30fps 영상 기준 기존 10/15/20 프레임 간격과 동일한 초당 샘플 수
+DEFAULT_SAMPLE_RATES = {
+    "facial": 3.0,
+    "posture": 2.0,
+    "gaze": 1.5,
+}
+
+# 프레임 수를 알 수 없는 스트림에서 사용할 기본 FPS
+FALLBACK_FPS = 30.0
+
+
+class FrameSampler:
+    """분석기별 프레임 샘플링 계획을 세웁니다.
+
+    원본 FPS나 영상 길이와 무관하게 초당 샘플 수(sample_rates)를 기준으로
+    분석할 프레임을 고르고, max_frames가 주어지면 전체 디코딩 프레임 수가
+    그 값을 넘지 않도록 모든 분석기의 샘플 수를 같은 비율로 줄입니다.
+    """
+
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None, max_frames: Optional[int] = None):
+        self.sample_rates = dict(sample_rates or DEFAULT_SAMPLE_RATES)
+        self.max_frames = max_frames if max_frames and max_frames > 0 else None
+
+    def plan(self, fps: float, frame_count: int) -> "FrameSchedule":
+        """영상 정보로부터 샘플링 스케줄을 생성합니다."""
+        if fps > 0 and frame_count > 0:
+            return self._plan_known_length(fps, frame_count)
+        return self._plan_unknown_length(fps)
+
+    def _plan_known_length(self, fps: float, frame_count: int) -> "FrameSchedule":
+        duration = frame_count / fps
+        counts = {
+            name: min(frame_count, max(1, int(round(duration * rate))))
+            for name, rate in self.sample_rates.items()
+            if rate > 0
+        }
+
+        # 프레임 예산 초과 시 모든 분석기를 같은 비율로 축소 (합계가 합집합의 상한)
+        total = sum(counts.values())
+        if self.max_frames and total > self.max_frames:
+            scale = self.max_frames / total
+            counts = {name: max(1, int(count * scale)) for name, count in counts.items()}
+
+        indices = {
+            name: np.unique(np.linspace(0, frame_count - 1, count).round().astype(int)).tolist()
+            for name, count in counts.items()
+        }
+        return FrameSchedule(indices=indices, sample_rates=self.sample_rates, max_frames=self.max_frames)
+
+    def _plan_unknown_length(self, fps: float) -> "FrameSchedule":
+        source_fps = fps if fps > 0 else FALLBACK_FPS
+        strides = {
+            name: max(1, int(round(source_fps / rate)))
+            for name, rate in self.sample_rates.items()
+            if rate > 0
+        }
+        logger.warning(f"프레임 수를 알 수 없어 간격 기반 샘플링 사용: {strides}")
+        return FrameSchedule(strides=strides, sample_rates=self.sample_rates, max_frames=self.max_frames)
+
+
+class FrameSchedule:
+    """한 영상에 대한 샘플링 스케줄과 실제 샘플링 기록"""
+
+    def __init__(
+        self,
+        indices: Optional[Dict[str, List[int]]] = None,
+        strides: Optional[Dict[str, int]] = None,
+        sample_rates: Optional[Dict[str, float]] = None,
+        max_frames: Optional[int] = None
+    ):
+        self._indices = {name: set(values) for name, values in (indices or {}).items()}
+        self._strides = strides or {}
+        self._last_index = max((max(values) for values in (indices or {}).values() if values), default=None)
+        self.sample_rates = sample_rates or {}
+        self.max_frames = max_frames
+        self.decoded_frames = 0
+        self.sampled_frames: Dict[str, List[int]] = {
+            name: [] for name in list(self._indices) + list(self._strides)
+        }
+
+    def analyzers_for(self, frame_index: int) -> List[str]:
+        """해당 프레임을 필요로 하는 분석기 목록"""
+        if self._strides:
+            return [name for name, stride in self._strides.items() if frame_index % stride == 0]
+        return [name for name, values in self._indices.items() if frame_index in values]
+
+    def is_finished(self, frame_index: int) -> bool:
+        """더 이상 디코딩할 프레임이 없는지 여부"""
+        if self.max_frames and self.decoded_frames >= self.max_frames:
+            return True
+        return self._last_index is not None and frame_index > self._last_index
+
+    def record(self, analyzer: str, frame_index: int):
+        """분석기가 실제로 처리한 프레임을 기록합니다."""
+        self.sampled_frames.setdefault(analyzer, []).append(frame_index)
+
+    def sample_count(self, analyzer: str) -> int:
+        return len(self.sampled_frames.get(analyzer, []))
+
+    def to_dict(self) -> Dict:
+        """video_info에 포함할 샘플링 정보"""
+        return {
+            "sample_rates": self.sample_rates,
+            "max_frames": self.max_frames,
+            "decoded_frames": self.decoded_frames,
+            "sampled_frames": self.sampled_frames
+        }
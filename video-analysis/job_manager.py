@@ -0,0 +1,166 @@
+# === Video Analysis Job Manager (Process Pool) ===
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 분석기 (프로세스 안에서 한 번만 초기화되어 MediaPipe 모델을 유지)
+_worker_video_analyzer = None
+_worker_question_analyzer = None
+_worker_downloader = None
+
+
+def _init_worker():
+    """워커 프로세스 초기화 - 분석기와 MediaPipe 모델을 미리 로드"""
+    global _worker_video_analyzer, _worker_question_analyzer, _worker_downloader
+    from video_analyzer import VideoAnalyzer
+    from video_downloader import VideoDownloader
+    from question_video_analyzer import QuestionVideoAnalyzer
+
+    _worker_video_analyzer = VideoAnalyzer()
+    _worker_question_analyzer = QuestionVideoAnalyzer(video_analyzer=_worker_video_analyzer)
+    _worker_downloader = VideoDownloader()
+    logger.info(f"비디오 분석 워커 초기화 완료 (pid={os.getpid()})")
+
+
+def run_video_analysis(video_url: str, application_id: Optional[int] = None) -> Dict[str, Any]:
+    """워커에서 전체 비디오 분석 수행 (다운로드 → 분석 → 임시 파일 정리)"""
+    video_path = _worker_downloader.download_video(video_url, application_id)
+    if not video_path:
+        raise RuntimeError("비디오 다운로드 실패")
+
+    try:
+        return _worker_video_analyzer.analyze_video(video_path, application_id)
+    finally:
+        if os.path.exists(video_path):
+            os.remove(video_path)
+
+
+def run_question_analysis(video_url: str, question_logs: List[Dict]) -> Dict[str, Any]:
+    """워커에서 질문별 구간 분석 수행"""
+    return _worker_question_analyzer.analyze_question_segments(video_url, question_logs)
+
+
+class JobQueueFullError(Exception):
+    """대기 중인 작업이 너무 많을 때 발생"""
+    pass
+
+
+class VideoAnalysisJobManager:
+    """프로세스 풀 기반 비디오 분석 작업 관리자
+
+    작업 제출 시 job_id를 즉시 반환하고, 제한된 수의 워커 프로세스에서
+    분석을 수행합니다. 상태와 결과는 메모리에 보관하며 result_ttl 이후 정리됩니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending_jobs: Optional[int] = None,
+        result_ttl: Optional[int] = None
+    ):
+        self.max_workers = max_workers or int(
+            os.getenv("VIDEO_ANALYSIS_WORKERS", max(1, (os.cpu_count() or 2) // 2))
+        )
+        self.max_pending_jobs = max_pending_jobs or int(os.getenv("VIDEO_ANALYSIS_MAX_PENDING_JOBS", "20"))
+        self.result_ttl = result_ttl or int(os.getenv("VIDEO_ANALYSIS_JOB_TTL", "3600"))
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+
+    def start(self):
+        """워커 프로세스 풀 시작"""
+        if self.executor is None:
+            # TensorFlow/MediaPipe 상태를 fork로 복제하지 않도록 spawn 사용
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            logger.info(f"비디오 분석 워커 풀 시작: {self.max_workers}개 프로세스")
+
+    def shutdown(self):
+        """워커 프로세스 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            logger.info("비디오 분석 워커 풀 종료")
+
+    def pending_count(self) -> int:
+        return sum(1 for job in self.jobs.values() if job["status"] == "pending")
+
+    def submit(self, job_type: str, func, *args) -> str:
+        """작업 제출 후 job_id 반환"""
+        self._cleanup_expired()
+        if self.pending_count() >= self.max_pending_jobs:
+            raise JobQueueFullError(f"대기 중인 분석 작업이 너무 많습니다 ({self.max_pending_jobs}개)")
+
+        self.start()
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "job_type": job_type,
+            "status": "pending",
+            "created_at": time.time(),
+            "finished_at": None,
+            "result": None,
+            "error": None
+        }
+        self.jobs[job_id] = job
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, func, *args)
+        job["_future"] = future
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+        return job_id
+
+    async def run(self, job_type: str, func, *args) -> Dict[str, Any]:
+        """작업 제출 후 완료될 때까지 대기 (이벤트 루프는 블로킹하지 않음)"""
+        job_id = self.submit(job_type, func, *args)
+        # 요청이 끊겨도 워커 작업은 취소하지 않음
+        return await asyncio.shield(self.jobs[job_id]["_future"])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (내부 필드 제외)"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if not key.startswith("_")}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "pending_jobs": self.pending_count(),
+            "max_pending_jobs": self.max_pending_jobs,
+            "tracked_jobs": len(self.jobs)
+        }
+
+    def _on_done(self, job_id: str, future):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        job["finished_at"] = time.time()
+        if future.cancelled():
+            job["status"] = "cancelled"
+        elif future.exception() is not None:
+            job["status"] = "failed"
+            job["error"] = str(future.exception())
+            logger.error(f"비디오 분석 작업 실패 ({job_id}): {job['error']}")
+        else:
+            job["status"] = "completed"
+            job["result"] = future.result()
+            logger.info(f"비디오 분석 작업 완료 ({job_id})")
+
+    def _cleanup_expired(self):
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job["finished_at"] and now - job["finished_at"] > self.result_ttl
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
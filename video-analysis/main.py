@@ -6,9 +6,13 @@ from typing import List, Dict, Optional
 import logging
 import json
 import os
-from video_analyzer import VideoAnalyzer
 from video_downloader import VideoDownloader
-from question_video_analyzer import QuestionVideoAnalyzer
+from job_manager import (
+    VideoAnalysisJobManager,
+    JobQueueFullError,
+    run_video_analysis,
+    run_question_analysis
+)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -42,15 +46,24 @@ class AudioExtractionRequest(BaseModel):
 class FileDeleteRequest(BaseModel):
     file_path: str
 
-# 분석기 인스턴스
-video_analyzer = VideoAnalyzer()
+# 다운로더 인스턴스 (분석기는 워커 프로세스마다 따로 초기화됨)
 video_downloader = VideoDownloader()
-question_video_analyzer = QuestionVideoAnalyzer()
+job_manager = VideoAnalysisJobManager()
+
+@app.on_event("startup")
+async def start_job_manager():
+    """분석 워커 풀 시작"""
+    job_manager.start()
+
+@app.on_event("shutdown")
+async def stop_job_manager():
+    """분석 워커 풀 종료"""
+    job_manager.shutdown()
 
 @app.get("/health")
 async def health_check():
     """서비스 상태 확인"""
-    return {"status": "healthy", "service": "video-analysis"}
+    return {"status": "healthy", "service": "video-analysis", "jobs": job_manager.stats()}
 
 @app.post("/download-video")
 async def download_video(request: VideoAnalysisRequest):
@@ -115,47 +128,74 @@ async def extract_audio(request: AudioExtractionRequest):
 
 @app.post("/analyze-video-url")
 async def analyze_video_url(request: VideoAnalysisRequest):
-    """전체 비디오 분석"""
+    """전체 비디오 분석 (워커 풀에서 실행, 완료까지 대기)"""
     try:
         logger.info(f"비디오 분석 요청: {request.video_url}")
         
-        # 비디오 다운로드
-        video_path = video_downloader.download_video(request.video_url, request.application_id)
-        if not video_path:
-            raise HTTPException(status_code=400, detail="비디오 다운로드 실패")
-        
-        # 비디오 분석 수행
-        analysis_result = video_analyzer.analyze_video(video_path, request.application_id)
-        
-        # 임시 파일 정리
-        if os.path.exists(video_path):
-            os.remove(video_path)
+        analysis_result = await job_manager.run(
+            "analyze-video-url", run_video_analysis, request.video_url, request.application_id
+        )
         
         logger.info("비디오 분석 완료")
         return analysis_result
         
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"비디오 분석 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"분석 중 오류가 발생했습니다: {str(e)}")
 
 @app.post("/analyze-question-segments")
 async def analyze_question_segments(request: QuestionAnalysisRequest):
-    """질문별 구간 분석"""
+    """질문별 구간 분석 (워커 풀에서 실행, 완료까지 대기)"""
     try:
         logger.info(f"질문별 분석 요청: {len(request.question_logs)}개 질문")
         
-        # 질문별 분석 수행
-        analysis_result = question_video_analyzer.analyze_question_segments(
-            request.video_url, request.question_logs
+        analysis_result = await job_manager.run(
+            "analyze-question-segments", run_question_analysis, request.video_url, request.question_logs
         )
         
         logger.info("질문별 분석 완료")
         return analysis_result
         
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"질문별 분석 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"질문별 분석 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/jobs/analyze-video-url")
+async def submit_video_analysis_job(request: VideoAnalysisRequest):
+    """전체 비디오 분석 작업 제출 (job_id 즉시 반환)"""
+    try:
+        job_id = job_manager.submit(
+            "analyze-video-url", run_video_analysis, request.video_url, request.application_id
+        )
+        logger.info(f"비디오 분석 작업 제출: {job_id}")
+        return {"job_id": job_id, "status": "pending"}
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+@app.post("/jobs/analyze-question-segments")
+async def submit_question_analysis_job(request: QuestionAnalysisRequest):
+    """질문별 구간 분석 작업 제출 (job_id 즉시 반환)"""
+    try:
+        job_id = job_manager.submit(
+            "analyze-question-segments", run_question_analysis, request.video_url, request.question_logs
+        )
+        logger.info(f"질문별 분석 작업 제출: {job_id}")
+        return {"job_id": job_id, "status": "pending"}
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """분석 작업 상태 및 결과 조회"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return job
+
 @app.post("/delete-file")
 async def delete_file(request: FileDeleteRequest):
     """파일 삭제 (임시 파일 정리용)"""
@@ -187,6 +227,9 @@ async def root():
             "/extract-audio",
             "/analyze-video-url",
             "/analyze-question-segments",
+            "/jobs/analyze-video-url",
+            "/jobs/analyze-question-segments",
+            "/jobs/{job_id}",
             "/delete-file"
         ]
     }
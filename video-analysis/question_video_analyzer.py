@@ -14,9 +14,13 @@ logger = logging.getLogger(__name__)
 class QuestionVideoAnalyzer:
     """질문별 비디오 분석기"""
     
-    def __init__(self):
-        """초기화"""
-        self.video_analyzer = VideoAnalyzer()
+    def __init__(self, video_analyzer: Optional[VideoAnalyzer] = None):
+        """초기화
+
+        Args:
+            video_analyzer: 공유할 VideoAnalyzer (없으면 새로 생성)
+        """
+        self.video_analyzer = video_analyzer or VideoAnalyzer()
         self.video_downloader = VideoDownloader()
         
     def analyze_question_segments(self, video_url: str, question_logs: List[Dict]) -> Dict:
@@ -7,11 +7,14 @@ import soundfile as sf
 import tempfile
 import os
 import logging
+import threading
 from typing import Dict, Any, List, Tuple, Optional
 import json
 from datetime import datetime
 import subprocess
+import base64
 from video_downloader import VideoDownloader
+from frame_sampler import FrameSampler, FrameSchedule, DEFAULT_SAMPLE_RATES
 
 # TensorFlow 기반 감정 분석
 try:
@@ -29,25 +32,42 @@ import asyncio
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Agent가 공유 경로를 사용할 수 없다고 응답하면 base64 전송으로 재요청하는 오류 코드
+SHARED_PATH_FALLBACK_ERRORS = ("shared_path_not_found", "shared_path_outside_volume")
+
 class VideoAnalyzer:
     """AI 모델을 사용한 영상 분석 클래스"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None, max_frames: Optional[int] = None):
+        """초기화
+
+        Args:
+            sample_rates: 분석기별 초당 샘플 수 (facial/posture/gaze)
+            max_frames: 영상 한 개당 디코딩할 최대 프레임 수
+        """
         self.downloader = VideoDownloader()
+        if sample_rates is None:
+            sample_rates = {
+                name: float(os.getenv(f"VIDEO_ANALYSIS_{name.upper()}_SAMPLE_FPS", default))
+                for name, default in DEFAULT_SAMPLE_RATES.items()
+            }
+        if max_frames is None:
+            max_frames = int(os.getenv("VIDEO_ANALYSIS_MAX_FRAMES", "1800"))
+        self.frame_sampler = FrameSampler(sample_rates, max_frames)
         self.mp_face_detection = mp.solutions.face_detection
         self.mp_face_mesh = mp.solutions.face_mesh
         self.mp_pose = mp.solutions.pose
         self.mp_hands = mp.solutions.hands
-        self.face_mesh = None
-        self.pose = None
-        self.hands = None
+        self.face_detection = None
         self.trimmed_files = []  # 자른 영상 파일 추적
         
         # Agent 서비스 URL
         self.agent_service_url = "http://kocruit_agent:8001"
+        # Agent와 파일 전달 방식: path(shared_temp 볼륨 경로 전달) 또는 base64
+        self.agent_transfer_mode = os.getenv("AGENT_FILE_TRANSFER_MODE", "path")
         
         # 모델 초기화
+        self._models_lock = threading.Lock()
         self._initialize_models()
     
     def _initialize_models(self):
@@ -55,30 +75,11 @@ class VideoAnalyzer:
         try:
             logger.info("AI 모델 초기화 시작...")
             
-            # MediaPipe 모델들 초기화
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                static_image_mode=False,
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            self.pose = self.mp_pose.Pose(
-                static_image_mode=False,
-                model_complexity=1,
-                smooth_landmarks=True,
-                enable_segmentation=False,
-                smooth_segmentation=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
+            # 프레임 간 상태가 없는 FaceDetection만 인스턴스당 한 번 만들어 재사용
+            # (추적 상태를 가진 Pose/FaceMesh는 영상마다 _create_tracking_models로 새로 생성)
+            self.face_detection = self.mp_face_detection.FaceDetection(
+                model_selection=1,
+                min_detection_confidence=0.5
             )
             
             logger.info("MediaPipe 모델들 초기화 완료")
@@ -149,9 +150,14 @@ class VideoAnalyzer:
             # 3단계: 자른 비디오로 분석 수행
             analysis_video_path = video_path  # 기본값
             
-            # 자른 비디오가 있으면 임시 파일로 저장
-            if speaker_analysis.get("trimmed_video_base64"):
-                trimmed_video_data = base64.b64decode(speaker_analysis["trimmed_video_base64"])
+            # 자른 비디오가 있으면 임시 파일로 저장 (경로 전달 방식이면 공유 볼륨 파일 그대로 사용)
+            trimmed_video_path = speaker_analysis.pop("trimmed_video_path", None)
+            if trimmed_video_path and os.path.exists(trimmed_video_path):
+                analysis_video_path = trimmed_video_path
+                logger.info(f"공유 볼륨의 자른 비디오 사용: {analysis_video_path}")
+                self.trimmed_files.append(analysis_video_path)  # 정리 목록에 추가
+            elif speaker_analysis.get("trimmed_video_base64"):
+                trimmed_video_data = base64.b64decode(speaker_analysis.pop("trimmed_video_base64"))
                 analysis_video_path = tempfile.mktemp(suffix=".mp4")
                 with open(analysis_video_path, 'wb') as f:
                     f.write(trimmed_video_data)
@@ -171,6 +177,9 @@ class VideoAnalyzer:
             
             logger.info(f"분석 비디오 정보: {frame_count}프레임, {fps}fps, {duration:.2f}초")
             
+            schedule = self.frame_sampler.plan(fps, frame_count)
+            frame_analysis = self._analyze_frames(cap, schedule)
+            
             # 분석 결과 초기화
             analysis_result = {
                 "video_path": analysis_video_path,
@@ -180,12 +189,11 @@ class VideoAnalyzer:
                     "frame_count": frame_count,
                     "fps": fps,
                     "duration": duration,
-                    "is_trimmed": analysis_video_path != video_path
+                    "is_trimmed": analysis_video_path != video_path,
+                    "sampling": schedule.to_dict()
                 },
                 "speaker_analysis": speaker_analysis,
-                "facial_expressions": self._analyze_facial_expressions(cap),
-                "posture_analysis": self._analyze_posture(cap),
-                "gaze_analysis": self._analyze_gaze(cap),
+                **frame_analysis,
                 "audio_analysis": self._analyze_audio_quality(temp_audio_path, speaker_analysis),
                 "overall_score": 0,
                 "recommendations": []
@@ -215,177 +223,223 @@ class VideoAnalyzer:
             if temp_file_path and os.path.exists(temp_file_path):
                 self.downloader.cleanup_temp_file(temp_file_path)
     
-    def _analyze_facial_expressions(self, cap: cv2.VideoCapture) -> Dict[str, Any]:
-        """얼굴 표정을 분석합니다."""
-        try:
-            with self.mp_face_detection.FaceDetection(
-                model_selection=1, min_detection_confidence=0.5
-            ) as face_detection:
-                smile_count = 0
-                total_frames = 0
-                confidence_scores = []
-                
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                    
-                    # 10프레임마다 분석 (성능 최적화)
-                    if total_frames % 10 == 0:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        results = face_detection.process(rgb_frame)
-                        
-                        if results.detections:
-                            for detection in results.detections:
-                                confidence_scores.append(detection.score[0])
-                                
-                                # 간단한 미소 감지 (입술 영역 분석)
-                                # 실제로는 더 정교한 감정 분석 모델 사용 필요
-                                if detection.score[0] > 0.8:
-                                    smile_count += 1
-                    
-                    total_frames += 1
-                
-                smile_frequency = smile_count / max(total_frames // 10, 1)
-                avg_confidence = np.mean(confidence_scores) if confidence_scores else 0
-                
-                return {
-                    "smile_frequency": round(smile_frequency, 3),
-                    "eye_contact_ratio": round(avg_confidence, 3),
-                    "emotion_variation": round(len(set(confidence_scores)) / max(len(confidence_scores), 1), 3),
-                    "confidence_score": round(avg_confidence, 3)
-                }
-                
-        except Exception as e:
-            logger.error(f"얼굴 표정 분석 오류: {str(e)}")
-            return {
-                "smile_frequency": None,
-                "eye_contact_ratio": None,
-                "emotion_variation": None,
-                "confidence_score": None
-            }
-    
-    def _analyze_posture(self, cap: cv2.VideoCapture) -> Dict[str, Any]:
-        """자세를 분석합니다."""
-        try:
-            with self.mp_pose.Pose(
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            ) as pose:
-                posture_changes = 0
-                nod_count = 0
-                hand_gestures = []
-                posture_scores = []
-                
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                prev_pose = None
-                
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                    
-                    # 15프레임마다 분석
-                    if cap.get(cv2.CAP_PROP_POS_FRAMES) % 15 == 0:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        results = pose.process(rgb_frame)
-                        
-                        if results.pose_landmarks:
-                            current_pose = self._extract_pose_features(results.pose_landmarks)
-                            
-                            if prev_pose is not None:
-                                # 자세 변화 감지
-                                pose_change = self._calculate_pose_change(prev_pose, current_pose)
-                                if pose_change > 0.1:
-                                    posture_changes += 1
-                                
-                                # 고개 끄덕임 감지
-                                if self._detect_nod(prev_pose, current_pose):
-                                    nod_count += 1
-                            
-                            prev_pose = current_pose
-                            posture_scores.append(self._calculate_posture_score(results.pose_landmarks))
-                
-                avg_posture_score = np.mean(posture_scores) if posture_scores else 0
-                
-                return {
-                    "posture_score": round(avg_posture_score, 3),
-                    "posture_changes": posture_changes,
-                    "nod_count": nod_count,
-                    "hand_gestures": hand_gestures
-                }
-                
-        except Exception as e:
-            logger.error(f"자세 분석 오류: {str(e)}")
-            return {
-                "posture_score": None,
-                "posture_changes": None,
-                "nod_count": None,
-                "hand_gestures": []
-            }
-    
-    def _analyze_gaze(self, cap: cv2.VideoCapture) -> Dict[str, Any]:
-        """시선을 분석합니다."""
+    def _create_tracking_models(self):
+        """영상 한 개 분석용 Pose, FaceMesh 그래프 생성
+
+        static_image_mode=False 그래프는 이전 프레임의 랜드마크를 추적하므로,
+        이전 영상의 추적 상태가 다음 영상 첫 프레임들에 섞이지 않도록 영상마다 새로 만듭니다.
+        """
+        pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=1,
+            smooth_landmarks=True,
+            enable_segmentation=False,
+            smooth_segmentation=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        return pose, face_mesh
+
+    def _analyze_frames(self, cap: cv2.VideoCapture, schedule: FrameSchedule) -> Dict[str, Dict[str, Any]]:
+        """한 번의 디코딩으로 표정/자세/시선 분석을 함께 수행합니다.
+
+        스케줄에 포함된 프레임만 디코딩하고(나머지는 grab으로 건너뜀),
+        RGB 변환도 프레임당 한 번만 수행한 뒤 초기화 때 만든 FaceDetection과
+        이 영상용으로 만든 Pose, FaceMesh에 전달합니다.
+        """
+        facial_state = {"smile_count": 0, "confidence_scores": []}
+        posture_state = {"prev_pose": None, "posture_changes": 0, "nod_count": 0, "posture_scores": []}
+        gaze_state = {"focus_frames": 0, "eye_aversion_count": 0, "gaze_consistency": []}
+        failed = set()
+        total_frames = 0
+
         try:
-            with self.mp_face_mesh.FaceMesh(
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            ) as face_mesh:
-                focus_frames = 0
-                total_frames = 0
-                eye_aversion_count = 0
-                gaze_consistency = []
-                
+            # FaceDetection은 재사용 (그래프는 스레드 안전하지 않으므로 한 번에 한 영상만),
+            # 추적 그래프는 이 영상 분석이 끝나면 닫음
+            pose, face_mesh = self._create_tracking_models()
+            with self._models_lock, pose, face_mesh:
+                face_detection = self.face_detection
                 cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                
-                while True:
+
+                while not schedule.is_finished(total_frames):
+                    analyzers = [name for name in schedule.analyzers_for(total_frames) if name not in failed]
+
+                    # 어떤 분석기도 사용하지 않는 프레임은 디코딩하지 않고 건너뜀
+                    if not analyzers:
+                        if not cap.grab():
+                            break
+                        total_frames += 1
+                        continue
+
                     ret, frame = cap.read()
                     if not ret:
                         break
-                    
-                    # 20프레임마다 분석
-                    if total_frames % 20 == 0:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        results = face_mesh.process(rgb_frame)
-                        
-                        if results.multi_face_landmarks:
-                            landmarks = results.multi_face_landmarks[0]
-                            
-                            # 시선 방향 계산 (간단한 구현)
-                            left_eye = landmarks.landmark[33]  # 왼쪽 눈
-                            right_eye = landmarks.landmark[263]  # 오른쪽 눈
-                            
-                            # 화면 중앙을 향하는지 확인
-                            eye_center_x = (left_eye.x + right_eye.x) / 2
-                            if 0.4 < eye_center_x < 0.6:  # 화면 중앙 영역
-                                focus_frames += 1
-                            else:
-                                eye_aversion_count += 1
-                            
-                            gaze_consistency.append(eye_center_x)
-                    
+
+                    schedule.decoded_frames += 1
+                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    run_facial = "facial" in analyzers
+                    run_posture = "posture" in analyzers
+                    run_gaze = "gaze" in analyzers
+
+                    if run_facial:
+                        try:
+                            self._process_facial_frame(face_detection, rgb_frame, facial_state)
+                            schedule.record("facial", total_frames)
+                        except Exception as e:
+                            logger.error(f"얼굴 표정 분석 오류: {str(e)}")
+                            failed.add("facial")
+
+                    if run_posture:
+                        try:
+                            self._process_posture_frame(pose, rgb_frame, posture_state)
+                            schedule.record("posture", total_frames)
+                        except Exception as e:
+                            logger.error(f"자세 분석 오류: {str(e)}")
+                            failed.add("posture")
+
+                    if run_gaze:
+                        try:
+                            self._process_gaze_frame(face_mesh, rgb_frame, gaze_state)
+                            schedule.record("gaze", total_frames)
+                        except Exception as e:
+                            logger.error(f"시선 분석 오류: {str(e)}")
+                            failed.add("gaze")
+
                     total_frames += 1
-                
-                focus_ratio = focus_frames / max(total_frames // 20, 1)
-                gaze_consistency_score = 1 - np.std(gaze_consistency) if gaze_consistency else 0
-                
-                return {
-                    "focus_ratio": round(focus_ratio, 3),
-                    "eye_aversion_count": eye_aversion_count,
-                    "gaze_consistency": round(gaze_consistency_score, 3)
-                }
-                
+
         except Exception as e:
-            logger.error(f"시선 분석 오류: {str(e)}")
-            return {
-                "focus_ratio": None,
-                "eye_aversion_count": None,
-                "gaze_consistency": None
-            }
+            logger.error(f"프레임 분석 오류: {str(e)}")
+            failed.update({"facial", "posture", "gaze"})
+
+        return {
+            "facial_expressions": self._summarize_facial_expressions(facial_state, schedule.sample_count("facial"))
+                if "facial" not in failed else self._empty_facial_result(),
+            "posture_analysis": self._summarize_posture(posture_state)
+                if "posture" not in failed else self._empty_posture_result(),
+            "gaze_analysis": self._summarize_gaze(gaze_state, schedule.sample_count("gaze"))
+                if "gaze" not in failed else self._empty_gaze_result()
+        }
+
+    def _process_facial_frame(self, face_detection, rgb_frame: np.ndarray, state: Dict[str, Any]):
+        """얼굴 표정 분석용 프레임 하나를 처리합니다."""
+        results = face_detection.process(rgb_frame)
+
+        if results.detections:
+            for detection in results.detections:
+                state["confidence_scores"].append(detection.score[0])
+
+                # 간단한 미소 감지 (입술 영역 분석)
+                # 실제로는 더 정교한 감정 분석 모델 사용 필요
+                if detection.score[0] > 0.8:
+                    state["smile_count"] += 1
+
+    def _process_posture_frame(self, pose, rgb_frame: np.ndarray, state: Dict[str, Any]):
+        """자세 분석용 프레임 하나를 처리합니다."""
+        results = pose.process(rgb_frame)
+
+        if results.pose_landmarks:
+            current_pose = self._extract_pose_features(results.pose_landmarks)
+            prev_pose = state["prev_pose"]
+
+            if prev_pose is not None:
+                # 자세 변화 감지
+                pose_change = self._calculate_pose_change(prev_pose, current_pose)
+                if pose_change > 0.1:
+                    state["posture_changes"] += 1
+
+                # 고개 끄덕임 감지
+                if self._detect_nod(prev_pose, current_pose):
+                    state["nod_count"] += 1
+
+            state["prev_pose"] = current_pose
+            state["posture_scores"].append(self._calculate_posture_score(results.pose_landmarks))
+
+    def _process_gaze_frame(self, face_mesh, rgb_frame: np.ndarray, state: Dict[str, Any]):
+        """시선 분석용 프레임 하나를 처리합니다."""
+        results = face_mesh.process(rgb_frame)
+
+        if results.multi_face_landmarks:
+            landmarks = results.multi_face_landmarks[0]
+
+            # 시선 방향 계산 (간단한 구현)
+            left_eye = landmarks.landmark[33]  # 왼쪽 눈
+            right_eye = landmarks.landmark[263]  # 오른쪽 눈
+
+            # 화면 중앙을 향하는지 확인
+            eye_center_x = (left_eye.x + right_eye.x) / 2
+            if 0.4 < eye_center_x < 0.6:  # 화면 중앙 영역
+                state["focus_frames"] += 1
+            else:
+                state["eye_aversion_count"] += 1
+
+            state["gaze_consistency"].append(eye_center_x)
+
+    def _summarize_facial_expressions(self, state: Dict[str, Any], sampled_count: int) -> Dict[str, Any]:
+        """얼굴 표정 분석 결과를 집계합니다."""
+        confidence_scores = state["confidence_scores"]
+        smile_frequency = state["smile_count"] / max(sampled_count, 1)
+        avg_confidence = np.mean(confidence_scores) if confidence_scores else 0
+
+        return {
+            "smile_frequency": round(smile_frequency, 3),
+            "eye_contact_ratio": round(avg_confidence, 3),
+            "emotion_variation": round(len(set(confidence_scores)) / max(len(confidence_scores), 1), 3),
+            "confidence_score": round(avg_confidence, 3)
+        }
+
+    def _summarize_posture(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """자세 분석 결과를 집계합니다."""
+        posture_scores = state["posture_scores"]
+        avg_posture_score = np.mean(posture_scores) if posture_scores else 0
+
+        return {
+            "posture_score": round(avg_posture_score, 3),
+            "posture_changes": state["posture_changes"],
+            "nod_count": state["nod_count"],
+            "hand_gestures": []
+        }
+
+    def _summarize_gaze(self, state: Dict[str, Any], sampled_count: int) -> Dict[str, Any]:
+        """시선 분석 결과를 집계합니다."""
+        gaze_consistency = state["gaze_consistency"]
+        focus_ratio = state["focus_frames"] / max(sampled_count, 1)
+        gaze_consistency_score = 1 - np.std(gaze_consistency) if gaze_consistency else 0
+
+        return {
+            "focus_ratio": round(focus_ratio, 3),
+            "eye_aversion_count": state["eye_aversion_count"],
+            "gaze_consistency": round(gaze_consistency_score, 3)
+        }
+
+    def _empty_facial_result(self) -> Dict[str, Any]:
+        return {
+            "smile_frequency": None,
+            "eye_contact_ratio": None,
+            "emotion_variation": None,
+            "confidence_score": None
+        }
+
+    def _empty_posture_result(self) -> Dict[str, Any]:
+        return {
+            "posture_score": None,
+            "posture_changes": None,
+            "nod_count": None,
+            "hand_gestures": []
+        }
+
+    def _empty_gaze_result(self) -> Dict[str, Any]:
+        return {
+            "focus_ratio": None,
+            "eye_aversion_count": None,
+            "gaze_consistency": None
+        }
     
     def _extract_audio(self, video_path: str) -> Optional[str]:
         """비디오에서 오디오를 추출합니다."""
@@ -408,66 +462,72 @@ class VideoAnalyzer:
             return None
     
     def _request_speaker_analysis_and_trim(self, audio_path: str, video_path: str) -> Dict[str, Any]:
-        """Agent 서비스로 화자 분리 및 비디오 자르기를 요청합니다."""
+        """Agent 서비스로 화자 분리 및 비디오 자르기를 요청합니다.
+
+        기본적으로 shared_temp 볼륨의 파일 경로만 전달하고, Agent가 경로를 찾지 못하거나
+        공유 볼륨 밖의 경로로 판단하면 기존 base64 방식으로 다시 요청합니다.
+        """
         try:
             logger.info("Agent 서비스로 화자 분리 및 비디오 자르기 요청...")
             
-            # 오디오 파일을 base64로 인코딩
-            with open(audio_path, 'rb') as f:
-                audio_data = f.read()
-            
-            import base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-            
-            # 비디오 파일을 base64로 인코딩
-            with open(video_path, 'rb') as f:
-                video_data = f.read()
-            
-            video_base64 = base64.b64encode(video_data).decode('utf-8')
-            
-            # Agent 서비스 API 호출
-            async def make_request():
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    response = await client.post(
-                        f"{self.agent_service_url}/speaker-analysis-and-trim",
-                        json={
-                            "audio_data": audio_base64,
-                            "video_data": video_base64,
-                            "audio_filename": os.path.basename(audio_path),
-                            "video_filename": os.path.basename(video_path)
-                        }
-                    )
-                    return response.json()
+            payload = {
+                "audio_filename": os.path.basename(audio_path),
+                "video_filename": os.path.basename(video_path)
+            }
             
-            # 동기적으로 실행 (이벤트 루프 충돌 방지)
-            try:
-                # 기존 이벤트 루프가 있는지 확인
-                try:
-                    loop = asyncio.get_running_loop()
-                    # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, make_request())
-                        result = future.result()
-                except RuntimeError:
-                    # 실행 중인 루프가 없으면 직접 실행
-                    result = asyncio.run(make_request())
-                
-                if result.get("success"):
-                    logger.info("화자 분리 및 비디오 자르기 완료")
-                    return result.get("analysis", {})
-                else:
-                    logger.warning(f"화자 분리 및 비디오 자르기 실패: {result.get('message', 'Unknown error')}")
-                    return {}
-                    
-            except Exception as e:
-                logger.error(f"Agent 서비스 요청 오류: {str(e)}")
+            result = None
+            if self.agent_transfer_mode == "path":
+                result = self._post_to_agent({
+                    **payload,
+                    "audio_path": os.path.abspath(audio_path),
+                    "video_path": os.path.abspath(video_path)
+                })
+                if result.get("error_code") in SHARED_PATH_FALLBACK_ERRORS:
+                    logger.warning(f"Agent에서 공유 경로를 사용할 수 없어 base64 전송으로 전환합니다 ({result['error_code']})")
+                    result = None
+            
+            if result is None:
+                # 오디오/비디오 파일을 base64로 인코딩
+                with open(audio_path, 'rb') as f:
+                    payload["audio_data"] = base64.b64encode(f.read()).decode('utf-8')
+                with open(video_path, 'rb') as f:
+                    payload["video_data"] = base64.b64encode(f.read()).decode('utf-8')
+                result = self._post_to_agent(payload)
+            
+            if result.get("success"):
+                logger.info("화자 분리 및 비디오 자르기 완료")
+                return result.get("analysis", {})
+            else:
+                logger.warning(f"화자 분리 및 비디오 자르기 실패: {result.get('message', 'Unknown error')}")
                 return {}
                 
         except Exception as e:
             logger.error(f"화자 분리 및 비디오 자르기 요청 오류: {str(e)}")
             return {}
     
+    def _post_to_agent(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 서비스의 화자 분리 API를 동기적으로 호출합니다."""
+        async def make_request():
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                response = await client.post(
+                    f"{self.agent_service_url}/speaker-analysis-and-trim",
+                    json=payload
+                )
+                return response.json()
+        
+        # 동기적으로 실행 (이벤트 루프 충돌 방지)
+        try:
+            # 기존 이벤트 루프가 있는지 확인
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 실행 중인 루프가 없으면 직접 실행
+            return asyncio.run(make_request())
+        
+        # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return executor.submit(asyncio.run, make_request()).result()
+    
     def _analyze_audio_quality(self, audio_path: str, speaker_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
         """오디오 품질을 분석합니다."""
         try: